@@ -56,6 +56,26 @@ def init_extensions(app: Flask):
     )
 
 
+def init_spatial_index(app: Flask):
+    if app.config.get("SPATIAL_INDEX_ENABLED"):
+
+        @app.before_first_request
+        def build_spatial_index():
+            from core.domains.house.repository.house_repository import HouseRepository
+
+            HouseRepository().get_real_estate_spatial_index()
+
+
+def init_search_index(app: Flask):
+    if app.config.get("SEARCH_INDEX_ENABLED"):
+
+        @app.before_first_request
+        def build_search_index():
+            from core.domains.house.repository.house_repository import HouseRepository
+
+            HouseRepository().get_house_search_index()
+
+
 def init_sentry(app: Flask):
     if app.config.get("SENTRY_KEY", None):
         sentry_sdk.init(
@@ -87,6 +107,8 @@ def create_app(
         init_db(app, db)
         init_provider(app)
         init_extensions(app)
+        init_spatial_index(app)
+        init_search_index(app)
         init_sentry(app)
         init_commands()
 
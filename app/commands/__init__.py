@@ -1,2 +1,3 @@
 def init_commands():
     from . import worker  # noqa
+    from . import batch  # noqa
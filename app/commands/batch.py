@@ -0,0 +1,177 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Optional
+
+import click
+from flask import current_app
+
+from app.commands.enum import TopicEnum
+from app.commands.worker import get_worker
+from app.extensions import redis
+from app.extensions.utils.batch_helper import BatchDagRunner, BatchNode, BatchResult
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix, RedisExpire
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+
+def run_house_batch_step(topic: str, method_name: str = "execute") -> Optional[dict]:
+    return getattr(get_worker(topic), method_name)()
+
+
+def init_house_batch_process() -> None:
+    """
+        worker process 마다 app 생성 -> DB connection pool, redis client 를 부모 process 와 공유하지 않음
+    """
+    from app import create_app
+
+    create_app(os.environ.get("FLASK_CONFIG") or "default").app_context().push()
+
+
+# House batch DAG (선행 node 가 모두 성공해야 실행)
+# - 법정코드 -> 공급면적 조회 -> 공급면적 바인딩 -> 매매,전세 평균가 (실거래가 공급면적 필요)
+# - 분양 -> 매매 전환 후 분양 / 매매 평균가 계산
+# - 지도 마커는 거래 상태(trade_status, deposit_status) 업데이트 이후
+# - 행정구역 평균가는 분양, 매매 평균가 계산 이후
+HOUSE_BATCH_NODES = [
+    BatchNode(
+        name="replace_public_to_private",
+        func=partial(
+            run_house_batch_step, TopicEnum.REPLACE_PUBLIC_TO_PRIVATE_SALES.value
+        ),
+    ),
+    BatchNode(
+        name="add_legal_code",
+        func=partial(run_house_batch_step, TopicEnum.ADD_LEGAL_CODE_HOUSE.value),
+    ),
+    BatchNode(
+        name="add_supply_area",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.ADD_SUPPLY_AREA_TO_PRIVATE_SALE_DETAILS.value,
+        ),
+        depends_on=("add_legal_code",),
+    ),
+    BatchNode(
+        name="bind_supply_area",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.BIND_SUPPLY_AREA_TO_PRIVATE_SALE_DETAILS.value,
+        ),
+        depends_on=("add_supply_area",),
+    ),
+    BatchNode(
+        name="upsert_public_sale_avg_prices",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.PRE_CALCULATE_AVERAGE_HOUSE.value,
+            "execute_upsert_public_sale_avg_prices",
+        ),
+        depends_on=("replace_public_to_private",),
+    ),
+    BatchNode(
+        name="update_public_sale_acquisition_tax",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.PRE_CALCULATE_AVERAGE_HOUSE.value,
+            "execute_update_public_sale_acquisition_tax",
+        ),
+        depends_on=("upsert_public_sale_avg_prices",),
+    ),
+    BatchNode(
+        name="upsert_private_sale_avg_prices",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.PRE_CALCULATE_AVERAGE_HOUSE.value,
+            "execute_upsert_private_sale_avg_prices",
+        ),
+        depends_on=("replace_public_to_private", "bind_supply_area"),
+    ),
+    BatchNode(
+        name="update_private_sales_status",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.PRE_CALCULATE_AVERAGE_HOUSE.value,
+            "execute_update_private_sales_status",
+        ),
+        depends_on=("upsert_private_sale_avg_prices",),
+    ),
+    BatchNode(
+        name="refresh_map_markers",
+        func=partial(
+            run_house_batch_step,
+            TopicEnum.PRE_CALCULATE_AVERAGE_HOUSE.value,
+            "execute_refresh_map_markers",
+        ),
+        depends_on=("update_private_sales_status",),
+    ),
+    BatchNode(
+        name="pre_calculate_administrative",
+        func=partial(
+            run_house_batch_step, TopicEnum.PRE_CALCULATE_AVERAGE_ADMINISTRATIVE.value
+        ),
+        depends_on=("upsert_public_sale_avg_prices", "upsert_private_sale_avg_prices"),
+    ),
+]
+
+
+def _load_house_batch_state() -> Dict[str, BatchResult]:
+    state = redis.get(key=RedisKeyPrefix.HOUSE_BATCH_STATE.value)
+    if not state:
+        return dict()
+    return {name: BatchResult(**result) for name, result in json.loads(state).items()}
+
+
+def _save_house_batch_state(state: Dict[str, BatchResult]) -> None:
+    redis.set(
+        key=RedisKeyPrefix.HOUSE_BATCH_STATE.value,
+        value=json.dumps({name: result._asdict() for name, result in state.items()}),
+        ex=RedisExpire.HOUSE_BATCH_STATE_TIME.value,
+    )
+
+
+@current_app.cli.command("start-house-batch")
+@click.option("--resume", is_flag=True, help="이전 실행에서 성공한 node 는 건너뛴다.")
+def start_house_batch(resume):
+    max_workers = current_app.config.get("HOUSE_BATCH_MAX_WORKERS")
+    state = _load_house_batch_state() if resume else dict()
+
+    def save_result(result: BatchResult) -> None:
+        state[result.name] = result
+        _save_house_batch_state(state=state)
+
+    runner = BatchDagRunner(
+        nodes=HOUSE_BATCH_NODES,
+        max_workers=max_workers,
+        executor_factory=lambda: ProcessPoolExecutor(
+            max_workers=max_workers, initializer=init_house_batch_process
+        ),
+        on_result=save_result,
+    )
+    results = runner.run(completed=state)
+
+    for result in results.values():
+        logger.info(
+            f"🚀\tHouseBatch - {result.name} : {result.status}, "
+            f"records: {result.seconds:.2f} secs, counts: {result.counts}, "
+            f"error: {result.error}"
+        )
+
+    if any(not result.is_success for result in results.values()):
+        # 실패 node 부터 재개 : flask start-house-batch --resume
+        exit(os.EX_SOFTWARE)
+
+    redis.delete(key=RedisKeyPrefix.HOUSE_BATCH_STATE.value)
+    exit(os.EX_OK)
+
+
+@current_app.cli.command("backfill-administrative-avg")
+@click.option("--from-yyyymm", type=int, required=True, help="계약년월 시작 (ex. 202101)")
+@click.option("--to-yyyymm", type=int, required=True, help="계약년월 끝 (ex. 202106)")
+def backfill_administrative_avg(from_yyyymm, to_yyyymm):
+    result = get_worker(
+        TopicEnum.PRE_CALCULATE_AVERAGE_ADMINISTRATIVE.value
+    ).execute_backfill(from_yyyymm=from_yyyymm, to_yyyymm=to_yyyymm)
+    logger.info(f"🚀\tBackfillAdministrativeAvg - {result}")
@@ -16,6 +16,7 @@ from core.domains.notification.use_case.v1.notification_worker_use_case import (
     PrePrcsNotificationUseCase,
     ConvertNoticePushMessageUseCase,
 )
+from core.domains.user.use_case.v1.user_worker_use_case import FlushRecentlyViewUseCase
 
 
 def get_worker(topic: str):
@@ -39,6 +40,8 @@ def get_worker(topic: str):
         return AddSupplyAreaUseCase(topic=topic)
     elif topic == TopicEnum.BIND_SUPPLY_AREA_TO_PRIVATE_SALE_DETAILS.value:
         return BindSupplyAreaUseCase(topic=topic)
+    elif topic == TopicEnum.FLUSH_RECENTLY_VIEW.value:
+        return FlushRecentlyViewUseCase(topic=topic)
 
 
 @current_app.cli.command("start-worker")
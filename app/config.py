@@ -19,6 +19,68 @@ class Config:
     # Redis
     REDIS_URL = os.environ.get("REDIS_URL") or "redis://127.0.0.1:6379"
 
+    # Map
+    # 지도 bounding tile 캐시 사용 여부 (level 15 이상 매물 조회)
+    BOUNDING_TILE_CACHE_ENABLED = (
+        os.environ.get("BOUNDING_TILE_CACHE_ENABLED") or "True"
+    ) == "True"
+    # 지도 bounding/반경 조회 시 PostGIS 필터 대신 in-memory 공간 인덱스 사용 여부
+    SPATIAL_INDEX_ENABLED = (
+        os.environ.get("SPATIAL_INDEX_ENABLED") or "False"
+    ) == "True"
+    # 매물 검색 시 DB(pg_trgm) 대신 in-memory 검색 인덱스 사용 여부
+    # (초성 검색은 인덱스로만 가능 -> 사용 안함 / 빌드 전이면 초성 키워드는 빈 결과)
+    SEARCH_INDEX_ENABLED = (os.environ.get("SEARCH_INDEX_ENABLED") or "False") == "True"
+    # 지도 마커 클러스터링 : 해당 level 미만(15 이상)에서 클러스터 응답, 0 이면 사용 안함
+    BOUNDING_CLUSTER_EXPAND_LEVEL = int(
+        os.environ.get("BOUNDING_CLUSTER_EXPAND_LEVEL") or 0
+    )
+
+    # Sync
+    # datamart 동기화 메세지 수신 방식 (scan : sync:* key scan, stream : redis streams)
+    SYNC_INGESTION_MODE = os.environ.get("SYNC_INGESTION_MODE") or "scan"
+    # sync worker 지표(/metrics) 노출 port, 0 이면 사용 안함
+    SYNC_METRICS_PORT = int(os.environ.get("SYNC_METRICS_PORT") or 0)
+    # 매매, 전세 평균가 계산 대상 (full : 오늘 변경된 매물 전체, incremental : dirty set)
+    PRIVATE_SALE_AVG_CALC_MODE = os.environ.get("PRIVATE_SALE_AVG_CALC_MODE") or "full"
+    # 행정구역 평균가 집계 방식 (sql : GROUPING SETS, memory : app 에서 rollup)
+    ADMINISTRATIVE_AVG_CALC_ENGINE = (
+        os.environ.get("ADMINISTRATIVE_AVG_CALC_ENGINE") or "sql"
+    )
+
+    # HouseRepository 대량 insert / update chunk 크기 (chunk 단위 commit)
+    BULK_WRITE_CHUNK_SIZE = int(os.environ.get("BULK_WRITE_CHUNK_SIZE") or 1000)
+
+    # 최근 본 매물 write-behind (redis buffer -> FlushRecentlyViewUseCase 에서 batch upsert)
+    # 사용 시 flush worker (tanos.flush_recently_view.v1) 를 먼저 배포해야 함
+    RECENTLY_VIEW_WRITE_BEHIND_ENABLED = (
+        os.environ.get("RECENTLY_VIEW_WRITE_BEHIND_ENABLED") or "False"
+    ) == "True"
+    # sec, buffer flush 주기
+    RECENTLY_VIEW_FLUSH_INTERVAL = float(
+        os.environ.get("RECENTLY_VIEW_FLUSH_INTERVAL") or 5
+    )
+
+    # House batch DAG (flask start-house-batch) - 동시 실행 process 수
+    HOUSE_BATCH_MAX_WORKERS = int(os.environ.get("HOUSE_BATCH_MAX_WORKERS") or 4)
+
+    # 건축물대장 API (data.go.kr) - AddSupplyAreaUseCase
+    BUILDING_REGISTRY_URL = (
+        os.environ.get("BUILDING_REGISTRY_URL")
+        or "http://apis.data.go.kr/1613000/BldRgstService_v2"
+    )
+    BUILDING_REGISTRY_SERVICE_KEY = (
+        os.environ.get("BUILDING_REGISTRY_SERVICE_KEY")
+        or "dbNxRdjZCqBvSjcfDHnxPgUm0CXIjGhNHSAlbvBxI0BvOu3dpL8t%2FFQ%2BDRE%2FoKPw61Nm0gHxqYTlYEgDxz37aw%3D%3D"
+    )
+    # 초당 API 호출 수, 동시 호출 thread 수
+    BUILDING_REGISTRY_RATE_LIMIT = float(
+        os.environ.get("BUILDING_REGISTRY_RATE_LIMIT") or 20
+    )
+    BUILDING_REGISTRY_MAX_WORKERS = int(
+        os.environ.get("BUILDING_REGISTRY_MAX_WORKERS") or 8
+    )
+
     # Naver Cloud Platform Environment
     SENS_SID = os.environ.get("SENS_SID") or ""
     NCP_ACCESS_KEY = os.environ.get("NCP_ACCESS_KEY") or ""
@@ -71,6 +133,7 @@ class TestConfig(Config):
     SQLALCHEMY_BINDS = {"read_only": "sqlite:///:memory:"}
 
     WTF_CSRF_ENABLED = False
+    BOUNDING_TILE_CACHE_ENABLED = False
 
 
 class DevelopmentConfig(Config):
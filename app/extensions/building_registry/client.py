@@ -0,0 +1,336 @@
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from time import monotonic, sleep
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    NamedTuple,
+)
+from xml.etree.ElementTree import iterparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.extensions.utils.log_helper import logger_
+from core.exceptions import ExternalApiErrorException
+
+logger = logger_.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+        초당 rate 개 token 충전, 최대 capacity 개 보관 (thread-safe)
+        - acquire() 는 token 이 생길 때까지 대기
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            sleep(wait_time)
+
+
+class ExposPubuseAreaItem(NamedTuple):
+    """
+        전유공용면적 item (XML tag -> EXPOS_PUBUSE_AREA_ITEM_TAGS 순서)
+    """
+
+    rnum: Optional[str]
+    bld_nm: Optional[str]
+    dong_nm: Optional[str]
+    ho_nm: Optional[str]
+    flr_no_nm: Optional[str]
+    area: Optional[str]
+    new_plat_plc: Optional[str]
+    plat_plc: Optional[str]
+    etc_purps: Optional[str]
+    expos_pubuse_gb_cd_nm: Optional[str]
+    main_atch_gb_cd: Optional[str]
+    main_atch_gb_cd_nm: Optional[str]
+    main_purps_cd: Optional[str]
+
+
+EXPOS_PUBUSE_AREA_ITEM_TAGS = (
+    "rnum",
+    "bldNm",
+    "dongNm",
+    "hoNm",
+    "flrNoNm",
+    "area",
+    "newPlatPlc",
+    "platPlc",
+    "etcPurps",
+    "exposPubuseGbCdNm",
+    "mainAtchGbCd",
+    "mainAtchGbCdNm",
+    "mainPurpsCd",
+)
+
+
+class ExposPubuseAreaItems:
+    """
+        전유공용면적 조회 결과 (전체 page) iterator
+        - response body 를 메모리에 올리지 않고 iterparse 로 item 단위 streaming parse
+        - 처리한 item element 는 바로 clear 후 부모(items)에서 제거
+          -> page 크기(numOfRows)와 무관하게 메모리 일정
+        - totalCount 는 items 뒤에 내려오므로 순회가 끝난 후에 확인 가능 (결과 없으면 None)
+          -> item 이 있는데 totalCount 가 없거나 숫자가 아니면 ExternalApiErrorException
+    """
+
+    def __init__(self, client: "BuildingRegistryClient", params: dict):
+        self._client = client
+        self._params = params
+        self.total_count: Optional[str] = None
+
+    def _iter_page(self, page_no: int) -> Iterator[ExposPubuseAreaItem]:
+        response = self._client._request(
+            path=self._client.EXPOS_PUBUSE_AREA_PATH,
+            params=dict(self._params, pageNo=page_no),
+            stream=True,
+        )
+        try:
+            # gzip 응답도 풀어서 parser 에 전달
+            response.raw.decode_content = True
+            items = None
+            for event, element in iterparse(response.raw, events=("start", "end")):
+                if event == "start":
+                    if element.tag == "items":
+                        items = element
+                    continue
+
+                if element.tag == "item":
+                    yield ExposPubuseAreaItem(
+                        *(element.findtext(tag) for tag in EXPOS_PUBUSE_AREA_ITEM_TAGS)
+                    )
+                    element.clear()
+                    # clear 만 하면 빈 item element 가 items 에 계속 쌓임
+                    if items is not None:
+                        items.remove(element)
+                elif element.tag == "totalCount":
+                    self._page_total_count = element.text
+        finally:
+            response.close()
+
+    def __iter__(self) -> Iterator[ExposPubuseAreaItem]:
+        page_no = 1
+        while True:
+            last_item = None
+            self._page_total_count = None
+            for last_item in self._iter_page(page_no=page_no):
+                yield last_item
+
+            if not last_item:
+                break
+
+            self.total_count = self._page_total_count
+            try:
+                # rnum 은 1부터 시작
+                has_next_page = int(last_item.rnum) < int(self.total_count)
+            except (TypeError, ValueError):
+                raise ExternalApiErrorException(
+                    type_=f"invalid page - rnum : {last_item.rnum}, "
+                    f"totalCount : {self.total_count}"
+                )
+
+            if has_next_page:
+                page_no += 1
+                continue
+            break
+
+
+class BuildingRegistryClient:
+    """
+        건축물대장 API (data.go.kr BldRgstService_v2) client
+        - keep-alive session 공유 (connection pool 크기 = max_workers)
+        - TokenBucket 으로 API 호출량 제한 (RATE_LIMIT : 초당 호출 수)
+        - 연결 실패, 429, 5xx 는 exponential backoff + full jitter 로 재시도
+        - fetch_many() : thread pool 로 여러 대상 동시 조회, 완료 순서대로 반환
+          (동시에 submit 하는 대상은 max_workers * FETCH_WINDOW_FACTOR 개까지)
+        - 응답 XML 은 ExposPubuseAreaItems 에서 item 단위 streaming parse
+    """
+
+    EXPOS_PUBUSE_AREA_PATH = "/getBrExposPubuseAreaInfo"
+    NUM_OF_ROWS = 10000
+    RATE_LIMIT = 20
+    MAX_WORKERS = 8
+    MAX_RETRIES = 5
+    # sec
+    TIMEOUT = 30
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # fetch_many 에서 완료되지 않은 future 최대 수 = max_workers * FETCH_WINDOW_FACTOR
+    FETCH_WINDOW_FACTOR = 2
+
+    def __init__(
+        self,
+        url: str,
+        service_key: str,
+        rate_limit: float = RATE_LIMIT,
+        max_workers: int = MAX_WORKERS,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+    ):
+        self.url = url
+        self.service_key = service_key
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._rate_limiter = TokenBucket(rate=rate_limit)
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers),
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _get_backoff_time(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.BACKOFF_MAX, self.backoff_base * (2 ** attempt))
+        )
+
+    def _request(
+        self, path: str, params: dict, stream: bool = False
+    ) -> requests.Response:
+        """
+            ServiceKey 는 이미 URL encoding 된 값이므로 params 로 넘기지 않고 query string 에 직접 붙인다.
+            stream=True 이면 body 를 읽지 않은 response 반환 (호출한 쪽에서 close 필요)
+        """
+        url = f"{self.url}{path}?ServiceKey={self.service_key}"
+        for attempt in range(self.max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                response = self._session.get(
+                    url=url,
+                    params=params,
+                    headers={
+                        "Content-Type": "application/json; charset=utf8",
+                        "Cache-Control": "no-cache",
+                    },
+                    timeout=self.TIMEOUT,
+                    stream=stream,
+                )
+                if response.status_code == 200:
+                    return response
+
+                response.close()
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    raise ExternalApiErrorException(
+                        type_=f"status_code : {response.status_code}"
+                    )
+                error = f"status_code : {response.status_code}"
+            except requests.RequestException as e:
+                error = str(e)
+
+            if attempt < self.max_retries:
+                backoff_time = self._get_backoff_time(attempt=attempt)
+                logger.info(
+                    f"[BuildingRegistryClient] retry {attempt + 1}/{self.max_retries} "
+                    f"after {backoff_time:.2f} secs - {error}"
+                )
+                sleep(backoff_time)
+
+        raise ExternalApiErrorException(type_=error)
+
+    def iter_expos_pubuse_area_items(
+        self, front_legal_code: str, back_legal_code: str, bun: str, ji: Optional[str]
+    ) -> ExposPubuseAreaItems:
+        """
+            전유공용면적 조회 (전체 page, streaming)
+            - 순회 완료 후 total_count 확인
+        """
+        params = dict(
+            numOfRows=self.NUM_OF_ROWS,
+            sigunguCd=front_legal_code,
+            bjdongCd=back_legal_code,
+            bun=bun,
+        )
+        if ji:
+            params.update(ji=ji)
+        return ExposPubuseAreaItems(client=self, params=params)
+
+    def get_expos_pubuse_area_items(
+        self, front_legal_code: str, back_legal_code: str, bun: str, ji: Optional[str]
+    ) -> Tuple[Optional[str], List[ExposPubuseAreaItem]]:
+        """
+            전유공용면적 조회 (전체 page)
+            return : (totalCount, items) / 조회 결과 없으면 (None, [])
+        """
+        items = self.iter_expos_pubuse_area_items(
+            front_legal_code=front_legal_code,
+            back_legal_code=back_legal_code,
+            bun=bun,
+            ji=ji,
+        )
+        item_list = list(items)
+        return items.total_count, item_list
+
+    def fetch_many(
+        self, fetch: Callable[[Any], Any], targets: Iterable[Any]
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """
+            targets 를 max_workers 개 thread 로 동시에 조회
+            - 전체를 한번에 submit 하지 않고 window 크기만큼만 유지 (완료 1건 -> 다음 대상 submit)
+            - 반환한 future 는 바로 제거 -> 결과가 메모리에 쌓이지 않음
+            - 순회 중단(break, 예외) 시 아직 시작하지 않은 future 는 cancel
+            return : 완료 순서대로 (target, fetch 결과, 예외)
+        """
+        targets = iter(targets)
+        window = self.max_workers * self.FETCH_WINDOW_FACTOR
+        futures: Dict[Future, Any] = dict()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for target in islice(targets, window):
+                futures[executor.submit(fetch, target)] = target
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = futures.pop(future)
+                    for next_target in islice(targets, 1):
+                        futures[executor.submit(fetch, next_target)] = next_target
+
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        result, error = None, e
+                    yield target, result, error
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
@@ -1,16 +1,22 @@
 import abc
+from contextlib import contextmanager
 from datetime import timedelta
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, List, Tuple, Dict, Iterator
 
 import redis
 from flask import Flask
-from redis import RedisError
+from redis import RedisError, ResponseError
+from redis.client import Pipeline
 from rediscluster import RedisCluster
+from rediscluster.exceptions import RedisClusterException
 
 from app.extensions.utils.log_helper import logger_
 
 logger = logger_.getLogger(__name__)
 
+# redis-py-cluster 의 RedisClusterException 은 RedisError 를 상속하지 않으므로 함께 처리
+REDIS_ERRORS = (RedisError, RedisClusterException)
+
 
 class Cache:
     __metaclass__ = abc.ABCMeta
@@ -23,14 +29,88 @@ class Cache:
     def get_after_scan(self) -> Optional[dict]:
         pass
 
+    @abc.abstractmethod
+    def get_many_after_scan(self, count: int) -> List[dict]:
+        pass
+
+    @abc.abstractmethod
+    def count_keys(self, pattern: str) -> int:
+        pass
+
     @abc.abstractmethod
     def set(self, key: Any, value: Any, ex: Union[int, timedelta] = None,) -> None:
         pass
 
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abc.abstractmethod
+    def incr(self, key: str) -> int:
+        pass
+
+    @abc.abstractmethod
+    def pipeline(self) -> Iterator[Pipeline]:
+        pass
+
+    @abc.abstractmethod
+    def mget(self, keys: List[Any]) -> List[Optional[bytes]]:
+        pass
+
+    @abc.abstractmethod
+    def mset(self, mapping: Dict[Any, Any], ex: Union[int, timedelta] = None) -> None:
+        pass
+
+    @abc.abstractmethod
+    def is_exists(self, key: Any) -> int:
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: Any) -> int:
+        pass
+
+    @abc.abstractmethod
+    def delete_many(self, keys: List[Any]) -> int:
+        pass
+
+    @abc.abstractmethod
+    def unlink(self, keys: List[Any]) -> int:
+        pass
+
+    @abc.abstractmethod
+    def add_set_members(self, key: str, values: List[Any]) -> int:
+        pass
+
+    @abc.abstractmethod
+    def get_set_members(self, key: str) -> List[bytes]:
+        pass
+
+    @abc.abstractmethod
+    def get_hash_field(self, key: str, field: str) -> Optional[bytes]:
+        pass
+
+    @abc.abstractmethod
+    def set_hash_field(
+        self, key: str, field: str, value: Any, ex: Union[int, timedelta] = None
+    ) -> None:
+        pass
+
+    @abc.abstractmethod
+    def get_hash_all(self, key: str) -> Dict[bytes, bytes]:
+        pass
+
+    @abc.abstractmethod
+    def rename_if_not_exists(self, key: str, new_key: str) -> bool:
+        pass
+
     @abc.abstractmethod
     def clear_cache(self) -> None:
         pass
 
+    @abc.abstractmethod
+    def reset_scan(self) -> None:
+        pass
+
     @abc.abstractmethod
     def get_by_key(self, key: str) -> str:
         pass
@@ -43,9 +123,35 @@ class Cache:
     def is_available(self) -> None:
         pass
 
+    @abc.abstractmethod
+    def create_stream_group(self, stream: str, group: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def read_stream_group(
+        self, stream: str, group: str, consumer: str, count: int, block: int
+    ) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        pass
+
+    @abc.abstractmethod
+    def claim_pending_stream(
+        self, stream: str, group: str, consumer: str, min_idle_time: int, count: int
+    ) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        pass
+
+    @abc.abstractmethod
+    def ack_stream(self, stream: str, group: str, ids: List[bytes]) -> int:
+        pass
+
+    @abc.abstractmethod
+    def get_stream_backlog(self, stream: str, group: str) -> int:
+        pass
+
 
 class RedisClient(Cache):
     CONFIG_NAME = "REDIS_URL"
+    # multi-key 명령 1번에 담는 최대 key 수
+    BATCH_SIZE = 1000
     CLUSTER_NODE_1 = "REDIS_NODE_HOST_1"
     CLUSTER_NODE_2 = "REDIS_NODE_HOST_2"
 
@@ -77,6 +183,58 @@ class RedisClient(Cache):
             self._redis_client = self._redis_client.from_url(redis_url)
             test = 1
 
+    @property
+    def is_cluster(self) -> bool:
+        return isinstance(self._redis_client, RedisCluster)
+
+    @contextmanager
+    def pipeline(self) -> Iterator[Pipeline]:
+        """
+            with redis.pipeline() as pipeline:
+                pipeline.set(...)
+                pipeline.expire(...)
+            -> with 블록 종료 시 한번에 전송 (transaction 없음)
+            - RedisCluster 는 ClusterPipeline 이 key 의 slot(node) 별로 나누어 전송
+        """
+        pipeline = self._redis_client.pipeline(transaction=False)
+        try:
+            yield pipeline
+            pipeline.execute()
+        finally:
+            pipeline.reset()
+
+    def _group_keys_by_slot(self, keys: List[Any]) -> Dict[int, List[Any]]:
+        """
+            multi-key 명령(MGET, DEL, UNLINK)은 cluster 에서 같은 hash slot 의 key 만 가능
+            -> standalone 은 하나의 그룹, cluster 는 hash slot 별 그룹
+        """
+        if not self.is_cluster:
+            return {0: list(keys)}
+
+        keyslot = self._redis_client.connection_pool.nodes.keyslot
+        slot_keys = dict()
+        for key in keys:
+            slot_keys.setdefault(keyslot(key), []).append(key)
+        return slot_keys
+
+    def _execute_multi_key_command(self, command: str, keys: List[Any]) -> List[Any]:
+        """
+            hash slot 별 multi-key 명령을 BATCH_SIZE 단위로 pipeline 에 담아 한번에 전송
+            return : slot 그룹 순서대로의 (keys, 결과) 목록
+        """
+        batches = list()
+        for slot_keys in self._group_keys_by_slot(keys=keys).values():
+            for offset in range(0, len(slot_keys), self.BATCH_SIZE):
+                batches.append(slot_keys[offset : offset + self.BATCH_SIZE])
+
+        pipeline = self._redis_client.pipeline(transaction=False)
+        try:
+            for batch in batches:
+                pipeline.execute_command(command, *batch)
+            return list(zip(batches, pipeline.execute()))
+        finally:
+            pipeline.reset()
+
     def scan(self, pattern: str) -> None:
         self.keys = self._redis_client.scan_iter(match=pattern)
 
@@ -89,12 +247,149 @@ class RedisClient(Cache):
         except StopIteration:
             return None
 
+    def get_many_after_scan(self, count: int) -> List[dict]:
+        """
+            scan 결과에서 최대 count 개의 key 를 꺼내 MGET 으로 한번에 조회
+            - 조회 사이에 삭제된 key 는 제외
+        """
+        keys = list()
+        for key in self.keys or []:
+            keys.append(key)
+            if len(keys) >= count:
+                break
+        if not keys:
+            return []
+
+        result = list()
+        for key, value in zip(keys, self.mget(keys=keys)):
+            self.copied_keys.append(key)
+            if value is not None:
+                result.append({"key": key, "value": value.decode("utf-8")})
+        return result
+
+    def count_keys(self, pattern: str) -> int:
+        """
+            pattern 에 해당하는 key 수 (전체 key 를 SCAN 하므로 자주 호출하지 않는다.)
+        """
+        return sum(
+            1
+            for _ in self._redis_client.scan_iter(
+                match=pattern, count=self.BATCH_SIZE
+            )
+        )
+
     def set(self, key: Any, value: Any, ex: Union[int, timedelta] = None,) -> None:
         self._redis_client.set(name=key, value=value, ex=ex)
 
+    def get(self, key: str) -> Optional[bytes]:
+        # get_by_key()와 달리 key가 없으면 None 반환
+        return self._redis_client.get(name=key)
+
+    def incr(self, key: str) -> int:
+        return self._redis_client.incr(name=key)
+
+    def mget(self, keys: List[Any]) -> List[Optional[bytes]]:
+        """
+            key 가 없으면 None, 요청한 keys 순서대로 반환
+        """
+        if not keys:
+            return []
+
+        values = dict()
+        for batch, batch_values in self._execute_multi_key_command(
+            command="MGET", keys=keys
+        ):
+            values.update(zip(batch, batch_values))
+        return [values.get(key) for key in keys]
+
+    def mset(self, mapping: Dict[Any, Any], ex: Union[int, timedelta] = None) -> None:
+        """
+            MSET 은 TTL 을 지원하지 않으므로 ex 가 있으면 SET EX 를 pipeline 으로 전송
+        """
+        if not mapping:
+            return
+
+        if ex is None and not self.is_cluster:
+            self._redis_client.mset(mapping)
+            return
+
+        with self.pipeline() as pipeline:
+            for key, value in mapping.items():
+                pipeline.set(name=key, value=value, ex=ex)
+
+    def is_exists(self, key: Any) -> int:
+        return self._redis_client.exists(key)
+
+    def delete(self, key: Any) -> int:
+        return self._redis_client.delete(key)
+
+    def delete_many(self, keys: List[Any]) -> int:
+        if not keys:
+            return 0
+        return sum(
+            count
+            for _, count in self._execute_multi_key_command(command="DEL", keys=keys)
+        )
+
+    def unlink(self, keys: List[Any]) -> int:
+        """
+            DEL 과 같으나 메모리 해제는 redis 에서 비동기로 처리
+        """
+        if not keys:
+            return 0
+        return sum(
+            count
+            for _, count in self._execute_multi_key_command(command="UNLINK", keys=keys)
+        )
+
+    def add_set_members(self, key: str, values: List[Any]) -> int:
+        """
+            SADD : 이미 있는 값은 무시, 새로 추가된 값의 수 반환
+        """
+        if not values:
+            return 0
+        return self._redis_client.sadd(key, *values)
+
+    def get_set_members(self, key: str) -> List[bytes]:
+        """
+            SSCAN 으로 BATCH_SIZE 씩 조회 (큰 set 을 SMEMBERS 로 한번에 조회할 때의 blocking 방지)
+        """
+        return list(self._redis_client.sscan_iter(name=key, count=self.BATCH_SIZE))
+
+    def get_hash_field(self, key: str, field: str) -> Optional[bytes]:
+        return self._redis_client.hget(name=key, key=field)
+
+    def set_hash_field(
+        self, key: str, field: str, value: Any, ex: Union[int, timedelta] = None
+    ) -> None:
+        """
+            HSET + EXPIRE (TTL 은 hash key 전체에 적용)
+        """
+        with self.pipeline() as pipeline:
+            pipeline.hset(name=key, key=field, value=value)
+            if ex is not None:
+                pipeline.expire(name=key, time=ex)
+
+    def get_hash_all(self, key: str) -> Dict[bytes, bytes]:
+        return self._redis_client.hgetall(name=key)
+
+    def rename_if_not_exists(self, key: str, new_key: str) -> bool:
+        """
+            RENAMENX : new_key 가 이미 있으면 변경하지 않고 False
+            - key 가 없으면 ResponseError
+            - RedisCluster 는 두 key 가 같은 slot 이어야 함 (hash tag ex. {prefix}:a)
+        """
+        return bool(self._redis_client.renamenx(key, new_key))
+
     def clear_cache(self) -> None:
-        for key in self.copied_keys:
-            self._redis_client.delete(key)
+        self.unlink(keys=self.copied_keys)
+        self.keys = None
+        self.copied_keys = []
+
+    def reset_scan(self) -> None:
+        """
+            copied_keys 를 삭제하지 않고 scan 상태만 초기화 -> 다음 scan 에서 다시 조회
+        """
         self.keys = None
         self.copied_keys = []
 
@@ -111,3 +406,102 @@ class RedisClient(Cache):
             logger.error(f"[RedisClient][is_available] ping error")
             return False
         return True
+
+    def create_stream_group(self, stream: str, group: str) -> None:
+        """
+            consumer group 생성 (stream 이 없으면 함께 생성), 이미 있으면 무시
+        """
+        try:
+            self._redis_client.xgroup_create(
+                name=stream, groupname=group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def read_stream_group(
+        self, stream: str, group: str, consumer: str, count: int, block: int
+    ) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        """
+            XREADGROUP : 다른 consumer 에게 전달되지 않은 새 메세지 조회
+            - block(ms) 동안 메세지가 없으면 빈 리스트 반환
+        """
+        response = self._redis_client.xreadgroup(
+            groupname=group,
+            consumername=consumer,
+            streams={stream: ">"},
+            count=count,
+            block=block,
+        )
+        if not response:
+            return []
+        return response[0][1]
+
+    def claim_pending_stream(
+        self, stream: str, group: str, consumer: str, min_idle_time: int, count: int
+    ) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        """
+            min_idle_time(ms) 이상 ack 되지 않은 pending 메세지를 consumer 로 가져온다.
+            (처리 중 종료된 worker 의 메세지 복구)
+            - XTRIM / XDEL 로 stream 에서 삭제된 메세지는 처리할 수 없으므로 ack
+              (redis 7 미만은 pending 에 남아 복구 대상 조회를 막음)
+        """
+        pending_list = self._redis_client.xpending_range(
+            name=stream, groupname=group, min="-", max="+", count=count
+        )
+        message_ids = [
+            pending["message_id"]
+            for pending in pending_list
+            if pending["time_since_delivered"] >= min_idle_time
+        ]
+        if not message_ids:
+            return []
+
+        entries = [
+            (message_id, fields)
+            for message_id, fields in self._redis_client.xclaim(
+                name=stream,
+                groupname=group,
+                consumername=consumer,
+                min_idle_time=min_idle_time,
+                message_ids=message_ids,
+            )
+            if fields
+        ]
+
+        # 삭제된 메세지는 redis 버전에 따라 nil / 빈 fields 로 응답 -> stream 에서 직접 확인
+        claimed_ids = {message_id for message_id, _ in entries}
+        deleted_ids = [
+            message_id
+            for message_id in message_ids
+            if message_id not in claimed_ids
+            and not self._redis_client.xrange(
+                stream, min=message_id, max=message_id, count=1
+            )
+        ]
+        if deleted_ids:
+            logger.error(
+                f"[RedisClient][claim_pending_stream] ack deleted entries : "
+                f"{deleted_ids}"
+            )
+            self.ack_stream(stream=stream, group=group, ids=deleted_ids)
+
+        return entries
+
+    def ack_stream(self, stream: str, group: str, ids: List[bytes]) -> int:
+        if not ids:
+            return 0
+        return self._redis_client.xack(stream, group, *ids)
+
+    def get_stream_backlog(self, stream: str, group: str) -> int:
+        """
+            group 이 아직 처리하지 않은 메세지 수
+            - redis 7 이상 : 전달되지 않은 메세지 수(lag) + ack 되지 않은 메세지 수(pending)
+            - 그 외 : pending
+        """
+        for info in self._redis_client.xinfo_groups(name=stream):
+            name = info.get("name")
+            if (name.decode("utf-8") if isinstance(name, bytes) else name) != group:
+                continue
+            return (info.get("lag") or 0) + info.get("pending", 0)
+        return 0
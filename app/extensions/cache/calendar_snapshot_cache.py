@@ -0,0 +1,85 @@
+import json
+from typing import Any, List, Optional
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix, RedisExpire
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+
+class CalendarSnapshotCache:
+    """
+        월별 청약 캘린더 snapshot (SimpleCalendarInfoEntity.dict() 목록, is_like 제외)
+        - key : calendar_snapshot:{version}:{year_month} (월 별 key, 각각 TTL)
+        - sync 에서 real_estates, public_sales 변경 시 version incr 후 이번 달 snapshot 재생성
+            -> 조회 시작 시점의 version 으로 저장하므로 무효화 이전에 DB 조회한 snapshot 은
+               이전 version key 에만 저장됨 (TTL 만료)
+        - 사용자별 is_like 는 요청 시점에 merge (HouseRepository.get_liked_house_ids)
+
+        version = cache.get_version()
+        snapshot = cache.get(version=version, year_month="202108")
+    """
+
+    def __init__(self, client: Cache):
+        self._client = client
+
+    @staticmethod
+    def to_snapshot(entities: List[Any]) -> List[dict]:
+        """
+            entities : SimpleCalendarInfoEntity 목록 -> 사용자 무관 snapshot (is_like=False)
+        """
+        return [dict(entity.dict(), is_like=False) for entity in entities]
+
+    def _make_key(self, version: int, year_month: str) -> str:
+        return f"{RedisKeyPrefix.CALENDAR_SNAPSHOT.value}:{version}:{year_month}"
+
+    def get_version(self) -> Optional[int]:
+        """
+            return : 현재 snapshot version (redis 오류 시 None -> 캐시 사용 안함)
+        """
+        try:
+            version = self._client.get(
+                key=RedisKeyPrefix.CALENDAR_SNAPSHOT_VERSION.value
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[CalendarSnapshotCache][get_version] error : {e}")
+            return None
+
+        return int(version or 0)
+
+    def get(self, version: int, year_month: str) -> Optional[List[dict]]:
+        """
+            return : snapshot (cache miss 또는 redis 오류 시 None)
+        """
+        try:
+            value = self._client.get(
+                key=self._make_key(version=version, year_month=year_month)
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[CalendarSnapshotCache][get] error : {e}")
+            return None
+
+        return json.loads(value) if value is not None else None
+
+    def set(self, version: int, year_month: str, snapshot: List[dict]) -> None:
+        try:
+            self._client.set(
+                key=self._make_key(version=version, year_month=year_month),
+                value=json.dumps(snapshot, ensure_ascii=False),
+                ex=RedisExpire.CALENDAR_SNAPSHOT_TIME.value,
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[CalendarSnapshotCache][set] error : {e}")
+
+    def invalidate(self) -> Optional[int]:
+        """
+            return : 변경된 version (redis 오류 시 None)
+        """
+        try:
+            return self._client.incr(
+                key=RedisKeyPrefix.CALENDAR_SNAPSHOT_VERSION.value
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[CalendarSnapshotCache][invalidate] error : {e}")
+            return None
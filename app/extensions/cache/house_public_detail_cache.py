@@ -0,0 +1,73 @@
+from typing import Optional
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix, RedisExpire
+from app.extensions.utils.log_helper import logger_
+from app.extensions.utils.time_helper import get_server_timestamp
+from core.domains.house.entity.house_entity import HousePublicDetailEntity
+
+logger = logger_.getLogger(__name__)
+
+
+class HousePublicDetailCache:
+    """
+        분양 매물 상세의 사용자 무관 HousePublicDetailEntity 캐싱 (read-through)
+        - is_like, button_links, ticket_usage_results 는 비워서 저장 -> 요청 시점에 merge
+        - key : house_public_detail:{version}:{today}:{house_id}
+            -> version : 매물 동기화 / 분양 관련 batch 후 incr 하여 전체 무효화 (이전 key 는 TTL 만료)
+            -> today : status, is_special_supply_finished 가 오늘 날짜 기준으로 계산되므로 일 단위 분리
+    """
+
+    def __init__(self, client: Cache):
+        self._client = client
+
+    def _make_key(self, house_id: int) -> Optional[str]:
+        try:
+            version = self._client.get(
+                key=RedisKeyPrefix.HOUSE_PUBLIC_DETAIL_VERSION.value
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[HousePublicDetailCache][_make_key] error : {e}")
+            return None
+
+        return (
+            f"{RedisKeyPrefix.HOUSE_PUBLIC_DETAIL.value}:{int(version or 0)}:"
+            f"{get_server_timestamp().strftime('%Y%m%d')}:{house_id}"
+        )
+
+    def get(self, house_id: int) -> Optional[HousePublicDetailEntity]:
+        """
+            return : 캐싱된 entity (cache miss 또는 redis 오류 시 None)
+        """
+        key = self._make_key(house_id=house_id)
+        if not key:
+            return None
+
+        try:
+            value = self._client.get(key=key)
+        except REDIS_ERRORS as e:
+            logger.error(f"[HousePublicDetailCache][get] error : {e}")
+            return None
+
+        return HousePublicDetailEntity.parse_raw(value) if value is not None else None
+
+    def set(self, house_id: int, entity: HousePublicDetailEntity) -> None:
+        key = self._make_key(house_id=house_id)
+        if not key:
+            return
+
+        try:
+            self._client.set(
+                key=key,
+                value=entity.json(),
+                ex=RedisExpire.HOUSE_PUBLIC_DETAIL_TIME.value,
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[HousePublicDetailCache][set] error : {e}")
+
+    @classmethod
+    def bump_version(cls, client: Cache) -> None:
+        try:
+            client.incr(key=RedisKeyPrefix.HOUSE_PUBLIC_DETAIL_VERSION.value)
+        except REDIS_ERRORS as e:
+            logger.error(f"[HousePublicDetailCache][bump_version] error : {e}")
@@ -0,0 +1,227 @@
+import json
+import math
+from typing import List, Optional, Tuple, Set, Dict
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix, RedisExpire
+from app.extensions.utils.log_helper import logger_
+from core.domains.house.dto.house_dto import CoordinatesRangeDto
+from core.domains.house.enum.house_enum import BoundingLevelEnum
+
+logger = logger_.getLogger(__name__)
+
+
+class MapTileCache:
+    """
+        지도 bounding 결과를 web mercator tile 단위로 캐싱한다.
+        - viewport -> 요청 level 기준 tile 목록으로 변환 후 tile 별로 조회/저장
+        - key : bounding_tile:{global_version}:{version}:{level}:{x}:{y}:{filter_key}
+            -> filter_key : private_type, public_type, public_status, include_private, min_area, max_area
+        - version : SELECT_QUERYSET_FLAG_LEVEL 기준 상위 tile 의 version
+            -> 매물 변경 시 해당 좌표의 상위 tile version 을 incr 하여 하위 level tile 전체를 무효화
+            -> 이전 version 의 key 는 TTL 로 만료된다.
+    """
+
+    # viewport 가 너무 넓으면(비정상 요청) 캐시를 사용하지 않고 바로 조회한다.
+    MAX_TILE_COUNT = 64
+    GLOBAL_VERSION = "all"
+
+    def __init__(self, client: Cache):
+        self._client = client
+
+    @classmethod
+    def get_tile(cls, longitude: float, latitude: float, level: int) -> Tuple[int, int]:
+        n = 2 ** level
+        lat_rad = math.radians(latitude)
+        x = int((longitude + 180.0) / 360.0 * n)
+        y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+    @classmethod
+    def get_tile_bounds(
+        cls, x: int, y: int, level: int
+    ) -> Tuple[float, float, float, float]:
+        """
+            CoordinatesRangeDto 와 같은 순서로 반환한다.
+            (start_x: 서쪽 경도, start_y: 북쪽 위도, end_x: 동쪽 경도, end_y: 남쪽 위도)
+        """
+        n = 2 ** level
+
+        def tile_to_longitude(tile_x: int) -> float:
+            return tile_x / n * 360.0 - 180.0
+
+        def tile_to_latitude(tile_y: int) -> float:
+            return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+        return (
+            tile_to_longitude(x),
+            tile_to_latitude(y),
+            tile_to_longitude(x + 1),
+            tile_to_latitude(y + 1),
+        )
+
+    @classmethod
+    def get_tiles_bounds(
+        cls, tiles: List[Tuple[int, int]], level: int
+    ) -> Tuple[float, float, float, float]:
+        """
+            tile 목록을 모두 포함하는 범위 (get_tile_bounds 와 같은 순서)
+        """
+        start_x, start_y, _, _ = cls.get_tile_bounds(
+            x=min(x for x, _ in tiles), y=min(y for _, y in tiles), level=level
+        )
+        _, _, end_x, end_y = cls.get_tile_bounds(
+            x=max(x for x, _ in tiles), y=max(y for _, y in tiles), level=level
+        )
+        return start_x, start_y, end_x, end_y
+
+    @classmethod
+    def get_tile_range(cls, dto: CoordinatesRangeDto) -> Tuple[int, int, int, int]:
+        start_x, end_x = min(dto.start_x, dto.end_x), max(dto.start_x, dto.end_x)
+        start_y, end_y = max(dto.start_y, dto.end_y), min(dto.start_y, dto.end_y)
+
+        min_tile_x, min_tile_y = cls.get_tile(
+            longitude=start_x, latitude=start_y, level=dto.level
+        )
+        max_tile_x, max_tile_y = cls.get_tile(
+            longitude=end_x, latitude=end_y, level=dto.level
+        )
+
+        return min_tile_x, min_tile_y, max_tile_x, max_tile_y
+
+    @classmethod
+    def get_tiles(cls, dto: CoordinatesRangeDto) -> List[Tuple[int, int]]:
+        min_tile_x, min_tile_y, max_tile_x, max_tile_y = cls.get_tile_range(dto=dto)
+        return [
+            (x, y)
+            for x in range(min_tile_x, max_tile_x + 1)
+            for y in range(min_tile_y, max_tile_y + 1)
+        ]
+
+    @classmethod
+    def make_filter_key(cls, dto: CoordinatesRangeDto) -> str:
+        public_status = (
+            ",".join(str(status) for status in sorted(dto.public_status))
+            if dto.public_status
+            else ""
+        )
+        return (
+            f"{dto.private_type}:{dto.public_type}:{public_status}:"
+            f"{dto.include_private}:{dto.min_area}:{dto.max_area}"
+        )
+
+    def _get_versions(self, keys: List[str]) -> Dict[str, int]:
+        return {
+            key: int(version) if version else 0
+            for key, version in zip(keys, self._client.mget(keys=keys))
+        }
+
+    def _get_parent_tile(self, x: int, y: int, level: int) -> Tuple[int, int]:
+        shift = max(level - BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value, 0)
+        return x >> shift, y >> shift
+
+    def _make_global_version_key(self) -> str:
+        return f"{RedisKeyPrefix.BOUNDING_TILE_VERSION.value}:{self.GLOBAL_VERSION}"
+
+    def _make_version_key(self, x: int, y: int) -> str:
+        return (
+            f"{RedisKeyPrefix.BOUNDING_TILE_VERSION.value}:"
+            f"{BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value}:{x}:{y}"
+        )
+
+    def get_tile_keys(
+        self, dto: CoordinatesRangeDto
+    ) -> Optional[Dict[Tuple[int, int], str]]:
+        """
+            viewport 에 걸치는 tile 별 cache key 를 만든다.
+            (version 은 tile 마다 조회하지 않고 상위 tile version 을 MGET 으로 한번에 조회)
+            tile 수가 MAX_TILE_COUNT 를 넘거나 redis 오류 시 None 반환 -> 캐시 없이 조회
+        """
+        min_tile_x, min_tile_y, max_tile_x, max_tile_y = self.get_tile_range(dto=dto)
+        tile_count = (max_tile_x - min_tile_x + 1) * (max_tile_y - min_tile_y + 1)
+        if tile_count > self.MAX_TILE_COUNT:
+            return None
+
+        filter_key = self.make_filter_key(dto=dto)
+        parent_tiles = {
+            (x, y): self._get_parent_tile(x=x, y=y, level=dto.level)
+            for x, y in self.get_tiles(dto=dto)
+        }
+        global_version_key = self._make_global_version_key()
+        version_keys = {
+            parent_tile: self._make_version_key(x=parent_tile[0], y=parent_tile[1])
+            for parent_tile in set(parent_tiles.values())
+        }
+        try:
+            versions = self._get_versions(
+                keys=[global_version_key, *version_keys.values()]
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[MapTileCache][get_tile_keys] error : {e}")
+            return None
+
+        tile_keys = dict()
+        for (x, y), parent_tile in parent_tiles.items():
+            version = versions[version_keys[parent_tile]]
+            tile_keys[(x, y)] = (
+                f"{RedisKeyPrefix.BOUNDING_TILE.value}:{versions[global_version_key]}:"
+                f"{version}:{dto.level}:{x}:{y}:{filter_key}"
+            )
+        return tile_keys
+
+    def get_tile_values(self, keys: List[str]) -> Dict[str, Optional[List[dict]]]:
+        """
+            return : key -> tile 값 (cache miss 또는 redis 오류 시 None)
+        """
+        try:
+            values = self._client.mget(keys=keys)
+        except REDIS_ERRORS as e:
+            logger.error(f"[MapTileCache][get_tile_values] error : {e}")
+            return {key: None for key in keys}
+
+        return {
+            key: json.loads(value) if value is not None else None
+            for key, value in zip(keys, values)
+        }
+
+    def set_tile_values(self, tile_values: Dict[str, List[dict]]) -> None:
+        try:
+            self._client.mset(
+                mapping={
+                    key: json.dumps(value, ensure_ascii=False)
+                    for key, value in tile_values.items()
+                },
+                ex=RedisExpire.BOUNDING_TILE_TIME.value,
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[MapTileCache][set_tile_values] error : {e}")
+
+    def invalidate(self, coordinates: List[Tuple[float, float]]) -> int:
+        """
+            coordinates : (longitude, latitude) 목록
+            return : 무효화된 상위 tile 수
+        """
+        parent_tiles: Set[Tuple[int, int]] = {
+            self.get_tile(
+                longitude=longitude,
+                latitude=latitude,
+                level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value,
+            )
+            for longitude, latitude in coordinates
+            if longitude is not None and latitude is not None
+        }
+
+        try:
+            with self._client.pipeline() as pipeline:
+                for x, y in parent_tiles:
+                    pipeline.incr(self._make_version_key(x=x, y=y))
+        except REDIS_ERRORS as e:
+            logger.error(f"[MapTileCache][invalidate] error : {e}")
+
+        return len(parent_tiles)
+
+    def invalidate_all(self) -> None:
+        try:
+            self._client.incr(key=self._make_global_version_key())
+        except REDIS_ERRORS as e:
+            logger.error(f"[MapTileCache][invalidate_all] error : {e}")
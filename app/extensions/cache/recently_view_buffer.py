@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import List
+
+from redis import ResponseError
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from app.extensions.utils.log_helper import logger_
+from app.extensions.utils.time_helper import get_server_timestamp
+from core.domains.user.dto.user_dto import RecentlyViewDto
+
+logger = logger_.getLogger(__name__)
+
+
+class RecentlyViewBuffer:
+    """
+        최근 본 매물 write-behind buffer
+        - add : HSET {user_id}:{house_id}:{type} = 조회 시각 (중복 조회는 마지막 시각으로 합쳐짐)
+        - flush (FlushRecentlyViewUseCase)
+            1. buffer -> flushing 으로 RENAMENX (이후 조회는 새 buffer 에 쌓임)
+               -> 다른 worker 가 먼저 만든 flushing 을 덮어쓰지 않음
+            2. flushing 전체를 batch upsert 후 삭제
+            -> DB 장애 등으로 upsert 실패 시 flushing 이 남아 다음 flush 에서 재처리 (upsert 는 멱등)
+    """
+
+    def __init__(self, client: Cache):
+        self._client = client
+
+    def add(self, dto: RecentlyViewDto) -> bool:
+        """
+            return : buffer 저장 실패 시 False -> 호출하는 쪽에서 바로 DB 저장
+        """
+        try:
+            self._client.set_hash_field(
+                key=RedisKeyPrefix.RECENTLY_VIEW_BUFFER.value,
+                field=f"{dto.user_id}:{dto.house_id}:{dto.type}",
+                value=get_server_timestamp().isoformat(),
+            )
+        except REDIS_ERRORS as e:
+            logger.error(f"[RecentlyViewBuffer][add] error : {e}")
+            return False
+        return True
+
+    def get_flush_list(self) -> List[dict]:
+        """
+            이전 flush 가 실패해서 flushing 이 남아있으면 그대로 재처리, 없으면 buffer 를 flushing 으로 이동
+            return : [dict(user_id, house_id, type, viewed_at)]
+        """
+        flushing_key = RedisKeyPrefix.RECENTLY_VIEW_FLUSHING.value
+        if not self._client.is_exists(flushing_key):
+            try:
+                # False : 그 사이 다른 worker 가 flushing 생성 -> 해당 flushing 처리
+                self._client.rename_if_not_exists(
+                    key=RedisKeyPrefix.RECENTLY_VIEW_BUFFER.value, new_key=flushing_key
+                )
+            except ResponseError as e:
+                if "no such key" not in str(e).lower():
+                    raise
+                # buffer 없음 -> flush 대상 없음
+                return []
+
+        flush_list = list()
+        for field, value in self._client.get_hash_all(key=flushing_key).items():
+            try:
+                user_id, house_id, type_ = field.decode().split(":")
+                flush_list.append(
+                    dict(
+                        user_id=int(user_id),
+                        house_id=int(house_id),
+                        type=int(type_),
+                        viewed_at=datetime.fromisoformat(value.decode()),
+                    )
+                )
+            except ValueError as e:
+                # 형식이 잘못된 field 는 제외 (flush 완료 시 함께 삭제)
+                logger.error(
+                    f"[RecentlyViewBuffer][get_flush_list] invalid field {field} : {e}"
+                )
+        return flush_list
+
+    def complete_flush(self) -> None:
+        self._client.delete(key=RedisKeyPrefix.RECENTLY_VIEW_FLUSHING.value)
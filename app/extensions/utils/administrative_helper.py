@@ -0,0 +1,126 @@
+import math
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.domains.house.enum.house_enum import CalcPyoungEnum, DivisionLevelEnum
+
+EMPTY_LEGAL_CODE = "00000"
+# 세종특별자치시는 시군구(level 2) 행정구역이 없음
+SEJONG_LEGAL_CODE_PREFIX = "36"
+APARTMENT = "아파트"
+OFFICETEL = "오피스텔"
+
+# (front_legal_code, back_legal_code, level)
+DivisionKey = Tuple[str, str, DivisionLevelEnum]
+
+
+class AdministrativePriceRow(NamedTuple):
+    """
+        private_sale 1건의 (건물 타입, 거래 타입) 별 합계 (HouseRepository.get_common_query_object 1 row)
+    """
+
+    real_estate_id: int
+    front_legal_code: str
+    back_legal_code: str
+    building_type: str
+    trade_type: str
+    pyoung: Optional[float]
+    trade_price: int
+    deposit_price: int
+
+
+def round_half_up(value: float) -> int:
+    # postgresql round(numeric) 와 동일 (.5 는 0 에서 먼 쪽으로)
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+class AdministrativeAvgPriceRollup:
+    """
+        행정구역 level 1 ~ 3 평균가를 1번의 순회로 계산 (SQL GROUPING SETS 집계의 in-memory 버전)
+        - level 1 : 법정코드 앞 2자리 + "000" / level 2 : front_legal_code / level 3 : front + back
+        - (행정구역, 건물 타입, 거래 타입) 별 round(sum(가격) / sum(평수)) * 34 -> 행정구역 별 합산
+        - 결과는 (front_legal_code, back_legal_code, level) 로 administrative_divisions 에 bind
+          -> HouseRepository.set_administrative_division_id
+
+        rollup = AdministrativeAvgPriceRollup()
+        rollup.add_all(rows=rows)  # 월별 backfill 시 조회 기간만 바꿔서 사용
+        result_list = rollup.get_result_list()
+    """
+
+    def __init__(self):
+        # (행정구역, 건물 타입, 거래 타입) -> [sum(pyoung), sum(trade), sum(deposit)]
+        self._sums: Dict[Tuple[DivisionKey, str, str], List[float]] = dict()
+
+    def _get_division_keys(self, row: AdministrativePriceRow) -> List[DivisionKey]:
+        front_legal_code = row.front_legal_code or EMPTY_LEGAL_CODE
+        if front_legal_code == EMPTY_LEGAL_CODE:
+            return []
+
+        back_legal_code = row.back_legal_code or EMPTY_LEGAL_CODE
+        keys = [
+            (f"{front_legal_code[:2]}000", EMPTY_LEGAL_CODE, DivisionLevelEnum.LEVEL_1),
+            (front_legal_code, back_legal_code, DivisionLevelEnum.LEVEL_3),
+        ]
+        if not front_legal_code.startswith(SEJONG_LEGAL_CODE_PREFIX):
+            keys.append((front_legal_code, EMPTY_LEGAL_CODE, DivisionLevelEnum.LEVEL_2))
+        return keys
+
+    def add(self, row: AdministrativePriceRow) -> None:
+        for division_key in self._get_division_keys(row=row):
+            sums = self._sums.setdefault(
+                (division_key, row.building_type, row.trade_type), [0.0, 0, 0]
+            )
+            # 평수가 없는 거래(NULL)는 가격만 합산 (SQL sum 과 동일)
+            sums[0] += row.pyoung or 0
+            sums[1] += row.trade_price or 0
+            sums[2] += row.deposit_price or 0
+
+    def add_all(self, rows: Iterable[AdministrativePriceRow]) -> None:
+        for row in rows:
+            self.add(row=row)
+
+    def _get_per_price(self, sum_price: int, sum_pyoung: float) -> int:
+        if not sum_pyoung:
+            return 0
+        return (
+            round_half_up(sum_price / sum_pyoung)
+            * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
+        )
+
+    def get_result_list(self) -> List[dict]:
+        """
+            return : update_avg_price_to_administrative_division 입력 형태 (id 제외)
+        """
+        results: Dict[DivisionKey, dict] = dict()
+        for (
+            (division_key, building_type, _),
+            (sum_pyoung, sum_trade_price, sum_deposit_price),
+        ) in self._sums.items():
+            front_legal_code, back_legal_code, level = division_key
+            result = results.setdefault(
+                division_key,
+                dict(
+                    front_legal_code=front_legal_code,
+                    back_legal_code=back_legal_code,
+                    apt_trade_price=0,
+                    apt_deposit_price=0,
+                    op_trade_price=0,
+                    op_deposit_price=0,
+                    public_sale_price=0,
+                    level=level,
+                ),
+            )
+            if building_type == APARTMENT:
+                prefix = "apt"
+            elif building_type == OFFICETEL:
+                prefix = "op"
+            else:
+                continue
+
+            result[f"{prefix}_trade_price"] += self._get_per_price(
+                sum_price=sum_trade_price, sum_pyoung=sum_pyoung
+            )
+            result[f"{prefix}_deposit_price"] += self._get_per_price(
+                sum_price=sum_deposit_price, sum_pyoung=sum_pyoung
+            )
+
+        return list(results.values())
@@ -0,0 +1,192 @@
+from concurrent.futures import Executor, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from time import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.extensions.utils.enum.batch_enum import BatchStatusEnum
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+
+class BatchNode(NamedTuple):
+    """
+        func : 인자 없이 호출, 처리 건수 dict 반환 (실패 시 예외 발생)
+        - process pool 에서 실행되므로 pickle 가능해야 함 (module level 함수 or partial)
+    """
+
+    name: str
+    func: Callable[[], Optional[dict]]
+    depends_on: Tuple[str, ...] = ()
+
+
+class BatchResult(NamedTuple):
+    name: str
+    status: str
+    seconds: float = 0.0
+    counts: Optional[dict] = None
+    error: Optional[str] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.status == BatchStatusEnum.SUCCESS.value
+
+
+def run_batch_node(name: str, func: Callable[[], Optional[dict]]) -> BatchResult:
+    """
+        worker process 에서 node 1개 실행
+        - 예외, exit() 모두 BatchResult 로 변환 (pool 로 SystemExit 이 전달되지 않도록)
+    """
+    start_time = time()
+    try:
+        counts = func()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return BatchResult(
+                name=name,
+                status=BatchStatusEnum.FAILED.value,
+                seconds=time() - start_time,
+                error=f"exit code : {e.code}",
+            )
+        counts = None
+    except Exception as e:
+        logger.error(f"[run_batch_node][{name}] error : {e}")
+        return BatchResult(
+            name=name,
+            status=BatchStatusEnum.FAILED.value,
+            seconds=time() - start_time,
+            error=str(e),
+        )
+
+    return BatchResult(
+        name=name,
+        status=BatchStatusEnum.SUCCESS.value,
+        seconds=time() - start_time,
+        counts=counts,
+    )
+
+
+class BatchDagRunner:
+    """
+        의존 관계(DAG)로 선언한 batch node 실행기
+        - 선행 node 가 모두 성공한 node 부터 process pool 에서 동시 실행
+        - 선행 node 가 실패 / skip 되면 후행 node 는 SKIPPED
+        - run(completed=...) : 이전 실행에서 성공한 node 는 건너뛰고 실패 지점부터 재개
+        - on_result : node 완료 시마다 호출 (실행 상태 저장용)
+    """
+
+    def __init__(
+        self,
+        nodes: List[BatchNode],
+        max_workers: int = 4,
+        executor_factory: Optional[Callable[[], Executor]] = None,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+    ):
+        self._nodes = {node.name: node for node in nodes}
+        if len(self._nodes) != len(nodes):
+            raise ValueError("duplicated batch node name")
+
+        self.max_workers = max_workers
+        self._executor_factory = executor_factory or (
+            lambda: ProcessPoolExecutor(max_workers=self.max_workers)
+        )
+        self._on_result = on_result
+        self.order = self._get_topological_order()
+
+    def _get_topological_order(self) -> List[str]:
+        for node in self._nodes.values():
+            for dependency in node.depends_on:
+                if dependency not in self._nodes:
+                    raise ValueError(
+                        f"unknown dependency : {node.name} -> {dependency}"
+                    )
+
+        order = list()
+        in_degrees = {
+            name: len(node.depends_on) for name, node in self._nodes.items()
+        }
+        ready = [name for name, in_degree in in_degrees.items() if not in_degree]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for node in self._nodes.values():
+                if name in node.depends_on:
+                    in_degrees[node.name] -= 1
+                    if not in_degrees[node.name]:
+                        ready.append(node.name)
+
+        if len(order) != len(self._nodes):
+            raise ValueError("batch nodes have a cycle")
+        return order
+
+    def _set_result(self, results: Dict[str, BatchResult], result: BatchResult):
+        results[result.name] = result
+        if self._on_result:
+            self._on_result(result)
+
+    def run(
+        self, completed: Optional[Dict[str, BatchResult]] = None
+    ) -> Dict[str, BatchResult]:
+        """
+            return : {node 이름: BatchResult} (DAG 순서)
+        """
+        results = {
+            name: result
+            for name, result in (completed or dict()).items()
+            if name in self._nodes and result.is_success
+        }
+        for name in results:
+            logger.info(f"[BatchDagRunner] {name} : already succeeded, skip")
+
+        pending = [name for name in self.order if name not in results]
+        running = dict()
+
+        with self._executor_factory() as executor:
+            while pending or running:
+                # 위상 정렬 순서로 확인 -> 연쇄 SKIPPED 도 1번에 처리
+                for name in list(pending):
+                    dependencies = self._nodes[name].depends_on
+                    failed_dependencies = [
+                        dependency
+                        for dependency in dependencies
+                        if dependency in results and not results[dependency].is_success
+                    ]
+                    if failed_dependencies:
+                        pending.remove(name)
+                        self._set_result(
+                            results,
+                            BatchResult(
+                                name=name,
+                                status=BatchStatusEnum.SKIPPED.value,
+                                error=f"upstream failed : {failed_dependencies}",
+                            ),
+                        )
+                    elif all(dependency in results for dependency in dependencies):
+                        pending.remove(name)
+                        logger.info(f"[BatchDagRunner] {name} : start")
+                        future = executor.submit(
+                            run_batch_node, name, self._nodes[name].func
+                        )
+                        running[future] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # worker process 비정상 종료 등
+                        result = BatchResult(
+                            name=name,
+                            status=BatchStatusEnum.FAILED.value,
+                            error=str(e),
+                        )
+                    logger.info(
+                        f"[BatchDagRunner] {name} : {result.status}, "
+                        f"{result.seconds:.2f} secs, counts : {result.counts}"
+                    )
+                    self._set_result(results, result)
+
+        return {name: results[name] for name in self.order if name in results}
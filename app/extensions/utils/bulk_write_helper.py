@@ -0,0 +1,231 @@
+import csv
+import io
+import json
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from sqlalchemy import Table, text
+
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+# COPY (FORMAT csv) NULL 표기 -> 빈 문자열과 NULL 구분
+COPY_NULL = r"\N"
+
+# 연결 끊김 등 row 와 무관한 DB-API 예외 (sqlalchemy.exc 래핑 / psycopg2 원본 모두 같은 이름)
+NON_DATA_ERROR_NAMES = ("OperationalError", "InterfaceError")
+
+
+class BulkWriteResult(NamedTuple):
+    row_count: int
+    # bisect 로 분리된 실패 row
+    failure_rows: List[dict]
+
+
+def is_non_data_error(e: Exception) -> bool:
+    """
+        OperationalError / InterfaceError (연결 끊김, timeout 등), connection invalidate
+        -> 나누어 재시도해도 모두 실패하므로 실패 row 로 기록하지 않음
+        - raise ... from e 로 래핑된 경우 __cause__ 까지 확인
+    """
+    while e is not None:
+        if getattr(e, "connection_invalidated", False):
+            return True
+        if any(cls.__name__ in NON_DATA_ERROR_NAMES for cls in type(e).__mro__):
+            return True
+        e = e.__cause__
+    return False
+
+
+def bisect_write(
+    rows: List[dict], write: Callable[[List[dict]], None]
+) -> Tuple[List[dict], List[dict]]:
+    """
+        write(rows) 실패 시 반으로 나누어 재시도 -> 실패 row 만 분리
+        - write : 실패 시 예외 발생, commit / rollback 은 write 에서 처리
+        - 불량 row k 개 -> 약 2k * log2(len(rows)) 번 write (row 단위 재시도 n 번 대신)
+        - 연결 끊김 등 row 와 무관한 예외(is_non_data_error)는 bisect 하지 않고 그대로 raise
+        return : (성공 rows, 실패 rows)
+    """
+    if not rows:
+        return [], []
+
+    try:
+        write(rows)
+        return rows, []
+    except Exception as e:
+        if is_non_data_error(e):
+            raise
+        if len(rows) == 1:
+            logger.info(f"[bisect_write] failed row : {e}")
+            return [], rows
+
+    mid = len(rows) // 2
+    left_success, left_failure = bisect_write(rows=rows[:mid], write=write)
+    right_success, right_failure = bisect_write(rows=rows[mid:], write=write)
+    return left_success + right_success, left_failure + right_failure
+
+
+class BulkWriter:
+    """
+        대량 insert / update 공통 처리 (chunk_size 단위 write + commit)
+        - postgresql : insert -> COPY FROM STDIN / update -> temp table COPY + UPDATE ... FROM
+        - 그 외 (sqlite 테스트 등) : executemany insert / bulk_update_mappings
+        - 실패 chunk 만 rollback -> bisect_write 로 실패 row 분리 (BulkWriteResult.failure_rows)
+
+        writer = BulkWriter(session=session, chunk_size=1000)
+        result = writer.insert(model=PrivateSaleAvgPriceModel, rows=create_list)
+    """
+
+    def __init__(self, session: Any, chunk_size: int = 1000):
+        self._session = session
+        self.chunk_size = chunk_size
+
+    @property
+    def is_postgresql(self) -> bool:
+        return self._session.get_bind().dialect.name == "postgresql"
+
+    def insert(self, model: Any, rows: Iterable[dict]) -> BulkWriteResult:
+        return self.write(
+            rows=rows, write_chunk=partial(self._insert_chunk, model.__table__)
+        )
+
+    def update(self, model: Any, rows: Iterable[dict]) -> BulkWriteResult:
+        """
+            rows : id + 변경 컬럼 (bulk_update_mappings 입력과 동일)
+        """
+        return self.write(rows=rows, write_chunk=partial(self._update_chunk, model))
+
+    def write(
+        self, rows: Iterable[dict], write_chunk: Callable[[List[dict]], None]
+    ) -> BulkWriteResult:
+        row_count = 0
+        failure_rows = list()
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+
+            success, failure = bisect_write(
+                rows=chunk, write=partial(self._commit_chunk, write_chunk)
+            )
+            row_count += len(success)
+            failure_rows.extend(failure)
+
+        return BulkWriteResult(row_count=row_count, failure_rows=failure_rows)
+
+    def _commit_chunk(
+        self, write_chunk: Callable[[List[dict]], None], chunk: List[dict]
+    ) -> None:
+        try:
+            write_chunk(chunk)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def _group_by_columns(
+        self, table: Table, rows: List[dict]
+    ) -> Dict[Tuple[str, ...], List[dict]]:
+        """
+            row 마다 key 구성이 다를 수 있으므로 컬럼 구성 별로 분리 (테이블 컬럼이 아닌 key 제외)
+        """
+        table_columns = set(table.columns.keys())
+        groups: Dict[Tuple[str, ...], List[dict]] = dict()
+        for row in rows:
+            data = {key: value for key, value in row.items() if key in table_columns}
+            groups.setdefault(tuple(sorted(data)), []).append(data)
+        return groups
+
+    def _set_defaults(self, table: Table, rows: List[dict]) -> List[dict]:
+        """
+            COPY 는 python side default(Column(default=...))를 적용하지 않음 -> 직접 채움
+        """
+        defaults = {
+            column.key: column.default
+            for column in table.columns
+            if column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        }
+        result = list()
+        for row in rows:
+            data = dict(row)
+            for key, default in defaults.items():
+                if key not in data:
+                    data[key] = (
+                        default.arg if default.is_scalar else default.arg(None)
+                    )
+            result.append(data)
+        return result
+
+    def _to_copy_value(self, value: Any) -> Any:
+        if value is None:
+            return COPY_NULL
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return value
+
+    def _copy(self, table_name: str, columns: Tuple[str, ...], rows: List[dict]):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([self._to_copy_value(row[column]) for column in columns])
+        buffer.seek(0)
+
+        column_names = ", ".join(f'"{column}"' for column in columns)
+        cursor = self._session.connection().connection.cursor()
+        cursor.copy_expert(
+            f"COPY {table_name} ({column_names}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+
+    def _insert_chunk(self, table: Table, chunk: List[dict]) -> None:
+        groups = self._group_by_columns(
+            table=table, rows=self._set_defaults(table=table, rows=chunk)
+        )
+        for columns, rows in groups.items():
+            if self.is_postgresql:
+                self._copy(table_name=table.name, columns=columns, rows=rows)
+            else:
+                self._session.execute(table.insert(), rows)
+
+    def _update_chunk(self, model: Any, chunk: List[dict]) -> None:
+        if not self.is_postgresql:
+            self._session.bulk_update_mappings(model, chunk)
+            return
+
+        table = model.__table__
+        temp_table_name = f"temp_bulk_update_{table.name}"
+        for columns, rows in self._group_by_columns(table=table, rows=chunk).items():
+            if "id" not in columns:
+                raise ValueError(f"update rows must have id : {table.name}")
+
+            set_columns = [
+                f'"{column}" = t."{column}"' for column in columns if column != "id"
+            ]
+            if "updated_at" in table.columns and "updated_at" not in columns:
+                # bulk_update_mappings 의 onupdate=func.now() 와 동일
+                set_columns.append('"updated_at" = now()')
+
+            column_names = ", ".join(f'"{column}"' for column in columns)
+            self._session.execute(
+                text(
+                    f"CREATE TEMP TABLE {temp_table_name} ON COMMIT DROP AS "
+                    f"SELECT {column_names} FROM {table.name} WITH NO DATA"
+                )
+            )
+            self._copy(table_name=temp_table_name, columns=columns, rows=rows)
+            self._session.execute(
+                text(
+                    f"UPDATE {table.name} SET {', '.join(set_columns)} "
+                    f"FROM {temp_table_name} AS t WHERE {table.name}.id = t.id"
+                )
+            )
+            # 같은 chunk 안의 다른 컬럼 구성에서 temp table 재생성
+            self._session.execute(text(f"DROP TABLE {temp_table_name}"))
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BatchStatusEnum(Enum):
+    SUCCESS = "success"
+    FAILED = "failed"
+    # 선행 node 실패로 실행하지 않음
+    SKIPPED = "skipped"
@@ -3,7 +3,33 @@ from enum import Enum
 
 class RedisKeyPrefix(Enum):
     MOBILE_AUTH = "mobile_auth"
+    BOUNDING_TILE = "bounding_tile"
+    BOUNDING_TILE_VERSION = "bounding_tile_version"
+    SPATIAL_INDEX_VERSION = "spatial_index_version"
+    SEARCH_INDEX_VERSION = "search_index_version"
+    # 평균가 재계산 대상 private_sale_id (SyncDataUseCase -> PreCalculateAverageUseCase)
+    PRIVATE_SALE_AVG_DIRTY = "private_sale_avg_dirty"
+    # 재계산 중인 dirty set -> RENAME 하므로 dirty key 이름을 hash tag 로 사용 (같은 slot)
+    PRIVATE_SALE_AVG_PROCESSING = "{private_sale_avg_dirty}:processing"
+    # house batch DAG node 별 실행 결과 (실패 node 부터 재개)
+    HOUSE_BATCH_STATE = "house_batch_state"
+    # 월별 청약 캘린더 snapshot ({prefix}:{version}:{year_month})
+    CALENDAR_SNAPSHOT = "calendar_snapshot"
+    CALENDAR_SNAPSHOT_VERSION = "calendar_snapshot_version"
+    # 분양 매물 상세 (사용자 무관 entity)
+    HOUSE_PUBLIC_DETAIL = "house_public_detail"
+    HOUSE_PUBLIC_DETAIL_VERSION = "house_public_detail_version"
+    # 최근 본 매물 write-behind buffer (hash) -> flush 시 RENAME 하므로 같은 hash tag 사용
+    RECENTLY_VIEW_BUFFER = "{recently_view}:buffer"
+    RECENTLY_VIEW_FLUSHING = "{recently_view}:flushing"
+    # "sync:*" scan 패턴에 포함되지 않도록 prefix 를 분리
+    SYNC_STREAM = "sync_stream"
+    SYNC_STREAM_GROUP = "sync_stream_group"
 
 
 class RedisExpire(Enum):
     MOBILE_AUTH_TIME = 180
+    BOUNDING_TILE_TIME = 600
+    HOUSE_BATCH_STATE_TIME = 86400
+    CALENDAR_SNAPSHOT_TIME = 86400
+    HOUSE_PUBLIC_DETAIL_TIME = 86400
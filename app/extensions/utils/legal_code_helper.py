@@ -0,0 +1,158 @@
+import re
+from typing import Dict, List, Optional, Tuple, NamedTuple
+
+from core.domains.house.entity.house_entity import (
+    AdministrativeDivisionLegalCodeEntity,
+    RealEstateLegalCodeEntity,
+    LegalCodeUnmatchedEntity,
+)
+from core.domains.house.enum.house_enum import LegalCodeUnmatchedReasonEnum
+
+# 예) 용산동2가
+DONG_GA_PATTERN = re.compile(r"\D*동\d가")
+# 예) 안양1동
+NUMBER_DONG_PATTERN = re.compile(r"\D*\d동")
+GA_PATTERN = re.compile(r"[0-9]+가")
+NUMBER_PATTERN = re.compile(r"[0-9]+")
+
+# 예외) 충주 목행동 + 용탄동 -> 목행.용탄동 통합
+MERGED_DONG_NAME = "목행.용탄동"
+MERGED_DONG_SOURCES = ("목행동", "용탄동")
+
+
+class AdministrativeDocument(NamedTuple):
+    seq: int
+    entity: AdministrativeDivisionLegalCodeEntity
+    # 공백, '.' 제거한 행정구역 전체 이름
+    name: str
+    is_number_dong: bool
+
+
+class LegalCodeMatcher:
+    """
+        real_estates -> administrative_divisions 법정코드 매칭
+        - 행정구역은 build 시 1번만 정규화하여 동 이름('.' 제거) 별로 dictionary 에 저장
+        - 매물은 가능한 동 이름 후보(원본, 동N가 -> 동, N동 -> 동, 목행.용탄동)로만 조회
+          -> 같은 동 이름의 행정구역(보통 1 ~ 수 건)만 시도 / 시군구 / 지번주소 비교
+        - 매칭 규칙, 우선 순위(행정구역 목록 순서)는 기존 전체 비교 방식과 동일
+    """
+
+    def __init__(
+        self, administrative_info: List[AdministrativeDivisionLegalCodeEntity]
+    ):
+        self._dong_index: Dict[str, List[AdministrativeDocument]] = dict()
+        for seq, administrative in enumerate(administrative_info):
+            self._dong_index.setdefault(
+                administrative.short_name.replace(".", ""), []
+            ).append(
+                AdministrativeDocument(
+                    seq=seq,
+                    entity=administrative,
+                    name=administrative.name.replace(" ", "").replace(".", ""),
+                    is_number_dong=bool(
+                        NUMBER_DONG_PATTERN.match(administrative.short_name)
+                    ),
+                )
+            )
+
+    def _get_dong_candidates(self, real_estate: RealEstateLegalCodeEntity) -> List[str]:
+        dong_myun = real_estate.dong_myun
+        if dong_myun in MERGED_DONG_SOURCES:
+            return [MERGED_DONG_NAME]
+
+        candidates = [dong_myun]
+        if DONG_GA_PATTERN.match(dong_myun):
+            candidates.append(GA_PATTERN.sub("", dong_myun))
+        if NUMBER_DONG_PATTERN.match(real_estate.jibun_address):
+            candidates.extend(
+                [NUMBER_PATTERN.sub("", candidate) for candidate in candidates]
+            )
+        return candidates
+
+    def _is_matched(
+        self,
+        real_estate: RealEstateLegalCodeEntity,
+        administrative: AdministrativeDocument,
+    ) -> bool:
+        dong_myun_ = real_estate.dong_myun
+        if DONG_GA_PATTERN.match(dong_myun_):
+            dong_myun_without_ga = GA_PATTERN.sub("", dong_myun_)
+            if administrative.entity.short_name == dong_myun_without_ga:
+                dong_myun_ = dong_myun_without_ga
+
+        jibun_address_ = real_estate.jibun_address
+        if (
+            NUMBER_DONG_PATTERN.match(jibun_address_)
+            and not administrative.is_number_dong
+        ):
+            jibun_address_ = NUMBER_PATTERN.sub("", jibun_address_)
+            dong_myun_ = NUMBER_PATTERN.sub("", dong_myun_)
+
+        if real_estate.dong_myun in MERGED_DONG_SOURCES:
+            dong_myun_ = MERGED_DONG_NAME
+            jibun_address_ = jibun_address_.replace(
+                real_estate.dong_myun, MERGED_DONG_NAME
+            )
+
+        jibun_address_ = jibun_address_.replace(" ", "").replace(".", "")
+        return (
+            administrative.entity.short_name.replace(".", "")
+            == dong_myun_.replace(".", "")
+            and real_estate.si_do.replace(" ", "") in administrative.name
+            and real_estate.si_gun_gu.replace(" ", "") in administrative.name
+            and administrative.name in jibun_address_
+        )
+
+    def _get_documents(
+        self, real_estate: RealEstateLegalCodeEntity
+    ) -> List[AdministrativeDocument]:
+        documents = dict()
+        for candidate in self._get_dong_candidates(real_estate=real_estate):
+            for document in self._dong_index.get(candidate.replace(".", ""), []):
+                documents[document.seq] = document
+        return [documents[seq] for seq in sorted(documents.keys())]
+
+    def match(
+        self, real_estate: RealEstateLegalCodeEntity
+    ) -> Optional[AdministrativeDivisionLegalCodeEntity]:
+        for document in self._get_documents(real_estate=real_estate):
+            if self._is_matched(real_estate=real_estate, administrative=document):
+                return document.entity
+        return None
+
+    def match_all(
+        self, target_list: List[RealEstateLegalCodeEntity]
+    ) -> Tuple[List[dict], List[LegalCodeUnmatchedEntity]]:
+        """
+            return : (real_estates 법정코드 update_list, 매칭 실패 목록)
+        """
+        update_list = list()
+        unmatched_list = list()
+        for real_estate in target_list:
+            administrative = self.match(real_estate=real_estate)
+            if administrative:
+                update_list.append(
+                    {
+                        "id": real_estate.id,
+                        "front_legal_code": administrative.front_legal_code,
+                        "back_legal_code": administrative.back_legal_code,
+                    }
+                )
+                continue
+
+            reason = (
+                LegalCodeUnmatchedReasonEnum.NOT_MATCHED_ADDRESS
+                if self._get_documents(real_estate=real_estate)
+                else LegalCodeUnmatchedReasonEnum.NOT_FOUND_DONG
+            )
+            unmatched_list.append(
+                LegalCodeUnmatchedEntity(
+                    id=real_estate.id,
+                    jibun_address=real_estate.jibun_address,
+                    si_do=real_estate.si_do,
+                    si_gun_gu=real_estate.si_gun_gu,
+                    dong_myun=real_estate.dong_myun,
+                    reason=reason.value,
+                )
+            )
+        return update_list, unmatched_list
@@ -0,0 +1,74 @@
+from typing import List, Tuple, Dict, Optional
+
+from app.extensions.cache.map_tile_cache import MapTileCache
+from core.domains.house.entity.house_entity import (
+    BoundingRealEstateEntity,
+    BoundingClusterEntity,
+)
+from core.domains.house.enum.house_enum import BoundingClusterEnum
+
+
+class MapClusterHelper:
+    """
+        grid 기반 지도 마커 클러스터링
+        - 요청 level + GRID_LEVEL_OFFSET 의 tile 을 cell 로 사용하여 마커를 묶는다.
+        - cell 내 마커 수가 MIN_CLUSTER_SIZE 이상이면 클러스터(개수, 중심 좌표, 평균가)로 변환
+        - 그 외 마커는 개별 마커로 반환
+    """
+
+    @classmethod
+    def _get_avg(cls, prices: List[Optional[int]]) -> Optional[int]:
+        prices = [price for price in prices if price]
+        if not prices:
+            return None
+        return round(sum(prices) / len(prices))
+
+    @classmethod
+    def _make_cluster_entity(
+        cls, entities: List[BoundingRealEstateEntity]
+    ) -> BoundingClusterEntity:
+        private_sales = [
+            entity.private_sales for entity in entities if entity.private_sales
+        ]
+        public_sales = [entity.public_sales for entity in entities if entity.public_sales]
+        houses = private_sales + public_sales
+
+        return BoundingClusterEntity(
+            latitude=sum(house.latitude for house in houses) / len(houses),
+            longitude=sum(house.longitude for house in houses) / len(houses),
+            count=len(houses),
+            private_count=len(private_sales),
+            public_count=len(public_sales),
+            avg_trade_price=cls._get_avg(
+                prices=[house.trade_price for house in private_sales]
+            ),
+            avg_supply_price=cls._get_avg(
+                prices=[house.supply_price for house in public_sales]
+            ),
+        )
+
+    @classmethod
+    def make_clusters(
+        cls, entities: List[BoundingRealEstateEntity], level: int
+    ) -> Tuple[List[BoundingRealEstateEntity], List[BoundingClusterEntity]]:
+        grid_level = level + BoundingClusterEnum.GRID_LEVEL_OFFSET.value
+
+        cells: Dict[Tuple[int, int], List[BoundingRealEstateEntity]] = dict()
+        for entity in entities:
+            house = entity.private_sales or entity.public_sales
+            if not house:
+                continue
+            cell = MapTileCache.get_tile(
+                longitude=house.longitude, latitude=house.latitude, level=grid_level
+            )
+            cells.setdefault(cell, []).append(entity)
+
+        houses = list()
+        clusters = list()
+        for cell_entities in cells.values():
+            if len(cell_entities) >= BoundingClusterEnum.MIN_CLUSTER_SIZE.value:
+                clusters.append(cls._make_cluster_entity(entities=cell_entities))
+            else:
+                houses.extend(cell_entities)
+
+        return houses, clusters
@@ -0,0 +1,486 @@
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from threading import Lock, Thread
+from time import time
+from typing import List, Dict, Optional, Callable, NamedTuple, Set, Tuple
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+CHOSEONG_LIST = [
+    "ㄱ",
+    "ㄲ",
+    "ㄴ",
+    "ㄷ",
+    "ㄸ",
+    "ㄹ",
+    "ㅁ",
+    "ㅂ",
+    "ㅃ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅉ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+]
+CHOSEONG_SET = set(CHOSEONG_LIST)
+# 한글 음절(가-힣) 또는 자모(ㄱ-ㅣ) 묶음 / 그 외 문자(숫자, 영문 등) 묶음으로 분리
+KEYWORD_PATTERN = re.compile("[ㄱ-ㅣ가-힣]+|[^\\sㄱ-ㅣ가-힣]+")
+
+
+def get_choseong(text: str) -> str:
+    """
+        한글 음절은 초성으로 변환, 그 외 문자는 그대로 반환
+        ex) 반포자이 -> ㅂㅍㅈㅇ
+    """
+    result = list()
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            result.append(CHOSEONG_LIST[(code - HANGUL_START) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong(text: str) -> bool:
+    return bool(text) and all(char in CHOSEONG_SET for char in text)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_START <= ord(char) <= HANGUL_END
+
+
+def split_trailing_choseong(keyword: str) -> Tuple[str, Optional[str]]:
+    """
+        입력 중인 마지막 초성 분리 (음절 뒤에 초성이 붙은 경우만)
+        ex) 반포ㅈ -> ("반포", "ㅈ"), ㅂㅍ -> ("ㅂㅍ", None)
+    """
+    if (
+        len(keyword) >= 2
+        and keyword[-1] in CHOSEONG_SET
+        and is_hangul_syllable(keyword[-2])
+    ):
+        return keyword[:-1], keyword[-1]
+    return keyword, None
+
+
+def get_syllable_range(choseong: str) -> Tuple[str, str]:
+    """
+        초성으로 시작하는 음절 구간 (첫 음절, 마지막 음절)
+        ex) ㅈ -> ("자", "짛")
+    """
+    start = HANGUL_START + CHOSEONG_LIST.index(choseong) * 588
+    return chr(start), chr(start + 587)
+
+
+def find_keyword(text: str, keyword: str) -> int:
+    """
+        text 내 keyword 위치 (없으면 -1)
+        - 마지막 초성은 해당 초성으로 시작하는 음절과 일치 ex) 반포ㅈ -> 반포자이
+    """
+    stem, choseong = split_trailing_choseong(keyword=keyword)
+    if not choseong:
+        return text.find(keyword)
+
+    index = text.find(stem)
+    while index != -1:
+        next_index = index + len(stem)
+        if next_index < len(text) and get_choseong(text[next_index]) == choseong:
+            return index
+        index = text.find(stem, index + 1)
+    return -1
+
+
+def normalize_text(text: Optional[str]) -> str:
+    return "".join(text.split()).lower() if text else ""
+
+
+def split_search_keywords(keywords: str) -> List[str]:
+    """
+        검색어 -> 키워드 목록 (중복 제거, 입력 순서 유지)
+        - 띄어쓰기 분리 후 한글 / 숫자 등을 다시 분리
+        ex) "반포 자이2차" -> ["반포", "자이", "2", "차"]
+    """
+    split_keywords = list()
+    for keyword in KEYWORD_PATTERN.findall(keywords.lower()):
+        if keyword not in split_keywords:
+            split_keywords.append(keyword)
+    return split_keywords
+
+
+class SearchDocument(NamedTuple):
+    id: int
+    name: str
+    latitude: float
+    longitude: float
+    house_type: str
+    # 정렬 우선 순위 (서울 -> 경기 -> 그 외)
+    region_rank: int
+    # 매물명
+    name_text: str
+    # 동
+    dong_text: str
+    # 매물명 + 동 + 주소 (띄어쓰기 제거, 소문자)
+    text: str
+    # 매물명 초성
+    choseong: str
+
+
+class PrefixIndex:
+    """
+        prefix 자동완성 인덱스 (trie 대신 정렬된 key 목록 + bisect)
+        - keys : 정렬된 key 목록, offsets : key 별 문서 offset array
+            -> prefix 에 해당하는 key 는 정렬 순서상 연속 구간 [lo, hi)
+        - 문서 offset 이 작을수록 우선 순위가 높다. (region_rank, id 순)
+        - 1 글자 prefix 는 구간이 넓으므로 상위 TOP_K 결과를 빌드 시 미리 계산
+        - 음절 뒤 입력 중인 초성은 해당 초성의 음절 구간으로 검색 ex) 반포ㅈ -> 반포자이
+    """
+
+    TOP_K = 30
+    # prefix 구간 끝 (한글 음절/자모보다 큰 문자)
+    MAX_CHAR = "\uffff"
+
+    def __init__(self):
+        self._keys: List[str] = list()
+        self._offsets = array("I")
+        self._short_prefixes: Dict[str, List[int]] = dict()
+
+    def build(self, entries: List[Tuple[str, int]]) -> None:
+        """
+            entries : (key, 문서 offset) 목록
+        """
+        entries = sorted(set(entry for entry in entries if entry[0]))
+        keys = [key for key, _ in entries]
+        offsets = array("I", (offset for _, offset in entries))
+
+        short_prefix_offsets: Dict[str, Set[int]] = dict()
+        for key, offset in entries:
+            short_prefix_offsets.setdefault(key[0], set()).add(offset)
+        short_prefixes = {
+            prefix: heapq.nsmallest(self.TOP_K, prefix_offsets)
+            for prefix, prefix_offsets in short_prefix_offsets.items()
+        }
+
+        self._keys, self._offsets, self._short_prefixes = (
+            keys,
+            offsets,
+            short_prefixes,
+        )
+
+    def search(self, prefix: str, limit: int = 10) -> List[int]:
+        keys, offsets, short_prefixes = (
+            self._keys,
+            self._offsets,
+            self._short_prefixes,
+        )
+        if not prefix:
+            return []
+        if len(prefix) == 1 and limit <= self.TOP_K:
+            return short_prefixes.get(prefix, [])[:limit]
+
+        stem, choseong = split_trailing_choseong(keyword=prefix)
+        if choseong:
+            # 반포ㅈ -> [반포자, 반포짛 + MAX_CHAR) 구간
+            first, last = get_syllable_range(choseong=choseong)
+            lo = bisect_left(keys, stem + first)
+            hi = bisect_left(keys, stem + last + self.MAX_CHAR, lo)
+        else:
+            lo = bisect_left(keys, prefix)
+            hi = bisect_left(keys, prefix + self.MAX_CHAR, lo)
+        return heapq.nsmallest(limit, set(offsets[lo:hi]))
+
+
+class SearchIndexSnapshot(NamedTuple):
+    """
+        build 결과 (변경하지 않음) -> 재빌드 시 snapshot 을 통째로 교체
+    """
+
+    documents: List[SearchDocument]
+    text_grams: Dict[str, array]
+    choseong_grams: Dict[str, array]
+    prefix_indexes: Dict[Optional[str], PrefixIndex]
+
+
+EMPTY_SNAPSHOT = SearchIndexSnapshot(
+    documents=list(), text_grams=dict(), choseong_grams=dict(), prefix_indexes=dict()
+)
+
+
+class SearchIndex:
+    """
+        n-gram(2-gram) 역색인 기반 매물 검색 인덱스
+        - gram -> 문서 offset array (문서는 region_rank, id 순 정렬 -> offset 순이 기본 정렬 순서)
+        - 키워드 별 gram posting 교집합으로 후보를 구한 후 포함 여부로 검증
+            -> 서로 떨어진 여러 단어 검색 가능 (모든 키워드 AND)
+        - 초성 키워드(ㅂㅍㅈㅇ)는 매물명 초성 역색인으로 검색
+        - 음절 뒤 입력 중인 초성(반포ㅈ)은 음절 부분으로 후보를 구한 후 초성 일치 여부로 검증
+        - 점수 : 매물명 일치 > 주소/동 일치, 매물명 prefix 일치 시 가산
+        - 키워드가 1개면(입력 중 자동완성) 매물명/동 prefix 일치 결과(PrefixIndex)를 먼저 반환
+        - 조회는 요청 시작 시점의 snapshot 1개만 사용 (background 재빌드와 섞이지 않음)
+    """
+
+    GRAM_SIZE = 2
+
+    def __init__(self):
+        self._snapshot: SearchIndexSnapshot = EMPTY_SNAPSHOT
+
+    @property
+    def is_built(self) -> bool:
+        return bool(self._snapshot.documents)
+
+    def __len__(self) -> int:
+        return len(self._snapshot.documents)
+
+    @classmethod
+    def _get_grams(cls, text: str) -> Set[str]:
+        if len(text) <= cls.GRAM_SIZE:
+            return {text} if text else set()
+        return {
+            text[offset : offset + cls.GRAM_SIZE]
+            for offset in range(len(text) - cls.GRAM_SIZE + 1)
+        }
+
+    @classmethod
+    def _get_index_grams(cls, text: str) -> Set[str]:
+        # 1 글자 키워드 검색을 위해 1-gram 도 함께 색인
+        return cls._get_grams(text=text) | set(text)
+
+    @classmethod
+    def _add_posting(cls, grams: Dict[str, array], text: str, offset: int) -> None:
+        for gram in cls._get_index_grams(text=text):
+            grams.setdefault(gram, array("I")).append(offset)
+
+    def build(self, documents: List[SearchDocument]) -> None:
+        """
+            조회 중인 요청에 영향이 없도록 새 snapshot 을 만든 후 한번에 교체한다.
+        """
+        documents = sorted(
+            documents, key=lambda document: (document.region_rank, document.id)
+        )
+
+        text_grams = dict()
+        choseong_grams = dict()
+        prefix_entries: Dict[Optional[str], List[Tuple[str, int]]] = dict()
+        for offset, document in enumerate(documents):
+            self._add_posting(grams=text_grams, text=document.text, offset=offset)
+            self._add_posting(
+                grams=choseong_grams, text=document.choseong, offset=offset
+            )
+            # 초성 key 는 매물명만 (초성 검색은 매물명 초성 기준)
+            for key in (document.name_text, document.choseong, document.dong_text):
+                prefix_entries.setdefault(None, []).append((key, offset))
+                prefix_entries.setdefault(document.house_type, []).append(
+                    (key, offset)
+                )
+
+        prefix_indexes = dict()
+        for house_type, entries in prefix_entries.items():
+            prefix_indexes[house_type] = PrefixIndex()
+            prefix_indexes[house_type].build(entries=entries)
+
+        self._snapshot = SearchIndexSnapshot(
+            documents=documents,
+            text_grams=text_grams,
+            choseong_grams=choseong_grams,
+            prefix_indexes=prefix_indexes,
+        )
+
+    @classmethod
+    def _get_candidates(cls, grams: Dict[str, array], keyword: str) -> Set[int]:
+        postings = [grams.get(gram) for gram in cls._get_grams(text=keyword)]
+        if not postings or not all(postings):
+            return set()
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _get_score(document: SearchDocument, keyword: str, choseong: bool) -> int:
+        index = find_keyword(
+            text=document.choseong if choseong else document.name_text,
+            keyword=keyword,
+        )
+        if index == 0:
+            return 3
+        if index > 0:
+            return 2
+        return 1
+
+    @staticmethod
+    def _get_prefix_offsets(
+        snapshot: SearchIndexSnapshot,
+        prefix: str,
+        house_type: Optional[str],
+        limit: int,
+    ) -> List[int]:
+        prefix_index = snapshot.prefix_indexes.get(house_type)
+        if not prefix_index:
+            return []
+        return prefix_index.search(prefix=normalize_text(prefix), limit=limit)
+
+    def autocomplete(
+        self, prefix: str, house_type: Optional[str] = None, limit: int = 10
+    ) -> List[SearchDocument]:
+        snapshot = self._snapshot
+        return [
+            snapshot.documents[offset]
+            for offset in self._get_prefix_offsets(
+                snapshot=snapshot, prefix=prefix, house_type=house_type, limit=limit
+            )
+        ]
+
+    def search(
+        self, keywords: List[str], house_type: Optional[str] = None, limit: int = 10
+    ) -> List[SearchDocument]:
+        snapshot = self._snapshot
+        documents = snapshot.documents
+        if not keywords or not documents:
+            return []
+
+        prefix_offsets = list()
+        if len(keywords) == 1:
+            prefix_offsets = self._get_prefix_offsets(
+                snapshot=snapshot,
+                prefix=keywords[0],
+                house_type=house_type,
+                limit=limit,
+            )
+            if len(prefix_offsets) >= limit:
+                return [documents[offset] for offset in prefix_offsets]
+
+        candidates: Optional[Set[int]] = None
+        for keyword in keywords:
+            choseong = is_choseong(keyword)
+            keyword_candidates = self._get_candidates(
+                grams=snapshot.choseong_grams if choseong else snapshot.text_grams,
+                keyword=split_trailing_choseong(keyword=keyword)[0],
+            )
+            candidates = (
+                keyword_candidates
+                if candidates is None
+                else candidates & keyword_candidates
+            )
+            if not candidates:
+                break
+
+        results = list()
+        for offset in candidates:
+            document = documents[offset]
+            if house_type and document.house_type != house_type:
+                continue
+
+            score = 0
+            for keyword in keywords:
+                choseong = is_choseong(keyword)
+                if (
+                    find_keyword(
+                        text=document.choseong if choseong else document.text,
+                        keyword=keyword,
+                    )
+                    < 0
+                ):
+                    break
+                score += self._get_score(
+                    document=document, keyword=keyword, choseong=choseong
+                )
+            else:
+                results.append((-score, offset))
+
+        results.sort()
+        offsets = prefix_offsets + [
+            offset for _, offset in results if offset not in prefix_offsets
+        ]
+        return [documents[offset] for offset in offsets[:limit]]
+
+
+class HouseSearchIndex(SearchIndex):
+    """
+        매물 검색 인덱스 (프로세스 단위)
+        - 최초 사용 시 빌드, 이후 VERSION_CHECK_SECONDS 마다 redis version 확인 후 변경 시 재빌드
+        - 빌드는 별도 thread 에서 진행 -> 검색 요청은 기존 인덱스 사용 (입력 중 DB 조회 없음)
+        - version 은 SyncDataUseCase 에서 매물 동기화 후 증가시킨다.
+    """
+
+    VERSION_CHECK_SECONDS = 60
+    VERSION_KEY = RedisKeyPrefix.SEARCH_INDEX_VERSION.value
+
+    def __init__(self):
+        super().__init__()
+        self.version: Optional[bytes] = None
+        self._checked_at = 0.0
+        self._build_lock = Lock()
+        self._build_thread: Optional[Thread] = None
+
+    def _get_version(self, client: Cache) -> Optional[bytes]:
+        try:
+            return client.get(key=self.VERSION_KEY)
+        except REDIS_ERRORS as e:
+            logger.error(f"[HouseSearchIndex][_get_version] error : {e}")
+            return self.version
+
+    def _rebuild(
+        self, version: Optional[bytes], loader: Callable[[], List[SearchDocument]]
+    ) -> None:
+        try:
+            start_time = time()
+            self.build(documents=loader())
+            self.version = version
+            logger.info(
+                f"[HouseSearchIndex] build {len(self)} documents, "
+                f"records: {time() - start_time} secs"
+            )
+        except Exception as e:
+            logger.error(f"[HouseSearchIndex][_rebuild] error : {e}")
+
+    def refresh(
+        self, client: Cache, loader: Callable[[], List[SearchDocument]]
+    ) -> None:
+        """
+            loader : 별도 thread 에서 호출 (app context 필요 시 loader 에서 처리)
+        """
+        now = time()
+        if now - self._checked_at < self.VERSION_CHECK_SECONDS:
+            return
+        self._checked_at = now
+
+        version = self._get_version(client=client)
+        if self.is_built and version == self.version:
+            return
+
+        with self._build_lock:
+            if self._build_thread and self._build_thread.is_alive():
+                return
+            self._build_thread = Thread(
+                target=self._rebuild,
+                kwargs=dict(version=version, loader=loader),
+                daemon=True,
+            )
+            self._build_thread.start()
+
+    @classmethod
+    def bump_version(cls, client: Cache) -> None:
+        try:
+            client.incr(key=cls.VERSION_KEY)
+        except REDIS_ERRORS as e:
+            logger.error(f"[HouseSearchIndex][bump_version] error : {e}")
+
+
+house_search_index = HouseSearchIndex()
@@ -0,0 +1,203 @@
+import re
+import struct
+from array import array
+from time import time
+from typing import List, Tuple, Dict, Optional, Callable, Any
+
+from app.extensions.cache.cache import Cache, REDIS_ERRORS
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+
+class SpatialIndex:
+    """
+        좌표(경도 x, 위도 y) 기반 grid 공간 인덱스
+        - id, x, y 를 cell 순서로 정렬한 array 로 보관 (point 당 24 bytes)
+        - cells : (cell_x, cell_y) -> array 내 [start, end) 범위
+        - query_bounding : ST_Contains(ST_MakeEnvelope(...), coordinates) 와 동일 (경계 제외)
+        - query_radius : ST_DWithin(coordinates, point, degree) 와 동일 (degree 단위 거리, 경계 포함)
+    """
+
+    CELL_SIZE = 0.01
+
+    def __init__(self, cell_size: float = CELL_SIZE):
+        self.cell_size = cell_size
+        self._grid: Optional[Tuple[array, array, array, Dict]] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._grid is not None
+
+    def __len__(self) -> int:
+        return len(self._grid[0]) if self._grid else 0
+
+    def _get_cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def build(self, points: List[Tuple[int, float, float]]) -> None:
+        """
+            points : (id, x, y) 목록
+            조회 중인 요청에 영향이 없도록 새 grid 를 만든 후 한번에 교체한다.
+        """
+        cell_points = sorted(
+            (self._get_cell(x=x, y=y), idx, x, y)
+            for idx, x, y in points
+            if x is not None and y is not None
+        )
+
+        ids, xs, ys = array("q"), array("d"), array("d")
+        cells = dict()
+        for offset, (cell, idx, x, y) in enumerate(cell_points):
+            ids.append(idx)
+            xs.append(x)
+            ys.append(y)
+            start, _ = cells.get(cell, (offset, offset))
+            cells[cell] = (start, offset + 1)
+
+        self._grid = (ids, xs, ys, cells)
+
+    def _get_candidate_ranges(
+        self, start_x: float, start_y: float, end_x: float, end_y: float
+    ) -> List[Tuple[int, int]]:
+        cells = self._grid[3]
+        min_cell_x, min_cell_y = self._get_cell(x=start_x, y=start_y)
+        max_cell_x, max_cell_y = self._get_cell(x=end_x, y=end_y)
+
+        # 조회 범위의 cell 수가 실제 cell 수보다 많으면 전체 cell 을 순회
+        if (max_cell_x - min_cell_x + 1) * (max_cell_y - min_cell_y + 1) > len(cells):
+            return [
+                cell_range
+                for (cell_x, cell_y), cell_range in cells.items()
+                if min_cell_x <= cell_x <= max_cell_x
+                and min_cell_y <= cell_y <= max_cell_y
+            ]
+
+        ranges = list()
+        for cell_x in range(min_cell_x, max_cell_x + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                cell_range = cells.get((cell_x, cell_y))
+                if cell_range:
+                    ranges.append(cell_range)
+        return ranges
+
+    def query_bounding(
+        self, start_x: float, start_y: float, end_x: float, end_y: float
+    ) -> List[int]:
+        if not self._grid:
+            return []
+
+        start_x, end_x = min(start_x, end_x), max(start_x, end_x)
+        start_y, end_y = min(start_y, end_y), max(start_y, end_y)
+        ids, xs, ys, _ = self._grid
+
+        result = list()
+        for start, end in self._get_candidate_ranges(
+            start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y
+        ):
+            for offset in range(start, end):
+                if start_x < xs[offset] < end_x and start_y < ys[offset] < end_y:
+                    result.append(ids[offset])
+        return result
+
+    def query_radius(self, x: float, y: float, degree: float) -> List[int]:
+        if not self._grid:
+            return []
+
+        ids, xs, ys, _ = self._grid
+        squared_degree = degree * degree
+
+        result = list()
+        for start, end in self._get_candidate_ranges(
+            start_x=x - degree, start_y=y - degree, end_x=x + degree, end_y=y + degree
+        ):
+            for offset in range(start, end):
+                dx, dy = xs[offset] - x, ys[offset] - y
+                if dx * dx + dy * dy <= squared_degree:
+                    result.append(ids[offset])
+        return result
+
+    @staticmethod
+    def get_point(geometry: Any) -> Optional[Tuple[float, float]]:
+        """
+            geoalchemy2 WKBElement(EWKB) / WKTElement -> (x, y)
+            POINT 가 아니거나 해석할 수 없으면 None
+        """
+        data = getattr(geometry, "data", geometry)
+        if data is None:
+            return None
+
+        if isinstance(data, str):
+            matched = re.search(r"POINT\s*\(\s*([-\d.eE]+)\s+([-\d.eE]+)\s*\)", data)
+            if not matched:
+                return None
+            return float(matched.group(1)), float(matched.group(2))
+
+        data = bytes(data)
+        if len(data) < 21:
+            return None
+
+        byte_order = "<" if data[0] == 1 else ">"
+        (geometry_type,) = struct.unpack(f"{byte_order}I", data[1:5])
+        offset = 5
+        if geometry_type & 0x20000000:
+            # EWKB SRID
+            offset += 4
+        if geometry_type & 0xFF != 1 or len(data) < offset + 16:
+            return None
+
+        return struct.unpack(f"{byte_order}dd", data[offset : offset + 16])
+
+
+class RealEstateSpatialIndex(SpatialIndex):
+    """
+        real_estates 좌표 인덱스 (프로세스 단위)
+        - 최초 사용 시 빌드, 이후 VERSION_CHECK_SECONDS 마다 redis version 확인 후 변경 시 재빌드
+        - version 은 SyncDataUseCase 에서 real_estates 동기화 후 증가시킨다.
+    """
+
+    VERSION_CHECK_SECONDS = 60
+    VERSION_KEY = RedisKeyPrefix.SPATIAL_INDEX_VERSION.value
+
+    def __init__(self, cell_size: float = SpatialIndex.CELL_SIZE):
+        super().__init__(cell_size=cell_size)
+        self.version: Optional[bytes] = None
+        self._checked_at = 0.0
+
+    def _get_version(self, client: Cache) -> Optional[bytes]:
+        try:
+            return client.get(key=self.VERSION_KEY)
+        except REDIS_ERRORS as e:
+            logger.error(f"[RealEstateSpatialIndex][_get_version] error : {e}")
+            return self.version
+
+    def refresh(
+        self, client: Cache, loader: Callable[[], List[Tuple[int, float, float]]]
+    ) -> None:
+        now = time()
+        if self.is_built and now - self._checked_at < self.VERSION_CHECK_SECONDS:
+            return
+        self._checked_at = now
+
+        version = self._get_version(client=client)
+        if self.is_built and version == self.version:
+            return
+
+        start_time = time()
+        self.build(points=loader())
+        self.version = version
+        logger.info(
+            f"[RealEstateSpatialIndex] build {len(self)} points, "
+            f"records: {time() - start_time} secs"
+        )
+
+    @classmethod
+    def bump_version(cls, client: Cache) -> None:
+        try:
+            client.incr(key=cls.VERSION_KEY)
+        except REDIS_ERRORS as e:
+            logger.error(f"[RealEstateSpatialIndex][bump_version] error : {e}")
+
+
+real_estate_spatial_index = RealEstateSpatialIndex()
@@ -1,5 +1,7 @@
 import random
 from datetime import datetime, timedelta
+from typing import Tuple
+
 from pytz import timezone
 
 
@@ -7,6 +9,30 @@ def get_server_timestamp():
     return datetime.now(timezone("Asia/Seoul"))
 
 
+def get_server_today_range() -> Tuple[datetime, datetime]:
+    """
+        오늘 00:00 ~ 내일 00:00 (timezone 제외) -> created_at >= start and created_at < end
+        - to_char(created_at, ...) == today 대신 범위 조건으로 index 사용
+    """
+    today = get_server_timestamp().replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+    return today, today + timedelta(days=1)
+
+
+def get_year_month_range(year_month: str) -> Tuple[str, str]:
+    """
+        year_month example: 202108 -> ("202108", "202109")
+        - YYYYMMDD 문자열 컬럼은 사전순 = 날짜순 -> col >= start and col < end 로 해당 월 조회
+    """
+    year, month = int(year_month[:4]), int(year_month[4:6])
+    if month == 12:
+        year, month = year + 1, 1
+    else:
+        month += 1
+    return year_month[:6], f"{year:04d}{month:02d}"
+
+
 def get_month_from_today():
     return datetime.now(timezone("Asia/Seoul")) - timedelta(days=30)
 
@@ -0,0 +1,156 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from time import time
+from typing import Dict, Optional
+
+from app.extensions.utils.log_helper import logger_
+
+logger = logger_.getLogger(__name__)
+
+
+class IdleBackoff:
+    """
+        worker polling 간격 (exponential backoff)
+        - 처리할 메세지가 있으면 reset -> 바로 다음 polling (backlog drain)
+        - 메세지가 없으면 MIN_DELAY 부터 FACTOR 배씩 MAX_DELAY 까지 대기 시간 증가
+    """
+
+    MIN_DELAY = 0.1
+    MAX_DELAY = 5.0
+    FACTOR = 2.0
+
+    def __init__(
+        self,
+        min_delay: float = MIN_DELAY,
+        max_delay: float = MAX_DELAY,
+        factor: float = FACTOR,
+    ):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self._delay = 0.0
+
+    def reset(self) -> None:
+        self._delay = 0.0
+
+    def next_delay(self) -> float:
+        self._delay = (
+            min(self._delay * self.factor, self.max_delay)
+            if self._delay
+            else self.min_delay
+        )
+        return self._delay
+
+
+class SyncMetrics:
+    """
+        SyncDataUseCase 처리량 지표 (prometheus text exposition format)
+        - sync_messages_total{table} : 처리한 메세지 수 -> rate() 로 messages/sec
+        - sync_batch_size : polling 1번에 가져온 메세지 수 (summary)
+        - sync_upsert_seconds{table} : 테이블 별 upsert 소요 시간 (summary)
+        - sync_backlog_size : 아직 처리되지 않은 메세지 수 (마지막 polling 기준)
+        - sync_messages_per_second : 마지막 batch 처리량
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.messages_total: Dict[str, int] = dict()
+        self.failures_total: Dict[str, int] = dict()
+        self.batch_size_sum = 0
+        self.batch_size_count = 0
+        self.upsert_seconds_sum: Dict[str, float] = dict()
+        self.upsert_seconds_count: Dict[str, int] = dict()
+        self.backlog_size = 0
+        self.messages_per_second = 0.0
+        self.last_batch_at: Optional[float] = None
+
+    def observe_batch(self, size: int, seconds: float) -> None:
+        with self._lock:
+            self.batch_size_sum += size
+            self.batch_size_count += 1
+            self.messages_per_second = size / seconds if seconds > 0 else 0.0
+            self.last_batch_at = time()
+
+    def observe_upsert(
+        self, table: str, count: int, failure_count: int, seconds: float
+    ) -> None:
+        with self._lock:
+            self.messages_total[table] = self.messages_total.get(table, 0) + count
+            self.failures_total[table] = (
+                self.failures_total.get(table, 0) + failure_count
+            )
+            self.upsert_seconds_sum[table] = (
+                self.upsert_seconds_sum.get(table, 0.0) + seconds
+            )
+            self.upsert_seconds_count[table] = (
+                self.upsert_seconds_count.get(table, 0) + 1
+            )
+
+    def set_backlog_size(self, size: int) -> None:
+        with self._lock:
+            self.backlog_size = size
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [
+                "# TYPE sync_messages_total counter",
+                *[
+                    f'sync_messages_total{{table="{table}"}} {count}'
+                    for table, count in sorted(self.messages_total.items())
+                ],
+                "# TYPE sync_failures_total counter",
+                *[
+                    f'sync_failures_total{{table="{table}"}} {count}'
+                    for table, count in sorted(self.failures_total.items())
+                ],
+                "# TYPE sync_batch_size summary",
+                f"sync_batch_size_sum {self.batch_size_sum}",
+                f"sync_batch_size_count {self.batch_size_count}",
+                "# TYPE sync_upsert_seconds summary",
+                *[
+                    f'sync_upsert_seconds_sum{{table="{table}"}} {seconds}'
+                    for table, seconds in sorted(self.upsert_seconds_sum.items())
+                ],
+                *[
+                    f'sync_upsert_seconds_count{{table="{table}"}} {count}'
+                    for table, count in sorted(self.upsert_seconds_count.items())
+                ],
+                "# TYPE sync_backlog_size gauge",
+                f"sync_backlog_size {self.backlog_size}",
+                "# TYPE sync_messages_per_second gauge",
+                f"sync_messages_per_second {self.messages_per_second}",
+                "# TYPE sync_last_batch_timestamp_seconds gauge",
+                f"sync_last_batch_timestamp_seconds {self.last_batch_at or 0}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port: int) -> ThreadingHTTPServer:
+        """
+            GET /metrics 로 지표 노출 (prometheus scrape 대상, daemon thread)
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"[SyncMetrics] metrics server started - port : {port}")
+        return server
+
+
+sync_metrics = SyncMetrics()
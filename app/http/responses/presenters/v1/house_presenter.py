@@ -3,6 +3,7 @@ from typing import Union
 
 from core.domains.house.schema.house_schema import (
     BoundingResponseSchema,
+    BoundingClusterResponseSchema,
     BoundingAdministrativeResponseSchema,
     GetHousePublicDetailResponseSchema,
     GetCalendarInfoResponseSchema,
@@ -135,6 +136,31 @@ class BoundingPresenter:
             return failure_response(output=output, status_code=output.code)
 
 
+class BoundingClusterPresenter:
+    def transform(self, output: Union[UseCaseSuccessOutput, UseCaseFailureOutput]):
+        if isinstance(output, UseCaseSuccessOutput):
+            try:
+                schema = BoundingClusterResponseSchema(
+                    houses=output.value.houses, clusters=output.value.clusters
+                )
+            except ValidationError:
+                return failure_response(
+                    UseCaseFailureOutput(
+                        type="response schema validation error",
+                        message=FailureType.INTERNAL_ERROR,
+                        code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                    ),
+                    status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+            result = {
+                "data": schema.dict(),
+                "meta": output.meta,
+            }
+            return success_response(result=result)
+        elif isinstance(output, UseCaseFailureOutput):
+            return failure_response(output=output, status_code=output.code)
+
+
 class BoundingAdministrativePresenter:
     def transform(self, output: Union[UseCaseSuccessOutput, UseCaseFailureOutput]):
         if isinstance(output, UseCaseSuccessOutput):
@@ -1,5 +1,5 @@
 from flasgger import swag_from
-from flask import request
+from flask import request, current_app
 from flask_jwt_extended import jwt_required
 
 from app.http.requests.v1.house_request import (
@@ -19,6 +19,7 @@ from app.http.requests.v1.house_request import UpsertInterestHouseRequestSchema
 from app.http.responses import failure_response
 from app.http.responses.presenters.v1.house_presenter import (
     BoundingPresenter,
+    BoundingClusterPresenter,
     BoundingAdministrativePresenter,
     GetHousePublicDetailPresenter,
     GetCalendarInfoPresenter,
@@ -39,6 +40,7 @@ from core.domains.house.enum.house_enum import (
 )
 from core.domains.house.use_case.v1.house_use_case import (
     BoundingUseCase,
+    BoundingClusterUseCase,
     GetHousePublicDetailUseCase,
     GetCalendarInfoUseCase,
     GetInterestHouseListUseCase,
@@ -101,6 +103,11 @@ def bounding_view():
         return BoundingAdministrativePresenter().transform(
             BoundingUseCase().execute(dto=dto)
         )
+    if dto.level < current_app.config.get("BOUNDING_CLUSTER_EXPAND_LEVEL", 0):
+        # BOUNDING_CLUSTER_EXPAND_LEVEL 미만 : 마커 클러스터 Presenter 변경
+        return BoundingClusterPresenter().transform(
+            BoundingClusterUseCase().execute(dto=dto)
+        )
     return BoundingPresenter().transform(BoundingUseCase().execute(dto=dto))
 
 
@@ -49,3 +49,4 @@ from .private_sale_avg_price_model import PrivateSaleAvgPriceModel
 from .public_sale_avg_price_model import PublicSaleAvgPriceModel
 from .house_photo_model import HousePhotoModel
 from .house_type_photo_model import HouseTypePhotoModel
+from .map_marker_model import MapMarkerModel
@@ -0,0 +1,56 @@
+from geoalchemy2 import Geometry
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    SmallInteger,
+    String,
+    Boolean,
+    Float,
+    DateTime,
+    func,
+)
+
+from app import db
+
+
+class MapMarkerModel(db.Model):
+    """
+        지도 매물 마커 projection 테이블 (private_sales 1건 당 1 row)
+        - id : private_sales.id
+        - default 평수 기준 매매/전세 평균가, 거래 상태를 미리 조인하여 저장
+        - PreCalculateAverageUseCase 배치에서 갱신, get_bounding (면적 필터 없을 때) 에서 조회
+    """
+
+    __tablename__ = "map_markers"
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        nullable=False,
+        autoincrement=False,
+    )
+    real_estate_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"), nullable=False, index=True,
+    )
+    jibun_address = Column(String(100), nullable=True)
+    road_address = Column(String(100), nullable=True)
+    coordinates = Column(
+        Geometry(geometry_type="POINT", srid=4326).with_variant(String, "sqlite"),
+        nullable=False,
+    )
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    building_type = Column(String(5), nullable=True)
+    name = Column(String(50), nullable=True)
+    is_available = Column(Boolean, nullable=False, default=True)
+    trade_pyoung = Column(Integer, nullable=True)
+    trade_price = Column(Integer, nullable=True)
+    deposit_pyoung = Column(Integer, nullable=True)
+    deposit_price = Column(Integer, nullable=True)
+    trade_status = Column(SmallInteger, nullable=False, default=0)
+    deposit_status = Column(SmallInteger, nullable=False, default=0)
+    created_at = Column(DateTime(), server_default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime(), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -8,6 +8,7 @@ from sqlalchemy import (
     func,
     Numeric,
     SmallInteger,
+    Index,
 )
 
 from app import db
@@ -16,6 +17,15 @@ from core.domains.house.entity.house_entity import PrivateSaleDetailEntity
 
 class PrivateSaleDetailModel(db.Model):
     __tablename__ = "private_sale_details"
+    __table_args__ = (
+        # 최근 거래 평균가 (private_sale_id, trade_type 별 contract_date 범위)
+        Index(
+            "ix_private_sale_details_sale_id_trade_type_contract_date",
+            "private_sale_id",
+            "trade_type",
+            "contract_date",
+        ),
+    )
 
     id = Column(
         BigInteger().with_variant(Integer, "sqlite"), primary_key=True, nullable=False,
@@ -33,9 +43,15 @@ class PrivateSaleDetailModel(db.Model):
     floor = Column(SmallInteger, nullable=True)
     trade_type = Column(String(5), nullable=False, index=True,)
     is_available = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(), server_default=func.now(), nullable=False, index=True
+    )
     updated_at = Column(
-        DateTime(), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
     )
 
     def to_entity(self) -> PrivateSaleDetailEntity:
@@ -48,9 +48,15 @@ class PrivateSaleModel(db.Model):
     trade_status = Column(SmallInteger, nullable=False, default=0)
     deposit_status = Column(SmallInteger, nullable=False, default=0)
     is_available = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime(), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(), server_default=func.now(), nullable=False, index=True
+    )
     updated_at = Column(
-        DateTime(), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
     )
 
     # relationship
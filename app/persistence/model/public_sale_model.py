@@ -47,18 +47,18 @@ class PublicSaleModel(db.Model):
     construct_company = Column(String(50), nullable=True)
     supply_household = Column(SmallInteger, nullable=False)
     offer_date = Column(String(8), nullable=True)
-    subscription_start_date = Column(String(8), nullable=True)
-    subscription_end_date = Column(String(8), nullable=True)
-    special_supply_date = Column(String(8), nullable=True)
-    special_supply_etc_date = Column(String(8), nullable=True)
+    subscription_start_date = Column(String(8), nullable=True, index=True)
+    subscription_end_date = Column(String(8), nullable=True, index=True)
+    special_supply_date = Column(String(8), nullable=True, index=True)
+    special_supply_etc_date = Column(String(8), nullable=True, index=True)
     special_etc_gyeonggi_date = Column(String(8), nullable=True)
-    first_supply_date = Column(String(8), nullable=True)
-    first_supply_etc_date = Column(String(8), nullable=True)
+    first_supply_date = Column(String(8), nullable=True, index=True)
+    first_supply_etc_date = Column(String(8), nullable=True, index=True)
     first_etc_gyeonggi_date = Column(String(8), nullable=True)
-    second_supply_date = Column(String(8), nullable=True)
-    second_supply_etc_date = Column(String(8), nullable=True)
+    second_supply_date = Column(String(8), nullable=True, index=True)
+    second_supply_etc_date = Column(String(8), nullable=True, index=True)
     second_etc_gyeonggi_date = Column(String(8), nullable=True)
-    notice_winner_date = Column(String(8), nullable=True)
+    notice_winner_date = Column(String(8), nullable=True, index=True)
     contract_start_date = Column(String(8), nullable=True)
     contract_end_date = Column(String(8), nullable=True)
     move_in_year = Column(String(4), nullable=True)
@@ -83,9 +83,15 @@ class PublicSaleModel(db.Model):
     hallway_type = Column(String(4), nullable=True)
     is_checked = Column(Boolean, nullable=False, default=False)
     is_available = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime(), server_default=func.now(), nullable=False)
+    created_at = Column(
+        DateTime(), server_default=func.now(), nullable=False, index=True
+    )
     updated_at = Column(
-        DateTime(), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
     )
 
     # relationship
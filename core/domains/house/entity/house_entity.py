@@ -563,6 +563,21 @@ class BoundingRealEstateEntity(BaseModel):
     public_sales: Optional[PublicSaleBoundingEntity]
 
 
+class BoundingClusterEntity(BaseModel):
+    latitude: float
+    longitude: float
+    count: int
+    private_count: int
+    public_count: int
+    avg_trade_price: Optional[int]
+    avg_supply_price: Optional[int]
+
+
+class BoundingClusterResultEntity(BaseModel):
+    houses: List[BoundingRealEstateEntity]
+    clusters: List[BoundingClusterEntity]
+
+
 class AdministrativeDivisionLegalCodeEntity(BaseModel):
     id: int
     name: str
@@ -579,6 +594,15 @@ class RealEstateLegalCodeEntity(BaseModel):
     dong_myun: str
 
 
+class LegalCodeUnmatchedEntity(BaseModel):
+    id: int
+    jibun_address: Optional[str]
+    si_do: Optional[str]
+    si_gun_gu: Optional[str]
+    dong_myun: Optional[str]
+    reason: str
+
+
 class MapSearchEntity(BaseModel):
     id: int
     name: str
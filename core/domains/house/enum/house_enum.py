@@ -221,6 +221,19 @@ class PublicSaleStatusEnum(ExtendedEnum):
     IS_CLOSED = 3
 
 
+class BoundingClusterEnum(Enum):
+    """
+        사용처 : bounding_view(), BoundingClusterUseCase
+        사용 목적 : 지도 마커 클러스터링 grid 설정
+            GRID_LEVEL_OFFSET : 요청 level + offset 의 tile 을 클러스터 cell 로 사용
+                                (tile 256px 기준 offset 2 -> 64px cell)
+            MIN_CLUSTER_SIZE : cell 내 마커가 이 값 이상이면 클러스터로 묶는다
+    """
+
+    GRID_LEVEL_OFFSET = 2
+    MIN_CLUSTER_SIZE = 2
+
+
 class BoundingIncludePrivateEnum(ExtendedEnum):
     """
     사용 모델 : PrivateSaleModel
@@ -314,3 +327,45 @@ class HouseAreaRange(Enum):
 
     MIN_AREA = 0
     MAX_AREA = 500
+
+
+class SyncIngestionModeEnum(Enum):
+    """
+        사용 목적 : SyncDataUseCase -> datamart 동기화 메세지 수신 방식 (SYNC_INGESTION_MODE)
+    """
+
+    SCAN = "scan"
+    STREAM = "stream"
+
+
+class PrivateSaleAvgCalcModeEnum(Enum):
+    """
+        사용 목적 : PreCalculateAverageUseCase step 3 -> 매매, 전세 평균가 계산 대상 (PRIVATE_SALE_AVG_CALC_MODE)
+        - full : 오늘 생성, 수정된 private_sales 전체 (정합성 재계산용)
+        - incremental : SyncDataUseCase 에서 private_sale_details 가 변경된 private_sales 만
+    """
+
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
+class AdministrativeAvgCalcEngineEnum(Enum):
+    """
+        사용 목적 : PreCalculateAdministrativeDivisionUseCase -> 행정구역 평균가 집계 방식 (ADMINISTRATIVE_AVG_CALC_ENGINE)
+        - sql : GROUPING SETS 집계 (HouseRepository.get_administrative_avg_prices)
+        - memory : 거래 row 조회 후 app 에서 집계 (AdministrativeAvgPriceRollup)
+    """
+
+    SQL = "sql"
+    MEMORY = "memory"
+
+
+class LegalCodeUnmatchedReasonEnum(Enum):
+    """
+        사용 목적 : AddLegalCodeUseCase -> 법정코드 매칭 실패 사유
+        - NOT_FOUND_DONG : 같은 동 이름의 행정구역이 없음
+        - NOT_MATCHED_ADDRESS : 동 이름은 같으나 시도, 시군구, 지번주소가 일치하는 행정구역이 없음
+    """
+
+    NOT_FOUND_DONG = "not_found_dong"
+    NOT_MATCHED_ADDRESS = "not_matched_address"
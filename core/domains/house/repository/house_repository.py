@@ -1,8 +1,12 @@
-import re
+import csv
+import io
+import json
 from datetime import timedelta
 from enum import Enum
-from typing import Optional, List, Any, Tuple, Union, Dict
+from itertools import islice
+from typing import Optional, List, Any, Tuple, Union, Dict, Set, Iterable
 
+from flask import current_app
 from geoalchemy2 import Geometry
 from sqlalchemy import (
     and_,
@@ -15,17 +19,45 @@ from sqlalchemy import (
     case,
     Numeric,
     not_,
+    Column,
+    insert,
+    select,
+    tuple_,
 )
 from sqlalchemy import exc
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import joinedload, selectinload, contains_eager, aliased, Query
 from sqlalchemy.sql.functions import _FunctionGenerator
+from sqlalchemy.sql.visitors import replacement_traverse
 
+from app.extensions import redis
 from app.extensions.database import session
+from app.extensions.utils.administrative_helper import AdministrativePriceRow
+from app.extensions.utils.bulk_write_helper import BulkWriter, BulkWriteResult
 from app.extensions.utils.house_helper import HouseHelper
 from app.extensions.utils.image_helper import S3Helper
 from app.extensions.utils.log_helper import logger_
 from app.extensions.utils.query_helper import RawQueryHelper
-from app.extensions.utils.time_helper import get_server_timestamp
+from app.extensions.utils.search_index import (
+    SearchIndex,
+    SearchDocument,
+    house_search_index,
+    split_search_keywords,
+    split_trailing_choseong,
+    is_choseong,
+    get_choseong,
+    normalize_text,
+)
+from app.extensions.utils.spatial_index import (
+    SpatialIndex,
+    real_estate_spatial_index,
+)
+from app.extensions.utils.time_helper import (
+    get_server_timestamp,
+    get_server_today_range,
+    get_year_month_range,
+)
 from app.persistence.model import (
     RealEstateModel,
     PrivateSaleModel,
@@ -40,6 +72,7 @@ from app.persistence.model import (
     PrivateSaleAvgPriceModel,
     GeneralSupplyResultModel,
     PublicSaleDetailPhotoModel,
+    MapMarkerModel,
 )
 from app.persistence.model.sync_failure_history_model import SyncFailureHistoryModel
 from app.persistence.model.temp_failure_supply_area_model import (
@@ -150,9 +183,54 @@ class HouseRepository:
                 f"[HouseRepository][update_is_like_house] house_id : {dto.house_id} error : {e}"
             )
 
+    def get_real_estate_points(self) -> List[Tuple[int, float, float]]:
+        query = (
+            session.using_bind("read_only")
+            .query(
+                RealEstateModel.id,
+                RealEstateModel.coordinates.ST_X().label("longitude"),
+                RealEstateModel.coordinates.ST_Y().label("latitude"),
+            )
+            .filter(
+                RealEstateModel.is_available == "True",
+                RealEstateModel.coordinates.isnot(None),
+            )
+        )
+        return [(query_.id, query_.longitude, query_.latitude) for query_ in query]
+
+    def get_real_estate_spatial_index(self) -> Optional[SpatialIndex]:
+        """
+            SPATIAL_INDEX_ENABLED 설정 시 in-memory 공간 인덱스 반환 (없으면 PostGIS 필터 사용)
+            - 인덱스는 is_available 인 real_estates 만 포함 -> bounding 쿼리의 is_available 필터와 동일
+        """
+        if not current_app.config.get("SPATIAL_INDEX_ENABLED"):
+            return None
+
+        try:
+            real_estate_spatial_index.refresh(
+                client=redis, loader=self.get_real_estate_points
+            )
+        except Exception as e:
+            logger.error(
+                f"[HouseRepository][get_real_estate_spatial_index] error : {e}"
+            )
+
+        return real_estate_spatial_index if real_estate_spatial_index.is_built else None
+
     def get_bounding_filter_with_two_points(
         self, dto: CoordinatesRangeDto
     ) -> _FunctionGenerator:
+        spatial_index = self.get_real_estate_spatial_index()
+        if spatial_index:
+            return RealEstateModel.id.in_(
+                spatial_index.query_bounding(
+                    start_x=dto.start_x,
+                    start_y=dto.start_y,
+                    end_x=dto.end_x,
+                    end_y=dto.end_y,
+                )
+            )
+
         return func.ST_Contains(
             func.ST_MakeEnvelope(dto.start_x, dto.end_y, dto.end_x, dto.start_y, 4326),
             RealEstateModel.coordinates,
@@ -161,6 +239,13 @@ class HouseRepository:
     def get_bounding_filter_with_radius(
         self, geometry_coordinates: Geometry, degree: float
     ) -> _FunctionGenerator:
+        spatial_index = self.get_real_estate_spatial_index()
+        point = SpatialIndex.get_point(geometry=geometry_coordinates)
+        if spatial_index and point:
+            return RealEstateModel.id.in_(
+                spatial_index.query_radius(x=point[0], y=point[1], degree=degree)
+            )
+
         return func.ST_DWithin(
             geometry_coordinates, RealEstateModel.coordinates, degree,
         )
@@ -229,6 +314,228 @@ class HouseRepository:
 
         return pyoung_filters
 
+    def _get_private_sale_pyoung_case(self) -> case:
+        return case(
+            [
+                (
+                    PrivateSaleAvgPriceModel.pyoung_div == "S",
+                    func.round(
+                        PrivateSaleAvgPriceModel.pyoung / CalcPyoungEnum.CALC_VAR.value
+                    ),
+                )
+            ],
+            else_=func.round(
+                (PrivateSaleAvgPriceModel.pyoung * CalcPyoungEnum.TEMP_CALC_VAR.value)
+                / CalcPyoungEnum.CALC_VAR.value
+            ),
+        )
+
+    def _get_private_default_pyoung_query(
+        self, real_estate_sub_query: Any, private_filters: List[Any]
+    ) -> Query:
+        """
+            default 평수 기준 매매/전세 평균가 (private_sales 1건 당 1 row)
+            - 아파트 또는 오피스텔에 매매정보가 없어도 보여줌 (left outer join)
+            - map_markers 갱신 시 사용
+        """
+        pyoung_case = self._get_private_sale_pyoung_case()
+
+        private_trade_query = (
+            session.using_bind("read_only")
+            .query(real_estate_sub_query)
+            .with_entities(
+                real_estate_sub_query.c.id.label("real_estate_id"),
+                real_estate_sub_query.c.jibun_address.label("jibun_address"),
+                real_estate_sub_query.c.road_address.label("road_address"),
+                real_estate_sub_query.c.coordinates.ST_Y().label("latitude"),
+                real_estate_sub_query.c.coordinates.ST_X().label("longitude"),
+                PrivateSaleModel.id.label("id"),
+                PrivateSaleModel.building_type.label("building_type"),
+                PrivateSaleModel.name.label("name"),
+                pyoung_case.label("trade_pyoung"),
+                PrivateSaleAvgPriceModel.trade_price.label("trade_price"),
+                literal(None, None).label("deposit_pyoung"),
+                literal(None, None).label("deposit_price"),
+                func.coalesce(PrivateSaleModel.trade_status, 0).label(
+                    "trade_status"
+                ),
+                literal(0, None).label("deposit_status"),
+            )
+            .join(
+                PrivateSaleModel,
+                PrivateSaleModel.real_estate_id == real_estate_sub_query.c.id,
+            )
+            .join(
+                PrivateSaleAvgPriceModel,
+                (PrivateSaleAvgPriceModel.private_sale_id == PrivateSaleModel.id)
+                & (
+                    PrivateSaleAvgPriceModel.default_trade_pyoung
+                    == PrivateSaleAvgPriceModel.pyoung
+                ),
+                isouter=True,
+            )
+            .filter(*private_filters)
+        )
+
+        private_deposit_query = (
+            session.using_bind("read_only")
+            .query(real_estate_sub_query)
+            .with_entities(
+                real_estate_sub_query.c.id.label("real_estate_id"),
+                real_estate_sub_query.c.jibun_address.label("jibun_address"),
+                real_estate_sub_query.c.road_address.label("road_address"),
+                real_estate_sub_query.c.coordinates.ST_Y().label("latitude"),
+                real_estate_sub_query.c.coordinates.ST_X().label("longitude"),
+                PrivateSaleModel.id.label("id"),
+                PrivateSaleModel.building_type.label("building_type"),
+                PrivateSaleModel.name.label("name"),
+                literal(None, None).label("trade_pyoung"),
+                literal(None, None).label("trade_price"),
+                pyoung_case.label("deposit_pyoung"),
+                PrivateSaleAvgPriceModel.deposit_price.label("deposit_price"),
+                literal(0, None).label("trade_status"),
+                func.coalesce(PrivateSaleModel.deposit_status, 0).label(
+                    "deposit_status"
+                ),
+            )
+            .join(
+                PrivateSaleModel,
+                PrivateSaleModel.real_estate_id == real_estate_sub_query.c.id,
+            )
+            .join(
+                PrivateSaleAvgPriceModel,
+                (PrivateSaleAvgPriceModel.private_sale_id == PrivateSaleModel.id)
+                & (
+                    PrivateSaleAvgPriceModel.default_deposit_pyoung
+                    == PrivateSaleAvgPriceModel.pyoung
+                ),
+                isouter=True,
+            )
+            .filter(*private_filters)
+        )
+
+        union_q = private_trade_query.union_all(private_deposit_query).subquery()
+        return (
+            session.using_bind("read_only")
+            .query(union_q)
+            .with_entities(
+                func.max(union_q.c.real_estate_id).label("real_estate_id"),
+                func.max(union_q.c.jibun_address).label("jibun_address"),
+                func.max(union_q.c.road_address).label("road_address"),
+                func.max(union_q.c.latitude).label("latitude"),
+                func.max(union_q.c.longitude).label("longitude"),
+                union_q.c.id,
+                func.max(union_q.c.building_type).label("building_type"),
+                func.max(union_q.c.name).label("name"),
+                func.max(union_q.c.trade_pyoung).label("trade_pyoung"),
+                func.max(union_q.c.trade_price).label("trade_price"),
+                func.max(union_q.c.deposit_pyoung).label("deposit_pyoung"),
+                func.max(union_q.c.deposit_price).label("deposit_price"),
+                func.max(union_q.c.trade_status).label("trade_status"),
+                func.max(union_q.c.deposit_status).label("deposit_status"),
+            )
+            .group_by(union_q.c.id)
+        )
+
+    def _get_map_marker_filters(self, filters: List[Any]) -> List[Any]:
+        """
+            real_estates, private_sales 기준으로 만들어진 bounding / private 필터를
+            map_markers 컬럼 기준 필터로 변환한다.
+        """
+        column_map = {
+            (RealEstateModel.__tablename__, "id"): MapMarkerModel.real_estate_id,
+            (RealEstateModel.__tablename__, "coordinates"): MapMarkerModel.coordinates,
+            (
+                PrivateSaleModel.__tablename__,
+                "is_available",
+            ): MapMarkerModel.is_available,
+            (
+                PrivateSaleModel.__tablename__,
+                "building_type",
+            ): MapMarkerModel.building_type,
+        }
+
+        def replace_column(element):
+            if isinstance(element, Column) and element.table is not None:
+                return column_map.get((element.table.name, element.name))
+            return None
+
+        return [
+            replacement_traverse(filter_, {}, replace_column) for filter_ in filters
+        ]
+
+    def refresh_map_markers(self) -> int:
+        """
+            map_markers 전체 갱신 (delete -> insert from select, 단일 트랜잭션)
+            - is_available 인 real_estates, private_sales 만 대상
+        """
+        real_estate_sub_query = (
+            session.query(RealEstateModel)
+            .filter(RealEstateModel.is_available == "True")
+            .subquery()
+        )
+        marker_query = self._get_private_default_pyoung_query(
+            real_estate_sub_query=real_estate_sub_query,
+            private_filters=[PrivateSaleModel.is_available == "True"],
+        ).subquery()
+
+        insert_query = insert(MapMarkerModel).from_select(
+            [
+                "id",
+                "real_estate_id",
+                "jibun_address",
+                "road_address",
+                "coordinates",
+                "latitude",
+                "longitude",
+                "building_type",
+                "name",
+                "is_available",
+                "trade_pyoung",
+                "trade_price",
+                "deposit_pyoung",
+                "deposit_price",
+                "trade_status",
+                "deposit_status",
+            ],
+            select(
+                [
+                    marker_query.c.id,
+                    marker_query.c.real_estate_id,
+                    marker_query.c.jibun_address,
+                    marker_query.c.road_address,
+                    func.ST_SetSRID(
+                        func.ST_MakePoint(
+                            marker_query.c.longitude, marker_query.c.latitude
+                        ),
+                        4326,
+                    ),
+                    marker_query.c.latitude,
+                    marker_query.c.longitude,
+                    marker_query.c.building_type,
+                    marker_query.c.name,
+                    literal(True),
+                    marker_query.c.trade_pyoung,
+                    marker_query.c.trade_price,
+                    marker_query.c.deposit_pyoung,
+                    marker_query.c.deposit_price,
+                    marker_query.c.trade_status,
+                    marker_query.c.deposit_status,
+                ]
+            ),
+        )
+
+        try:
+            session.query(MapMarkerModel).delete(synchronize_session=False)
+            result = session.execute(insert_query)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[HouseRepository][refresh_map_markers] error : {e}")
+            raise InsertFailErrorException
+
+        return result.rowcount
+
     def get_bounding(
         self,
         bounding_filter: _FunctionGenerator,
@@ -253,24 +560,7 @@ class HouseRepository:
         if include_private == BoundingIncludePrivateEnum.INCLUDE.value:
             trade_pyoung_filters = list()
             deposit_pyoung_filters = list()
-            pyoung_case = case(
-                [
-                    (
-                        PrivateSaleAvgPriceModel.pyoung_div == "S",
-                        func.round(
-                            PrivateSaleAvgPriceModel.pyoung
-                            / CalcPyoungEnum.CALC_VAR.value
-                        ),
-                    )
-                ],
-                else_=func.round(
-                    (
-                        PrivateSaleAvgPriceModel.pyoung
-                        * CalcPyoungEnum.TEMP_CALC_VAR.value
-                    )
-                    / CalcPyoungEnum.CALC_VAR.value
-                ),
-            )
+            pyoung_case = self._get_private_sale_pyoung_case()
 
             if (min_area or min_area == 0) and max_area:
                 trade_pyoung_filters.append(pyoung_case >= min_area)
@@ -281,124 +571,23 @@ class HouseRepository:
             """
                 # (1) 면적 필터가 없을 때는 default_pyoung 기준으로 보여줌
                       * 아파트 또는 오피스텔에 매매정보가 없어도 보여줌 (left outer join)
+                      * map_markers 에 미리 계산된 결과를 조회 (_get_private_default_pyoung_query)
                 
                 # (2) 면적 필터가 있을 때는 면적 필터 범위안에서 계약일이 가장 최근의 것 하나를 보여줌
                       * 아파트 또는 오피스텔에 매매정보가 없으면 안보여줌 (inner join)
                         * 평수 필터에서 해당 평수가 존재하지 않으면 맵에서 안보여주기로 했기 때문에
             """
             if not trade_pyoung_filters:
-                # (1)
-                private_trade_query = (
-                    session.using_bind("read_only")
-                    .query(real_estate_sub_query)
-                    .with_entities(
-                        real_estate_sub_query.c.id.label("real_estate_id"),
-                        real_estate_sub_query.c.jibun_address.label("jibun_address"),
-                        real_estate_sub_query.c.road_address.label("road_address"),
-                        real_estate_sub_query.c.coordinates.ST_Y().label("latitude"),
-                        real_estate_sub_query.c.coordinates.ST_X().label("longitude"),
-                        PrivateSaleModel.id.label("id"),
-                        PrivateSaleModel.building_type.label("building_type"),
-                        PrivateSaleModel.name.label("name"),
-                        pyoung_case.label("trade_pyoung"),
-                        PrivateSaleAvgPriceModel.trade_price.label("trade_price"),
-                        literal(None, None).label("deposit_pyoung"),
-                        literal(None, None).label("deposit_price"),
-                        func.coalesce(PrivateSaleModel.trade_status, 0).label(
-                            "trade_status"
-                        ),
-                        literal(0, None).label("deposit_status"),
-                    )
-                    .join(
-                        PrivateSaleModel,
-                        PrivateSaleModel.real_estate_id == real_estate_sub_query.c.id,
-                    )
-                    .join(
-                        PrivateSaleAvgPriceModel,
-                        (
-                            PrivateSaleAvgPriceModel.private_sale_id
-                            == PrivateSaleModel.id
-                        )
-                        & (
-                            PrivateSaleAvgPriceModel.default_trade_pyoung
-                            == PrivateSaleAvgPriceModel.pyoung
-                        ),
-                        isouter=True,
-                    )
-                    .filter(*private_filters)
-                )
-
-                private_deposit_query = (
-                    session.using_bind("read_only")
-                    .query(real_estate_sub_query)
-                    .with_entities(
-                        real_estate_sub_query.c.id.label("real_estate_id"),
-                        real_estate_sub_query.c.jibun_address.label("jibun_address"),
-                        real_estate_sub_query.c.road_address.label("road_address"),
-                        real_estate_sub_query.c.coordinates.ST_Y().label("latitude"),
-                        real_estate_sub_query.c.coordinates.ST_X().label("longitude"),
-                        PrivateSaleModel.id.label("id"),
-                        PrivateSaleModel.building_type.label("building_type"),
-                        PrivateSaleModel.name.label("name"),
-                        literal(None, None).label("trade_pyoung"),
-                        literal(None, None).label("trade_price"),
-                        pyoung_case.label("deposit_pyoung"),
-                        PrivateSaleAvgPriceModel.deposit_price.label("deposit_price"),
-                        literal(0, None).label("trade_status"),
-                        func.coalesce(PrivateSaleModel.deposit_status, 0).label(
-                            "deposit_status"
-                        ),
-                    )
-                    .join(
-                        PrivateSaleModel,
-                        PrivateSaleModel.real_estate_id == real_estate_sub_query.c.id,
-                    )
-                    .join(
-                        PrivateSaleAvgPriceModel,
-                        (
-                            PrivateSaleAvgPriceModel.private_sale_id
-                            == PrivateSaleModel.id
-                        )
-                        & (
-                            PrivateSaleAvgPriceModel.default_deposit_pyoung
-                            == PrivateSaleAvgPriceModel.pyoung
-                        ),
-                        isouter=True,
-                    )
-                    .filter(*private_filters)
+                # (1) map_markers projection 조회 (PreCalculateAverageUseCase 에서 갱신)
+                marker_filters = self._get_map_marker_filters(
+                    filters=[bounding_filter, *private_filters]
                 )
-
-                union_q = private_trade_query.union_all(
-                    private_deposit_query
-                ).subquery()
-                private_query = (
+                query_set = (
                     session.using_bind("read_only")
-                    .query(union_q)
-                    .with_entities(
-                        func.max(union_q.c.real_estate_id).label("real_estate_id"),
-                        func.max(union_q.c.jibun_address).label("jibun_address"),
-                        func.max(union_q.c.road_address).label("road_address"),
-                        func.max(union_q.c.latitude).label("latitude"),
-                        func.max(union_q.c.longitude).label("longitude"),
-                        union_q.c.id,
-                        func.max(union_q.c.building_type).label("building_type"),
-                        func.max(union_q.c.name).label("name"),
-                        func.max(union_q.c.trade_pyoung).label("trade_pyoung"),
-                        func.max(union_q.c.trade_price).label("trade_price"),
-                        func.max(union_q.c.deposit_pyoung).label("deposit_pyoung"),
-                        func.max(union_q.c.deposit_price).label("deposit_price"),
-                        func.max(union_q.c.trade_status).label("trade_status"),
-                        func.max(union_q.c.deposit_status).label("deposit_status"),
-                    )
-                    .group_by(union_q.c.id)
+                    .query(MapMarkerModel)
+                    .filter(*marker_filters)
+                    .all()
                 )
-                print("@@@@")
-                RawQueryHelper.print_raw_query(private_query)
-                print("@@@@")
-                try:
-                    query_set = private_query.all()
-                except Exception as e:
-                    pass
             else:
                 # (2)
                 # private_sales 매매 조회
@@ -815,19 +1004,61 @@ class HouseRepository:
             return None
         return interest_house
 
-    def get_house_with_public_sales(self, house_id: int) -> Tuple[Any, Any]:
-        filters = list()
-        filters.append(
-            and_(
-                PublicSaleModel.id == house_id,
-                PublicSaleModel.real_estate_id == RealEstateModel.id,
-                PublicSaleDetailModel.public_sale_id == PublicSaleModel.id,
-            )
-        )
+    def get_liked_house_ids(
+        self,
+        user_id: Optional[int],
+        house_ids: List[int],
+        type_: int = HouseTypeEnum.PUBLIC_SALES.value,
+    ) -> Set[int]:
+        """
+            사용자가 찜한 house_id set (매물 N 개 -> 1 query)
+            - 캘린더, 메인, 상세 등 목록의 is_like 는 set 포함 여부로 판단
+        """
+        if not user_id or not house_ids:
+            return set()
+
         query = (
             session.using_bind("read_only")
-            .query(
-                PublicSaleModel,
+            .query(InterestHouseModel.house_id)
+            .filter(
+                InterestHouseModel.user_id == user_id,
+                InterestHouseModel.type == type_,
+                InterestHouseModel.is_like == True,
+                InterestHouseModel.house_id.in_(set(house_ids)),
+            )
+        )
+        return {query_.house_id for query_ in query}
+
+    def _get_liked_calendar_house_ids(
+        self, queryset: Optional[list], user_id: int
+    ) -> Set[int]:
+        """
+            queryset : real_estates (+ public_sales) -> 찜하기 house_id 는 public_sales.id
+        """
+        return self.get_liked_house_ids(
+            user_id=user_id,
+            house_ids=[
+                public_sale.id
+                for query in queryset or []
+                for public_sale in query.public_sales
+            ],
+        )
+
+    def _is_liked_calendar_house(self, query: Any, liked_house_ids: Set[int]) -> bool:
+        return any(
+            public_sale.id in liked_house_ids for public_sale in query.public_sales
+        )
+
+    def get_house_with_public_sales(self, house_id: int) -> Tuple[Any, Any]:
+        """
+            분양 매물 상세 조회 -> (PublicSaleModel, 집계값 ...) , housing_category
+            - 집계 query (public_sale_details GROUP BY) 와 object 조회를 분리
+            - 1:N 관계는 selectinload (관계별 IN 조회 1번) -> cartesian join 방지
+        """
+        read_session = session.using_bind("read_only")
+        aggregate = (
+            read_session.query(
+                PublicSaleModel.id,
                 func.min(PublicSaleDetailModel.supply_area).label("min_supply_area"),
                 func.max(PublicSaleDetailModel.supply_area).label("max_supply_area"),
                 func.avg(PublicSaleDetailModel.supply_price).label("avg_supply_price"),
@@ -841,21 +1072,42 @@ class HouseRepository:
                 func.min(PublicSaleDetailModel.supply_price).label("min_supply_price"),
                 func.max(PublicSaleDetailModel.supply_price).label("max_supply_price"),
             )
-            .options(joinedload(PublicSaleModel.real_estates, innerjoin=True))
-            .options(joinedload(PublicSaleModel.public_sale_details, innerjoin=True))
-            .options(joinedload(PublicSaleModel.public_sale_photos))
-            .options(joinedload("public_sale_details.public_sale_detail_photos"))
-            .options(joinedload("public_sale_details.special_supply_results"))
-            .options(joinedload("public_sale_details.general_supply_results"))
-            .filter(*filters)
+            .join(RealEstateModel, PublicSaleModel.real_estate_id == RealEstateModel.id)
+            .join(
+                PublicSaleDetailModel,
+                PublicSaleDetailModel.public_sale_id == PublicSaleModel.id,
+            )
+            .filter(PublicSaleModel.id == house_id)
             .group_by(PublicSaleModel.id)
+            .first()
         )
-        query_set = query.first()
+        if not aggregate:
+            return None, None
 
-        if not query_set:
+        public_sale = (
+            read_session.query(PublicSaleModel)
+            .options(joinedload(PublicSaleModel.real_estates, innerjoin=True))
+            .options(selectinload(PublicSaleModel.public_sale_photos))
+            .options(
+                selectinload(PublicSaleModel.public_sale_details).selectinload(
+                    PublicSaleDetailModel.public_sale_detail_photos
+                ),
+                selectinload(PublicSaleModel.public_sale_details).selectinload(
+                    PublicSaleDetailModel.special_supply_results
+                ),
+                selectinload(PublicSaleModel.public_sale_details).selectinload(
+                    PublicSaleDetailModel.general_supply_results
+                ),
+            )
+            .filter(PublicSaleModel.id == house_id)
+            .first()
+        )
+        if not public_sale:
             return None, None
 
-        return query_set, query_set[0].housing_category
+        # make_house_public_detail_entity 입력 형태 유지 (PublicSaleModel, 집계값 ...)
+        query_set = (public_sale, *aggregate[1:])
+        return query_set, public_sale.housing_category
 
     def _get_supply_price_per_pyoung(
         self, supply_price: Optional[float], avg_pyoung_number: Optional[float]
@@ -923,12 +1175,13 @@ class HouseRepository:
         """
         result = list()
         if queryset:
+            # 사용자가 해당 분양 매물에 대해 찜하기 했는지 여부 (매물 수와 관계없이 1 query)
+            liked_house_ids = self._get_liked_calendar_house_ids(
+                queryset=queryset, user_id=user_id
+            )
             for query in queryset:
-                dto = GetHousePublicDetailDto(user_id=user_id, house_id=query.id)
-
-                # 사용자가 해당 분양 매물에 대해 찜하기 했는지 여부
-                is_like = self.is_user_liked_house(
-                    self.get_public_interest_house(dto=dto)
+                is_like = self._is_liked_calendar_house(
+                    query=query, liked_house_ids=liked_house_ids
                 )
                 result.append(query.to_detail_calendar_info_entity(is_like=is_like))
 
@@ -945,8 +1198,14 @@ class HouseRepository:
         result = list()
 
         if queryset:
+            liked_house_ids = self._get_liked_calendar_house_ids(
+                queryset=queryset, user_id=user_id
+            )
             for query in queryset:
-                result.append(query.to_simple_calendar_info_entity(is_like=False))
+                is_like = self._is_liked_calendar_house(
+                    query=query, liked_house_ids=liked_house_ids
+                )
+                result.append(query.to_simple_calendar_info_entity(is_like=is_like))
         return result
 
     def get_calendar_info_filters(self, year_month: str) -> list:
@@ -962,17 +1221,24 @@ class HouseRepository:
             )
         )
 
+        # YYYYMMDD 문자열 범위 조건 (startswith -> LIKE 대신 index range scan)
+        start, end = get_year_month_range(year_month=year_month)
         filters.append(
             or_(
-                PublicSaleModel.subscription_start_date.startswith(year_month),
-                PublicSaleModel.subscription_end_date.startswith(year_month),
-                PublicSaleModel.special_supply_date.startswith(year_month),
-                PublicSaleModel.special_supply_etc_date.startswith(year_month),
-                PublicSaleModel.first_supply_date.startswith(year_month),
-                PublicSaleModel.first_supply_etc_date.startswith(year_month),
-                PublicSaleModel.second_supply_date.startswith(year_month),
-                PublicSaleModel.second_supply_etc_date.startswith(year_month),
-                PublicSaleModel.notice_winner_date.startswith(year_month),
+                *[
+                    and_(column >= start, column < end)
+                    for column in (
+                        PublicSaleModel.subscription_start_date,
+                        PublicSaleModel.subscription_end_date,
+                        PublicSaleModel.special_supply_date,
+                        PublicSaleModel.special_supply_etc_date,
+                        PublicSaleModel.first_supply_date,
+                        PublicSaleModel.first_supply_etc_date,
+                        PublicSaleModel.second_supply_date,
+                        PublicSaleModel.second_supply_etc_date,
+                        PublicSaleModel.notice_winner_date,
+                    )
+                ]
             )
         )
         return filters
@@ -1275,98 +1541,194 @@ class HouseRepository:
 
         return search_entities
 
-    def get_search_house_list(self, keywords: str) -> List[MapSearchEntity]:
+    def _get_search_region_rank(self, si_do: Optional[str]) -> int:
+        if si_do == "서울특별시":
+            return 0
+        if si_do == "경기도":
+            return 1
+        return 2
+
+    def get_search_documents(self) -> List[SearchDocument]:
         """
-            todo: 검색 성능 고도화 필요, private_sales 붙이므로 front 화면 변경 필요 (핑퐁 작업 필요)
-            - full_scan 방식
-            - %LIKE% : 서로 다른 두 단어부터 검색 불가
-            - Full Text Search 필요(ts_vector, pg_trgm, elastic_search...)
+            in-memory 검색 인덱스(HouseSearchIndex) 빌드용 문서 조회
+            - 분양 : is_available, 임대 제외 / 매매 : 빌라 제외 (get_search_house_list 조건과 동일)
         """
-        public_filters = list()
-        private_filters = list()
-
-        public_text_keyword_filters = list()
-        private_text_keyword_filters = list()
-
-        public_number_keyword_filters = list()
-        private_number_keyword_filters = list()
-
-        public_filters.append(
-            and_(
+        public_query = (
+            session.using_bind("read_only")
+            .query(PublicSaleModel)
+            .with_entities(
+                RealEstateModel.id,
+                PublicSaleModel.name.label("name"),
+                PublicSaleModel.name.label("house_name"),
+                RealEstateModel.coordinates.ST_Y().label("latitude"),
+                RealEstateModel.coordinates.ST_X().label("longitude"),
+                literal("분양", String).label("house_type"),
+                RealEstateModel.si_do,
+                RealEstateModel.dong_myun,
+                RealEstateModel.jibun_address,
+                RealEstateModel.road_address,
+            )
+            .join(RealEstateModel, RealEstateModel.id == PublicSaleModel.real_estate_id)
+            .filter(
                 RealEstateModel.is_available == "True",
                 PublicSaleModel.is_available == "True",
                 PublicSaleModel.rent_type != RentTypeEnum.RENTAL.value,
-            ),
+            )
         )
 
-        private_filters.append(
-            and_(
+        private_query = (
+            session.using_bind("read_only")
+            .query(PrivateSaleModel)
+            .with_entities(
+                RealEstateModel.id,
+                (RealEstateModel.dong_myun + " " + PrivateSaleModel.name).label("name"),
+                PrivateSaleModel.name.label("house_name"),
+                RealEstateModel.coordinates.ST_Y().label("latitude"),
+                RealEstateModel.coordinates.ST_X().label("longitude"),
+                literal("매매", String).label("house_type"),
+                RealEstateModel.si_do,
+                RealEstateModel.dong_myun,
+                RealEstateModel.jibun_address,
+                RealEstateModel.road_address,
+            )
+            .join(
+                RealEstateModel, RealEstateModel.id == PrivateSaleModel.real_estate_id
+            )
+            .filter(
                 RealEstateModel.is_available == "True",
                 PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
-            ),
+            )
         )
 
-        hangul = re.compile("[^ ㄱ-ㅣ가-힣]+")
-        split_numbers = hangul.findall(keywords)
-
-        split_list = list()
-        for split_number in split_numbers:
-            split_list.append(keywords.split(split_number))
+        documents = list()
+        for query in public_query.union_all(private_query):
+            house_name = normalize_text(query.house_name)
+            documents.append(
+                SearchDocument(
+                    id=query.id,
+                    name=query.name,
+                    latitude=query.latitude,
+                    longitude=query.longitude,
+                    house_type=query.house_type,
+                    region_rank=self._get_search_region_rank(si_do=query.si_do),
+                    name_text=house_name,
+                    dong_text=normalize_text(query.dong_myun),
+                    text=house_name
+                    + normalize_text(query.dong_myun)
+                    + normalize_text(query.jibun_address)
+                    + normalize_text(query.road_address),
+                    choseong=get_choseong(house_name),
+                )
+            )
+        return documents
 
-        # 리스트안의 리스트 합치기
-        split_list = sum(split_list, [])
+    def get_house_search_index(self) -> Optional[SearchIndex]:
+        """
+            SEARCH_INDEX_ENABLED 설정 시 in-memory 검색 인덱스 반환
+            - 빌드/재빌드는 별도 thread 에서 진행 -> 빌드 완료 전에는 None (재빌드 중에는 기존 인덱스)
+        """
+        if not current_app.config.get("SEARCH_INDEX_ENABLED"):
+            return None
 
-        # 공백 원소 제거
-        split_list = list(filter(bool, split_list))
-        split_keywords = list()
-        for split_text in split_list:
-            # 띄어쓰기 분리
-            text = split_text.split()
-            for c in text:
-                split_keywords.append(c)
+        app = current_app._get_current_object()
 
-        # 검색 효율 떨어뜨리는 문자 제거
-        # word_list = ["단지", "아파트", "마을", "0"]
-        # for word in word_list:
-        #     if word in split_list:
-        #         split_list.remove(word)
+        def load_search_documents() -> List[SearchDocument]:
+            with app.app_context():
+                return self.get_search_documents()
 
-        split_set = set(split_keywords)
+        try:
+            house_search_index.refresh(client=redis, loader=load_search_documents)
+        except Exception as e:
+            logger.error(f"[HouseRepository][get_house_search_index] error : {e}")
 
-        # text 검색 키워드
-        for split_text in split_set:
-            public_text_keyword_filters.append(
-                (PublicSaleModel.name.contains(split_text))
-            )
-            private_text_keyword_filters.append(
-                (PrivateSaleModel.name.contains(split_text))
-            )
+        return house_search_index if house_search_index.is_built else None
 
-        # 숫자 검색 키워드
-        for split_number in split_numbers:
-            public_number_keyword_filters.append(
-                (PublicSaleModel.name.contains(split_number))
-            )
-            private_number_keyword_filters.append(
-                (PrivateSaleModel.name.contains(split_number))
+    def _get_search_house_id_query(
+        self,
+        id_column: Column,
+        name_column: Column,
+        real_estate_id_column: Column,
+        keywords: List[str],
+    ) -> Query:
+        """
+            키워드 별로 매물명, 동, 주소 중 하나에 포함되는 매물 id (키워드 간 AND)
+            - 컬럼 별 query 를 UNION -> 컬럼 별 pg_trgm GIN 인덱스(gin_trgm_ops) 사용
+              (여러 테이블 컬럼을 OR 로 묶으면 인덱스를 사용하지 못함)
+            - 키워드 간 INTERSECT
+        """
+        keyword_queries = list()
+        for keyword in keywords:
+            pattern = f"%{keyword}%"
+            name_query = (
+                session.using_bind("read_only")
+                .query(id_column)
+                .filter(name_column.ilike(pattern))
             )
+            real_estate_queries = [
+                session.using_bind("read_only")
+                .query(id_column)
+                .join(RealEstateModel, RealEstateModel.id == real_estate_id_column)
+                .filter(column.ilike(pattern))
+                for column in (
+                    RealEstateModel.dong_myun,
+                    RealEstateModel.jibun_address,
+                    RealEstateModel.road_address,
+                )
+            ]
+            keyword_queries.append(name_query.union(*real_estate_queries))
 
-        if not split_set:
-            # 띄어쓰기로 Like 검색
-            split_keywords = keywords.split()
+        return keyword_queries[0].intersect(*keyword_queries[1:])
 
-            # 검색 효율 떨어뜨리는 문자 제거
-            # for word in word_list:
-            #     if word in split_keywords:
-            #         split_keywords.remove(word)
+    def get_search_house_list(self, keywords: str) -> List[MapSearchEntity]:
+        """
+            매물 검색 (분양 10건, 매매 15건)
+            - 키워드 : 띄어쓰기, 한글/숫자 기준 분리 -> 서로 떨어진 단어도 검색 가능 (AND)
+            - 검색 대상 : 매물명, 동, 지번/도로명 주소
+            - 정렬 : 매물명 유사도(pg_trgm similarity) -> 서울 -> 경기 -> id
+            - in-memory 검색 인덱스 사용 시(SEARCH_INDEX_ENABLED) HouseSearchIndex 사용
+              -> 키워드 1개(입력 중 자동완성)면 매물명/동 prefix 일치 결과를 먼저 반환 (DB 조회 없음)
+              -> 입력 중인 마지막 초성도 검색 ex) 반포ㅈ -> 반포자이
+            - 인덱스 미사용(또는 빌드 전) 시 DB 조회
+              -> 초성 검색은 DB 에서 처리할 수 없으므로 빈 결과, 입력 중인 마지막 초성은 제외 후 검색
+        """
+        split_keywords = split_search_keywords(keywords=keywords)
+        if not split_keywords:
+            return []
 
-            for split_keyword in split_keywords:
-                public_text_keyword_filters.append(
-                    PublicSaleModel.name.contains(split_keyword),
-                )
-                private_text_keyword_filters.append(
-                    PrivateSaleModel.name.contains(split_keyword),
+        search_index = self.get_house_search_index()
+        if search_index:
+            documents = search_index.search(
+                keywords=split_keywords, house_type="분양", limit=10
+            ) + search_index.search(keywords=split_keywords, house_type="매매", limit=15)
+            return [
+                MapSearchEntity(
+                    id=document.id,
+                    name=document.name,
+                    latitude=document.latitude,
+                    longitude=document.longitude,
+                    house_type=document.house_type,
                 )
+                for document in documents
+            ]
+
+        if any(is_choseong(keyword) for keyword in split_keywords):
+            return []
+
+        split_keywords = [
+            split_trailing_choseong(keyword=keyword)[0] for keyword in split_keywords
+        ]
+        public_sale_id_query = self._get_search_house_id_query(
+            id_column=PublicSaleModel.id,
+            name_column=PublicSaleModel.name,
+            real_estate_id_column=PublicSaleModel.real_estate_id,
+            keywords=split_keywords,
+        )
+        private_sale_id_query = self._get_search_house_id_query(
+            id_column=PrivateSaleModel.id,
+            name_column=PrivateSaleModel.name,
+            real_estate_id_column=PrivateSaleModel.real_estate_id,
+            keywords=split_keywords,
+        )
 
         query_cond1 = (
             session.using_bind("read_only")
@@ -1379,8 +1741,13 @@ class HouseRepository:
                 literal("분양", String).label("house_type"),
             )
             .join(RealEstateModel, RealEstateModel.id == PublicSaleModel.real_estate_id)
-            .filter(*public_filters)
-            .filter(and_(*public_text_keyword_filters, *public_number_keyword_filters),)
+            .filter(
+                RealEstateModel.is_available == "True",
+                PublicSaleModel.is_available == "True",
+                PublicSaleModel.rent_type != RentTypeEnum.RENTAL.value,
+            )
+            .filter(PublicSaleModel.id.in_(public_sale_id_query))
+            .order_by(func.similarity(PublicSaleModel.name, keywords).desc())
             .order_by((RealEstateModel.si_do == "서울특별시").desc())
             .order_by((RealEstateModel.si_do == "경기도").desc())
             .order_by(RealEstateModel.id.asc())
@@ -1400,10 +1767,12 @@ class HouseRepository:
             .join(
                 RealEstateModel, RealEstateModel.id == PrivateSaleModel.real_estate_id
             )
-            .filter(*private_filters)
             .filter(
-                and_(*private_text_keyword_filters, *private_number_keyword_filters),
+                RealEstateModel.is_available == "True",
+                PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
             )
+            .filter(PrivateSaleModel.id.in_(private_sale_id_query))
+            .order_by(func.similarity(PrivateSaleModel.name, keywords).desc())
             .order_by((RealEstateModel.si_do == "서울특별시").desc())
             .order_by((RealEstateModel.si_do == "경기도").desc())
             .order_by(RealEstateModel.id.asc())
@@ -1628,12 +1997,10 @@ class HouseRepository:
                 PrivateSaleDetailModel.private_sale_id,
                 PrivateSaleDetailModel.private_area,
                 PrivateSaleDetailModel.supply_area,
-                func.to_char(
-                    func.to_date(
-                        func.max(PrivateSaleDetailModel.contract_date), "YYYYMMDD"
-                    ),
-                    "YYYYMMDD",
-                ).label("max_contract_date"),
+                # YYYYMMDD 문자열 -> max 가 곧 최근 계약일
+                func.max(PrivateSaleDetailModel.contract_date).label(
+                    "max_contract_date"
+                ),
                 func.to_char(
                     (
                         func.to_date(
@@ -1660,12 +2027,10 @@ class HouseRepository:
                 PrivateSaleDetailModel.private_sale_id,
                 PrivateSaleDetailModel.private_area,
                 PrivateSaleDetailModel.supply_area,
-                func.to_char(
-                    func.to_date(
-                        func.max(PrivateSaleDetailModel.contract_date), "YYYYMMDD"
-                    ),
-                    "YYYYMMDD",
-                ).label("max_contract_date"),
+                # YYYYMMDD 문자열 -> max 가 곧 최근 계약일
+                func.max(PrivateSaleDetailModel.contract_date).label(
+                    "max_contract_date"
+                ),
                 func.to_char(
                     (
                         func.to_date(
@@ -1901,33 +2266,50 @@ class HouseRepository:
 
         return avg_prices_update_list, avg_prices_create_list
 
-    def create_private_sale_avg_prices(self, create_list: List[dict]) -> None:
-        try:
-            session.bulk_insert_mappings(
-                PrivateSaleAvgPriceModel, [create_info for create_info in create_list]
-            )
+    def _bulk_write(
+        self, model: Any, rows: List[dict], is_update: bool = False
+    ) -> BulkWriteResult:
+        """
+            BULK_WRITE_CHUNK_SIZE 단위 insert / update (chunk 단위 commit, BulkWriter)
+            - 실패 chunk 는 bisect 로 실패 row 만 분리 -> sync_failure_histories 저장
+            - 나머지 row 는 반영됨 (전체 rollback 하지 않음)
+        """
+        writer = BulkWriter(
+            session=session, chunk_size=current_app.config.get("BULK_WRITE_CHUNK_SIZE")
+        )
+        if is_update:
+            result = writer.update(model=model, rows=rows)
+        else:
+            result = writer.insert(model=model, rows=rows)
 
-            session.commit()
-        except exc.IntegrityError as e:
-            session.rollback()
+        if result.failure_rows:
             logger.error(
-                f"[HouseRepository][create_private_sale_avg_prices] error : {e}"
+                f"[HouseRepository][_bulk_write] {model.__tablename__} : "
+                f"{result.row_count} Succeeded, {len(result.failure_rows)} Failed"
             )
-            raise NotUniqueErrorException
-
-    def update_private_sale_avg_prices(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                PrivateSaleAvgPriceModel, [update_info for update_info in update_list]
+            self.bulk_insert_sync_failure_histories(
+                insert_list=[
+                    dict(
+                        target_table=model.__tablename__,
+                        # Decimal, datetime -> JSON 컬럼 저장 가능한 값으로 변환
+                        sync_data=json.loads(json.dumps(row, default=str)),
+                    )
+                    for row in result.failure_rows
+                ]
             )
+        return result
 
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                f"[HouseRepository][update_private_sale_avg_prices] error : {e}"
-            )
-            raise UpdateFailErrorException
+    def create_private_sale_avg_prices(
+        self, create_list: List[dict]
+    ) -> BulkWriteResult:
+        return self._bulk_write(model=PrivateSaleAvgPriceModel, rows=create_list)
+
+    def update_private_sale_avg_prices(
+        self, update_list: List[dict]
+    ) -> BulkWriteResult:
+        return self._bulk_write(
+            model=PrivateSaleAvgPriceModel, rows=update_list, is_update=True
+        )
 
     def _is_exists_private_sale_avg_prices(
         self, private_sale_id: int, pyoung_number: int
@@ -2119,25 +2501,51 @@ class HouseRepository:
 
         return default_pyoung_dict
 
-    def get_default_infos(self, public_sale_id: int) -> Optional[dict]:
+    def get_default_infos_by_public_sale_ids(
+        self, public_sale_ids: List[int]
+    ) -> Dict[int, dict]:
+        """
+            public_sale_id 별 대표 타입(일반공급 세대수가 가장 많은 타입)의 공급면적, 공급가
+            - 대상 분양 전체의 타입을 1번에 조회 후 public_sale_id 별로 1건 선정
+            - 공급면적이 0 이면 대상에서 제외
+        """
         query = (
-            session.query(
-                PublicSaleDetailModel.supply_area, PublicSaleDetailModel.supply_price,
+            session.query(PublicSaleDetailModel)
+            .with_entities(
+                PublicSaleDetailModel.public_sale_id,
+                PublicSaleDetailModel.supply_area,
+                PublicSaleDetailModel.supply_price,
+                PublicSaleDetailModel.general_household,
+            )
+            .filter(PublicSaleDetailModel.public_sale_id.in_(public_sale_ids))
+            .order_by(
+                PublicSaleDetailModel.public_sale_id,
+                PublicSaleDetailModel.general_household.desc(),
             )
-            .filter(PublicSaleDetailModel.public_sale_id == public_sale_id)
-            .order_by(PublicSaleDetailModel.general_household.desc(),)
         )
 
-        query_set = query.first()
-
-        if not query_set:
-            return None
-        elif query_set[0] == 0:
-            return None
+        default_infos = dict()
+        for query_set in query.all():
+            if query_set.public_sale_id in default_infos:
+                continue
+            default_infos[query_set.public_sale_id] = dict(
+                supply_area=query_set.supply_area, supply_price=query_set.supply_price
+            )
 
-        return dict(supply_area=query_set[0], supply_price=query_set[1])
+        return {
+            public_sale_id: default_info
+            for public_sale_id, default_info in default_infos.items()
+            if default_info["supply_area"] != 0
+        }
 
-    def get_competition_and_min_score(self, public_sale_id: int) -> dict:
+    def get_competition_and_min_score_by_public_sale_ids(
+        self, public_sale_ids: List[int]
+    ) -> Dict[int, dict]:
+        """
+            public_sale_id 별 평균 경쟁률(해당지역), 최저 당첨가점
+            - 타입 별 합계 -> public_sale_id 별 합계 (group by 2단계)
+            - 해당지역 일반공급 결과가 없는 분양은 결과에서 제외 (None 처리)
+        """
         sub_query = (
             session.query(PublicSaleDetailModel)
             .with_entities(
@@ -2150,117 +2558,118 @@ class HouseRepository:
                 ).label("sum_applicant_num"),
             )
             .join(PublicSaleDetailModel.general_supply_results)
-            .filter(PublicSaleDetailModel.public_sale_id == public_sale_id)
+            .filter(PublicSaleDetailModel.public_sale_id.in_(public_sale_ids))
             .filter(PublicSaleDetailModel.general_household > 0)
             .filter(GeneralSupplyResultModel.region == "해당지역")
-            .group_by(PublicSaleDetailModel.id,)
-        ).subquery()
-
-        min_point_query = (
-            session.query(PublicSaleDetailModel)
-            .with_entities(
-                func.min(GeneralSupplyResultModel.win_point).label("min_win_point")
-            )
-            .join(PublicSaleDetailModel.general_supply_results)
-            .filter(PublicSaleDetailModel.public_sale_id == public_sale_id)
-            .filter(GeneralSupplyResultModel.win_point >= 0)
+            .group_by(PublicSaleDetailModel.id, PublicSaleDetailModel.public_sale_id)
         ).subquery()
 
-        base_query = (
+        competition_query = (
             session.query(sub_query)
             .with_entities(
+                sub_query.c.public_sale_id,
                 func.round(
                     func.sum(sub_query.c.sum_applicant_num)
                     / func.sum(sub_query.c.sum_general_household)
                 ).label("avg_competition"),
-                func.min(min_point_query.c.min_win_point).label("min_win_point"),
             )
             .group_by(sub_query.c.public_sale_id)
         )
 
-        query_set = base_query.first()
-        if not query_set:
-            return dict(avg_competition=None, min_score=None)
+        min_point_query = (
+            session.query(PublicSaleDetailModel)
+            .with_entities(
+                PublicSaleDetailModel.public_sale_id,
+                func.min(GeneralSupplyResultModel.win_point).label("min_win_point"),
+            )
+            .join(PublicSaleDetailModel.general_supply_results)
+            .filter(PublicSaleDetailModel.public_sale_id.in_(public_sale_ids))
+            .filter(GeneralSupplyResultModel.win_point >= 0)
+            .group_by(PublicSaleDetailModel.public_sale_id)
+        )
+        min_points = {
+            query_set.public_sale_id: query_set.min_win_point
+            for query_set in min_point_query.all()
+        }
 
-        return dict(avg_competition=query_set[0], min_score=query_set[1])
+        return {
+            query_set.public_sale_id: dict(
+                avg_competition=query_set.avg_competition,
+                min_score=min_points.get(query_set.public_sale_id),
+            )
+            for query_set in competition_query.all()
+        }
 
-    def _is_exists_public_sale_avg_prices(
-        self, public_sale_id: int, pyoung_number: int
-    ) -> Optional[int]:
+    def _get_public_sale_avg_price_ids(
+        self, public_sale_ids: List[int]
+    ) -> Dict[Tuple[int, int], int]:
+        """
+            return : {(public_sale_id, pyoung): public_sale_avg_prices.id}
+        """
         query = (
-            session.query(PublicSaleAvgPriceModel.id).filter(
-                and_(
-                    PublicSaleAvgPriceModel.public_sale_id == public_sale_id,
-                    PublicSaleAvgPriceModel.pyoung == pyoung_number,
-                )
+            session.query(PublicSaleAvgPriceModel)
+            .with_entities(
+                PublicSaleAvgPriceModel.id,
+                PublicSaleAvgPriceModel.public_sale_id,
+                PublicSaleAvgPriceModel.pyoung,
             )
-        ).first()
+            .filter(PublicSaleAvgPriceModel.public_sale_id.in_(public_sale_ids))
+        )
 
-        if not query:
-            return None
-        return query.id
+        return {
+            (query_set.public_sale_id, query_set.pyoung): query_set.id
+            for query_set in query.all()
+        }
 
     def make_pre_calc_target_public_sale_avg_prices_list(
-        self, public_sale_id: int, default_info: dict, competition_and_score_info: dict
-    ) -> Optional[Tuple[List[dict], List[dict]]]:
-        if not default_info:
-            return None
-
+        self,
+        default_infos: Dict[int, dict],
+        competition_and_score_infos: Dict[int, dict],
+    ) -> Tuple[List[dict], List[dict]]:
+        """
+            default_infos 에 포함된 분양 전체의 public_sale_avg_prices (update_list, create_list)
+            - 기존 row 존재 여부는 1번의 조회로 판단
+        """
         avg_prices_update_list = list()
         avg_prices_create_list = list()
+        if not default_infos:
+            return avg_prices_update_list, avg_prices_create_list
 
-        avg_price_info = {
-            "public_sale_id": public_sale_id,
-            "pyoung": HouseHelper.convert_area_to_pyoung(
-                area=default_info["supply_area"]
-            ),
-            "default_pyoung": HouseHelper.convert_area_to_pyoung(
-                area=default_info["supply_area"]
-            ),
-            "supply_price": default_info["supply_price"],
-            "avg_competition": competition_and_score_info["avg_competition"],
-            "min_score": competition_and_score_info["min_score"],
-        }
-        public_sale_avg_price_id = self._is_exists_public_sale_avg_prices(
-            public_sale_id=avg_price_info["public_sale_id"],
-            pyoung_number=avg_price_info["pyoung"],
+        avg_price_ids = self._get_public_sale_avg_price_ids(
+            public_sale_ids=list(default_infos.keys())
         )
+        for public_sale_id, default_info in default_infos.items():
+            competition_and_score_info = competition_and_score_infos.get(
+                public_sale_id, dict(avg_competition=None, min_score=None)
+            )
+            pyoung = HouseHelper.convert_area_to_pyoung(
+                area=default_info["supply_area"]
+            )
+            avg_price_info = {
+                "public_sale_id": public_sale_id,
+                "pyoung": pyoung,
+                "default_pyoung": pyoung,
+                "supply_price": default_info["supply_price"],
+                "avg_competition": competition_and_score_info["avg_competition"],
+                "min_score": competition_and_score_info["min_score"],
+            }
 
-        if public_sale_avg_price_id:
-            avg_price_info.update({"id": public_sale_avg_price_id})
-            avg_prices_update_list.append(avg_price_info)
-        else:
-            avg_prices_create_list.append(avg_price_info)
+            public_sale_avg_price_id = avg_price_ids.get((public_sale_id, pyoung))
+            if public_sale_avg_price_id:
+                avg_price_info.update({"id": public_sale_avg_price_id})
+                avg_prices_update_list.append(avg_price_info)
+            else:
+                avg_prices_create_list.append(avg_price_info)
 
         return avg_prices_update_list, avg_prices_create_list
 
-    def update_public_sale_avg_prices(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                PublicSaleAvgPriceModel, [update_info for update_info in update_list]
-            )
-
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                f"[HouseRepository][update_public_sale_avg_prices] error : {e}"
-            )
-            raise UpdateFailErrorException
-
-    def create_public_sale_avg_prices(self, create_list: List[dict]) -> None:
-        try:
-            session.bulk_insert_mappings(
-                PublicSaleAvgPriceModel, [create_info for create_info in create_list]
-            )
+    def update_public_sale_avg_prices(self, update_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(
+            model=PublicSaleAvgPriceModel, rows=update_list, is_update=True
+        )
 
-            session.commit()
-        except exc.IntegrityError as e:
-            session.rollback()
-            logger.error(
-                f"[HouseRepository][create_public_sale_avg_prices] error : {e}"
-            )
-            raise NotUniqueErrorException
+    def create_public_sale_avg_prices(self, create_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(model=PublicSaleAvgPriceModel, rows=create_list)
 
     def get_acquisition_tax_calc_target_list(self):
         filters = list()
@@ -2279,46 +2688,40 @@ class HouseRepository:
 
         return query.all()
 
-    def update_acquisition_taxes(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                PublicSaleDetailModel, [update_info for update_info in update_list]
-            )
+    def update_acquisition_taxes(self, update_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(
+            model=PublicSaleDetailModel, rows=update_list, is_update=True
+        )
 
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"[HouseRepository][update_acquisition_taxes] error : {e}")
-            raise UpdateFailErrorException
+    def _get_changed_today_filter(self, model: Any) -> Any:
+        """
+            오늘 생성 or 수정된 row (created_at, updated_at 을 함수로 감싸지 않는 범위 조건)
+        """
+        start, end = get_server_today_range()
+        return or_(
+            and_(model.created_at >= start, model.created_at < end),
+            and_(model.updated_at >= start, model.updated_at < end),
+        )
 
-    def get_common_query_object(self, yyyymm: int) -> Query:
+    def get_common_query_object(
+        self,
+        yyyymm: int,
+        to_yyyymm: Optional[int] = None,
+        is_changed_today: bool = True,
+    ) -> Query:
+        """
+            to_yyyymm : 계약년월 상한 (backfill 용)
+            is_changed_today : 오늘 생성 or 수정된 거래만 (nightly batch)
+        """
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
 
         filters.append(PrivateSaleDetailModel.contract_ym >= yyyymm)
-
-        filters.append(
-            and_(
-                PrivateSaleDetailModel.is_available == "True",
-                func.to_char(PrivateSaleDetailModel.created_at, "YYYY-mm-dd") == today,
-                PrivateSaleDetailModel.trade_type == "매매",
-            )
-            | and_(
-                PrivateSaleDetailModel.is_available == "True",
-                func.to_char(PrivateSaleDetailModel.updated_at, "YYYY-mm-dd") == today,
-                PrivateSaleDetailModel.trade_type == "매매",
-            )
-            | and_(
-                PrivateSaleDetailModel.is_available == "True",
-                func.to_char(PrivateSaleDetailModel.created_at, "YYYY-mm-dd") == today,
-                PrivateSaleDetailModel.trade_type == "전세",
-            )
-            | and_(
-                PrivateSaleDetailModel.is_available == "True",
-                func.to_char(PrivateSaleDetailModel.updated_at, "YYYY-mm-dd") == today,
-                PrivateSaleDetailModel.trade_type == "전세",
-            )
-        )
+        if to_yyyymm:
+            filters.append(PrivateSaleDetailModel.contract_ym <= to_yyyymm)
+        filters.append(PrivateSaleDetailModel.is_available == "True")
+        filters.append(PrivateSaleDetailModel.trade_type.in_(["매매", "전세"]))
+        if is_changed_today:
+            filters.append(self._get_changed_today_filter(model=PrivateSaleDetailModel))
 
         pyoung_case = case(
             [
@@ -2403,162 +2806,128 @@ class HouseRepository:
                 PrivateSaleModel.real_estate_id,
                 PrivateSaleModel.id,
                 PrivateSaleModel.building_type,
-                PrivateSaleDetailModel.trade_type,
-            )
-        )
-
-        union_query = query_cond1.union_all(query_cond2).subquery()
-        sub_q = aliased(union_query)
-
-        return sub_q
-
-    def get_si_do_avg_price(self, sub_q: Query):
-        query_cond3 = (
-            session.query(RealEstateModel)
-            .with_entities(
-                RealEstateModel.si_do,
-                func.max(RealEstateModel.front_legal_code).label("front_legal_code"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_deposit_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_deposit_price"),
-            )
-            .join(sub_q, RealEstateModel.id == sub_q.c.private_sales_real_estate_id)
-            .group_by(
-                RealEstateModel.si_do,
-                sub_q.c.private_sale_details_trade_type,
-                sub_q.c.private_sales_building_type,
-            )
-        ).subquery()
-
-        final_sub_q = aliased(query_cond3)
-
-        final_query = (
-            session.query(final_sub_q)
-            .with_entities(
-                final_sub_q.c.si_do,
-                func.substring(func.max(final_sub_q.c.front_legal_code), 1, 2).label(
-                    "legal_code"
-                ),
-                func.sum(final_sub_q.c.apt_per_trade_price).label(
-                    "apt_avg_trade_price"
-                ),
-                func.sum(final_sub_q.c.apt_per_deposit_price).label(
-                    "apt_avg_deposit_price"
-                ),
-                func.sum(final_sub_q.c.op_per_trade_price).label("op_avg_trade_price"),
-                func.sum(final_sub_q.c.op_per_deposit_price).label(
-                    "op_avg_deposit_price"
-                ),
+                PrivateSaleDetailModel.trade_type,
             )
-            .group_by(final_sub_q.c.si_do)
         )
 
-        query_set = final_query.all()
+        union_query = query_cond1.union_all(query_cond2).subquery()
+        sub_q = aliased(union_query)
 
-        if not query_set:
-            return []
+        return sub_q
 
-        return self._make_administrative_calc_avg_entity(
-            query_set=query_set, level=DivisionLevelEnum.LEVEL_1
+    def get_administrative_avg_prices(
+        self,
+        yyyymm: int,
+        to_yyyymm: Optional[int] = None,
+        is_changed_today: bool = True,
+    ) -> List[dict]:
+        """
+            행정구역 level 1 ~ 3 평균가를 GROUPING SETS 로 1번에 집계 (real_estates x sub_q 1회 scan)
+            - level 1 : si_do / level 2 : si_gun_gu, front_legal_code
+              level 3 : dong_myun, front_legal_code, back_legal_code
+            - 거래 타입, 건물 타입 별 round(sum(가격) / sum(평수)) * 34 -> 행정구역 별 합산
+            return : update_avg_price_to_administrative_division 입력 형태 (id 제외)
+        """
+        sub_q = self.get_common_query_object(
+            yyyymm=yyyymm, to_yyyymm=to_yyyymm, is_changed_today=is_changed_today
+        )
+        # (건물 타입, 가격) -> sub_q 컬럼 : apt_sum_trade_price, ...
+        price_types = (
+            ("apt", "trade_price"),
+            ("apt", "deposit_price"),
+            ("op", "trade_price"),
+            ("op", "deposit_price"),
+        )
+        type_columns = (
+            sub_q.c.private_sale_details_trade_type,
+            sub_q.c.private_sales_building_type,
         )
 
-    def get_si_gun_gu_avg_price(self, sub_q: Query):
         query_cond3 = (
             session.query(RealEstateModel)
             .with_entities(
+                # level 1 : 3, level 2 : 1, level 3 : 0
+                func.grouping(
+                    RealEstateModel.si_gun_gu, RealEstateModel.dong_myun
+                ).label("grouping_id"),
                 RealEstateModel.si_do,
                 RealEstateModel.si_gun_gu,
+                RealEstateModel.dong_myun,
                 RealEstateModel.front_legal_code,
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_deposit_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_deposit_price"),
+                RealEstateModel.back_legal_code,
+                func.max(RealEstateModel.front_legal_code).label(
+                    "max_front_legal_code"
+                ),
+                *[
+                    (
+                        func.round(
+                            func.sum(sub_q.c[f"{column}_sum_{price}"])
+                            / func.sum(sub_q.c.pyoung)
+                        )
+                        * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
+                    ).label(f"{column}_per_{price}")
+                    for column, price in price_types
+                ],
             )
             .join(sub_q, RealEstateModel.id == sub_q.c.private_sales_real_estate_id)
             .group_by(
-                RealEstateModel.si_do,
-                RealEstateModel.si_gun_gu,
-                RealEstateModel.front_legal_code,
-                sub_q.c.private_sale_details_trade_type,
-                sub_q.c.private_sales_building_type,
+                func.grouping_sets(
+                    tuple_(RealEstateModel.si_do, *type_columns),
+                    tuple_(
+                        RealEstateModel.si_do,
+                        RealEstateModel.si_gun_gu,
+                        RealEstateModel.front_legal_code,
+                        *type_columns,
+                    ),
+                    tuple_(
+                        RealEstateModel.si_do,
+                        RealEstateModel.si_gun_gu,
+                        RealEstateModel.dong_myun,
+                        RealEstateModel.front_legal_code,
+                        RealEstateModel.back_legal_code,
+                        *type_columns,
+                    ),
+                )
             )
         ).subquery()
 
         final_sub_q = aliased(query_cond3)
+        group_columns = (
+            final_sub_q.c.grouping_id,
+            final_sub_q.c.si_do,
+            final_sub_q.c.si_gun_gu,
+            final_sub_q.c.dong_myun,
+            final_sub_q.c.front_legal_code,
+            final_sub_q.c.back_legal_code,
+        )
 
         final_query = (
             session.query(final_sub_q)
             .with_entities(
-                final_sub_q.c.si_do,
-                final_sub_q.c.si_gun_gu,
-                final_sub_q.c.front_legal_code.label("legal_code"),
-                func.sum(final_sub_q.c.apt_per_trade_price).label(
-                    "apt_avg_trade_price"
-                ),
-                func.sum(final_sub_q.c.apt_per_deposit_price).label(
-                    "apt_avg_deposit_price"
-                ),
-                func.sum(final_sub_q.c.op_per_trade_price).label("op_avg_trade_price"),
-                func.sum(final_sub_q.c.op_per_deposit_price).label(
-                    "op_avg_deposit_price"
+                *group_columns,
+                func.max(final_sub_q.c.max_front_legal_code).label(
+                    "max_front_legal_code"
                 ),
+                *[
+                    func.sum(final_sub_q.c[f"{column}_per_{price}"]).label(
+                        f"{column}_avg_{price}"
+                    )
+                    for column, price in price_types
+                ],
             )
             .filter(
-                and_(
-                    final_sub_q.c.front_legal_code != "00000",
-                    final_sub_q.c.si_do != "세종특별자치시",
+                or_(
+                    final_sub_q.c.grouping_id == 3,
+                    and_(
+                        final_sub_q.c.front_legal_code != "00000",
+                        or_(
+                            final_sub_q.c.grouping_id == 0,
+                            final_sub_q.c.si_do != "세종특별자치시",
+                        ),
+                    ),
                 )
             )
-            .group_by(
-                final_sub_q.c.si_do,
-                final_sub_q.c.si_gun_gu,
-                final_sub_q.c.front_legal_code,
-            )
+            .group_by(*group_columns)
         )
 
         query_set = final_query.all()
@@ -2566,185 +2935,117 @@ class HouseRepository:
         if not query_set:
             return []
 
-        return self._make_administrative_calc_avg_entity(
-            query_set=query_set, level=DivisionLevelEnum.LEVEL_2
-        )
+        return self._make_administrative_avg_price_list(query_set=query_set)
 
-    def get_dong_myun_avg_price(self, sub_q: Query):
-        query_cond3 = (
+    def get_administrative_price_rows(
+        self,
+        yyyymm: int,
+        to_yyyymm: Optional[int] = None,
+        is_changed_today: bool = True,
+    ) -> List[AdministrativePriceRow]:
+        """
+            AdministrativeAvgPriceRollup 입력용 (real_estate_id, 법정코드, 평수, 가격) row 조회
+            - 행정구역 집계는 app 에서 수행 -> DB 는 sub_q x real_estates join 만
+        """
+        sub_q = self.get_common_query_object(
+            yyyymm=yyyymm, to_yyyymm=to_yyyymm, is_changed_today=is_changed_today
+        )
+        query = (
             session.query(RealEstateModel)
             .with_entities(
-                RealEstateModel.si_do,
-                RealEstateModel.si_gun_gu,
-                RealEstateModel.dong_myun,
-                RealEstateModel.front_legal_code,
-                RealEstateModel.back_legal_code,
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.apt_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("apt_per_deposit_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_trade_price) / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_trade_price"),
-                (
-                    func.round(
-                        func.sum(sub_q.c.op_sum_deposit_price)
-                        / func.sum(sub_q.c.pyoung)
-                    )
-                    * CalcPyoungEnum.AVG_DEFAULT_PYOUNG.value
-                ).label("op_per_deposit_price"),
-            )
-            .join(sub_q, RealEstateModel.id == sub_q.c.private_sales_real_estate_id)
-            .group_by(
-                RealEstateModel.si_do,
-                RealEstateModel.si_gun_gu,
-                RealEstateModel.dong_myun,
+                RealEstateModel.id,
                 RealEstateModel.front_legal_code,
                 RealEstateModel.back_legal_code,
-                sub_q.c.private_sale_details_trade_type,
                 sub_q.c.private_sales_building_type,
-            )
-        ).subquery()
-
-        final_sub_q = aliased(query_cond3)
-
-        final_query = (
-            session.query(final_sub_q)
-            .with_entities(
-                final_sub_q.c.si_do,
-                final_sub_q.c.si_gun_gu,
-                final_sub_q.c.dong_myun,
-                final_sub_q.c.front_legal_code.label("front_legal_code"),
-                final_sub_q.c.back_legal_code.label("back_legal_code"),
-                func.sum(final_sub_q.c.apt_per_trade_price).label(
-                    "apt_avg_trade_price"
-                ),
-                func.sum(final_sub_q.c.apt_per_deposit_price).label(
-                    "apt_avg_deposit_price"
+                sub_q.c.private_sale_details_trade_type,
+                sub_q.c.pyoung,
+                (sub_q.c.apt_sum_trade_price + sub_q.c.op_sum_trade_price).label(
+                    "trade_price"
                 ),
-                func.sum(final_sub_q.c.op_per_trade_price).label("op_avg_trade_price"),
-                func.sum(final_sub_q.c.op_per_deposit_price).label(
-                    "op_avg_deposit_price"
+                (sub_q.c.apt_sum_deposit_price + sub_q.c.op_sum_deposit_price).label(
+                    "deposit_price"
                 ),
             )
-            .filter(final_sub_q.c.front_legal_code != "00000")
-            .group_by(
-                final_sub_q.c.si_do,
-                final_sub_q.c.si_gun_gu,
-                final_sub_q.c.dong_myun,
-                final_sub_q.c.front_legal_code,
-                final_sub_q.c.back_legal_code,
-            )
+            .join(sub_q, RealEstateModel.id == sub_q.c.private_sales_real_estate_id)
         )
 
-        query_set = final_query.all()
-
-        if not query_set:
-            return []
-
-        return self._make_administrative_calc_avg_entity(
-            query_set=query_set, level=DivisionLevelEnum.LEVEL_3
-        )
+        return [AdministrativePriceRow(*row) for row in query.all()]
 
-    def _make_administrative_calc_avg_entity(
-        self, query_set: Query, level: Enum
-    ) -> List[dict]:
+    def _make_administrative_avg_price_list(self, query_set: List[Any]) -> List[dict]:
+        """
+            grouping_id -> level 별 법정코드
+            - level 1 : 시도 법정코드 앞 2자리 + "000" / "00000"
+            - level 2 : front_legal_code / "00000"
+            - level 3 : front_legal_code / back_legal_code
+        """
+        grouping_levels = {
+            3: DivisionLevelEnum.LEVEL_1,
+            1: DivisionLevelEnum.LEVEL_2,
+            0: DivisionLevelEnum.LEVEL_3,
+        }
         result = list()
-        if level == DivisionLevelEnum.LEVEL_1:
-            for query in query_set:
-                result.append(
-                    dict(
-                        front_legal_code=query[1] + "000",
-                        back_legal_code="00000",
-                        apt_trade_price=query[2],
-                        apt_deposit_price=query[3],
-                        op_trade_price=query[4],
-                        op_deposit_price=query[5],
-                        public_sale_price=0,
-                        level=level,
-                    )
-                )
-        elif level == DivisionLevelEnum.LEVEL_2:
-            for query in query_set:
-                result.append(
-                    dict(
-                        front_legal_code=query[2],
-                        back_legal_code="00000",
-                        apt_trade_price=query[3],
-                        apt_deposit_price=query[4],
-                        op_trade_price=query[5],
-                        op_deposit_price=query[6],
-                        public_sale_price=0,
-                        level=level,
-                    )
-                )
-        else:
-            for query in query_set:
-                result.append(
-                    dict(
-                        front_legal_code=query[3],
-                        back_legal_code=query[4],
-                        apt_trade_price=query[5],
-                        apt_deposit_price=query[6],
-                        op_trade_price=query[7],
-                        op_deposit_price=query[8],
-                        public_sale_price=0,
-                        level=level,
-                    )
+        for query in query_set:
+            level = grouping_levels[query.grouping_id]
+            front_legal_code = query.front_legal_code
+            back_legal_code = query.back_legal_code
+            if level == DivisionLevelEnum.LEVEL_1:
+                front_legal_code = query.max_front_legal_code[:2] + "000"
+                back_legal_code = "00000"
+            elif level == DivisionLevelEnum.LEVEL_2:
+                back_legal_code = "00000"
+
+            result.append(
+                dict(
+                    front_legal_code=front_legal_code,
+                    back_legal_code=back_legal_code,
+                    apt_trade_price=query.apt_avg_trade_price,
+                    apt_deposit_price=query.apt_avg_deposit_price,
+                    op_trade_price=query.op_avg_trade_price,
+                    op_deposit_price=query.op_avg_deposit_price,
+                    public_sale_price=0,
+                    level=level,
                 )
+            )
 
         return result
 
     def set_administrative_division_id(
         self, result_list: List[dict]
     ) -> Tuple[List[dict], List[dict]]:
+        """
+            (front_legal_code, back_legal_code, level) 로 administrative_divisions.id bind
+            - 행정구역 전체를 1번 조회하여 dictionary 로 매핑
+        """
+        administrative_ids = {
+            (query.front_legal_code, query.back_legal_code, query.level): query.id
+            for query in session.query(
+                AdministrativeDivisionModel.id,
+                AdministrativeDivisionModel.front_legal_code,
+                AdministrativeDivisionModel.back_legal_code,
+                AdministrativeDivisionModel.level,
+            )
+        }
+
         failure_list = list()
         update_list = list()
         for result in result_list:
-            query = (
-                session.query(AdministrativeDivisionModel).filter_by(
-                    front_legal_code=result["front_legal_code"],
-                    back_legal_code=result["back_legal_code"],
-                    level=result["level"],
-                )
-            ).first()
-
-            if not query:
+            administrative_id = administrative_ids.get(
+                (result["front_legal_code"], result["back_legal_code"], result["level"])
+            )
+            if not administrative_id:
                 failure_list.append(result)
                 continue
 
-            result["id"] = query.id
+            result["id"] = administrative_id
             update_list.append(result)
         return update_list, failure_list
 
     def update_avg_price_to_administrative_division(
         self, update_list: List[dict]
-    ) -> None:
-        try:
-            session.bulk_update_mappings(
-                AdministrativeDivisionModel,
-                [update_info for update_info in update_list],
-            )
-
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                f"[HouseRepository][update_avg_price_to_administrative_division] error : {e}"
-            )
-            raise UpdateFailErrorException
+    ) -> BulkWriteResult:
+        return self._bulk_write(
+            model=AdministrativeDivisionModel, rows=update_list, is_update=True
+        )
 
     def get_administrative_divisions_legal_code_info_all_list(
         self,
@@ -2775,19 +3076,10 @@ class HouseRepository:
             [query.to_legal_code_entity() for query in query_set] if query_set else None
         )
 
-    def update_legal_code_to_real_estates(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                RealEstateModel, [update_info for update_info in update_list]
-            )
-
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(
-                f"[HouseRepository][update_legal_code_to_real_estates] error : {e}"
-            )
-            raise UpdateFailErrorException
+    def update_legal_code_to_real_estates(
+        self, update_list: List[dict]
+    ) -> BulkWriteResult:
+        return self._bulk_write(model=RealEstateModel, rows=update_list, is_update=True)
 
     def get_target_list_of_public_sales(self) -> Optional[List[PublicSaleEntity]]:
         filters = list()
@@ -3069,12 +3361,10 @@ class HouseRepository:
             session.query(PrivateSaleDetailModel)
             .with_entities(
                 PrivateSaleDetailModel.private_sales_id,
-                func.to_char(
-                    func.to_date(
-                        func.max(PrivateSaleDetailModel.contract_date), "YYYYMMDD"
-                    ),
-                    "YYYYMMDD",
-                ).label("max_contract_date"),
+                # YYYYMMDD 문자열 -> max 가 곧 최근 계약일
+                func.max(PrivateSaleDetailModel.contract_date).label(
+                    "max_contract_date"
+                ),
                 func.to_char(
                     (
                         func.to_date(
@@ -3098,12 +3388,10 @@ class HouseRepository:
             session.query(PrivateSaleDetailModel)
             .with_entities(
                 PrivateSaleDetailModel.private_sales_id,
-                func.to_char(
-                    func.to_date(
-                        func.max(PrivateSaleDetailModel.contract_date), "YYYYMMDD"
-                    ),
-                    "YYYYMMDD",
-                ).label("max_contract_date"),
+                # YYYYMMDD 문자열 -> max 가 곧 최근 계약일
+                func.max(PrivateSaleDetailModel.contract_date).label(
+                    "max_contract_date"
+                ),
                 func.to_char(
                     (
                         func.to_date(
@@ -3146,18 +3434,12 @@ class HouseRepository:
         """
         target_ids = list()
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
 
         filters.append(
             and_(
                 PrivateSaleModel.is_available == "True",
                 PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
-                func.to_char(PrivateSaleModel.created_at, "YYYY-mm-dd") == today,
-            )
-            | and_(
-                PrivateSaleModel.is_available == "True",
-                PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
-                func.to_char(PrivateSaleModel.updated_at, "YYYY-mm-dd") == today,
+                self._get_changed_today_filter(model=PrivateSaleModel),
             )
         )
         query = session.query(PrivateSaleModel).filter(*filters)
@@ -3190,17 +3472,8 @@ class HouseRepository:
 
         return [query.to_entity() for query in query_set] if query_set else None
 
-    def bulk_update_public_sales(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                PublicSaleModel, [update_info for update_info in update_list],
-            )
-
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"[HouseRepository][bulk_update_public_sales] error : {e}")
-            raise UpdateFailErrorException
+    def bulk_update_public_sales(self, update_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(model=PublicSaleModel, rows=update_list, is_update=True)
 
     def get_recent_private_sales(self):
         query = (
@@ -3214,23 +3487,8 @@ class HouseRepository:
             return None
         return query_set.to_entity()
 
-    def bulk_create_private_sale(self, create_list: List[dict]) -> None:
-        failed_pk_list = list()
-        try:
-            session.bulk_insert_mappings(
-                PrivateSaleModel, [create_info for create_info in create_list]
-            )
-
-            session.commit()
-        except exc.IntegrityError as e:
-            session.rollback()
-            logger.error(f"[HouseRepository][bulk_create_private_sale] error : {e}")
-            for entry in create_list:
-                failed_pk_list.append(entry["id"])
-            logger.info(
-                f"[HouseRepository][bulk_create_private_sale]-failed_list: {failed_pk_list})"
-            )
-            raise NotUniqueErrorException
+    def bulk_create_private_sale(self, create_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(model=PrivateSaleModel, rows=create_list)
 
     def get_real_estates_have_both_public_and_private(
         self, real_estate_ids: List[int]
@@ -3284,18 +3542,12 @@ class HouseRepository:
 
     def get_target_list_of_upsert_public_sale_avg_prices(self) -> Optional[List[int]]:
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
 
         filters.append(
             and_(
                 PublicSaleModel.is_available == "True",
                 PublicSaleModel.rent_type == RentTypeEnum.PRE_SALE,
-                func.to_char(PublicSaleModel.created_at, "YYYY-mm-dd") == today,
-            )
-            | and_(
-                PublicSaleModel.is_available == "True",
-                PublicSaleModel.rent_type == RentTypeEnum.PRE_SALE,
-                func.to_char(PublicSaleModel.updated_at, "YYYY-mm-dd") == today,
+                self._get_changed_today_filter(model=PublicSaleModel),
             )
         )
         query = (
@@ -3321,25 +3573,32 @@ class HouseRepository:
 
         return target_ids
 
-    def get_target_of_upsert_private_sale_avg_prices(self,) -> Optional[List[int]]:
+    def get_target_of_upsert_private_sale_avg_prices(
+        self, private_sale_ids: Optional[List[int]] = None
+    ) -> Optional[List[int]]:
         """
             연립다세대 제외
+            - private_sale_ids 없음 (full) : 오늘 생성, 수정된 private_sales 전체
+            - private_sale_ids 있음 (incremental) : 해당 private_sales 중 대상만
         """
         target_ids = list()
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
-        filters.append(
-            and_(
-                PrivateSaleModel.is_available == "True",
-                PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
-                func.to_char(PrivateSaleModel.created_at, "YYYY-mm-dd") == today,
+        if private_sale_ids is not None:
+            filters.append(
+                and_(
+                    PrivateSaleModel.id.in_(private_sale_ids),
+                    PrivateSaleModel.is_available == "True",
+                    PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
+                )
             )
-            | and_(
-                PrivateSaleModel.is_available == "True",
-                PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
-                func.to_char(PrivateSaleModel.updated_at, "YYYY-mm-dd") == today,
+        else:
+            filters.append(
+                and_(
+                    PrivateSaleModel.is_available == "True",
+                    PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
+                    self._get_changed_today_filter(model=PrivateSaleModel),
+                )
             )
-        )
         query = session.query(PrivateSaleModel).filter(*filters)
 
         query_set = query.all()
@@ -3367,7 +3626,6 @@ class HouseRepository:
         """
         target_list = list()
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
         filters.append(
             and_(
                 RealEstateModel.is_available == "True",
@@ -3376,12 +3634,7 @@ class HouseRepository:
                 TempSupplyAreaApiModel.id == None,
                 TempSummarySupplyAreaApiModel.id == None,
             )
-            & and_(
-                or_(
-                    func.to_char(PrivateSaleModel.created_at, "YYYY-mm-dd") == today,
-                    func.to_char(PrivateSaleModel.updated_at, "YYYY-mm-dd") == today,
-                )
-            )
+            & self._get_changed_today_filter(model=PrivateSaleModel)
         )
         query = (
             session.query(RealEstateModel)
@@ -3441,29 +3694,49 @@ class HouseRepository:
         return target_list
 
     # todo. AddSupplyAreaUseCase에서 사용 -> antman 이관 후 삭제 필요
-    def create_temp_supply_area_api(
-        self, create_list: List[dict], summary_failure_list: List[dict]
-    ) -> None:
+    def copy_temp_supply_area_api(
+        self, columns: Tuple[str, ...], rows: Iterable[tuple], chunk_size: int = 5000
+    ) -> int:
+        """
+            temp_supply_area_api 에 row tuple(columns 순서) 을 chunk 단위로 적재
+            - postgresql : COPY FROM STDIN (csv), 그 외 : executemany insert
+            - 전체 rows 를 1 트랜잭션으로 처리 -> 실패 시 해당 rows 전체 rollback
+            return : 적재 건수
+        """
+        table = TempSupplyAreaApiModel.__table__
+        is_postgresql = session.get_bind().dialect.name == "postgresql"
+        copy_query = (
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        )
+        row_count = 0
+
         try:
-            session.bulk_insert_mappings(
-                TempSupplyAreaApiModel, [create_info for create_info in create_list]
-            )
+            cursor = session.connection().connection.cursor() if is_postgresql else None
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+
+                if is_postgresql:
+                    buffer = io.StringIO()
+                    # None -> 빈 값(unquoted) -> NULL
+                    csv.writer(buffer).writerows(chunk)
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_query, buffer)
+                else:
+                    session.execute(
+                        table.insert(), [dict(zip(columns, row)) for row in chunk]
+                    )
+                row_count += len(chunk)
 
             session.commit()
-        except exc.IntegrityError as e:
+        except Exception as e:
             session.rollback()
-            logger.error(f"[HouseRepository][create_temp_supply_area_api] error : {e}")
+            logger.error(f"[HouseRepository][copy_temp_supply_area_api] error : {e}")
+            raise InsertFailErrorException
 
-            for create_info in create_list:
-                summary_failure_list.append(
-                    dict(
-                        real_estate_id=create_info["req_real_estate_id"],
-                        real_estate_name=create_info["req_real_estate_name"],
-                        private_sales_id=create_info["req_private_sales_id"],
-                        private_sale_name=create_info["req_private_sale_name"],
-                        success_yn=False,
-                    )
-                )
+        return row_count
 
     # todo. AddSupplyAreaUseCase에서 사용 -> antman 이관 후 삭제 필요
     def create_summary_failure_list_to_temp_summary(
@@ -3690,7 +3963,6 @@ class HouseRepository:
          """
         target_list = list()
         filters = list()
-        today = get_server_timestamp().strftime("%Y-%m-%d")
         filters.append(
             and_(
                 RealEstateModel.is_available == "True",
@@ -3698,12 +3970,7 @@ class HouseRepository:
                 PrivateSaleModel.building_type != BuildTypeEnum.ROW_HOUSE.value,
                 TempSummarySupplyAreaApiModel.success_yn == True,
             )
-            & and_(
-                or_(
-                    func.to_char(PrivateSaleModel.created_at, "YYYY-mm-dd") == today,
-                    func.to_char(PrivateSaleModel.updated_at, "YYYY-mm-dd") == today,
-                )
-            )
+            & self._get_changed_today_filter(model=PrivateSaleModel)
         )
         query = (
             session.query(RealEstateModel)
@@ -3850,41 +4117,61 @@ class HouseRepository:
             )
             raise NotUniqueErrorException
 
-    def bulk_update_private_sales(self, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                PrivateSaleModel, [update_info for update_info in update_list],
-            )
+    def bulk_update_private_sales(self, update_list: List[dict]) -> BulkWriteResult:
+        return self._bulk_write(
+            model=PrivateSaleModel, rows=update_list, is_update=True
+        )
 
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"[HouseRepository][bulk_update_private_sales] error : {e}")
-            raise UpdateFailErrorException
+    def get_exists_ids_by_ids(self, model: Any, ids: List[int]) -> Set[int]:
+        if not ids:
+            return set()
 
-    def bulk_update_target_model(self, model: object, update_list: List[dict]) -> None:
-        try:
-            session.bulk_update_mappings(
-                model, [update_info for update_info in update_list],
-            )
+        query = session.query(model.id).filter(model.id.in_(ids))
+        return {query_.id for query_ in query}
 
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            logger.error(f"[HouseRepository][bulk_update_target_model] error : {e}")
-            raise UpdateFailErrorException
+    def upsert_target_model(self, model: Any, upsert_list: List[dict]) -> None:
+        """
+            INSERT ... ON CONFLICT (id) DO UPDATE (batch 단위, 단일 트랜잭션)
+            - 모델 컬럼이 아닌 key 는 제외 (ex: real_estates 의 x_vl, y_vl)
+            - row 마다 key 구성이 다를 수 있으므로 key 구성 별로 나누어 실행
+        """
+        table_columns = set(model.__table__.columns.keys())
+        dialect_insert = (
+            postgresql_insert
+            if session.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+
+        upsert_groups: Dict[Tuple[str, ...], List[dict]] = dict()
+        for upsert_info in upsert_list:
+            upsert_data = {
+                key: value
+                for key, value in upsert_info.items()
+                if key in table_columns
+            }
+            upsert_groups.setdefault(tuple(sorted(upsert_data)), []).append(upsert_data)
 
-    def bulk_insert_target_model(self, model: object, insert_list: List[dict]) -> None:
         try:
-            session.bulk_insert_mappings(
-                model, [insert_info for insert_info in insert_list],
-            )
+            for columns, upsert_data in upsert_groups.items():
+                query = dialect_insert(model.__table__)
+                update_set = {
+                    column: query.excluded[column]
+                    for column in columns
+                    if column not in ("id", "created_at")
+                }
+                if "updated_at" in table_columns:
+                    update_set["updated_at"] = func.now()
+
+                session.execute(
+                    query.on_conflict_do_update(index_elements=["id"], set_=update_set),
+                    upsert_data,
+                )
 
             session.commit()
         except Exception as e:
             session.rollback()
-            logger.error(f"[HouseRepository][bulk_insert_target_model] error : {e}")
-            raise InsertFailErrorException
+            logger.error(f"[HouseRepository][upsert_target_model] error : {e}")
+            raise InsertFailErrorException from e
 
     def bulk_insert_sync_failure_histories(self, insert_list: List[dict]) -> None:
         try:
@@ -3900,8 +4187,46 @@ class HouseRepository:
             )
             raise InsertFailErrorException
 
-    def _is_exists_by_id(self, model: Any, data: Dict):
-        query = session.query(exists().where(model.id == data.get("id")))
-        if query.scalar():
-            return True
-        return False
+    def get_coordinates_by_target_ids(
+        self, model: Any, target_ids: List[int]
+    ) -> List[Tuple[float, float]]:
+        """
+            변경된 row id -> 해당 매물의 (경도, 위도) 목록 반환 (지도 tile 캐시 무효화용)
+            - real_estates, private_sales, private_sale_details, public_sales, public_sale_details 외에는 빈 리스트
+        """
+        if not target_ids:
+            return []
+
+        query = session.query(
+            RealEstateModel.coordinates.ST_X().label("longitude"),
+            RealEstateModel.coordinates.ST_Y().label("latitude"),
+        )
+
+        if model == RealEstateModel:
+            query = query.filter(RealEstateModel.id.in_(target_ids))
+        elif model in (PrivateSaleModel, PrivateSaleDetailModel):
+            query = query.join(
+                PrivateSaleModel, PrivateSaleModel.real_estate_id == RealEstateModel.id
+            )
+            if model == PrivateSaleModel:
+                query = query.filter(PrivateSaleModel.id.in_(target_ids))
+            else:
+                query = query.join(
+                    PrivateSaleDetailModel,
+                    PrivateSaleDetailModel.private_sale_id == PrivateSaleModel.id,
+                ).filter(PrivateSaleDetailModel.id.in_(target_ids))
+        elif model in (PublicSaleModel, PublicSaleDetailModel):
+            query = query.join(
+                PublicSaleModel, PublicSaleModel.real_estate_id == RealEstateModel.id
+            )
+            if model == PublicSaleModel:
+                query = query.filter(PublicSaleModel.id.in_(target_ids))
+            else:
+                query = query.join(
+                    PublicSaleDetailModel,
+                    PublicSaleDetailModel.public_sale_id == PublicSaleModel.id,
+                ).filter(PublicSaleDetailModel.id.in_(target_ids))
+        else:
+            return []
+
+        return [(query_.longitude, query_.latitude) for query_ in query.distinct()]
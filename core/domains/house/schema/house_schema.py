@@ -5,6 +5,7 @@ from pydantic import BaseModel, StrictStr
 from core.domains.banner.entity.banner_entity import ButtonLinkEntity
 from core.domains.house.entity.house_entity import (
     BoundingRealEstateEntity,
+    BoundingClusterEntity,
     AdministrativeDivisionEntity,
     GetHouseMainEntity,
     GetMainPreSubscriptionEntity,
@@ -40,6 +41,11 @@ class BoundingResponseSchema(BaseModel):
     houses: List[BoundingRealEstateEntity]
 
 
+class BoundingClusterResponseSchema(BaseModel):
+    houses: List[BoundingRealEstateEntity]
+    clusters: List[BoundingClusterEntity]
+
+
 class BoundingAdministrativeResponseSchema(BaseModel):
     houses: Union[Optional[List[AdministrativeDivisionEntity]], str]
 
@@ -3,10 +3,16 @@ from http import HTTPStatus
 from typing import Union, List, Optional, Dict
 
 import inject
+from flask import current_app
 
+from app.extensions import redis
+from app.extensions.cache.calendar_snapshot_cache import CalendarSnapshotCache
+from app.extensions.cache.house_public_detail_cache import HousePublicDetailCache
+from app.extensions.cache.map_tile_cache import MapTileCache
 from app.extensions.utils.event_observer import send_message, get_event_object
 from app.extensions.utils.house_helper import HouseHelper
 from app.extensions.utils.image_helper import S3Helper
+from app.extensions.utils.map_cluster_helper import MapClusterHelper
 from app.extensions.utils.report_helper import ReportHelper
 from app.extensions.utils.time_helper import get_server_timestamp
 from core.domains.banner.entity.banner_entity import (
@@ -36,6 +42,7 @@ from core.domains.house.entity.house_entity import (
     HousePublicDetailEntity,
     MapSearchEntity,
     BoundingRealEstateEntity,
+    BoundingClusterResultEntity,
     PublicSalePhotoEntity,
     PublicSaleDetailEntity,
 )
@@ -85,6 +92,57 @@ class HouseBaseUseCase:
         )
         return get_event_object(topic_name=BannerTopicEnum.GET_BUTTON_LINK_LIST)
 
+    def _get_simple_calendar_info(
+        self, user_id: Optional[int], year_month: str
+    ) -> List[SimpleCalendarInfoEntity]:
+        """
+            월별 캘린더 snapshot (CalendarSnapshotCache) 조회 후 사용자 is_like 만 merge
+            - cache miss : DB 조회 후 조회 전에 확인한 version 으로 snapshot 저장
+              (sync 에서 변경 시 version 변경 + 이번 달 재생성)
+        """
+        calendar_snapshot_cache = CalendarSnapshotCache(client=redis)
+        version = calendar_snapshot_cache.get_version()
+        snapshot = (
+            calendar_snapshot_cache.get(version=version, year_month=year_month)
+            if version is not None
+            else None
+        )
+        if snapshot is None:
+            search_filters = self._house_repo.get_calendar_info_filters(
+                year_month=year_month
+            )
+            calendar_entities = self._house_repo.get_simple_calendar_info(
+                user_id=user_id, search_filters=search_filters
+            )
+            if version is not None and calendar_entities is not None:
+                calendar_snapshot_cache.set(
+                    version=version,
+                    year_month=year_month,
+                    snapshot=CalendarSnapshotCache.to_snapshot(
+                        entities=calendar_entities
+                    ),
+                )
+            return calendar_entities
+
+        liked_house_ids = self._house_repo.get_liked_house_ids(
+            user_id=user_id,
+            house_ids=[
+                calendar["public_sale"]["id"]
+                for calendar in snapshot
+                if calendar.get("public_sale")
+            ],
+        )
+        return [
+            SimpleCalendarInfoEntity(
+                **dict(
+                    calendar,
+                    is_like=bool(calendar.get("public_sale"))
+                    and calendar["public_sale"]["id"] in liked_house_ids,
+                )
+            )
+            for calendar in snapshot
+        ]
+
 
 class UpsertInterestHouseUseCase(HouseBaseUseCase):
     def execute(
@@ -117,6 +175,108 @@ class UpsertInterestHouseUseCase(HouseBaseUseCase):
 
 
 class BoundingUseCase(HouseBaseUseCase):
+    def _get_bounding(
+        self, dto: CoordinatesRangeDto, private_filters: List, public_filters: List
+    ) -> Union[List[BoundingRealEstateEntity], List]:
+        bounding_filter = self._house_repo.get_bounding_filter_with_two_points(dto=dto)
+        return self._house_repo.get_bounding(
+            bounding_filter=bounding_filter,
+            private_filters=private_filters,
+            public_filters=public_filters,
+            public_status_filters=dto.public_status,
+            include_private=dto.include_private,
+            min_area=dto.min_area,
+            max_area=dto.max_area,
+        )
+
+    def _is_in_viewport(
+        self, entity: BoundingRealEstateEntity, dto: CoordinatesRangeDto
+    ) -> bool:
+        house = entity.private_sales or entity.public_sales
+        if not house:
+            return False
+
+        start_x, end_x = min(dto.start_x, dto.end_x), max(dto.start_x, dto.end_x)
+        start_y, end_y = min(dto.start_y, dto.end_y), max(dto.start_y, dto.end_y)
+        return (
+            start_x <= house.longitude <= end_x and start_y <= house.latitude <= end_y
+        )
+
+    def _get_bounding_with_tile_cache(
+        self, dto: CoordinatesRangeDto, private_filters: List, public_filters: List
+    ) -> Union[List[BoundingRealEstateEntity], List]:
+        """
+            viewport -> tile 단위로 나누어 tile 별 캐시 조회 (MapTileCache)
+            - tile 값은 MGET 으로 한번에 조회
+            - cache miss 인 tile 전체를 포함하는 범위로 get_bounding 1번 조회
+              -> 매물 좌표로 tile 을 구해 tile 별로 나누어 한번에 저장
+            - tile 경계에 걸친 매물 중복 제거 후 viewport 범위 내의 매물만 반환
+        """
+        map_tile_cache = MapTileCache(client=redis)
+        tile_keys = map_tile_cache.get_tile_keys(dto=dto)
+        if not tile_keys:
+            return self._get_bounding(
+                dto=dto, private_filters=private_filters, public_filters=public_filters
+            )
+
+        cached_tiles = map_tile_cache.get_tile_values(keys=list(tile_keys.values()))
+        tile_entities = list()
+        missed_tile_keys = dict()
+        for tile, key in tile_keys.items():
+            cached_tile = cached_tiles.get(key)
+            if cached_tile is None:
+                missed_tile_keys[tile] = key
+                continue
+            tile_entities.extend(
+                BoundingRealEstateEntity(**entity) for entity in cached_tile
+            )
+
+        if missed_tile_keys:
+            start_x, start_y, end_x, end_y = MapTileCache.get_tiles_bounds(
+                tiles=list(missed_tile_keys), level=dto.level
+            )
+            missed_entities = self._get_bounding(
+                dto=dto.copy(
+                    update=dict(
+                        start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y
+                    )
+                ),
+                private_filters=private_filters,
+                public_filters=public_filters,
+            )
+
+            missed_tiles = {key: list() for key in missed_tile_keys.values()}
+            for entity in missed_entities:
+                house = entity.private_sales or entity.public_sales
+                if not house:
+                    continue
+                key = missed_tile_keys.get(
+                    MapTileCache.get_tile(
+                        longitude=house.longitude,
+                        latitude=house.latitude,
+                        level=dto.level,
+                    )
+                )
+                # 조회 범위 중 캐시된 tile 에 속한 매물은 캐시 값 사용
+                if not key:
+                    continue
+                missed_tiles[key].append(entity.dict())
+                tile_entities.append(entity)
+
+            map_tile_cache.set_tile_values(tile_values=missed_tiles)
+
+        bounding_entities = dict()
+        for entity in tile_entities:
+            if not self._is_in_viewport(entity=entity, dto=dto):
+                continue
+            if entity.private_sales:
+                house_key = ("private", entity.private_sales.private_sale_id)
+            else:
+                house_key = ("public", entity.public_sales.public_sale_id)
+            bounding_entities[house_key] = entity
+
+        return list(bounding_entities.values())
+
     def execute(
         self, dto: CoordinatesRangeDto
     ) -> Union[UseCaseSuccessOutput, UseCaseFailureOutput]:
@@ -171,20 +331,20 @@ class BoundingUseCase(HouseBaseUseCase):
 
         # dto.level condition
         if dto.level >= BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value:
-            bounding_filter = self._house_repo.get_bounding_filter_with_two_points(
-                dto=dto
-            )
-            bounding_entities_list: Union[
-                List[BoundingRealEstateEntity], List
-            ] = self._house_repo.get_bounding(
-                bounding_filter=bounding_filter,
-                private_filters=private_filters,
-                public_filters=public_filters,
-                public_status_filters=dto.public_status,
-                include_private=dto.include_private,
-                min_area=dto.min_area,
-                max_area=dto.max_area,
-            )
+            if current_app.config.get("BOUNDING_TILE_CACHE_ENABLED"):
+                bounding_entities_list: Union[
+                    List[BoundingRealEstateEntity], List
+                ] = self._get_bounding_with_tile_cache(
+                    dto=dto,
+                    private_filters=private_filters,
+                    public_filters=public_filters,
+                )
+            else:
+                bounding_entities_list = self._get_bounding(
+                    dto=dto,
+                    private_filters=private_filters,
+                    public_filters=public_filters,
+                )
         else:
             bounding_entities_list = self._house_repo.get_administrative_divisions(
                 dto=dto
@@ -193,6 +353,27 @@ class BoundingUseCase(HouseBaseUseCase):
         return UseCaseSuccessOutput(value=bounding_entities_list)
 
 
+class BoundingClusterUseCase(BoundingUseCase):
+    def execute(
+        self, dto: CoordinatesRangeDto
+    ) -> Union[UseCaseSuccessOutput, UseCaseFailureOutput]:
+        """
+            매물 쿼리 결과를 grid cell 단위 클러스터로 묶어 반환 (MapClusterHelper)
+            BOUNDING_CLUSTER_EXPAND_LEVEL 미만 level 에서 bounding_view()가 사용합니다.
+        """
+        output = super().execute(dto=dto)
+        if not isinstance(output, UseCaseSuccessOutput):
+            return output
+
+        houses, clusters = MapClusterHelper.make_clusters(
+            entities=output.value or [], level=dto.level
+        )
+
+        return UseCaseSuccessOutput(
+            value=BoundingClusterResultEntity(houses=houses, clusters=clusters)
+        )
+
+
 class GetHousePublicDetailUseCase(HouseBaseUseCase):
     def _sort_public_sale_photos(self, photos: List[PublicSalePhotoEntity]):
         if not photos:
@@ -352,32 +533,27 @@ class GetHousePublicDetailUseCase(HouseBaseUseCase):
     def execute(
         self, dto: GetHousePublicDetailDto
     ) -> Union[UseCaseSuccessOutput, UseCaseFailureOutput]:
-        if not self._house_repo.is_enable_public_sale_house(house_id=dto.house_id):
+        # 사용자 무관 분양 매물 상세 (HousePublicDetailCache -> miss 시 DB 조회)
+        house_public_detail_entity = self._get_house_public_detail_entity(
+            house_id=dto.house_id
+        )
+        if not house_public_detail_entity:
             return UseCaseFailureOutput(
                 type="house_id",
                 message=FailureType.NOT_FOUND_ERROR,
                 code=HTTPStatus.NOT_FOUND,
             )
+
         # 사용자가 해당 house에 찜하기 되어있는지 여부
-        is_like = self._house_repo.is_user_liked_house(
-            self._house_repo.get_public_interest_house(dto=dto)
+        is_like = dto.house_id in self._house_repo.get_liked_house_ids(
+            user_id=dto.user_id, house_ids=[dto.house_id]
         )
 
-        # 분양 매물 상세 query -> house_with_public_sales
-        (
-            house_with_public_sales,
-            housing_category,
-        ) = self._house_repo.get_house_with_public_sales(house_id=dto.house_id)
-        if not house_with_public_sales or not housing_category:
-            return UseCaseFailureOutput(
-                type="house_id",
-                message=FailureType.NOT_FOUND_ERROR,
-                code=HTTPStatus.NOT_FOUND,
-            )
-
         # get button link list
         # 민영 url
-        if self._is_private_category(housing_category=housing_category):
+        if self._is_private_category(
+            housing_category=house_public_detail_entity.public_sales.housing_category
+        ):
             button_link_list = self._get_button_link_list(
                 section_type=ButtonSectionType.PUBLIC_SALE_DETAIL_PRIVATE_REGISTRATION.value
             )
@@ -413,12 +589,15 @@ class GetHousePublicDetailUseCase(HouseBaseUseCase):
                     house_type_ranks=ticket_usage_results[index].house_type_ranks
                 )
 
-        # real_estates, public_sales, details, photos, button, ticket
-        entities: HousePublicDetailEntity = self._house_repo.make_house_public_detail_entity(
-            house_with_public_sales=house_with_public_sales,
-            is_like=is_like,
-            button_link_list=button_link_list,
-            ticket_usage_results=ticket_usage_results,
+        # 사용자 별 정보 merge -> is_like, button, ticket
+        entities: HousePublicDetailEntity = house_public_detail_entity.copy(
+            update=dict(
+                is_like=is_like,
+                button_links=button_link_list if button_link_list else None,
+                ticket_usage_results=ticket_usage_results
+                if ticket_usage_results
+                else None,
+            )
         )
 
         house_applicants_dict: Dict = ReportHelper().make_response_object_to_house_applicants(
@@ -446,6 +625,38 @@ class GetHousePublicDetailUseCase(HouseBaseUseCase):
 
         return UseCaseSuccessOutput(value=response_schema)
 
+    def _get_house_public_detail_entity(
+        self, house_id: int
+    ) -> Optional[HousePublicDetailEntity]:
+        """
+            real_estates, public_sales, details, photos 조회 (사용자 무관 -> read-through 캐싱)
+            return : 조회 불가능한 매물이면 None
+        """
+        house_public_detail_cache = HousePublicDetailCache(client=redis)
+        entity = house_public_detail_cache.get(house_id=house_id)
+        if entity:
+            return entity
+
+        if not self._house_repo.is_enable_public_sale_house(house_id=house_id):
+            return None
+
+        # 분양 매물 상세 query -> house_with_public_sales
+        (
+            house_with_public_sales,
+            housing_category,
+        ) = self._house_repo.get_house_with_public_sales(house_id=house_id)
+        if not house_with_public_sales or not housing_category:
+            return None
+
+        entity = self._house_repo.make_house_public_detail_entity(
+            house_with_public_sales=house_with_public_sales,
+            is_like=False,
+            button_link_list=[],
+            ticket_usage_results=None,
+        )
+        house_public_detail_cache.set(house_id=house_id, entity=entity)
+        return entity
+
     def __create_recently_view(self, dto: RecentlyViewDto) -> None:
         send_message(topic_name=UserTopicEnum.CREATE_RECENTLY_VIEW, dto=dto)
         return get_event_object(topic_name=UserTopicEnum.CREATE_RECENTLY_VIEW)
@@ -507,12 +718,8 @@ class GetCalendarInfoUseCase(HouseBaseUseCase):
     def execute(
         self, dto: GetCalendarInfoDto
     ) -> Union[UseCaseSuccessOutput, UseCaseFailureOutput]:
-        year_month = dto.year + dto.month
-        search_filters = self._house_repo.get_calendar_info_filters(
-            year_month=year_month
-        )
-        calendar_entities = self._house_repo.get_simple_calendar_info(
-            user_id=dto.user_id, search_filters=search_filters
+        calendar_entities = self._get_simple_calendar_info(
+            user_id=dto.user_id, year_month=dto.year + dto.month
         )
 
         return UseCaseSuccessOutput(value=calendar_entities)
@@ -805,13 +1012,8 @@ class GetHouseMainUseCase(HouseBaseUseCase):
         if 0 < now.month < 10:
             month = "0" + month
 
-        year_month = year + month
-
-        search_filters = self._house_repo.get_calendar_info_filters(
-            year_month=year_month
-        )
-        calendar_entities = self._house_repo.get_simple_calendar_info(
-            user_id=dto.user_id, search_filters=search_filters
+        calendar_entities = self._get_simple_calendar_info(
+            user_id=dto.user_id, year_month=year + month
         )
 
         result = self._make_house_main_entity(
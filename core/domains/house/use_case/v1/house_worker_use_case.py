@@ -1,27 +1,42 @@
 import json
 import os
-import re
-import sys
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from time import time, sleep
-from typing import List, Optional, Dict
+from time import time
+from typing import List, Optional, Dict, Tuple, Set, Iterator, Callable
 
 import inject
 import requests
-import xmltodict
+from flask import current_app
 from PIL import Image
-from sqlalchemy.orm import Query
+from redis import ResponseError
 
+from app import redis
+from app.extensions.building_registry.client import (
+    BuildingRegistryClient,
+    ExposPubuseAreaItem,
+)
+from app.extensions.cache.calendar_snapshot_cache import CalendarSnapshotCache
+from app.extensions.cache.house_public_detail_cache import HousePublicDetailCache
+from app.extensions.cache.map_tile_cache import MapTileCache
+from app.extensions.utils.administrative_helper import AdministrativeAvgPriceRollup
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
 from app.extensions.utils.house_helper import HouseHelper
 from app.extensions.utils.image_helper import ImageHelper, ImageNameCollector, S3Helper
+from app.extensions.utils.legal_code_helper import LegalCodeMatcher
 from app.extensions.utils.log_helper import logger_
 from app.extensions.utils.math_helper import MathHelper
 from app.extensions.utils.time_helper import get_server_timestamp
-from app.persistence.model import PublicSaleDetailModel
+from app.persistence.model import (
+    PublicSaleDetailModel,
+    PublicSaleModel,
+    PrivateSaleModel,
+)
 from core.domains.house.entity.house_entity import (
     AdministrativeDivisionLegalCodeEntity,
     RealEstateLegalCodeEntity,
+    LegalCodeUnmatchedEntity,
     PublicSaleEntity,
     UpdateContractStatusTargetEntity,
     RecentlyContractedEntity,
@@ -37,8 +52,11 @@ from core.domains.house.enum.house_enum import (
     ReplacePublicToPrivateSalesEnum,
     BuildTypeEnum,
     HouseBatchTimeDelta,
+    PrivateSaleAvgCalcModeEnum,
+    AdministrativeAvgCalcEngineEnum,
 )
 from core.domains.house.repository.house_repository import HouseRepository
+from core.exceptions import InsertFailErrorException
 
 logger = logger_.getLogger(__name__)
 
@@ -91,6 +109,49 @@ class PreCalculateAverageUseCase(BaseHouseWorkerUseCase):
         - 거래가 전혀 없다 -> status: 0
     """
 
+    # step 1 : 1번에 계산 / 저장하는 분양 수 (IN 절 크기)
+    PUBLIC_SALE_CHUNK_SIZE = 1000
+
+    def _upsert_public_sale_avg_prices(
+        self, public_sale_ids: List[int]
+    ) -> Tuple[int, int, Set[int]]:
+        """
+            분양 평균가 계산 (Batch_step_1)
+            - 대표 타입 / 경쟁률, 최저 가점 / 기존 row 를 분양 전체에 대해 group by 쿼리로 조회
+            - create / update 각각 bulk 1번 (분양 1건 당 쿼리 + commit 하던 방식 대체)
+            return : (create 건수, update 건수, 실패(대표 타입 없음 / 저장 실패) public_sale_id)
+        """
+        default_infos = self._house_repo.get_default_infos_by_public_sale_ids(
+            public_sale_ids=public_sale_ids
+        )
+        competition_and_score_infos = self._house_repo.get_competition_and_min_score_by_public_sale_ids(
+            public_sale_ids=list(default_infos.keys())
+        )
+        (
+            avg_price_update_list,
+            avg_price_create_list,
+        ) = self._house_repo.make_pre_calc_target_public_sale_avg_prices_list(
+            default_infos=default_infos,
+            competition_and_score_infos=competition_and_score_infos,
+        )
+
+        failed_ids = set(public_sale_ids) - set(default_infos.keys())
+        create_count, update_count = 0, 0
+        if avg_price_create_list:
+            result = self._house_repo.create_public_sale_avg_prices(
+                create_list=avg_price_create_list
+            )
+            create_count = result.row_count
+            failed_ids.update(row["public_sale_id"] for row in result.failure_rows)
+        if avg_price_update_list:
+            result = self._house_repo.update_public_sale_avg_prices(
+                update_list=avg_price_update_list
+            )
+            update_count = result.row_count
+            failed_ids.update(row["public_sale_id"] for row in result.failure_rows)
+
+        return create_count, update_count, failed_ids
+
     def _calculate_house_acquisition_xax(
         self, private_area: float, supply_price: int
     ) -> int:
@@ -233,11 +294,64 @@ class PreCalculateAverageUseCase(BaseHouseWorkerUseCase):
         else:
             return PrivateSaleContractStatusEnum.NOTHING.value
 
-    def execute(self):
-        logger.info(f"🚀\tPreCalculateAverage Start - {self.client_id}")
+    def _is_private_sale_avg_incremental_mode(self) -> bool:
+        return (
+            current_app.config.get("PRIVATE_SALE_AVG_CALC_MODE")
+            == PrivateSaleAvgCalcModeEnum.INCREMENTAL.value
+        )
 
-        # Batch_step_1 : Upsert_public_sale_avg_prices
-        public_batch_flag = True
+    def _get_private_sale_avg_dirty_ids(self) -> List[int]:
+        """
+            SyncDataUseCase 에서 실거래가 변경이 기록된 private_sale_id 전체를 가져온다.
+            - 이전 배치가 완료되지 못해 processing 이 남아있으면 그대로 재처리
+            - 없으면 dirty set 을 processing 으로 RENAMENX (이후 변경은 새 dirty set 에 쌓임)
+            -> processing 은 저장 완료 후 삭제 (_complete_private_sale_avg_dirty_ids)
+        """
+        processing_key = RedisKeyPrefix.PRIVATE_SALE_AVG_PROCESSING.value
+        if not redis.is_exists(processing_key):
+            try:
+                # False : 그 사이 다른 worker 가 processing 생성 -> 해당 processing 처리
+                redis.rename_if_not_exists(
+                    key=RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value,
+                    new_key=processing_key,
+                )
+            except ResponseError as e:
+                if "no such key" not in str(e).lower():
+                    raise
+                # dirty set 없음 -> 재계산 대상 없음
+                return []
+
+        return [int(member) for member in redis.get_set_members(key=processing_key)]
+
+    def _complete_private_sale_avg_dirty_ids(self) -> None:
+        redis.delete(key=RedisKeyPrefix.PRIVATE_SALE_AVG_PROCESSING.value)
+
+    def _invalidate_map_tile_cache(self, model: object, target_ids: List[int]) -> None:
+        """
+            평균가 / 거래 상태가 변경된 매물이 속한 지도 tile 캐시 무효화 (MapTileCache)
+        """
+        try:
+            coordinates = self._house_repo.get_coordinates_by_target_ids(
+                model=model, target_ids=target_ids
+            )
+            tile_count = MapTileCache(client=redis).invalidate(coordinates=coordinates)
+            logger.info(f"🚀\tInvalidate map tile cache -> {tile_count} tiles")
+        except Exception as e:
+            logger.error(f"☠️\tInvalidate map tile cache Error - {e}")
+
+    def _run_step(self, step: Callable[[], dict], results: Dict[str, dict]) -> bool:
+        try:
+            results[step.__name__] = step()
+        except Exception:
+            # 실패 log, slack 메세지는 각 step 에서 처리
+            return False
+        return True
+
+    def execute_upsert_public_sale_avg_prices(self) -> dict:
+        """
+            Batch_step_1 : Upsert_public_sale_avg_prices
+        """
+        public_sale_changed_ids = list()
         try:
             start_time = time()
             logger.info(f"🚀\tUpsert_public_sale_avg_prices : Start")
@@ -256,48 +370,22 @@ class PreCalculateAverageUseCase(BaseHouseWorkerUseCase):
                 )
 
             else:
-                for idx in target_ids:
-                    competition_and_score_info: dict = self._house_repo.get_competition_and_min_score(
-                        public_sale_id=idx
-                    )
-                    default_info: dict = self._house_repo.get_default_infos(
-                        public_sale_id=idx
+                chunk_size = self.PUBLIC_SALE_CHUNK_SIZE
+                for offset in range(0, len(target_ids), chunk_size):
+                    chunk_ids = target_ids[offset : offset + chunk_size]
+                    (
+                        create_count,
+                        update_count,
+                        failed_ids,
+                    ) = self._upsert_public_sale_avg_prices(public_sale_ids=chunk_ids)
+
+                    create_public_sale_avg_prices_count += create_count
+                    update_public_sale_avg_prices_count += update_count
+                    public_sale_avg_prices_failed_list.extend(sorted(failed_ids))
+                    public_sale_changed_ids.extend(
+                        idx for idx in chunk_ids if idx not in failed_ids
                     )
 
-                    if default_info:
-                        (
-                            avg_price_update_list,
-                            avg_price_create_list,
-                        ) = self._house_repo.make_pre_calc_target_public_sale_avg_prices_list(
-                            public_sale_id=idx,
-                            default_info=default_info,
-                            competition_and_score_info=competition_and_score_info,
-                        )
-                        if avg_price_create_list:
-                            self._house_repo.create_public_sale_avg_prices(
-                                create_list=avg_price_create_list
-                            )
-                            create_public_sale_avg_prices_count += len(
-                                avg_price_create_list
-                            )
-                        else:
-                            logger.info(
-                                f"🚀\tUpsert_public_sale_avg_prices : Nothing avg_price_create_list"
-                            )
-                        if avg_price_update_list:
-                            self._house_repo.update_public_sale_avg_prices(
-                                update_list=avg_price_update_list
-                            )
-                            update_public_sale_avg_prices_count += len(
-                                avg_price_update_list
-                            )
-                        else:
-                            logger.info(
-                                f"🚀\tUpsert_public_sale_avg_prices : Nothing avg_price_update_list"
-                            )
-                    else:
-                        public_sale_avg_prices_failed_list.append(idx)
-
             logger.info(
                 f"🚀\tUpsert_public_sale_avg_prices : Finished !!, "
                 f"records: {time() - start_time} secs, "
@@ -327,72 +415,108 @@ class PreCalculateAverageUseCase(BaseHouseWorkerUseCase):
                 title="☠️ [PreCalculateAverageUseCase Step1] >>> 분양 평균가 계산 배치",
                 message=f"Upsert_public_sale_avg_prices Error - {e}",
             )
-            public_batch_flag = False
+            raise
+        finally:
+            # 지도 tile 캐시 무효화 (BoundingUseCase)
+            if public_sale_changed_ids:
+                self._invalidate_map_tile_cache(
+                    model=PublicSaleModel, target_ids=public_sale_changed_ids
+                )
 
-        # Batch_step_2 : Update_public_sale_acquisition_tax
-        if public_batch_flag:
-            try:
-                start_time = time()
-                logger.info(f"🚀\tUpdate_public_sale_acquisition_tax : Start")
+        return dict(
+            created=create_public_sale_avg_prices_count,
+            updated=update_public_sale_avg_prices_count,
+            failed=len(public_sale_avg_prices_failed_list),
+        )
 
-                # PublicSaleDetails.acquisition_tax == 0 건에 대하여 취득세 계산 후 업데이트
-                target_list: List[
-                    PublicSaleDetailModel
-                ] = self._house_repo.get_acquisition_tax_calc_target_list()
-                update_list = list()
-                if not target_list:
-                    logger.info(
-                        f"🚀\tUpdate_public_sale_acquisition_tax : Nothing acquisition_tax_target_list"
+    def execute_update_public_sale_acquisition_tax(self) -> dict:
+        """
+            Batch_step_2 : Update_public_sale_acquisition_tax (Batch_step_1 성공 시)
+        """
+        try:
+            start_time = time()
+            logger.info(f"🚀\tUpdate_public_sale_acquisition_tax : Start")
+
+            # PublicSaleDetails.acquisition_tax == 0 건에 대하여 취득세 계산 후 업데이트
+            target_list: List[
+                PublicSaleDetailModel
+            ] = self._house_repo.get_acquisition_tax_calc_target_list()
+            updated_count, failed_count = 0, 0
+            if not target_list:
+                logger.info(
+                    f"🚀\tUpdate_public_sale_acquisition_tax : Nothing acquisition_tax_target_list"
+                )
+            else:
+                update_list = self._make_acquisition_tax_update_list(
+                    target_list=target_list
+                )
+                if update_list:
+                    result = self._house_repo.update_acquisition_taxes(
+                        update_list=update_list
                     )
+                    updated_count = result.row_count
+                    failed_count = len(result.failure_rows)
+                    HousePublicDetailCache.bump_version(client=redis)
                 else:
-                    update_list = self._make_acquisition_tax_update_list(
-                        target_list=target_list
+                    logger.info(
+                        f"🚀\tUpdate_public_sale_acquisition_tax : Nothing acquisition_tax_update_list"
                     )
-                    if update_list:
-                        self._house_repo.update_acquisition_taxes(
-                            update_list=update_list
-                        )
-                    else:
-                        logger.info(
-                            f"🚀\tUpdate_public_sale_acquisition_tax : Nothing acquisition_tax_update_list"
-                        )
 
-                self.send_slack_message(
-                    title=f"🚀 [PreCalculateAverageUseCase Step2] >>> 취득세 계산 배치",
-                    message=f"Update_public_sale_acquisition_tax : Finished !! \n "
-                    f"records: {time() - start_time} secs \n "
-                    f"{len(update_list)} Updated",
-                )
+            emoji = "🚀"
+            if failed_count:
+                emoji = "☠️"
 
-            except Exception as e:
-                logger.error(f"🚀\tUpdate_public_sale_acquisition_tax Error - {e}")
-                self.send_slack_message(
-                    title="☠️ [PreCalculateAverageUseCase Step2] >>> 취득세 계산 배치",
-                    message=f"Update_public_sale_acquisition_tax Error - {e}",
-                )
-        else:
-            logger.info(
-                f"🚀\tUpdate_public_sale_acquisition_tax : passed step_2 due to step_1 failed"
+            self.send_slack_message(
+                title=f"{emoji} [PreCalculateAverageUseCase Step2] >>> 취득세 계산 배치",
+                message=f"Update_public_sale_acquisition_tax : Finished !! \n "
+                f"records: {time() - start_time} secs \n "
+                f"{updated_count} Updated \n "
+                f"{failed_count} Failed",
+            )
+
+        except Exception as e:
+            logger.error(f"🚀\tUpdate_public_sale_acquisition_tax Error - {e}")
+            self.send_slack_message(
+                title="☠️ [PreCalculateAverageUseCase Step2] >>> 취득세 계산 배치",
+                message=f"Update_public_sale_acquisition_tax Error - {e}",
             )
+            raise
 
-        # Batch_step_3 : Upsert_private_sale_avg_prices
+        return dict(updated=updated_count, failed=failed_count)
+
+    def execute_upsert_private_sale_avg_prices(self) -> dict:
         """
+            Batch_step_3 : Upsert_private_sale_avg_prices
             타입이 다르고 평수가 같은 경우가 있는데 이 경우에 평균을 낼 경우 거래일자에 따라 오차가 커질 수 있으므로 둘다 upsert 하고
             front에서는 최근 거래일 기준에 가까운 것을 보여준다. -> 현재는 같은 평수가 있을 경우 거래일과는 상관없이 랜덤으로 보여주는 중
         """
-        private_batch_flag = True
+        dirty_ids = list()
+        private_sale_changed_ids = list()
         try:
             start_time = time()
             logger.info(f"🚀\tUpsert_private_sale_avg_prices : Start")
 
             create_private_sale_avg_prices_count = 0
             update_private_sale_avg_prices_count = 0
+            private_sale_failed_count = 0
             final_create_list = list()
             final_update_list = list()
 
             # 매매, 전세 가격 평균 계산
             # target_ids = [idx for idx in range(1, 355105)]
-            target_ids = self._house_repo.get_target_of_upsert_private_sale_avg_prices()
+            if self._is_private_sale_avg_incremental_mode():
+                dirty_ids = self._get_private_sale_avg_dirty_ids()
+                target_ids = (
+                    self._house_repo.get_target_of_upsert_private_sale_avg_prices(
+                        private_sale_ids=dirty_ids
+                    )
+                    if dirty_ids
+                    else None
+                )
+            else:
+                target_ids = (
+                    self._house_repo.get_target_of_upsert_private_sale_avg_prices()
+                )
 
             if not target_ids:
                 logger.info(f"🚀\tUpsert_private_sale_avg_prices : Nothing target_ids")
@@ -421,95 +545,215 @@ class PreCalculateAverageUseCase(BaseHouseWorkerUseCase):
                     final_update_list.extend(avg_price_update_list)
                     final_create_list.extend(avg_price_create_list)
 
+                failure_rows = list()
                 if final_create_list:
-                    self._house_repo.create_private_sale_avg_prices(
+                    result = self._house_repo.create_private_sale_avg_prices(
                         create_list=final_create_list
                     )
-                    create_private_sale_avg_prices_count += len(final_create_list)
+                    create_private_sale_avg_prices_count += result.row_count
+                    failure_rows.extend(result.failure_rows)
                 else:
                     logger.info(
                         f"🚀\tUpsert_private_sale_avg_prices : Nothing avg_price_create_list"
                     )
 
                 if final_update_list:
-                    self._house_repo.update_private_sale_avg_prices(
+                    result = self._house_repo.update_private_sale_avg_prices(
                         update_list=final_update_list
                     )
-                    update_private_sale_avg_prices_count += len(final_update_list)
+                    update_private_sale_avg_prices_count += result.row_count
+                    failure_rows.extend(result.failure_rows)
+
+                failed_ids = {row["private_sale_id"] for row in failure_rows}
+                private_sale_failed_count = len(failed_ids)
+                if failed_ids and dirty_ids:
+                    # 저장 실패 매물은 다음 배치에서 다시 계산하도록 dirty set 복구
+                    redis.add_set_members(
+                        key=RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value,
+                        values=list(failed_ids),
+                    )
+
+                if final_create_list or final_update_list:
+                    private_sale_changed_ids.extend(
+                        idx for idx in target_ids if idx not in failed_ids
+                    )
 
                 logger.info(
                     f"🚀\tUpsert_private_sale_avg_prices : Finished !!, "
                     f"records: {time() - start_time} secs, "
                     f"{create_private_sale_avg_prices_count} Created, "
                     f"{update_private_sale_avg_prices_count} Updated, "
+                    f"{private_sale_failed_count} Failed, "
                 )
 
+            if dirty_ids:
+                # 저장 완료 (실패 매물은 dirty set 에 복구됨) -> processing 삭제
+                self._complete_private_sale_avg_dirty_ids()
+
+            emoji = "🚀"
+            if private_sale_failed_count:
+                emoji = "☠️"
+
             self.send_slack_message(
-                title="🚀 [PreCalculateAverageUseCase Step3] >>> 매매,전세 평균가 계산 배치",
+                title=f"{emoji} [PreCalculateAverageUseCase Step3] >>> 매매,전세 평균가 계산 배치",
                 message=f"Upsert_private_sale_avg_prices : Finished !! \n "
                 f"records: {time() - start_time} secs \n "
                 f"{create_private_sale_avg_prices_count} Created \n "
-                f"{update_private_sale_avg_prices_count} Updated",
+                f"{update_private_sale_avg_prices_count} Updated \n "
+                f"{private_sale_failed_count} Failed",
             )
 
         except Exception as e:
+            # processing 을 삭제하지 않음 -> 다음 배치에서 다시 계산
             logger.error(f"\tUpsert_private_sale_avg_prices Error - {e}")
             self.send_slack_message(
                 title="☠️ [PreCalculateAverageUseCase Step3] >>> 매매,전세 평균가 계산 배치",
                 message=f"Upsert_private_sale_avg_prices Error - {e}",
             )
-            private_batch_flag = False
+            raise
 
-        # Batch_step_4 : update_private_sales_status
-        # (현재 날짜 기준 최근 N개월 거래 여부 업데이트)
-        if private_batch_flag:
-            update_list = list()
-            try:
-                start_time = time()
-                logger.info(f"🚀\tUpdate_private_sales_status : Start")
+        # 지도 tile 캐시 무효화 (BoundingUseCase)
+        if private_sale_changed_ids:
+            self._invalidate_map_tile_cache(
+                model=PrivateSaleModel, target_ids=private_sale_changed_ids
+            )
 
-                target_ids = self._house_repo.get_private_sales_all_id_list()
-                if not target_ids:
-                    logger.info(f"🚀\tUpdate_private_sales_status : Nothing target_ids")
+        return dict(
+            created=create_private_sale_avg_prices_count,
+            updated=update_private_sale_avg_prices_count,
+            failed=private_sale_failed_count,
+        )
 
-                else:
-                    target_list: List[
-                        UpdateContractStatusTargetEntity
-                    ] = self._house_repo.get_update_status_target_of_private_sale_details(
-                        private_sale_ids=target_ids
-                    )
+    def execute_update_private_sales_status(self) -> dict:
+        """
+            Batch_step_4 : update_private_sales_status (Batch_step_3 성공 시)
+            (현재 날짜 기준 최근 N개월 거래 여부 업데이트)
+        """
+        updated_count, failed_count = 0, 0
+        try:
+            start_time = time()
+            logger.info(f"🚀\tUpdate_private_sales_status : Start")
 
-                    update_list = self._make_private_sale_status_update_list(
-                        target_list=target_list
-                    )
+            target_ids = self._house_repo.get_private_sales_all_id_list()
+            if not target_ids:
+                logger.info(f"🚀\tUpdate_private_sales_status : Nothing target_ids")
 
-                    self._house_repo.bulk_update_private_sales(update_list=update_list)
+            else:
+                target_list: List[
+                    UpdateContractStatusTargetEntity
+                ] = self._house_repo.get_update_status_target_of_private_sale_details(
+                    private_sale_ids=target_ids
+                )
 
-                    logger.info(
-                        f"🚀\tUpdate_private_sales_status : Finished !!, "
-                        f"records: {time() - start_time} secs, "
-                        f"{len(update_list)} Updated, "
-                    )
+                update_list = self._make_private_sale_status_update_list(
+                    target_list=target_list
+                )
 
-                self.send_slack_message(
-                    title=f"🚀 [PreCalculateAverageUseCase Step4] >>> 현재 날짜 기준 최근 6달 거래 여부 업데이트",
-                    message=f"Update_private_sales_status : Finished !! \n "
-                    f"records: {time() - start_time} secs \n "
-                    f"{len(update_list)} Updated",
+                result = self._house_repo.bulk_update_private_sales(
+                    update_list=update_list
                 )
+                updated_count = result.row_count
+                failed_count = len(result.failure_rows)
+                # 전체 private_sales 대상 업데이트이므로 tile 캐시 전체 무효화
+                MapTileCache(client=redis).invalidate_all()
 
-            except Exception as e:
-                logger.error(f"🚀\tUpdate_private_sales_status Error - {e}")
-                self.send_slack_message(
-                    title="☠️ [PreCalculateAverageUseCase Step4] >>> 현재 날짜 기준 최근 6달 거래 여부 업데이트",
-                    message=f"Update_private_sales_status Error - {e}",
+                logger.info(
+                    f"🚀\tUpdate_private_sales_status : Finished !!, "
+                    f"records: {time() - start_time} secs, "
+                    f"{updated_count} Updated, "
+                    f"{failed_count} Failed, "
                 )
+
+            emoji = "🚀"
+            if failed_count:
+                emoji = "☠️"
+
+            self.send_slack_message(
+                title=f"{emoji} [PreCalculateAverageUseCase Step4] >>> 현재 날짜 기준 최근 6달 거래 여부 업데이트",
+                message=f"Update_private_sales_status : Finished !! \n "
+                f"records: {time() - start_time} secs \n "
+                f"{updated_count} Updated \n "
+                f"{failed_count} Failed",
+            )
+
+        except Exception as e:
+            logger.error(f"🚀\tUpdate_private_sales_status Error - {e}")
+            self.send_slack_message(
+                title="☠️ [PreCalculateAverageUseCase Step4] >>> 현재 날짜 기준 최근 6달 거래 여부 업데이트",
+                message=f"Update_private_sales_status Error - {e}",
+            )
+            raise
+
+        return dict(updated=updated_count, failed=failed_count)
+
+    def execute_refresh_map_markers(self) -> dict:
+        """
+            Batch_step_5 : refresh_map_markers (Batch_step_3 성공 시)
+            (지도 매매 마커 projection 테이블 갱신 -> BoundingUseCase 면적 필터 없는 조회)
+        """
+        try:
+            start_time = time()
+            logger.info(f"🚀\tRefresh_map_markers : Start")
+
+            map_markers_count = self._house_repo.refresh_map_markers()
+            # 마커 전체가 갱신되므로 tile 캐시 전체 무효화
+            MapTileCache(client=redis).invalidate_all()
+
+            logger.info(
+                f"🚀\tRefresh_map_markers : Finished !!, "
+                f"records: {time() - start_time} secs, "
+                f"{map_markers_count} Created, "
+            )
+            self.send_slack_message(
+                title=f"🚀 [PreCalculateAverageUseCase Step5] >>> 지도 마커 갱신",
+                message=f"Refresh_map_markers : Finished !! \n "
+                f"records: {time() - start_time} secs \n "
+                f"{map_markers_count} Created",
+            )
+
+        except Exception as e:
+            logger.error(f"🚀\tRefresh_map_markers Error - {e}")
+            self.send_slack_message(
+                title="☠️ [PreCalculateAverageUseCase Step5] >>> 지도 마커 갱신",
+                message=f"Refresh_map_markers Error - {e}",
+            )
+            raise
+
+        return dict(created=map_markers_count)
+
+    def execute(self) -> Dict[str, dict]:
+        """
+            step 1 ~ 5 순차 실행 (house batch DAG 에서는 step 별로 실행)
+            return : {step method 이름: 처리 건수}
+        """
+        logger.info(f"🚀\tPreCalculateAverage Start - {self.client_id}")
+        results = dict()
+
+        if self._run_step(
+            step=self.execute_upsert_public_sale_avg_prices, results=results
+        ):
+            self._run_step(
+                step=self.execute_update_public_sale_acquisition_tax, results=results
+            )
+        else:
+            logger.info(
+                f"🚀\tUpdate_public_sale_acquisition_tax : passed step_2 due to step_1 failed"
+            )
+
+        if self._run_step(
+            step=self.execute_upsert_private_sale_avg_prices, results=results
+        ):
+            self._run_step(
+                step=self.execute_update_private_sales_status, results=results
+            )
+            self._run_step(step=self.execute_refresh_map_markers, results=results)
         else:
             logger.info(
                 f"🚀\tUpdate_private_sales_status : passed step_4 due to step_3 failed"
             )
+            logger.info(f"🚀\tRefresh_map_markers : passed step_5 due to step_3 failed")
 
-        sys.exit(0)
+        return results
 
 
 class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
@@ -521,9 +765,67 @@ class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
         - private_sales -> rent_type -> 전세 / 월세 / 매매 별로 private_sale_details의 해당 평균을 구한다.
         - public_sales -> 분양가 평균(public_sale_price)을 구한다.
         - 예시) 서울특별시 -> 서울특별시에 해당되는 모든 매물
+        - execute : nightly batch (오늘 변경된 거래) / execute_backfill : 지정 계약년월 구간 재계산
     """
 
-    def execute(self):
+    def get_avg_price_list(
+        self,
+        yyyymm: int,
+        to_yyyymm: Optional[int] = None,
+        is_changed_today: bool = True,
+    ) -> List[dict]:
+        """
+            level 1 ~ 3 평균가 집계 (ADMINISTRATIVE_AVG_CALC_ENGINE)
+            - sql : GROUPING SETS 집계
+            - memory : 거래 row 조회 후 AdministrativeAvgPriceRollup 으로 1번에 집계
+            return : (front_legal_code, back_legal_code, level) 별 평균가 -> set_administrative_division_id
+        """
+        if (
+            current_app.config.get("ADMINISTRATIVE_AVG_CALC_ENGINE")
+            == AdministrativeAvgCalcEngineEnum.MEMORY.value
+        ):
+            rollup = AdministrativeAvgPriceRollup()
+            rollup.add_all(
+                rows=self._house_repo.get_administrative_price_rows(
+                    yyyymm=yyyymm,
+                    to_yyyymm=to_yyyymm,
+                    is_changed_today=is_changed_today,
+                )
+            )
+            return rollup.get_result_list()
+
+        return self._house_repo.get_administrative_avg_prices(
+            yyyymm=yyyymm, to_yyyymm=to_yyyymm, is_changed_today=is_changed_today
+        )
+
+    def execute_backfill(self, from_yyyymm: int, to_yyyymm: int) -> dict:
+        """
+            지정 계약년월 구간의 전체 거래로 행정구역 평균가 재계산 (수동 backfill)
+        """
+        logger.info(
+            f"🚀\tPreCalculateAdministrative Backfill Start - {from_yyyymm} ~ {to_yyyymm}"
+        )
+        start_time = time()
+        result_list = self.get_avg_price_list(
+            yyyymm=from_yyyymm, to_yyyymm=to_yyyymm, is_changed_today=False
+        )
+        update_list, failure_list = self._house_repo.set_administrative_division_id(
+            result_list=result_list
+        )
+        result = self._house_repo.update_avg_price_to_administrative_division(
+            update_list=update_list
+        )
+        failure_list.extend(result.failure_rows)
+
+        logger.info(
+            f"🚀\tPreCalculateAdministrative Backfill : Finished !!, "
+            f"records: {time() - start_time} secs, "
+            f"{result.row_count} Updated, "
+            f"{len(failure_list)} Failed"
+        )
+        return dict(updated=result.row_count, failed=len(failure_list))
+
+    def execute(self) -> dict:
         logger.info(f"🚀\tPreCalculateAdministrative Start - {self.client_id}")
         try:
             """
@@ -534,26 +836,15 @@ class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
             """
             start_time = time()
 
-            # si_do
             two_month_from_today = int(
                 (
                     datetime.now() - timedelta(days=HouseBatchTimeDelta.SIX_MONTH.value)
                 ).strftime("%Y%m")
             )
-            common_query_object: Query = self._house_repo.get_common_query_object(
+            # level 1 ~ 3 (si_do, si_gun_gu, dong_myun) 1번에 집계
+            result_list: List[dict] = self.get_avg_price_list(
                 yyyymm=two_month_from_today
             )
-            lv1_list: List[dict] = self._house_repo.get_si_do_avg_price(
-                sub_q=common_query_object
-            )
-            lv2_list: List[dict] = self._house_repo.get_si_gun_gu_avg_price(
-                sub_q=common_query_object
-            )
-            lv3_list: List[dict] = self._house_repo.get_dong_myun_avg_price(
-                sub_q=common_query_object
-            )
-
-            result_list = lv1_list + lv2_list + lv3_list
 
             # 2191 / 2190
             # administrative_division_id를 bind하고 맵핑 되지 않는 리스트를 반환한다.
@@ -561,14 +852,17 @@ class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
                 result_list=result_list
             )
 
-            self._house_repo.update_avg_price_to_administrative_division(
+            # 저장 실패 row (sync_failure_histories 기록) 도 실패로 집계
+            result = self._house_repo.update_avg_price_to_administrative_division(
                 update_list=update_list
             )
+            updated_count = result.row_count
+            failure_list.extend(result.failure_rows)
 
             logger.info(
                 f"🚀\tPreCalculateAdministrativeDivisionUseCase : Finished !!, "
                 f"records: {time() - start_time} secs, "
-                f"{len(result_list)} Updated, "
+                f"{updated_count} Updated, "
                 f"{len(failure_list)} Failed, "
                 f"Failed_list : {failure_list}, "
             )
@@ -581,8 +875,8 @@ class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
                 title=f"{emoji} [PreCalculateAdministrativeDivisionUseCase] >>> 행정구역별 매매,전세 평균가 계산",
                 message=f"PreCalculateAdministrativeDivisionUseCase : Finished !! \n "
                 f"records: {time() - start_time} secs \n "
-                f"{len(update_list)} Updated"
-                f"{len(failure_list)} Failed"
+                f"{updated_count} Updated \n "
+                f"{len(failure_list)} Failed \n "
                 f"Failed_list : {failure_list}",
             )
 
@@ -592,9 +886,9 @@ class PreCalculateAdministrativeDivisionUseCase(BaseHouseWorkerUseCase):
                 title="☠️ [PreCalculateAdministrativeDivisionUseCase] >>> 행정구역별 매매,전세 평균가 계산",
                 message=f"PreCalculateAdministrative Error - {e}",
             )
-            sys.exit(0)
+            raise
 
-        exit(os.EX_OK)
+        return dict(updated=updated_count, failed=len(failure_list))
 
 
 class AddLegalCodeUseCase(BaseHouseWorkerUseCase):
@@ -602,74 +896,29 @@ class AddLegalCodeUseCase(BaseHouseWorkerUseCase):
         self,
         administrative_info: List[AdministrativeDivisionLegalCodeEntity],
         target_list: List[RealEstateLegalCodeEntity],
-    ) -> List[dict]:
+    ) -> Tuple[List[dict], List[LegalCodeUnmatchedEntity]]:
         """
             real_estates.jibun_address 주소가 없을 경우 혹은 건축예정이라 불확실한 경우 직접 매뉴얼 작업 필요
             todo: '동탄X동' 주소가 올 경우 하위 구성하는 동에 대한 별도 로직 필요
+            - 행정구역을 동 이름 기준 dictionary 로 1번 정규화 후 매물 별로 조회 (LegalCodeMatcher)
+            return : (update_list, 매칭 실패 목록)
         """
-        update_list = list()
-        failed_list = list()
-        cond_1 = re.compile(r"\D*동\d가")
-        cond_2 = re.compile(r"\D*\d동")
-
-        for real_estate in target_list:
-            for administrative in administrative_info:
-                # 예) 용산동2가 -> 행정구역에 용산동이랑 매칭되는지 확인
-                if cond_1.match(real_estate.dong_myun):
-                    dong_myun_ = re.sub(r"[0-9]+가", "", real_estate.dong_myun)
-                    if administrative.short_name != dong_myun_:
-                        dong_myun_ = real_estate.dong_myun
-                else:
-                    dong_myun_ = real_estate.dong_myun
-
-                # 예) 안양1동 -> 안양동으로 처리하여 행정구역 안양동과 매칭되는지 확인
-                if cond_2.match(real_estate.jibun_address) and not cond_2.match(
-                    administrative.short_name
-                ):
-                    jibun_address_ = re.sub(r"[0-9]+", "", real_estate.jibun_address)
-                    dong_myun_ = re.sub(r"[0-9]+", "", dong_myun_)
-                else:
-                    jibun_address_ = real_estate.jibun_address
-
-                # 예외) 충주 목행동 + 용탄동 -> 목행.용탄동 통합
-                if real_estate.dong_myun == "목행동" or real_estate.dong_myun == "용탄동":
-                    dong_myun_ = "목행.용탄동"
-                    if real_estate.dong_myun == "목행동":
-                        jibun_address_ = jibun_address_.replace("목행동", dong_myun_)
-                    elif real_estate.dong_myun == "용탄동":
-                        jibun_address_ = jibun_address_.replace("용탄동", dong_myun_)
-
-                administrative_name_ = administrative.name.replace(" ", "").replace(
-                    ".", ""
-                )
-                administrative_short_name_ = administrative.short_name.replace(".", "")
-                jibun_address_ = jibun_address_.replace(" ", "").replace(".", "")
-
-                si_do_ = real_estate.si_do.replace(" ", "")
-                si_gun_gu_ = real_estate.si_gun_gu.replace(" ", "")
-                dong_myun_ = dong_myun_.replace(".", "")
-
-                if (
-                    administrative_short_name_ == dong_myun_
-                    and si_do_ in administrative_name_
-                    and si_gun_gu_ in administrative_name_
-                    and administrative_name_ in jibun_address_
-                ):
-                    front_legal_code = administrative.front_legal_code
-                    back_legal_code = administrative.back_legal_code
+        return LegalCodeMatcher(administrative_info=administrative_info).match_all(
+            target_list=target_list
+        )
 
-                    update_dict = {
-                        "id": real_estate.id,
-                        "front_legal_code": front_legal_code,
-                        "back_legal_code": back_legal_code,
-                    }
-                    update_list.append(update_dict)
-                    print(f"updated list : id - {real_estate.id}")
-                    break
-            failed_list.append(real_estate.id)
-        return update_list
+    def _get_unmatched_summary(
+        self, unmatched_list: List[LegalCodeUnmatchedEntity]
+    ) -> Dict[str, List[int]]:
+        """
+            return : {실패 사유: [real_estate_id, ...]}
+        """
+        summary = dict()
+        for unmatched in unmatched_list:
+            summary.setdefault(unmatched.reason, []).append(unmatched.id)
+        return summary
 
-    def execute(self):
+    def execute(self) -> dict:
         start_time = time()
         logger.info(f"🚀\tAddLegalCodeUseCase Start - {self.client_id}")
 
@@ -684,16 +933,24 @@ class AddLegalCodeUseCase(BaseHouseWorkerUseCase):
             logger.info(
                 f"🚀\tAddLegalCodeUseCase : administrative_divisions_legal_code_info_list"
             )
-            exit(os.EX_OK)
+            return dict(updated=0, failed=0)
         if not real_estate_info:
             logger.info(f"🚀\tAddLegalCodeUseCase : real_estates_legal_code_info_list")
-            exit(os.EX_OK)
-        update_list = self._make_real_estates_legal_code_update_list(
+            return dict(updated=0, failed=0)
+        update_list, unmatched_list = self._make_real_estates_legal_code_update_list(
             administrative_info=administrative_info, target_list=real_estate_info
         )
+        unmatched_summary = self._get_unmatched_summary(unmatched_list=unmatched_list)
+        for unmatched in unmatched_list:
+            logger.info(f"🚀\tAddLegalCodeUseCase : unmatched - {unmatched.dict()}")
 
+        updated_count = 0
         try:
-            self._house_repo.update_legal_code_to_real_estates(update_list=update_list)
+            # 실패 row 는 sync_failure_histories 기록 후 아래 failure_list 재조회에 포함
+            result = self._house_repo.update_legal_code_to_real_estates(
+                update_list=update_list
+            )
+            updated_count = result.row_count
         except Exception as e:
             logger.error(
                 f"🚀\tAddLegalCodeUseCase - update_legal_code_to_real_estates "
@@ -710,8 +967,9 @@ class AddLegalCodeUseCase(BaseHouseWorkerUseCase):
         logger.info(
             f"🚀\tAddLegalCodeUseCase : Finished !!, "
             f"records: {time() - start_time} secs, "
-            f"{len(update_list) if update_list else 0} Updated, "
-            f"{len(failure_list) if failure_list else 0} Failed"
+            f"{updated_count} Updated, "
+            f"{len(failure_list) if failure_list else 0} Failed, "
+            f"Unmatched : {unmatched_summary}"
         )
 
         emoji = "🚀"
@@ -723,12 +981,15 @@ class AddLegalCodeUseCase(BaseHouseWorkerUseCase):
             title=f"{emoji} [AddLegalCodeUseCase] >>> New real_estates - 법정코드 부여 배치",
             message=f"AddLegalCodeUseCase : Finished !! \n "
             f"records: {time() - start_time} secs \n "
-            f"{len(update_list) if update_list else 0} Updated, "
-            f"{len(failure_list) if failure_list else 0} Failed"
+            f"{updated_count} Updated, "
+            f"{len(failure_list) if failure_list else 0} Failed \n "
+            f"Unmatched : {unmatched_summary} \n "
             f"Failed_list : {failure_list}",
         )
 
-        exit(os.EX_OK)
+        return dict(
+            updated=updated_count, failed=len(failure_list) if failure_list else 0,
+        )
 
 
 class UpsertUploadPhotoUseCase(BaseHouseWorkerUseCase):
@@ -1044,6 +1305,8 @@ class UpsertUploadPhotoUseCase(BaseHouseWorkerUseCase):
             for name in passed_dirs:
                 logger.info(f"🚀\tPassed_dir_list : {name} passed")
 
+        HousePublicDetailCache.bump_version(client=redis)
+
         logger.info(
             f"🚀\tInsertUploadPhotoUseCase - Done! "
             f"public_sale_photos: {total_public_sale_photos} upserted, "
@@ -1139,7 +1402,7 @@ class ReplacePublicToPrivateUseCase(BaseHouseWorkerUseCase):
             else:
                 result_dict_list.append(
                     {
-                        "id": start_pk,
+                        "id": start_idx,
                         "real_estate_id": target.real_estate_id,
                         "name": target.name,
                         "building_type": BuildTypeEnum.APARTMENT,
@@ -1178,7 +1441,7 @@ class ReplacePublicToPrivateUseCase(BaseHouseWorkerUseCase):
             )
         return result_dict_list
 
-    def execute(self):
+    def execute(self) -> dict:
         logger.info(f"🚀\tReplacePublicToPrivateUseCase Start - {self.client_id}")
         start_time = time()
 
@@ -1189,14 +1452,14 @@ class ReplacePublicToPrivateUseCase(BaseHouseWorkerUseCase):
             logger.info(
                 f"🚀\t [get_target_list_of_public_sales] - Nothing to replace target "
             )
-            exit(os.EX_OK)
+            return dict(created=0, updated=0)
 
         # replace_targets: 매매 전환 대상 리스트
         replace_targets = self._get_replace_target(public_sales=public_sales)
 
         if not replace_targets:
             logger.info(f"🚀\t [get_replace_target] - Nothing to replace target ")
-            exit(os.EX_OK)
+            return dict(created=0, updated=0)
 
         private_sale_start_idx = 1
         recent_private_sale_info = self._house_repo.get_recent_private_sales()
@@ -1225,12 +1488,12 @@ class ReplacePublicToPrivateUseCase(BaseHouseWorkerUseCase):
         )
 
         try:
-            self._house_repo.bulk_update_private_sales(
+            public_ref_id_result = self._house_repo.bulk_update_private_sales(
                 update_list=public_ref_id_update_list
             )
         except Exception as e:
             logger.error(f"🚀\t [bulk_update_private_sales] - Error : {e} ")
-            exit(os.EX_OK)
+            raise
 
         # 최초 생성 매매건 - 이미 생성되어 있는 real_estate_id는 패스하고 insert 진행
         create_list = self._make_replace_private_sales_create_list(
@@ -1240,35 +1503,60 @@ class ReplacePublicToPrivateUseCase(BaseHouseWorkerUseCase):
         )
 
         try:
-            self._house_repo.bulk_create_private_sale(create_list=create_list)
+            create_result = self._house_repo.bulk_create_private_sale(
+                create_list=create_list
+            )
         except Exception as e:
-            logger.error(f"🚀\t [bulk_update_public_sales] - Error : {e} ")
-            exit(os.EX_OK)
+            logger.error(f"🚀\t [bulk_create_private_sale] - Error : {e} ")
+            raise
+
+        # 매매 전환(생성 / public_ref_id 업데이트) 실패 건은 분양 매물을 유지 -> 다음 배치에서 재처리
+        failed_public_sale_ids = {
+            row["public_ref_id"]
+            for row in public_ref_id_result.failure_rows + create_result.failure_rows
+        }
 
         # bulk_update : 전환 대상 public_sales is_available = False 처리
         update_list = self._make_disable_update_list_to_replace_target(
-            target_list=replace_targets
+            target_list=[
+                target
+                for target in replace_targets
+                if target.id not in failed_public_sale_ids
+            ]
         )
         try:
-            self._house_repo.bulk_update_public_sales(update_list=update_list)
+            disable_result = self._house_repo.bulk_update_public_sales(
+                update_list=update_list
+            )
         except Exception as e:
             logger.error(f"🚀\t [bulk_update_public_sales] - Error : {e} ")
-            exit(os.EX_OK)
+            raise
 
-        if avoid_pk_list:
-            logger.info(
-                f"🚀\t [bulk_create_private_sale] - Done! "
-                f"{len(replace_targets) - len(avoid_pk_list)} / {len(replace_targets)} created, "
-                f"records: {time() - start_time} secs"
-            )
-        else:
-            logger.info(
-                f"🚀\t [bulk_create_private_sale] - Done! "
-                f"{len(replace_targets)} created, "
-                f"records: {time() - start_time} secs"
+        # public_sales.is_available 변경 -> 캘린더 snapshot, 분양 상세 캐시 무효화
+        CalendarSnapshotCache(client=redis).invalidate()
+        HousePublicDetailCache.bump_version(client=redis)
+
+        logger.info(
+            f"🚀\t [bulk_create_private_sale] - Done! "
+            f"{create_result.row_count} / {len(replace_targets)} created, "
+            f"{public_ref_id_result.row_count} updated, "
+            f"{disable_result.row_count} disabled, "
+            f"{len(failed_public_sale_ids)} failed, "
+            f"records: {time() - start_time} secs"
+        )
+        if failed_public_sale_ids or disable_result.failure_rows:
+            self.send_slack_message(
+                title="☠️ [ReplacePublicToPrivateUseCase] >>> 분양 매물 매매 전환 배치",
+                message=f"ReplacePublicToPrivateUseCase : Failed !! \n "
+                f"failed public_sale_ids : {sorted(failed_public_sale_ids)} \n "
+                f"disable failed : {len(disable_result.failure_rows)}",
             )
 
-        exit(os.EX_OK)
+        return dict(
+            created=create_result.row_count,
+            updated=public_ref_id_result.row_count,
+            failed=len(failed_public_sale_ids),
+        )
 
 
 class CheckNotUploadedPhotoUseCase(BaseHouseWorkerUseCase):
@@ -1326,39 +1614,147 @@ class AddSupplyAreaUseCase(BaseHouseWorkerUseCase):
                  MVP 이후에 Core 쪽에 추가한 후 해당 Topic은 삭제한다.
         - When : 데일리 실거래가가 들어온 직후 Tanos 배치가 돌기전에 돌려야 한다.
         - API Param
-            1. ServiceKey : dbNxRdjZCqBvSjcfDHnxPgUm0CXIjGhNHSAlbvBxI0BvOu3dpL8t%2FFQ%2BDRE%2FoKPw61Nm0gHxqYTlYEgDxz37aw%3D%3D
+            1. ServiceKey : BUILDING_REGISTRY_SERVICE_KEY (config)
             2. sigunguCd : front_legal_code
             3. bjdongCd : back_legal_code
             4. bun : land_number
             5. ji : land_number
-            6. numOfRows : 10
+            6. numOfRows : 10000
+        - 호출 : BuildingRegistryClient (thread pool 동시 조회, 초당 호출 수 제한, 재시도)
+        - 응답은 streaming parse -> row tuple 로 temp_supply_area_api 에 COPY (chunk 단위)
+        - 중단 후 재실행 시 저장 완료된 건은 get_target_of_add_to_supply_area 에서 제외됨
+          (temp_supply_area_api / temp_summary_supply_area_api 에 없는 private_sale 만 조회)
 
         - 삭제필요 코드는 전부 옆에와 같이 todo를 달아놈 -> todo. AddSupplyAreaUseCase에서 사용 -> antman 이관 후 삭제 필요
     """
 
-    def execute(self):
+    TEMP_SUPPLY_AREA_API_COLUMNS = (
+        "req_front_legal_code",
+        "req_back_legal_code",
+        "req_land_number",
+        "req_real_estate_id",
+        "req_real_estate_name",
+        "req_private_sale_id",
+        "req_private_sale_name",
+        "req_private_building_type",
+        "req_jibun_address",
+        "req_road_address",
+        "resp_rnum",
+        "resp_total_count",
+        "resp_name",
+        "resp_dong_nm",
+        "resp_ho_nm",
+        "resp_flr_no_nm",
+        "resp_area",
+        "resp_jibun_address",
+        "resp_road_address",
+        "resp_etc_purps",
+        "resp_expos_pubuse_gb_cd_nm",
+        "resp_main_atch_gb_cd",
+        "resp_main_atch_gb_cd_nm",
+        "resp_main_purps_cd",
+        "update_need",
+    )
+
+    def _get_land_number_params(self, land_number: str) -> Tuple[str, Optional[str]]:
+        """
+            return : (bun, ji) 예) 123-4 -> (0123, 0004)
+        """
+        land_number = land_number.split("-")
+        bun = land_number[0].zfill(4)
+        ji = land_number[1].zfill(4) if len(land_number) > 1 else None
+        return bun, ji
+
+    def _fetch_supply_area_items(
+        self, client: BuildingRegistryClient, target: AddSupplyAreaEntity
+    ) -> Tuple[Optional[str], List[ExposPubuseAreaItem]]:
+        """
+            API 응답을 streaming parse 하면서 적재 대상 item 만 남긴다.
+            return : (totalCount, items) / 조회 결과 없으면 (None, [])
+        """
+        bun, ji = self._get_land_number_params(land_number=target.req_land_number)
+        items = client.iter_expos_pubuse_area_items(
+            front_legal_code=target.req_front_legal_code,
+            back_legal_code=target.req_back_legal_code,
+            bun=bun,
+            ji=ji,
+        )
+        is_apartment = target.req_private_building_type.value == "아파트"
+        # if not (resp_main_atch_gb_cd == "0" and resp_main_purps_cd == "02001"):
+        #     continue
+        item_list = [
+            item
+            for item in items
+            if not (is_apartment and item.main_atch_gb_cd != "0")
+        ]
+        return items.total_count, item_list
+
+    def _iter_supply_area_rows(
+        self,
+        target: AddSupplyAreaEntity,
+        total_count: str,
+        items: List[ExposPubuseAreaItem],
+    ) -> Iterator[tuple]:
+        """
+            temp_supply_area_api row tuple (TEMP_SUPPLY_AREA_API_COLUMNS 순서)
+        """
+        req_values = (
+            target.req_front_legal_code,
+            target.req_back_legal_code,
+            target.req_land_number,
+            target.req_real_estate_id,
+            target.req_real_estate_name,
+            target.req_private_sale_id,
+            target.req_private_sale_name,
+            target.req_private_building_type.value,
+            target.req_jibun_address,
+            target.req_road_address,
+        )
+        for item in items:
+            yield req_values + (
+                # 1부터 시작
+                item.rnum,
+                total_count,
+                # 아파트 이름
+                item.bld_nm,
+                item.dong_nm,
+                item.ho_nm,
+                # 층 이름
+                item.flr_no_nm,
+                # 공급면적
+                item.area,
+                # 지번 주소
+                item.new_plat_plc,
+                # 도로명 주소
+                item.plat_plc,
+                # 아파트/ 오피스텔 / 펌프실 / 관리 / 주차장 ...
+                item.etc_purps,
+                # 전유 / 공용
+                item.expos_pubuse_gb_cd_nm,
+                # 0 / 1
+                item.main_atch_gb_cd,
+                # 주건축물 / 부속건출물, ....
+                item.main_atch_gb_cd_nm,
+                # 02001 / 02002~02006 (부속건축물)
+                item.main_purps_cd,
+                # update_need
+                True,
+            )
+
+    def execute(self) -> dict:
         logger.info(f"🚀\tAddSupplyAreaUseCase Start - {self.client_id}")
         start_time = time()
         emoji = "🚀"
 
-        # bulk insert summary_create_list to temp_summary_supply_area_api
-        # self._house_repo.create_summary_success_list_to_temp_summary()
-        #
-        # logger.info(
-        #     f"🚀\tAddSupplyAreaUseCase - Done! \n"
-        #     f"records: {time() - start_time} secs \n"
-        # )
-        # exit(os.EX_OK)
-
         # private_sales 중 아파트,오피스텔 건만 데이터를 조회한다.
         target_list: List[
             AddSupplyAreaEntity
         ] = self._house_repo.get_target_of_add_to_supply_area()
         last_target_id = None  # 실패로그를 위한 변수
-        create_list = list()
-        summary_failure_list = list()
         summary_failure_log_list = list()
+        api_failure_log_list = list()
         count = 0  # 로그 확인용 변수
+        batch_error = None
 
         if not target_list:
             logger.info(
@@ -1374,74 +1770,59 @@ class AddSupplyAreaUseCase(BaseHouseWorkerUseCase):
                 f"records: {time() - start_time} secs \n "
                 f"(총 타겟: 0 / 실패: 0)",
             )
-            exit(os.EX_OK)
+            return dict(target=0, failed=0, api_failed=0)
 
-        url = "http://apis.data.go.kr/1613000/BldRgstService_v2/getBrExposPubuseAreaInfo?ServiceKey=dbNxRdjZCqBvSjcfDHnxPgUm0CXIjGhNHSAlbvBxI0BvOu3dpL8t%2FFQ%2BDRE%2FoKPw61Nm0gHxqYTlYEgDxz37aw%3D%3D"
+        client = BuildingRegistryClient(
+            url=current_app.config.get("BUILDING_REGISTRY_URL"),
+            service_key=current_app.config.get("BUILDING_REGISTRY_SERVICE_KEY"),
+            rate_limit=current_app.config.get("BUILDING_REGISTRY_RATE_LIMIT"),
+            max_workers=current_app.config.get("BUILDING_REGISTRY_MAX_WORKERS"),
+        )
 
         try:
-            for target in target_list:
-                count += 1
-
-                last_target_id = target.req_real_estate_id
-                req_land_number = target.req_land_number
-                land_number = req_land_number.split("-")
-                ji = None
-
-                if len(land_number) > 1:
-                    bun = land_number[0].zfill(4)
-                    ji = land_number[1].zfill(4)
-                else:
-                    bun = land_number[0].zfill(4)
-
-                num_of_rows = 10000
-                page_no = 1
-                r_num = None
-
-                while True:
-                    start_call_time = time()
-
-                    request_param = "&numOfRows={}&pageNo={}&sigunguCd={}&bjdongCd={}&bun={}".format(
-                        num_of_rows,
-                        page_no,
-                        target.req_front_legal_code,
-                        target.req_back_legal_code,
-                        bun,
-                    )
-                    if ji:
-                        request_param += "&ji={}".format(ji)
+            with client:
+                for target, result, error in client.fetch_many(
+                    fetch=partial(self._fetch_supply_area_items, client),
+                    targets=target_list,
+                ):
+                    count += 1
+                    last_target_id = target.req_real_estate_id
 
-                    try:
-                        response = requests.get(
-                            url=url + request_param,
-                            headers={
-                                "Content-Type": "application/json; charset=utf8",
-                                "Cache-Control": "no-cache",
-                            },
-                        )
-                    except Exception as e:
+                    if error:
+                        # temp 테이블에 저장 안함 -> 재실행 시 다시 조회
                         logger.info(
                             f"☠️\tAddSupplyAreaUseCase - Response Failure! \n"
-                            f"exception : {str(e)} \n"
+                            f"real_estate_id: {target.req_real_estate_id} \n"
+                            f"exception : {str(error)} \n"
                         )
-                        sleep(5)
+                        api_failure_log_list.append(target.req_real_estate_id)
                         continue
 
+                    total_count, items = result
                     logger.info(
                         f"🚀\tcall API!\n"
                         f"count: {count} \n"
                         f"real_estate_id: {target.req_real_estate_id} \n"
-                        f"page_no: {page_no} / front_legal_code: {target.req_front_legal_code} / back_legal_code: {target.req_back_legal_code} \n"
-                        f"bun: {bun} / ji: {ji} \n"
-                        f"records: {time() - start_call_time} secs"
+                        f"items: {len(items)} / total_count: {total_count}"
                     )
 
-                    if response.status_code == 200:
-                        xpars = xmltodict.parse(response.text)
-                        json_data = json.dumps(xpars["response"]["body"])
-                        data = json.loads(json_data)
+                    is_failure = total_count is None
+                    # copy to temp_supply_area_api
+                    if items:
+                        try:
+                            self._house_repo.copy_temp_supply_area_api(
+                                columns=self.TEMP_SUPPLY_AREA_API_COLUMNS,
+                                rows=self._iter_supply_area_rows(
+                                    target=target, total_count=total_count, items=items
+                                ),
+                            )
+                        except InsertFailErrorException:
+                            is_failure = True
 
-                        if not data["items"]:
-                            summary_failure_list.append(
+                    # bulk insert summary_failure to temp_summary_supply_area_api
+                    if is_failure:
+                        self._house_repo.create_summary_failure_list_to_temp_summary(
+                            create_list=[
                                 dict(
                                     real_estate_id=target.req_real_estate_id,
                                     real_estate_name=target.req_real_estate_name,
@@ -1449,170 +1830,15 @@ class AddSupplyAreaUseCase(BaseHouseWorkerUseCase):
                                     private_sale_name=target.req_private_sale_name,
                                     success_yn=False,
                                 )
-                            )
-                            summary_failure_log_list.append(target.req_real_estate_id)
-                            break
-
-                        total_count = data["totalCount"]
-
-                        item_type = isinstance(
-                            data["items"]["item"], dict
-                        )  # list에 담겨져오는 것이 대부분이나 일부는 json 형식으로 내려옴
-                        if item_type:
-                            item = data["items"]["item"]
-                            resp_dong_nm = item["dongNm"]
-                            resp_ho_nm = item["hoNm"]
-                            resp_bld_nm = item["bldNm"]  # 아파트 이름
-                            resp_flr_no_nm = item["flrNoNm"]  # 층 이름
-                            resp_area = item["area"]  # 공급면적
-                            resp_jibun_address = item["newPlatPlc"]  # 지번 주소
-                            resp_road_address = item["platPlc"]  # 도로명 주소
-                            resp_etc_purps = item[
-                                "etcPurps"
-                            ]  # 아파트/ 오피스텔 / 펌프실 / 관리 / 주차장 ...
-                            resp_expos_pubuse_gb_cd_nm = item[
-                                "exposPubuseGbCdNm"
-                            ]  # 전유 / 공용
-                            resp_main_atch_gb_cd = item["mainAtchGbCd"]  # 0 / 1
-                            resp_main_atch_gb_cd_nm = item[
-                                "mainAtchGbCdNm"
-                            ]  # 주건축물 / 부속건출물, ....
-                            resp_main_purps_cd = item[
-                                "mainPurpsCd"
-                            ]  # 02001 / 02002~02006 (부속건축물)
-
-                            # 1부터 시작
-                            r_num = item["rnum"]
-
-                            # if not (resp_main_atch_gb_cd == "0" and resp_main_purps_cd == "02001"):
-                            #     continue
-
-                            if (
-                                resp_main_atch_gb_cd != "0"
-                                and target.req_private_building_type.value == "아파트"
-                            ):
-                                continue
-
-                            create_dict = dict(
-                                req_front_legal_code=target.req_front_legal_code,
-                                req_back_legal_code=target.req_back_legal_code,
-                                req_land_number=target.req_land_number,
-                                req_real_estate_id=target.req_real_estate_id,
-                                req_real_estate_name=target.req_real_estate_name,
-                                req_private_sale_id=target.req_private_sale_id,
-                                req_private_sale_name=target.req_private_sale_name,
-                                req_private_building_type=target.req_private_building_type.value,
-                                req_jibun_address=target.req_jibun_address,
-                                req_road_address=target.req_road_address,
-                                resp_rnum=r_num,
-                                resp_total_count=total_count,
-                                resp_name=resp_bld_nm,
-                                resp_dong_nm=resp_dong_nm,
-                                resp_ho_nm=resp_ho_nm,
-                                resp_flr_no_nm=resp_flr_no_nm,
-                                resp_area=resp_area,
-                                resp_jibun_address=resp_jibun_address,
-                                resp_road_address=resp_road_address,
-                                resp_etc_purps=resp_etc_purps,
-                                resp_expos_pubuse_gb_cd_nm=resp_expos_pubuse_gb_cd_nm,
-                                resp_main_atch_gb_cd=resp_main_atch_gb_cd,
-                                resp_main_atch_gb_cd_nm=resp_main_atch_gb_cd_nm,
-                                resp_main_purps_cd=resp_main_purps_cd,
-                                update_need=True,
-                            )
-
-                            create_list.append(create_dict)
-                        else:
-                            for item in data["items"]["item"]:
-                                resp_dong_nm = item["dongNm"]
-                                resp_ho_nm = item["hoNm"]
-                                resp_bld_nm = item["bldNm"]  # 아파트 이름
-                                resp_flr_no_nm = item["flrNoNm"]  # 층 이름
-                                resp_area = item["area"]  # 공급면적
-                                resp_jibun_address = item["newPlatPlc"]  # 지번 주소
-                                resp_road_address = item["platPlc"]  # 도로명 주소
-                                resp_etc_purps = item[
-                                    "etcPurps"
-                                ]  # 아파트/ 오피스텔 / 펌프실 / 관리 / 주차장 ...
-                                resp_expos_pubuse_gb_cd_nm = item[
-                                    "exposPubuseGbCdNm"
-                                ]  # 전유 / 공용
-                                resp_main_atch_gb_cd = item["mainAtchGbCd"]  # 0 / 1
-                                resp_main_atch_gb_cd_nm = item[
-                                    "mainAtchGbCdNm"
-                                ]  # 주건축물 / 부속건출물, ....
-                                resp_main_purps_cd = item[
-                                    "mainPurpsCd"
-                                ]  # 02001 / 02002~02006 (부속건축물)
-
-                                # 1부터 시작
-                                r_num = item["rnum"]
-
-                                # if not (resp_main_atch_gb_cd == "0" and resp_main_purps_cd == "02001"):
-                                #     continue
-
-                                if (
-                                    resp_main_atch_gb_cd != "0"
-                                    and target.req_private_building_type.value == "아파트"
-                                ):
-                                    continue
-
-                                create_dict = dict(
-                                    req_front_legal_code=target.req_front_legal_code,
-                                    req_back_legal_code=target.req_back_legal_code,
-                                    req_land_number=target.req_land_number,
-                                    req_real_estate_id=target.req_real_estate_id,
-                                    req_real_estate_name=target.req_real_estate_name,
-                                    req_private_sale_id=target.req_private_sale_id,
-                                    req_private_sale_name=target.req_private_sale_name,
-                                    req_private_building_type=target.req_private_building_type.value,
-                                    req_jibun_address=target.req_jibun_address,
-                                    req_road_address=target.req_road_address,
-                                    resp_rnum=r_num,
-                                    resp_total_count=total_count,
-                                    resp_name=resp_bld_nm,
-                                    resp_dong_nm=resp_dong_nm,
-                                    resp_ho_nm=resp_ho_nm,
-                                    resp_flr_no_nm=resp_flr_no_nm,
-                                    resp_area=resp_area,
-                                    resp_jibun_address=resp_jibun_address,
-                                    resp_road_address=resp_road_address,
-                                    resp_etc_purps=resp_etc_purps,
-                                    resp_expos_pubuse_gb_cd_nm=resp_expos_pubuse_gb_cd_nm,
-                                    resp_main_atch_gb_cd=resp_main_atch_gb_cd,
-                                    resp_main_atch_gb_cd_nm=resp_main_atch_gb_cd_nm,
-                                    resp_main_purps_cd=resp_main_purps_cd,
-                                    update_need=True,
-                                )
-
-                                create_list.append(create_dict)
-
-                        if int(r_num) < int(total_count):
-                            page_no += 1
-                            continue
-
-                        break
-
-                # bulk insert to temp_supply_area_api
-                if create_list:
-                    self._house_repo.create_temp_supply_area_api(
-                        create_list=create_list,
-                        summary_failure_list=summary_failure_list,
-                    )
-
-                # bulk insert summary_failure_list to temp_summary_supply_area_api
-                if summary_failure_list:
-                    self._house_repo.create_summary_failure_list_to_temp_summary(
-                        create_list=summary_failure_list
-                    )
-
-                create_list = list()
-                summary_failure_list = list()
+                            ]
+                        )
+                        summary_failure_log_list.append(target.req_real_estate_id)
 
             # bulk insert summary_create_list to temp_summary_supply_area_api
             self._house_repo.create_summary_success_list_to_temp_summary()
 
         except Exception as e:
+            batch_error = e
             logger.info(
                 f"☠️\tAddSupplyAreaUseCase - Failure! \n"
                 f"exception : {str(e)} \n"
@@ -1620,23 +1846,37 @@ class AddSupplyAreaUseCase(BaseHouseWorkerUseCase):
                 f"records: {time() - start_time} secs"
             )
 
+        if batch_error or api_failure_log_list:
+            emoji = "☠️"
+
         logger.info(
             f"🚀\tAddSupplyAreaUseCase - Done! \n"
             f"last_real_estate_id: {last_target_id} \n"
             f"records: {time() - start_time} secs \n"
-            f"(총 타겟: {len(target_list)} / 실패: {len(summary_failure_log_list)}) \n"
-            f"summary_failure_log_list(real_estate_id): {summary_failure_log_list}"
+            f"(총 타겟: {len(target_list)} / 실패: {len(summary_failure_log_list)} "
+            f"/ API 실패: {len(api_failure_log_list)}) \n"
+            f"summary_failure_log_list(real_estate_id): {summary_failure_log_list} \n"
+            f"api_failure_log_list(real_estate_id): {api_failure_log_list}"
         )
 
         self.send_slack_message(
             title=f"{emoji} [AddSupplyAreaUseCase] >>> 공급면적 추가 배치",
             message=f"AddSupplyAreaUseCase : Finished !! \n "
             f"records: {time() - start_time} secs \n "
-            f"(총 타겟: {len(target_list)} / 실패: {len(summary_failure_log_list)}) \n"
-            f"summary_failure_log_list(real_estate_id): {summary_failure_log_list}",
+            f"(총 타겟: {len(target_list)} / 실패: {len(summary_failure_log_list)} "
+            f"/ API 실패: {len(api_failure_log_list)}) \n"
+            f"summary_failure_log_list(real_estate_id): {summary_failure_log_list} \n"
+            f"api_failure_log_list(real_estate_id): {api_failure_log_list}",
         )
 
-        exit(os.EX_OK)
+        if batch_error:
+            raise batch_error
+
+        return dict(
+            target=len(target_list),
+            failed=len(summary_failure_log_list),
+            api_failed=len(api_failure_log_list),
+        )
 
 
 class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
@@ -1648,7 +1888,7 @@ class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
         - 삭제필요 코드는 전부 옆에와 같이 todo를 달아놈 -> todo. AddSupplyAreaUseCase에서 사용 -> antman 이관 후 삭제 필요
     """
 
-    def execute(self):
+    def execute(self) -> dict:
         logger.info(f"🚀\tBindSupplyAreaUseCase Start - {self.client_id}")
         start_time = time()
         emoji = "🚀"
@@ -1656,6 +1896,7 @@ class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
         last_target_id = None  # 실패로그를 위한 변수
         create_list = list()
         failure_list = list()
+        batch_error = None
 
         # private_sales.create_at or updated_at이 오늘날짜인 타겟 id를 조회한다.
         target_entities: List[
@@ -1670,7 +1911,7 @@ class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
                 f"records: {time() - start_time} secs \n "
                 f"Update_private_sale_ids : Nothing target_ids",
             )
-            exit(os.EX_OK)
+            return dict(created=0, failed=0)
 
         try:
             for target_entity in target_entities:
@@ -1721,6 +1962,8 @@ class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
             self._house_repo.create_temp_failure_supply_area(failure_list=failure_list)
 
         except Exception as e:
+            batch_error = e
+            emoji = "☠️"
             logger.info(
                 f"☠️\tBindSupplyAreaUseCase - Failure! \n"
                 f"last_real_estate_id: {last_target_id} \n"
@@ -1743,4 +1986,7 @@ class BindSupplyAreaUseCase(BaseHouseWorkerUseCase):
             f"summary_failure_log_list(real_estate_id): {failure_list}",
         )
 
-        exit(os.EX_OK)
+        if batch_error:
+            raise batch_error
+
+        return dict(created=len(create_list), failed=len(failure_list))
@@ -1,11 +1,23 @@
 import json
 import os
-from typing import Dict, List, Union
+from time import time, sleep
+from typing import Dict, List, Union, Any, Tuple
 
 import inject
+from flask import current_app
 
 from app import redis
+from app.extensions.cache.cache import REDIS_ERRORS
+from app.extensions.cache.calendar_snapshot_cache import CalendarSnapshotCache
+from app.extensions.cache.house_public_detail_cache import HousePublicDetailCache
+from app.extensions.cache.map_tile_cache import MapTileCache
+from app.extensions.utils.bulk_write_helper import bisect_write, is_non_data_error
+from app.extensions.utils.search_index import HouseSearchIndex
+from app.extensions.utils.spatial_index import RealEstateSpatialIndex
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
 from app.extensions.utils.log_helper import logger_
+from app.extensions.utils.time_helper import get_server_timestamp
+from app.extensions.utils.worker_helper import IdleBackoff, sync_metrics
 from app.persistence.model import (
     PublicSaleModel,
     PrivateSaleModel,
@@ -21,10 +33,22 @@ from app.persistence.model import (
     PublicSaleDetailPhotoModel,
     PublicSalePhotoModel,
 )
+from core.domains.house.enum.house_enum import SyncIngestionModeEnum
 from core.domains.house.repository.house_repository import HouseRepository
 
 logger = logger_.getLogger(__name__)
 
+# 분양 매물 상세 (GetHousePublicDetailUseCase) 조회에 사용되는 모델
+PUBLIC_DETAIL_MODELS = (
+    RealEstateModel,
+    PublicSaleModel,
+    PublicSaleDetailModel,
+    PublicSalePhotoModel,
+    PublicSaleDetailPhotoModel,
+    SpecialSupplyResultModel,
+    GeneralSupplyResultModel,
+)
+
 model_transfer_dict = dict(
     real_estates=RealEstateModel,
     private_sales=PrivateSaleModel,
@@ -43,15 +67,34 @@ model_transfer_dict = dict(
 
 
 class SyncDataUseCase:
+    UPSERT_CHUNK_SIZE = 1000
+    SCAN_GET_COUNT = 500
+    STREAM = RedisKeyPrefix.SYNC_STREAM.value
+    STREAM_GROUP = RedisKeyPrefix.SYNC_STREAM_GROUP.value
+    STREAM_READ_COUNT = 10000
+    # ms
+    STREAM_BLOCK_TIME = 5000
+    STREAM_PENDING_IDLE_TIME = 5 * 60 * 1000
+    SCAN_PATTERN = "sync:*"
+    # sec, scan 모드 대기 건수(남은 key 수) 갱신 주기 (전체 SCAN)
+    SCAN_BACKLOG_CHECK_SECONDS = 15
+    # sec, redis 장애(연결 끊김 등) 시 재시도 대기 시간 (exponential backoff)
+    REDIS_ERROR_MIN_SLEEP = 1.0
+    REDIS_ERROR_MAX_SLEEP = 30.0
+
     @inject.autoparams()
     def __init__(
         self, topic: str, house_repo: HouseRepository,
     ):
         self.topic = topic
         self._redis_client = redis
+        self._map_tile_cache = MapTileCache(client=redis)
+        self._calendar_snapshot_cache = CalendarSnapshotCache(client=redis)
         self._house_repo = house_repo
+        self._metrics = sync_metrics
         self._is_insert_failure = False
         self._is_update_failure = False
+        self._scan_backlog_checked_at = 0.0
 
     @property
     def client_id(self) -> str:
@@ -69,44 +112,256 @@ class SyncDataUseCase:
         version 2.
         PRIVATE_SALES = "sync:private-sales:1={...}"
         key = sync(유형):private-sales(테이블):pk(1)=value
+
+        version 3. (SYNC_INGESTION_MODE = stream)
+        stream = sync_stream, fields = {table: private_sales, value: {...}}
+        - consumer group(XREADGROUP / XACK) 으로 여러 worker 가 나누어 처리
+        - ack 되지 않은 메세지는 PENDING_IDLE_TIME 이후 다른 worker 가 가져가서 처리
+
+        polling
+        - 처리한 메세지가 있으면 대기 없이 바로 다음 polling (backlog drain)
+        - scan 모드에서 메세지가 없으면 IdleBackoff.MIN_DELAY ~ MAX_DELAY 범위로 대기 시간 증가
+        - stream 모드는 XREADGROUP block 이 대기 역할
+        - redis 장애 시 종료하지 않고 REDIS_ERROR_MIN_SLEEP ~ MAX_SLEEP 대기 후 재시도
         """
 
         logger.info(f"🚀\tSyncDataUseCase Start - {self.client_id}")
+        self._start_metrics_server()
+
+        is_stream_mode = (
+            current_app.config.get("SYNC_INGESTION_MODE")
+            == SyncIngestionModeEnum.STREAM.value
+        )
+        backoff = IdleBackoff()
+        error_backoff = IdleBackoff(
+            min_delay=self.REDIS_ERROR_MIN_SLEEP, max_delay=self.REDIS_ERROR_MAX_SLEEP
+        )
+        is_group_created = False
         while True:
-            messages = {}
-
             try:
-                # Insert Model
-                self._redis_client.scan(pattern="sync:*")
-                messages: dict = self._get_messages()
+                if is_stream_mode:
+                    if not is_group_created:
+                        self._redis_client.create_stream_group(
+                            stream=self.STREAM, group=self.STREAM_GROUP
+                        )
+                        is_group_created = True
+                    processed_count = self._process_stream()
+                else:
+                    processed_count = self._process_scan()
+            except REDIS_ERRORS as e:
+                logger.exception(f"☠️\tSyncDataUseCase redis error. {e}")
+                # redis 재시작으로 consumer group 이 사라졌을 수 있으므로 다시 생성
+                is_group_created = False
+                sleep(error_backoff.next_delay())
+                continue
+            except Exception as e:
+                if not is_non_data_error(e):
+                    raise
+                # DB 연결 끊김 -> 메세지는 남겨두고(ack / key 삭제 안함) 재시도
+                logger.exception(f"☠️\tSyncDataUseCase DB connection error. {e}")
+                sleep(error_backoff.next_delay())
+                continue
 
-                if messages:
-                    logger.info(
-                        f"[*] Get length of insert sync data -> {self._get_sync_data_len(messages=messages)}"
-                    )
+            error_backoff.reset()
+            if processed_count:
+                backoff.reset()
+            elif not is_stream_mode:
+                sleep(backoff.next_delay())
 
-                    self._upsert_target_model(messages=messages)
-                    logger.info("🚀\tInsert target model success")
-            except Exception as e:
-                logger.exception(f"☠️\tError insert process. {e}")
-                self._is_insert_failure = True
-
-            if self._is_insert_failure:
-                failure_list: Union[
-                    List[Dict], List
-                ] = self._transfer_sync_failure_history_entity(messages=messages)
-                self._house_repo.bulk_insert_sync_failure_histories(
-                    insert_list=failure_list
-                )
-                self._is_insert_failure = False
+    def _start_metrics_server(self) -> None:
+        port = current_app.config.get("SYNC_METRICS_PORT")
+        if not port:
+            return
+
+        try:
+            self._metrics.start_http_server(port=port)
+        except OSError as e:
+            # 같은 host 에서 다른 worker 가 port 를 사용 중인 경우 -> 지표 노출 없이 진행
+            logger.warning(f"[SyncDataUseCase] metrics server start fail : {e}")
 
-            # Clear cache
-            if self._redis_client.copied_keys:
+    def _process_scan(self) -> int:
+        """
+            return : 처리한 메세지 수
+        """
+        messages = {}
+        start_time = time()
+
+        try:
+            # Insert Model
+            self._redis_client.scan(pattern=self.SCAN_PATTERN)
+            messages: dict = self._get_messages()
+
+            if messages:
                 logger.info(
-                    f"🚀️\t Clear key length -> {len(self._redis_client.copied_keys)}"
+                    f"[*] Get length of insert sync data -> {self._get_sync_data_len(messages=messages)}"
+                )
+
+                self._upsert_target_model(messages=messages)
+                logger.info("🚀\tInsert target model success")
+        except Exception as e:
+            if is_non_data_error(e):
+                # 실패 이력 저장 / key 삭제 없이 다음 polling 에서 재처리
+                self._redis_client.reset_scan()
+                raise
+            logger.exception(f"☠️\tError insert process. {e}")
+            self._is_insert_failure = True
+
+        if self._is_insert_failure:
+            failure_list: Union[
+                List[Dict], List
+            ] = self._transfer_sync_failure_history_entity(messages=messages)
+            self._house_repo.bulk_insert_sync_failure_histories(
+                insert_list=failure_list
+            )
+            self._is_insert_failure = False
+
+        # Clear cache
+        if self._redis_client.copied_keys:
+            logger.info(
+                f"🚀️\t Clear key length -> {len(self._redis_client.copied_keys)}"
+            )
+            logger.info(f"🚀️\t Clear keys -> {self._redis_client.copied_keys}")
+            self._redis_client.clear_cache()
+
+        self._set_scan_backlog_size()
+
+        processed_count = self._get_sync_data_len(messages=messages)
+        if processed_count:
+            self._metrics.observe_batch(
+                size=processed_count, seconds=time() - start_time
+            )
+        return processed_count
+
+    def _process_stream(self) -> int:
+        """
+            pending 메세지(처리 중 종료된 worker) 복구 -> 새 메세지 조회 순으로 처리
+            - 처리 후(실패 시 sync_failure_histories 저장 후) ack
+            - DB 연결 끊김(is_non_data_error)은 ack 하지 않고 raise -> pending 에서 재처리
+            - 형식이 잘못된 메세지는 sync_failure_histories 저장 후 ack (pending 에 남아 무한 재처리 방지)
+            return : 처리한 메세지 수
+        """
+        entries = self._redis_client.claim_pending_stream(
+            stream=self.STREAM,
+            group=self.STREAM_GROUP,
+            consumer=self.client_id,
+            min_idle_time=self.STREAM_PENDING_IDLE_TIME,
+            count=self.STREAM_READ_COUNT,
+        )
+        if not entries:
+            entries = self._redis_client.read_stream_group(
+                stream=self.STREAM,
+                group=self.STREAM_GROUP,
+                consumer=self.client_id,
+                count=self.STREAM_READ_COUNT,
+                block=self.STREAM_BLOCK_TIME,
+            )
+        if not entries:
+            self._set_stream_backlog_size()
+            return 0
+
+        start_time = time()
+        messages, invalid_list = self._parse_stream_entries(entries=entries)
+        if invalid_list:
+            logger.error(f"☠️\tInvalid stream sync data -> {len(invalid_list)}")
+            self._house_repo.bulk_insert_sync_failure_histories(
+                insert_list=invalid_list
+            )
+            # 아래 upsert 가 DB 연결 끊김으로 중단되어도 실패 이력이 중복 저장되지 않도록 먼저 ack
+            self._redis_client.ack_stream(
+                stream=self.STREAM,
+                group=self.STREAM_GROUP,
+                ids=[failure["sync_data"]["entry_id"] for failure in invalid_list],
+            )
+        logger.info(
+            f"[*] Get length of stream sync data -> {self._get_sync_data_len(messages=messages)}"
+        )
+
+        try:
+            self._upsert_target_model(messages=messages)
+            logger.info("🚀\tInsert target model success")
+        except Exception as e:
+            if is_non_data_error(e):
+                # ack 하지 않음 -> pending 으로 남아 STREAM_PENDING_IDLE_TIME 후 재처리
+                raise
+            logger.exception(f"☠️\tError insert process. {e}")
+            self._house_repo.bulk_insert_sync_failure_histories(
+                insert_list=self._transfer_sync_failure_history_entity(
+                    messages=messages
+                )
+            )
+
+        self._redis_client.ack_stream(
+            stream=self.STREAM,
+            group=self.STREAM_GROUP,
+            ids=[entry_id for entry_id, _ in entries],
+        )
+
+        self._metrics.observe_batch(size=len(entries), seconds=time() - start_time)
+        self._set_stream_backlog_size()
+        return len(entries)
+
+    def _parse_stream_entries(
+        self, entries: List[Tuple[bytes, Dict[bytes, bytes]]]
+    ) -> Tuple[Dict[str, List[dict]], List[dict]]:
+        """
+            return : (table 별 메세지, 파싱 실패한 메세지의 sync_failure_histories insert_list)
+        """
+        messages = dict()
+        invalid_list = list()
+        for entry_id, fields in entries:
+            try:
+                table = fields[b"table"].decode("utf-8")
+                value = json.loads(fields[b"value"])
+            except (KeyError, UnicodeDecodeError, ValueError) as e:
+                logger.error(f"☠️\tInvalid stream entry {entry_id} : {e}")
+                invalid_list.append(
+                    dict(
+                        target_table=fields.get(b"table", b"").decode(
+                            "utf-8", errors="replace"
+                        )[:50],
+                        sync_data=dict(
+                            entry_id=entry_id.decode("utf-8"),
+                            value=fields.get(b"value", b"").decode(
+                                "utf-8", errors="replace"
+                            ),
+                        ),
+                    )
+                )
+                continue
+
+            messages.setdefault(table, []).append(value)
+        return messages, invalid_list
+
+    def _set_scan_backlog_size(self) -> None:
+        """
+            scan 모드 대기 건수 : 처리 후 남아있는 sync:* key 수
+            - 전체 key 를 SCAN 하므로 지표 노출 시(SYNC_METRICS_PORT)에만 갱신
+              (SCAN_BACKLOG_CHECK_SECONDS 마다)
+        """
+        if not current_app.config.get("SYNC_METRICS_PORT"):
+            return
+
+        now = time()
+        if now - self._scan_backlog_checked_at < self.SCAN_BACKLOG_CHECK_SECONDS:
+            return
+        self._scan_backlog_checked_at = now
+
+        try:
+            self._metrics.set_backlog_size(
+                size=self._redis_client.count_keys(pattern=self.SCAN_PATTERN)
+            )
+        except Exception as e:
+            logger.exception(f"☠️\tError get scan backlog. {e}")
+
+    def _set_stream_backlog_size(self) -> None:
+        try:
+            self._metrics.set_backlog_size(
+                size=self._redis_client.get_stream_backlog(
+                    stream=self.STREAM, group=self.STREAM_GROUP
                 )
-                logger.info(f"🚀️\t Clear keys -> {self._redis_client.copied_keys}")
-                self._redis_client.clear_cache()
+            )
+        except Exception as e:
+            logger.exception(f"☠️\tError get stream backlog. {e}")
 
     def _transfer_sync_failure_history_entity(
         self, messages: Dict
@@ -132,38 +387,41 @@ class SyncDataUseCase:
 
     def _get_messages(self) -> dict:
         # limit 만큼 메세지를 scan (10000이면 메세지 10000개를 스캔)
+        # SCAN_GET_COUNT 개씩 pipeline 으로 GET (key 당 왕복 1번 -> batch 당 1번)
         offset = 0
         limit = 10000
 
         messages = dict()
-        while True:
+        while offset < limit:
             try:
-                data = self._redis_client.get_after_scan()
-                if data is None or offset >= limit:
-                    break
+                data_list = self._redis_client.get_many_after_scan(
+                    count=min(self.SCAN_GET_COUNT, limit - offset)
+                )
+            except Exception as e:
+                logger.info("_get_messages() exception")
+                logger.exception(str(e))
+                raise
+
+            if not data_list:
+                break
 
+            for data in data_list:
                 key = (
                     data["key"].decode().split(":")[1]
                 )  # private_sales, public_sales ...
                 messages.setdefault(key, []).append(json.loads(data["value"]))
-                offset += 1
-            except Exception as e:
-                logger.info("_get_messages() exception")
-                logger.exception(str(e))
-                raise
+            offset += len(data_list)
 
         return messages
 
     def _upsert_target_model(self, messages: Dict) -> None:
+        """
+            모델 별로 UPSERT_CHUNK_SIZE 만큼 끊어서 upsert (INSERT ... ON CONFLICT DO UPDATE)
+            - chunk 당 id IN (...) 조회 1번으로 insert / update 건수 집계
+            - chunk upsert 실패 시 bisect 재시도, 실패 row 는 sync_failure_histories 에 저장
+        """
+        failure_list = list()
         for key in model_transfer_dict.keys():
-            # limit 만큼 메세지를 끊어서 처리
-            insert_offset = 0
-            update_offset = 0
-            limit = 10000
-
-            insert_data = list()
-            update_data = list()
-
             message = messages.get(key)
             if not message:
                 continue
@@ -173,44 +431,170 @@ class SyncDataUseCase:
             if model == RealEstateModel:
                 self.__set_coordinates(message=message)
 
-            for data in message:
-                is_exists = self._house_repo._is_exists_by_id(model=model, data=data)
-                if not is_exists:
-                    insert_data.append(data)
-                else:
-                    update_data.append(data)
-
-            # insert
-            if len(insert_data) > limit:
-                while True:
-                    data = insert_data[insert_offset : insert_offset + limit]
-                    if not data:
-                        break
-                    self._house_repo.bulk_insert_target_model(
-                        model=model, insert_list=data
+            start_time = time()
+            insert_count = 0
+            update_count = 0
+            failure_count = 0
+            success_list = list()
+            previous_coordinates = list()
+            for offset in range(0, len(message), self.UPSERT_CHUNK_SIZE):
+                chunk = message[offset : offset + self.UPSERT_CHUNK_SIZE]
+                exists_ids = self._house_repo.get_exists_ids_by_ids(
+                    model=model, ids=[data.get("id") for data in chunk]
+                )
+                if model == RealEstateModel and exists_ids:
+                    # 좌표가 변경된 경우 이전 위치의 tile 도 무효화하도록 upsert 전 좌표 조회
+                    previous_coordinates.extend(
+                        self._get_map_tile_coordinates(
+                            model=model, target_ids=list(exists_ids)
+                        )
                     )
-                    insert_offset += limit
 
-            elif insert_data and len(insert_data) <= limit:
-                self._house_repo.bulk_insert_target_model(
-                    model=model, insert_list=insert_data
+                success_data, failure_data = self._upsert_chunk(
+                    model=model, chunk=chunk
+                )
+                success_list.extend(success_data)
+                for data in success_data:
+                    if data.get("id") in exists_ids:
+                        update_count += 1
+                    else:
+                        insert_count += 1
+
+                failure_count += len(failure_data)
+                failure_list.extend(
+                    dict(target_table=key, sync_data=data) for data in failure_data
                 )
 
-            # update
-            if len(update_data) > limit:
-                while True:
-                    data = update_data[update_offset : update_offset + limit]
-                    if not data:
-                        break
-                    self._house_repo.bulk_update_target_model(
-                        model=model, update_list=data
-                    )
-                    update_offset += limit
+            upsert_seconds = time() - start_time
+            logger.info(
+                f"🚀\tUpsert {key} -> records: {upsert_seconds} secs, "
+                f"{insert_count} Created, {update_count} Updated, "
+                f"{failure_count} Failed"
+            )
+            self._metrics.observe_upsert(
+                table=key,
+                count=insert_count + update_count,
+                failure_count=failure_count,
+                seconds=upsert_seconds,
+            )
 
-            elif update_data and len(update_data) <= limit:
-                self._house_repo.bulk_update_target_model(
-                    model=model, update_list=update_data
-                )
+            self._invalidate_map_tile_cache(
+                model=model, message=message, previous_coordinates=previous_coordinates
+            )
+
+            if model == PrivateSaleDetailModel:
+                self._mark_private_sale_avg_dirty(message=success_list)
+
+            if model == RealEstateModel:
+                # API 프로세스의 in-memory 공간 인덱스 재빌드 요청
+                RealEstateSpatialIndex.bump_version(client=self._redis_client)
+
+            if model in (RealEstateModel, PublicSaleModel, PrivateSaleModel):
+                # API 프로세스의 in-memory 검색 인덱스 재빌드 요청
+                HouseSearchIndex.bump_version(client=self._redis_client)
+
+            if model in (RealEstateModel, PublicSaleModel):
+                self._refresh_calendar_snapshot()
+
+            if model in PUBLIC_DETAIL_MODELS:
+                # 분양 매물 상세 캐시 전체 무효화
+                HousePublicDetailCache.bump_version(client=self._redis_client)
+
+        if failure_list:
+            self._house_repo.bulk_insert_sync_failure_histories(
+                insert_list=failure_list
+            )
+
+    def _upsert_chunk(
+        self, model: Any, chunk: List[dict]
+    ) -> Tuple[List[dict], List[dict]]:
+        """
+            chunk upsert 실패 시 반으로 나누어 재시도 (bisect_write) -> 실패 row 만 분리
+            return : (성공 row 목록, 실패 row 목록)
+        """
+        return bisect_write(
+            rows=chunk,
+            write=lambda rows: self._house_repo.upsert_target_model(
+                model=model, upsert_list=rows
+            ),
+        )
+
+    def _refresh_calendar_snapshot(self) -> None:
+        """
+            청약 캘린더 snapshot 전체 무효화(version 변경) 후 이번 달 snapshot 재생성
+            - 다른 달은 첫 조회 시 생성
+        """
+        try:
+            version = self._calendar_snapshot_cache.invalidate()
+            if version is None:
+                return
+
+            year_month = get_server_timestamp().strftime("%Y%m")
+            calendar_entities = self._house_repo.get_simple_calendar_info(
+                user_id=None,
+                search_filters=self._house_repo.get_calendar_info_filters(
+                    year_month=year_month
+                ),
+            )
+            self._calendar_snapshot_cache.set(
+                version=version,
+                year_month=year_month,
+                snapshot=CalendarSnapshotCache.to_snapshot(entities=calendar_entities),
+            )
+            logger.info(f"🚀\tRefresh calendar snapshot -> {year_month}")
+        except Exception as e:
+            logger.exception(f"☠️\tError refresh calendar snapshot. {e}")
+
+    def _mark_private_sale_avg_dirty(self, message: List[dict]) -> None:
+        """
+            실거래가 추가, 변경된 private_sale_id 를 dirty set 에 기록
+            -> PreCalculateAverageUseCase(incremental) 에서 해당 매물만 평균가 재계산
+        """
+        try:
+            self._redis_client.add_set_members(
+                key=RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value,
+                values=list(
+                    {
+                        data.get("private_sale_id")
+                        for data in message
+                        if data.get("private_sale_id")
+                    }
+                ),
+            )
+        except Exception as e:
+            logger.exception(f"☠️\tError mark private sale avg dirty. {e}")
+
+    def _get_map_tile_coordinates(
+        self, model: object, target_ids: List[int]
+    ) -> List[Tuple[float, float]]:
+        try:
+            return self._house_repo.get_coordinates_by_target_ids(
+                model=model, target_ids=target_ids
+            )
+        except Exception as e:
+            logger.exception(f"☠️\tError get map tile coordinates. {e}")
+            return []
+
+    def _invalidate_map_tile_cache(
+        self,
+        model: object,
+        message: List[dict],
+        previous_coordinates: List[Tuple[float, float]],
+    ) -> None:
+        """
+            변경된 매물이 속한 지도 tile 캐시 무효화 (MapTileCache)
+            - previous_coordinates : upsert 전 좌표 (real_estates 좌표 변경 시 이전 위치 tile)
+            - 캐시 무효화 실패가 sync 실패로 이어지지 않도록 예외는 로그만 남긴다.
+        """
+        try:
+            coordinates = previous_coordinates + self._get_map_tile_coordinates(
+                model=model, target_ids=[data.get("id") for data in message]
+            )
+            if coordinates:
+                tile_count = self._map_tile_cache.invalidate(coordinates=coordinates)
+                logger.info(f"🚀\tInvalidate map tile cache -> {tile_count} tiles")
+        except Exception as e:
+            logger.exception(f"☠️\tError invalidate map tile cache. {e}")
 
     def __set_coordinates(self, message: List[dict]):
         for insert_data in message:
@@ -1,8 +1,10 @@
 from typing import Optional
 
-from flask import g
+from flask import g, current_app
 from pubsub import pub
 
+from app.extensions import redis
+from app.extensions.cache.recently_view_buffer import RecentlyViewBuffer
 from core.domains.notification.dto.notification_dto import (
     UpdateReceiveNotificationSettingDto,
 )
@@ -20,7 +22,12 @@ def update_app_agree_terms_to_receive_marketing(
 
 
 def create_recently_view(dto: RecentlyViewDto):
-    UserRepository().create_recently_view(dto=dto)
+    # write-behind : buffer 에 기록 후 바로 반환 (buffer 저장 실패 시 DB 에 바로 저장)
+    if not (
+        current_app.config.get("RECENTLY_VIEW_WRITE_BEHIND_ENABLED")
+        and RecentlyViewBuffer(client=redis).add(dto=dto)
+    ):
+        UserRepository().create_recently_view(dto=dto)
     setattr(g, UserTopicEnum.CREATE_RECENTLY_VIEW, None)
 
 
@@ -466,6 +466,71 @@ class UserRepository:
             )
             raise Exception(e)
 
+    def bulk_upsert_recently_views(self, upsert_list: List[dict]) -> None:
+        """
+            RecentlyViewBuffer flush -> 이미 본 매물은 update, 처음 본 매물은 insert (commit 1번)
+            upsert_list : [dict(user_id, house_id, type, viewed_at)]
+        """
+        if not upsert_list:
+            return
+
+        viewed_dict = {
+            (data["user_id"], data["house_id"], data["type"]): data["viewed_at"]
+            for data in upsert_list
+        }
+        try:
+            recently_views = (
+                session.query(
+                    RecentlyViewModel.id,
+                    RecentlyViewModel.user_id,
+                    RecentlyViewModel.house_id,
+                    RecentlyViewModel.type,
+                )
+                .filter(
+                    RecentlyViewModel.user_id.in_({key[0] for key in viewed_dict}),
+                    RecentlyViewModel.house_id.in_({key[1] for key in viewed_dict}),
+                )
+                .all()
+            )
+
+            update_list = list()
+            exists_keys = set()
+            for recently_view in recently_views:
+                key = (
+                    recently_view.user_id, recently_view.house_id, recently_view.type
+                )
+                if key not in viewed_dict:
+                    continue
+                exists_keys.add(key)
+                update_list.append(
+                    dict(
+                        id=recently_view.id,
+                        is_available=True,
+                        updated_at=viewed_dict[key],
+                    )
+                )
+
+            create_list = [
+                dict(
+                    user_id=user_id,
+                    house_id=house_id,
+                    type=type_,
+                    is_available=True,
+                    created_at=viewed_at,
+                    updated_at=viewed_at,
+                )
+                for (user_id, house_id, type_), viewed_at in viewed_dict.items()
+                if (user_id, house_id, type_) not in exists_keys
+            ]
+
+            session.bulk_update_mappings(RecentlyViewModel, update_list)
+            session.bulk_insert_mappings(RecentlyViewModel, create_list)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[UserRepository][bulk_upsert_recently_views] error : {e}")
+            raise Exception(e)
+
     def update_user_nickname_of_profile_setting(
         self, dto: UpsertUserInfoDetailDto
     ) -> None:
@@ -0,0 +1,76 @@
+import os
+from time import time, sleep
+
+import inject
+from flask import current_app
+
+from app import redis
+from app.extensions.cache.recently_view_buffer import RecentlyViewBuffer
+from app.extensions.utils.bulk_write_helper import bisect_write
+from app.extensions.utils.log_helper import logger_
+from core.domains.user.repository.user_repository import UserRepository
+
+logger = logger_.getLogger(__name__)
+
+
+class BaseUserWorkerUseCase:
+    @inject.autoparams()
+    def __init__(self, topic: str, user_repo: UserRepository):
+        self._user_repo = user_repo
+        self.topic = topic
+
+    @property
+    def client_id(self) -> str:
+        return f"{self.topic}-{os.getpid()}"
+
+
+class FlushRecentlyViewUseCase(BaseUserWorkerUseCase):
+    """
+        최근 본 매물 write-behind flush worker (RECENTLY_VIEW_WRITE_BEHIND_ENABLED)
+        - RECENTLY_VIEW_FLUSH_INTERVAL 마다 RecentlyViewBuffer 를 비우고 batch upsert
+        - (user_id, house_id, type) 중복 조회는 buffer 에서 1건으로 합쳐진다.
+        - upsert 실패 시 bisect_write 로 실패 row 만 분리 -> 로그 후 제외 (나머지는 반영)
+        - DB 연결 실패 등 row 와 무관한 예외는 flushing 을 남겨 다음 flush 에서 재처리
+    """
+
+    def execute(self) -> None:
+        logger.info(f"🚀\tFlushRecentlyViewUseCase Start - {self.client_id}")
+
+        buffer = RecentlyViewBuffer(client=redis)
+        interval = current_app.config.get("RECENTLY_VIEW_FLUSH_INTERVAL")
+        while True:
+            self.flush(buffer=buffer)
+            sleep(interval)
+
+    def flush(self, buffer: RecentlyViewBuffer) -> int:
+        """
+            return : upsert 된 (user_id, house_id, type) 수
+            - 연결 실패 등 예외 발생 시 flushing 이 남아 다음 flush 에서 재처리
+        """
+        start_time = time()
+        try:
+            flush_list = buffer.get_flush_list()
+            if not flush_list:
+                buffer.complete_flush()
+                return 0
+
+            success, failure = bisect_write(
+                rows=flush_list,
+                write=lambda rows: self._user_repo.bulk_upsert_recently_views(
+                    upsert_list=rows
+                ),
+            )
+            buffer.complete_flush()
+        except Exception as e:
+            logger.error(f"🚀\tFlushRecentlyView Error - {e}")
+            return 0
+
+        if failure:
+            logger.error(f"☠️\tFlushRecentlyView - {len(failure)} failed : {failure}")
+
+        logger.info(
+            f"🚀\tFlushRecentlyView - {len(success)} upserted, "
+            f"{len(failure)} failed, "
+            f"records: {time() - start_time} secs"
+        )
+        return len(success)
@@ -70,3 +70,8 @@ class UpdateFailErrorException(ErrorFormat):
 class InsertFailErrorException(ErrorFormat):
     code = HTTPStatus.BAD_REQUEST
     msg = "insert_fail_error"
+
+
+class ExternalApiErrorException(ErrorFormat):
+    code = HTTPStatus.BAD_GATEWAY
+    msg = "external_api_error"
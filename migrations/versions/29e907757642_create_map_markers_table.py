@@ -0,0 +1,88 @@
+"""create map_markers table
+
+Revision ID: 29e907757642
+Revises: eaa096feb2b8
+Create Date: 2026-10-18 10:12:41.318209
+
+"""
+import geoalchemy2
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "29e907757642"
+down_revision = "eaa096feb2b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "map_markers",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=False,
+            nullable=False,
+        ),
+        sa.Column(
+            "real_estate_id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            nullable=False,
+        ),
+        sa.Column("jibun_address", sa.String(length=100), nullable=True),
+        sa.Column("road_address", sa.String(length=100), nullable=True),
+        sa.Column(
+            "coordinates",
+            geoalchemy2.types.Geometry(
+                geometry_type="POINT",
+                srid=4326,
+                from_text="ST_GeomFromEWKT",
+                name="geometry",
+            ).with_variant(sa.String(), "sqlite"),
+            nullable=False,
+        ),
+        sa.Column("latitude", sa.Float(), nullable=False),
+        sa.Column("longitude", sa.Float(), nullable=False),
+        sa.Column("building_type", sa.String(length=5), nullable=True),
+        sa.Column("name", sa.String(length=50), nullable=True),
+        sa.Column("is_available", sa.Boolean(), nullable=False),
+        sa.Column("trade_pyoung", sa.Integer(), nullable=True),
+        sa.Column("trade_price", sa.Integer(), nullable=True),
+        sa.Column("deposit_pyoung", sa.Integer(), nullable=True),
+        sa.Column("deposit_price", sa.Integer(), nullable=True),
+        sa.Column("trade_status", sa.SmallInteger(), nullable=False),
+        sa.Column("deposit_status", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_map_markers_real_estate_id"),
+        "map_markers",
+        ["real_estate_id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_map_markers_coordinates",
+        "map_markers",
+        ["coordinates"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade():
+    op.drop_index("idx_map_markers_coordinates", table_name="map_markers")
+    op.drop_index(op.f("ix_map_markers_real_estate_id"), table_name="map_markers")
+    op.drop_table("map_markers")
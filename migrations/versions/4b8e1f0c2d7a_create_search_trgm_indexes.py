@@ -0,0 +1,40 @@
+"""create search trgm indexes
+
+Revision ID: 4b8e1f0c2d7a
+Revises: 29e907757642
+Create Date: 2026-10-18 11:02:17.524830
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b8e1f0c2d7a"
+down_revision = "29e907757642"
+branch_labels = None
+depends_on = None
+
+trgm_indexes = [
+    ("public_sales_name_gin_trgm_idx", "public_sales", "name"),
+    ("private_sales_name_gin_trgm_idx", "private_sales", "name"),
+    ("real_estates_dong_myun_gin_trgm_idx", "real_estates", "dong_myun"),
+    ("real_estates_jibun_address_gin_trgm_idx", "real_estates", "jibun_address"),
+    ("real_estates_road_address_gin_trgm_idx", "real_estates", "road_address"),
+]
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name, column_name in trgm_indexes:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    for index_name, table_name, _ in trgm_indexes:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,70 @@
+"""create date range indexes
+
+Revision ID: 7c3d9a2e5f10
+Revises: 4b8e1f0c2d7a
+Create Date: 2026-10-18 14:21:45.103682
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c3d9a2e5f10"
+down_revision = "4b8e1f0c2d7a"
+branch_labels = None
+depends_on = None
+
+# 오늘 생성 / 수정 batch 대상 조회 (created_at, updated_at 범위 조건)
+# 청약 캘린더 (YYYYMMDD 문자열 일정 컬럼 범위 조건)
+# 최근 거래 평균가 (private_sale_id, trade_type, contract_date)
+date_indexes = [
+    ("ix_private_sale_details_created_at", "private_sale_details", ["created_at"]),
+    ("ix_private_sale_details_updated_at", "private_sale_details", ["updated_at"]),
+    (
+        "ix_private_sale_details_sale_id_trade_type_contract_date",
+        "private_sale_details",
+        ["private_sale_id", "trade_type", "contract_date"],
+    ),
+    ("ix_private_sales_created_at", "private_sales", ["created_at"]),
+    ("ix_private_sales_updated_at", "private_sales", ["updated_at"]),
+    ("ix_public_sales_created_at", "public_sales", ["created_at"]),
+    ("ix_public_sales_updated_at", "public_sales", ["updated_at"]),
+    (
+        "ix_public_sales_subscription_start_date",
+        "public_sales",
+        ["subscription_start_date"],
+    ),
+    (
+        "ix_public_sales_subscription_end_date",
+        "public_sales",
+        ["subscription_end_date"],
+    ),
+    ("ix_public_sales_special_supply_date", "public_sales", ["special_supply_date"]),
+    (
+        "ix_public_sales_special_supply_etc_date",
+        "public_sales",
+        ["special_supply_etc_date"],
+    ),
+    ("ix_public_sales_first_supply_date", "public_sales", ["first_supply_date"]),
+    (
+        "ix_public_sales_first_supply_etc_date",
+        "public_sales",
+        ["first_supply_etc_date"],
+    ),
+    ("ix_public_sales_second_supply_date", "public_sales", ["second_supply_date"]),
+    (
+        "ix_public_sales_second_supply_etc_date",
+        "public_sales",
+        ["second_supply_etc_date"],
+    ),
+    ("ix_public_sales_notice_winner_date", "public_sales", ["notice_winner_date"]),
+]
+
+
+def upgrade():
+    for index_name, table_name, column_names in date_indexes:
+        op.create_index(index_name, table_name, column_names, unique=False)
+
+
+def downgrade():
+    for index_name, table_name, _ in date_indexes:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,103 @@
+from app.extensions.utils.administrative_helper import (
+    AdministrativeAvgPriceRollup,
+    AdministrativePriceRow,
+    round_half_up,
+)
+from core.domains.house.enum.house_enum import DivisionLevelEnum
+
+
+def make_row(
+    real_estate_id: int = 1,
+    front_legal_code: str = "11110",
+    back_legal_code: str = "10100",
+    building_type: str = "아파트",
+    trade_type: str = "매매",
+    pyoung: float = 34,
+    trade_price: int = 0,
+    deposit_price: int = 0,
+) -> AdministrativePriceRow:
+    return AdministrativePriceRow(
+        real_estate_id=real_estate_id,
+        front_legal_code=front_legal_code,
+        back_legal_code=back_legal_code,
+        building_type=building_type,
+        trade_type=trade_type,
+        pyoung=pyoung,
+        trade_price=trade_price,
+        deposit_price=deposit_price,
+    )
+
+
+def get_result(result_list, front_legal_code, back_legal_code, level) -> dict:
+    return next(
+        result
+        for result in result_list
+        if (result["front_legal_code"], result["back_legal_code"], result["level"])
+        == (front_legal_code, back_legal_code, level)
+    )
+
+
+def test_round_half_up_when_half_then_round_away_from_zero():
+    assert round_half_up(2.5) == 3
+    assert round_half_up(3.5) == 4
+    assert round_half_up(2.4) == 2
+
+
+def test_rollup_when_rows_in_divisions_then_return_level_1_to_3_avg_prices():
+    rollup = AdministrativeAvgPriceRollup()
+    rollup.add_all(
+        rows=[
+            # 서울 종로구 청운동 : 아파트 매매 / 전세
+            make_row(pyoung=10, trade_price=1000),
+            make_row(trade_type="전세", pyoung=10, deposit_price=500),
+            # 서울 종로구 신교동 : 아파트 매매
+            make_row(
+                real_estate_id=2, back_legal_code="10200", pyoung=30, trade_price=900
+            ),
+            # 서울 중구 : 오피스텔 매매
+            make_row(
+                real_estate_id=3,
+                front_legal_code="11140",
+                building_type="오피스텔",
+                pyoung=20,
+                trade_price=400,
+            ),
+        ]
+    )
+    result_list = rollup.get_result_list()
+
+    # level 3 : 청운동 -> 매매 100 * 34, 전세 50 * 34
+    dong = get_result(result_list, "11110", "10100", DivisionLevelEnum.LEVEL_3)
+    assert dong["apt_trade_price"] == 3400
+    assert dong["apt_deposit_price"] == 1700
+    assert dong["op_trade_price"] == 0
+
+    # level 2 : 종로구 -> 매매 (1000 + 900) / (10 + 30) = 47.5 -> 48
+    si_gun_gu = get_result(result_list, "11110", "00000", DivisionLevelEnum.LEVEL_2)
+    assert si_gun_gu["apt_trade_price"] == 48 * 34
+    assert si_gun_gu["apt_deposit_price"] == 50 * 34
+
+    # level 1 : 서울 -> 아파트 + 오피스텔
+    si_do = get_result(result_list, "11000", "00000", DivisionLevelEnum.LEVEL_1)
+    assert si_do["apt_trade_price"] == 48 * 34
+    assert si_do["op_trade_price"] == 20 * 34
+
+    assert len(result_list) == 6
+
+
+def test_rollup_when_sejong_or_empty_legal_code_then_skip_level_2_or_row():
+    rollup = AdministrativeAvgPriceRollup()
+    rollup.add_all(
+        rows=[
+            make_row(front_legal_code="36110", back_legal_code="10100", pyoung=10),
+            make_row(real_estate_id=2, front_legal_code="00000", pyoung=10),
+        ]
+    )
+    result_list = rollup.get_result_list()
+
+    assert sorted(
+        (result["front_legal_code"], result["level"]) for result in result_list
+    ) == [
+        ("36000", DivisionLevelEnum.LEVEL_1),
+        ("36110", DivisionLevelEnum.LEVEL_3),
+    ]
@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.extensions.utils.batch_helper import BatchDagRunner, BatchNode, BatchResult
+from app.extensions.utils.enum.batch_enum import BatchStatusEnum
+
+
+def make_runner(nodes, on_result=None) -> BatchDagRunner:
+    return BatchDagRunner(
+        nodes=nodes,
+        max_workers=4,
+        executor_factory=lambda: ThreadPoolExecutor(max_workers=4),
+        on_result=on_result,
+    )
+
+
+def fail():
+    raise ValueError("fail")
+
+
+def test_batch_dag_runner_when_independent_nodes_then_run_concurrently():
+    # 2개 node 가 동시에 실행되지 않으면 barrier 에서 timeout
+    barrier = threading.Barrier(2, timeout=5)
+    executed = list()
+
+    def wait_barrier(name: str):
+        barrier.wait()
+        executed.append(name)
+        return dict(count=1)
+
+    results = make_runner(
+        nodes=[
+            BatchNode(name="a", func=lambda: wait_barrier("a")),
+            BatchNode(name="b", func=lambda: wait_barrier("b")),
+            BatchNode(
+                name="c", func=lambda: executed.append("c"), depends_on=("a", "b")
+            ),
+        ]
+    ).run()
+
+    assert [result.status for result in results.values()] == [
+        BatchStatusEnum.SUCCESS.value
+    ] * 3
+    assert results["a"].counts == dict(count=1)
+    assert executed[-1] == "c"
+
+
+def test_batch_dag_runner_when_node_failed_then_skip_downstream_nodes():
+    saved_results = list()
+
+    results = make_runner(
+        nodes=[
+            BatchNode(name="a", func=fail),
+            BatchNode(name="b", func=lambda: None, depends_on=("a",)),
+            BatchNode(name="c", func=lambda: None, depends_on=("b",)),
+            BatchNode(name="d", func=lambda: exit(0)),
+        ],
+        on_result=saved_results.append,
+    ).run()
+
+    assert {name: result.status for name, result in results.items()} == dict(
+        a=BatchStatusEnum.FAILED.value,
+        b=BatchStatusEnum.SKIPPED.value,
+        c=BatchStatusEnum.SKIPPED.value,
+        d=BatchStatusEnum.SUCCESS.value,
+    )
+    assert results["a"].error == "fail"
+    assert sorted(result.name for result in saved_results) == ["a", "b", "c", "d"]
+
+
+def test_batch_dag_runner_when_resume_then_run_from_failed_node():
+    executed = list()
+    completed = dict(
+        a=BatchResult(name="a", status=BatchStatusEnum.SUCCESS.value),
+        b=BatchResult(name="b", status=BatchStatusEnum.FAILED.value),
+    )
+
+    results = make_runner(
+        nodes=[
+            BatchNode(name="a", func=lambda: executed.append("a")),
+            BatchNode(name="b", func=lambda: executed.append("b"), depends_on=("a",)),
+        ]
+    ).run(completed=completed)
+
+    assert executed == ["b"]
+    assert results["b"].is_success
+
+
+def test_batch_dag_runner_when_cycle_or_unknown_dependency_then_raise():
+    with pytest.raises(ValueError):
+        make_runner(
+            nodes=[
+                BatchNode(name="a", func=fail, depends_on=("b",)),
+                BatchNode(name="b", func=fail, depends_on=("a",)),
+            ]
+        )
+
+    with pytest.raises(ValueError):
+        make_runner(nodes=[BatchNode(name="a", func=fail, depends_on=("x",))])
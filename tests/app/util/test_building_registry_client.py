@@ -0,0 +1,210 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from time import monotonic
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from app.extensions.building_registry.client import BuildingRegistryClient, TokenBucket
+from core.exceptions import ExternalApiErrorException
+
+
+def make_item_xml(rnum: int) -> str:
+    return (
+        "<item>"
+        f"<rnum>{rnum}</rnum><bldNm>아파트</bldNm><dongNm>101</dongNm>"
+        f"<hoNm>{rnum}01</hoNm><area>84.9</area><mainAtchGbCd>0</mainAtchGbCd>"
+        "</item>"
+    )
+
+
+def make_response_xml(rnums: list, total_count: int) -> str:
+    items = "".join(make_item_xml(rnum=rnum) for rnum in rnums)
+    return (
+        "<response><header><resultCode>00</resultCode></header><body>"
+        f"<items>{items}</items><totalCount>{total_count}</totalCount>"
+        "</body></response>"
+    )
+
+
+class StubBuildingRegistryHandler(BaseHTTPRequestHandler):
+    """
+        bun=0001 : 1 page 당 2건, 총 3건 (2 page)
+        bun=0002 : 첫 호출 503 -> 재시도 시 1건
+        bun=0003 : 항상 503
+        bun=0004 : totalCount 누락
+        그 외 : 결과 없음
+    """
+
+    call_counts = dict()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        params = {key: values[0] for key, values in query.items()}
+        bun = params.get("bun")
+        with self.lock:
+            self.call_counts[bun] = self.call_counts.get(bun, 0) + 1
+            call_count = self.call_counts[bun]
+
+        if bun == "0001":
+            body = (
+                make_response_xml(rnums=[1, 2], total_count=3)
+                if params["pageNo"] == "1"
+                else make_response_xml(rnums=[3], total_count=3)
+            )
+        elif bun == "0002" and call_count > 1:
+            body = make_response_xml(rnums=[1], total_count=1)
+        elif bun == "0004":
+            body = (
+                "<response><body><items>"
+                f"{make_item_xml(rnum=1)}"
+                "</items></body></response>"
+            )
+        elif bun in ("0002", "0003"):
+            self.send_response(503)
+            self.end_headers()
+            return
+        else:
+            body = "<response><body><items/></body></response>"
+
+        encoded_body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(encoded_body)))
+        self.end_headers()
+        self.wfile.write(encoded_body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_client():
+    StubBuildingRegistryHandler.call_counts = dict()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBuildingRegistryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = BuildingRegistryClient(
+        url=f"http://127.0.0.1:{server.server_address[1]}",
+        service_key="test",
+        rate_limit=1000,
+        max_workers=4,
+        max_retries=2,
+        backoff_base=0.01,
+    )
+    yield client
+
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_expos_pubuse_area_items_when_many_pages_then_get_all_items(stub_client):
+    total_count, items = stub_client.get_expos_pubuse_area_items(
+        front_legal_code="11110", back_legal_code="10100", bun="0001", ji=None
+    )
+
+    assert total_count == "3"
+    assert [item.rnum for item in items] == ["1", "2", "3"]
+
+
+def test_iter_expos_pubuse_area_items_when_iterated_then_total_count_is_set(
+    stub_client,
+):
+    items = stub_client.iter_expos_pubuse_area_items(
+        front_legal_code="11110", back_legal_code="10100", bun="0001", ji=None
+    )
+    assert items.total_count is None
+
+    item = next(iter(items))
+    assert (item.rnum, item.dong_nm, item.area, item.main_atch_gb_cd) == (
+        "1",
+        "101",
+        "84.9",
+        "0",
+    )
+    # 응답에 없는 tag 는 None
+    assert item.etc_purps is None
+
+    assert len(list(items)) == 3
+    assert items.total_count == "3"
+
+
+def test_get_expos_pubuse_area_items_when_empty_then_return_empty_list(stub_client):
+    assert stub_client.get_expos_pubuse_area_items(
+        front_legal_code="11110", back_legal_code="10100", bun="0009", ji="0001"
+    ) == (None, [])
+
+
+def test_get_expos_pubuse_area_items_when_total_count_missing_then_raise(
+    stub_client,
+):
+    with pytest.raises(ExternalApiErrorException):
+        stub_client.get_expos_pubuse_area_items(
+            front_legal_code="11110", back_legal_code="10100", bun="0004", ji=None
+        )
+
+
+def test_get_expos_pubuse_area_items_when_server_error_then_retry(stub_client):
+    total_count, items = stub_client.get_expos_pubuse_area_items(
+        front_legal_code="11110", back_legal_code="10100", bun="0002", ji=None
+    )
+
+    assert [item.rnum for item in items] == ["1"]
+    assert StubBuildingRegistryHandler.call_counts["0002"] == 2
+
+    with pytest.raises(ExternalApiErrorException):
+        stub_client.get_expos_pubuse_area_items(
+            front_legal_code="11110", back_legal_code="10100", bun="0003", ji=None
+        )
+    # 최초 1번 + 재시도 2번
+    assert StubBuildingRegistryHandler.call_counts["0003"] == 3
+
+
+def test_fetch_many_when_targets_then_return_results_and_errors(stub_client):
+    def fetch(bun: str):
+        return stub_client.get_expos_pubuse_area_items(
+            front_legal_code="11110", back_legal_code="10100", bun=bun, ji=None
+        )
+
+    results = {
+        target: (result, error)
+        for target, result, error in stub_client.fetch_many(
+            fetch=fetch, targets=["0001", "0003", "0009"]
+        )
+    }
+
+    assert len(results["0001"][0][1]) == 3
+    assert isinstance(results["0003"][1], ExternalApiErrorException)
+    assert results["0009"] == ((None, []), None)
+
+
+def test_token_bucket_when_acquire_over_capacity_then_wait():
+    token_bucket = TokenBucket(rate=20, capacity=1)
+
+    start_time = monotonic()
+    for _ in range(3):
+        token_bucket.acquire()
+
+    # 1개는 바로, 나머지 2개는 1 / 20 초씩 대기
+    assert monotonic() - start_time >= 0.09
+
+
+def test_fetch_many_when_stopped_early_then_submit_only_window_and_cancel_rest(
+    stub_client,
+):
+    fetched = list()
+    lock = threading.Lock()
+
+    def fetch(target: int):
+        with lock:
+            fetched.append(target)
+        return target
+
+    results = stub_client.fetch_many(fetch=fetch, targets=range(100))
+    next(results)
+    results.close()
+
+    # max_workers(4) * FETCH_WINDOW_FACTOR(2) + 완료 후 추가 submit 1건
+    assert len(fetched) <= 4 * BuildingRegistryClient.FETCH_WINDOW_FACTOR + 1
@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.extensions.utils.bulk_write_helper import BulkWriter, bisect_write
+from app.persistence.model import DongInfoModel
+from core.exceptions import InsertFailErrorException
+
+
+def test_bisect_write_when_bad_rows_in_chunk_then_isolate_bad_rows():
+    written = list()
+
+    def write(rows):
+        if any(row["id"] in (3, 6) for row in rows):
+            raise ValueError("bad row")
+        written.extend(rows)
+
+    rows = [dict(id=id_) for id_ in range(1, 9)]
+    success, failure = bisect_write(rows=rows, write=write)
+
+    assert [row["id"] for row in success] == [1, 2, 4, 5, 7, 8]
+    assert [row["id"] for row in failure] == [3, 6]
+    assert written == success
+
+
+def test_bulk_writer_when_insert_and_update_then_commit_by_chunk_and_return_failure_rows(
+    session,
+):
+    session.add(DongInfoModel(id=1, private_sale_id=1, name="101동"))
+    session.commit()
+
+    writer = BulkWriter(session=session, chunk_size=2)
+    insert_result = writer.insert(
+        model=DongInfoModel,
+        rows=[
+            dict(id=2, private_sale_id=1, name="102동"),
+            # 중복 id -> 실패 row
+            dict(id=1, private_sale_id=1, name="101동"),
+            dict(id=3, private_sale_id=1, name="103동", x_vl=127.0),
+        ],
+    )
+    update_result = writer.update(
+        model=DongInfoModel,
+        rows=[dict(id=1, hhld_cnt=100), dict(id=3, name="103동(변경)")],
+    )
+    session.expire_all()
+
+    result = session.query(DongInfoModel).order_by(DongInfoModel.id).all()
+
+    assert insert_result.row_count == 2
+    assert [row["id"] for row in insert_result.failure_rows] == [1]
+    assert update_result.row_count == 2
+    assert not update_result.failure_rows
+    assert [(dong.id, dong.name, dong.hhld_cnt) for dong in result] == [
+        (1, "101동", 100),
+        (2, "102동", None),
+        (3, "103동(변경)", None),
+    ]
+
+
+def test_bisect_write_when_operational_error_then_raise_without_bisect():
+    calls = list()
+
+    def write(rows):
+        calls.append(rows)
+        raise OperationalError("COPY", None, Exception("server closed the connection"))
+
+    rows = [dict(id=id_) for id_ in range(1, 9)]
+    with pytest.raises(OperationalError):
+        bisect_write(rows=rows, write=write)
+
+    assert calls == [rows]
+
+
+def test_bisect_write_when_wrapped_operational_error_then_raise_without_bisect():
+    calls = list()
+
+    def write(rows):
+        calls.append(rows)
+        try:
+            raise OperationalError("INSERT", None, Exception("connection refused"))
+        except OperationalError as e:
+            raise InsertFailErrorException from e
+
+    rows = [dict(id=id_) for id_ in range(1, 9)]
+    with pytest.raises(InsertFailErrorException):
+        bisect_write(rows=rows, write=write)
+
+    assert calls == [rows]
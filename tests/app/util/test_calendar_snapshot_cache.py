@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+from rediscluster.exceptions import RedisClusterException
+
+from app.extensions.cache.calendar_snapshot_cache import CalendarSnapshotCache
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+
+
+def test_calendar_snapshot_cache_when_set_then_get_by_month_with_ttl(
+    fake_redis_client,
+):
+    cache = CalendarSnapshotCache(client=fake_redis_client)
+    version = cache.get_version()
+
+    cache.set(version=version, year_month="202108", snapshot=[dict(id=1)])
+
+    assert cache.get(version=version, year_month="202108") == [dict(id=1)]
+    assert cache.get(version=version, year_month="202109") is None
+    # 월 별 key 마다 TTL
+    assert (
+        0
+        < fake_redis_client._redis_client.ttl(
+            f"{RedisKeyPrefix.CALENDAR_SNAPSHOT.value}:{version}:202108"
+        )
+        <= 86400
+    )
+
+
+def test_calendar_snapshot_cache_when_invalidated_during_miss_then_stale_not_served(
+    fake_redis_client,
+):
+    cache = CalendarSnapshotCache(client=fake_redis_client)
+
+    # cache miss 조회 시작 -> DB 조회 중 sync 에서 무효화 후 이번 달 재생성
+    version = cache.get_version()
+    new_version = cache.invalidate()
+    cache.set(version=new_version, year_month="202108", snapshot=[dict(id=1, v=2)])
+    # 무효화 이전에 조회한 snapshot 저장
+    cache.set(version=version, year_month="202108", snapshot=[dict(id=1, v=1)])
+
+    assert cache.get_version() == new_version
+    assert cache.get(version=cache.get_version(), year_month="202108") == [
+        dict(id=1, v=2)
+    ]
+
+
+def test_calendar_snapshot_cache_when_redis_cluster_error_then_skip_cache():
+    client = MagicMock()
+    client.get.side_effect = RedisClusterException("cluster down")
+    client.set.side_effect = RedisClusterException("cluster down")
+    client.incr.side_effect = RedisClusterException("cluster down")
+    cache = CalendarSnapshotCache(client=client)
+
+    assert cache.get_version() is None
+    assert cache.get(version=1, year_month="202108") is None
+    cache.set(version=1, year_month="202108", snapshot=[dict(id=1)])
+    assert cache.invalidate() is None
@@ -0,0 +1,54 @@
+from app.extensions.cache.house_public_detail_cache import HousePublicDetailCache
+from core.domains.house.entity.house_entity import HousePublicDetailEntity
+
+
+def make_entity(house_id: int = 1) -> HousePublicDetailEntity:
+    return HousePublicDetailEntity(
+        id=house_id,
+        name="분양아파트",
+        road_address="서울시 어딘가",
+        jibun_address="서울시 어딘가",
+        si_do="서울특별시",
+        si_gun_gu="서초구",
+        dong_myun="어딘가",
+        ri="-",
+        road_name="어딘가1길",
+        road_number="10",
+        land_number="123-1",
+        is_available=True,
+        latitude=127,
+        longitude=37.71,
+        is_like=False,
+        is_special_supply_finished=False,
+        min_pyoung_number=25,
+        max_pyoung_number=32,
+        min_supply_area=84.0,
+        max_supply_area=112.0,
+        avg_supply_price=50000,
+        supply_price_per_pyoung=123,
+        min_acquisition_tax=100000,
+        max_acquisition_tax=200000,
+    )
+
+
+def test_house_public_detail_cache_when_set_then_get_same_entity(fake_redis_client):
+    cache = HousePublicDetailCache(client=fake_redis_client)
+    entity = make_entity()
+
+    assert cache.get(house_id=1) is None
+
+    cache.set(house_id=1, entity=entity)
+
+    assert cache.get(house_id=1) == entity
+    assert cache.get(house_id=2) is None
+
+
+def test_house_public_detail_cache_when_bump_version_then_cache_miss(
+    fake_redis_client,
+):
+    cache = HousePublicDetailCache(client=fake_redis_client)
+    cache.set(house_id=1, entity=make_entity())
+
+    HousePublicDetailCache.bump_version(client=fake_redis_client)
+
+    assert cache.get(house_id=1) is None
@@ -0,0 +1,206 @@
+import random
+import re
+from time import time
+from typing import List
+
+import pytest
+
+from app.extensions.utils.legal_code_helper import LegalCodeMatcher
+from core.domains.house.entity.house_entity import (
+    AdministrativeDivisionLegalCodeEntity,
+    RealEstateLegalCodeEntity,
+)
+from core.domains.house.enum.house_enum import LegalCodeUnmatchedReasonEnum
+
+
+def legacy_make_update_list(
+    administrative_info: List[AdministrativeDivisionLegalCodeEntity],
+    target_list: List[RealEstateLegalCodeEntity],
+) -> List[dict]:
+    """
+        기존 AddLegalCodeUseCase._make_real_estates_legal_code_update_list (매물 x 행정구역 전체 비교)
+    """
+    update_list = list()
+    cond_1 = re.compile(r"\D*동\d가")
+    cond_2 = re.compile(r"\D*\d동")
+
+    for real_estate in target_list:
+        for administrative in administrative_info:
+            if cond_1.match(real_estate.dong_myun):
+                dong_myun_ = re.sub(r"[0-9]+가", "", real_estate.dong_myun)
+                if administrative.short_name != dong_myun_:
+                    dong_myun_ = real_estate.dong_myun
+            else:
+                dong_myun_ = real_estate.dong_myun
+
+            if cond_2.match(real_estate.jibun_address) and not cond_2.match(
+                administrative.short_name
+            ):
+                jibun_address_ = re.sub(r"[0-9]+", "", real_estate.jibun_address)
+                dong_myun_ = re.sub(r"[0-9]+", "", dong_myun_)
+            else:
+                jibun_address_ = real_estate.jibun_address
+
+            if real_estate.dong_myun == "목행동" or real_estate.dong_myun == "용탄동":
+                dong_myun_ = "목행.용탄동"
+                if real_estate.dong_myun == "목행동":
+                    jibun_address_ = jibun_address_.replace("목행동", dong_myun_)
+                elif real_estate.dong_myun == "용탄동":
+                    jibun_address_ = jibun_address_.replace("용탄동", dong_myun_)
+
+            administrative_name_ = administrative.name.replace(" ", "").replace(".", "")
+            administrative_short_name_ = administrative.short_name.replace(".", "")
+            jibun_address_ = jibun_address_.replace(" ", "").replace(".", "")
+
+            si_do_ = real_estate.si_do.replace(" ", "")
+            si_gun_gu_ = real_estate.si_gun_gu.replace(" ", "")
+            dong_myun_ = dong_myun_.replace(".", "")
+
+            if (
+                administrative_short_name_ == dong_myun_
+                and si_do_ in administrative_name_
+                and si_gun_gu_ in administrative_name_
+                and administrative_name_ in jibun_address_
+            ):
+                update_list.append(
+                    {
+                        "id": real_estate.id,
+                        "front_legal_code": administrative.front_legal_code,
+                        "back_legal_code": administrative.back_legal_code,
+                    }
+                )
+                break
+    return update_list
+
+
+def make_administrative(
+    idx: int, name: str, short_name: str
+) -> AdministrativeDivisionLegalCodeEntity:
+    return AdministrativeDivisionLegalCodeEntity(
+        id=idx,
+        name=name,
+        short_name=short_name,
+        front_legal_code=f"{idx:05d}",
+        back_legal_code=f"{idx:05d}",
+    )
+
+
+def make_real_estate(
+    idx: int, si_do: str, si_gun_gu: str, dong_myun: str, jibun_address: str
+) -> RealEstateLegalCodeEntity:
+    return RealEstateLegalCodeEntity(
+        id=idx,
+        jibun_address=jibun_address,
+        si_do=si_do,
+        si_gun_gu=si_gun_gu,
+        dong_myun=dong_myun,
+    )
+
+
+administrative_info = [
+    make_administrative(1, "서울특별시 용산구 용산동", "용산동"),
+    make_administrative(2, "경기도 안양시 만안구 안양동", "안양동"),
+    make_administrative(3, "충청북도 충주시 목행.용탄동", "목행.용탄동"),
+    make_administrative(4, "서울특별시 강남구 신사동", "신사동"),
+    make_administrative(5, "서울특별시 관악구 신사동", "신사동"),
+]
+
+real_estate_info = [
+    make_real_estate(1, "서울특별시", "용산구", "용산동2가", "서울특별시 용산구 용산동2가 1-5"),
+    make_real_estate(2, "경기도", "안양시 만안구", "안양1동", "경기도 안양시 만안구 안양1동 10"),
+    make_real_estate(3, "충청북도", "충주시", "용탄동", "충청북도 충주시 용탄동 100"),
+    make_real_estate(4, "서울특별시", "관악구", "신사동", "서울특별시 관악구 신사동 3"),
+    make_real_estate(5, "부산광역시", "해운대구", "우동", "부산광역시 해운대구 우동 1"),
+    make_real_estate(6, "서울특별시", "서초구", "신사동", "서울특별시 서초구 신사동 7"),
+]
+
+
+def make_synthetic_data(administrative_count: int, real_estate_count: int):
+    rand = random.Random(0)
+    administrative_list = list()
+    for idx in range(administrative_count):
+        si_do = f"시도{idx % 17}"
+        si_gun_gu = f"시군구{idx % 250}"
+        short_name = f"{chr(0xAC00 + idx % 2000)}{chr(0xAC00 + idx // 2000)}동"
+        administrative_list.append(
+            make_administrative(idx, f"{si_do} {si_gun_gu} {short_name}", short_name)
+        )
+
+    real_estate_list = list()
+    for idx in range(real_estate_count):
+        administrative = rand.choice(administrative_list)
+        si_do, si_gun_gu, short_name = administrative.name.split(" ")
+        dong_myun = rand.choice(
+            [short_name, f"{short_name}{rand.randint(1, 5)}가", "없는동"]
+        )
+        real_estate_list.append(
+            make_real_estate(
+                idx,
+                si_do,
+                si_gun_gu,
+                dong_myun,
+                f"{si_do} {si_gun_gu} {dong_myun} {rand.randint(1, 999)}",
+            )
+        )
+    return administrative_list, real_estate_list
+
+
+def test_match_all_when_special_cases_then_same_as_legacy_matcher():
+    update_list, unmatched_list = LegalCodeMatcher(
+        administrative_info=administrative_info
+    ).match_all(target_list=real_estate_info)
+
+    assert update_list == legacy_make_update_list(
+        administrative_info=administrative_info, target_list=real_estate_info
+    )
+    # 동N가, N동, 목행.용탄동, 동명이 행정구역(신사동) 매칭
+    assert [(data["id"], data["front_legal_code"]) for data in update_list] == [
+        (1, "00001"),
+        (2, "00002"),
+        (3, "00003"),
+        (4, "00005"),
+    ]
+    assert [(data.id, data.reason) for data in unmatched_list] == [
+        (5, LegalCodeUnmatchedReasonEnum.NOT_FOUND_DONG.value),
+        (6, LegalCodeUnmatchedReasonEnum.NOT_MATCHED_ADDRESS.value),
+    ]
+
+
+def test_match_all_when_synthetic_data_then_same_as_legacy_matcher():
+    administrative_list, real_estate_list = make_synthetic_data(
+        administrative_count=500, real_estate_count=300
+    )
+
+    update_list, _ = LegalCodeMatcher(
+        administrative_info=administrative_list
+    ).match_all(target_list=real_estate_list)
+
+    assert update_list == legacy_make_update_list(
+        administrative_info=administrative_list, target_list=real_estate_list
+    )
+
+
+@pytest.mark.skip(reason="benchmark, 필요시 skip 제거 후 수동 실행 (pytest -s -k benchmark)")
+def test_benchmark_legal_code_matcher():
+    administrative_list, real_estate_list = make_synthetic_data(
+        administrative_count=5000, real_estate_count=2000
+    )
+
+    start_time = time()
+    legacy_update_list = legacy_make_update_list(
+        administrative_info=administrative_list, target_list=real_estate_list
+    )
+    legacy_seconds = time() - start_time
+
+    start_time = time()
+    update_list, _ = LegalCodeMatcher(
+        administrative_info=administrative_list
+    ).match_all(target_list=real_estate_list)
+    matcher_seconds = time() - start_time
+
+    print(
+        f"\nlegacy : {legacy_seconds:.3f} secs, "
+        f"LegalCodeMatcher : {matcher_seconds:.3f} secs, "
+        f"x{legacy_seconds / matcher_seconds:.1f}"
+    )
+    assert update_list == legacy_update_list
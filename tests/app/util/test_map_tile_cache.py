@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import pytest
+from rediscluster.exceptions import RedisClusterException
+
+from app.extensions.cache.cache import RedisClient
+from app.extensions.cache.map_tile_cache import MapTileCache
+from core.domains.house.dto.house_dto import CoordinatesRangeDto
+from core.domains.house.enum.house_enum import (
+    BoundingLevelEnum,
+    BoundingPrivateTypeEnum,
+    BoundingPublicTypeEnum,
+    BoundingIncludePrivateEnum,
+    HouseAreaRange,
+)
+
+
+def _make_coordinates_dto(
+    start_x: float, start_y: float, end_x: float, end_y: float, level: int
+) -> CoordinatesRangeDto:
+    return CoordinatesRangeDto(
+        user_id=1,
+        start_x=start_x,
+        start_y=start_y,
+        end_x=end_x,
+        end_y=end_y,
+        level=level,
+        private_type=BoundingPrivateTypeEnum.APT_ONLY.value,
+        public_type=BoundingPublicTypeEnum.PUBLIC_ONLY.value,
+        public_status=[2, 1],
+        include_private=BoundingIncludePrivateEnum.INCLUDE.value,
+        min_area=HouseAreaRange.MIN_AREA.value,
+        max_area=HouseAreaRange.MAX_AREA.value,
+    )
+
+
+def test_get_tile_bounds_when_get_tile_of_coordinates_then_bounds_include_coordinates():
+    longitude, latitude = 127.0276, 37.4979
+    x, y = MapTileCache.get_tile(
+        longitude=longitude,
+        latitude=latitude,
+        level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value,
+    )
+    start_x, start_y, end_x, end_y = MapTileCache.get_tile_bounds(
+        x=x, y=y, level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value
+    )
+
+    assert start_x <= longitude <= end_x
+    assert end_y <= latitude <= start_y
+
+
+def test_get_tiles_when_viewport_then_include_tiles_of_all_corners():
+    dto = _make_coordinates_dto(
+        start_x=127.02,
+        start_y=37.51,
+        end_x=127.04,
+        end_y=37.49,
+        level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value,
+    )
+    tiles = MapTileCache.get_tiles(dto=dto)
+
+    for longitude in (dto.start_x, dto.end_x):
+        for latitude in (dto.start_y, dto.end_y):
+            assert (
+                MapTileCache.get_tile(
+                    longitude=longitude, latitude=latitude, level=dto.level
+                )
+                in tiles
+            )
+
+
+def test_make_filter_key_when_public_status_order_is_different_then_same_key():
+    dto = _make_coordinates_dto(
+        start_x=127.02, start_y=37.51, end_x=127.04, end_y=37.49, level=16
+    )
+    reversed_dto = dto.copy(update=dict(public_status=[1, 2]))
+
+    assert MapTileCache.make_filter_key(dto=dto) == MapTileCache.make_filter_key(
+        dto=reversed_dto
+    )
+
+
+def test_get_tile_keys_when_viewport_is_too_wide_then_return_none():
+    dto = _make_coordinates_dto(
+        start_x=126.5,
+        start_y=37.7,
+        end_x=127.9,
+        end_y=37.42,
+        level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value,
+    )
+
+    assert MapTileCache(client=None).get_tile_keys(dto=dto) is None
+
+
+def test_get_tile_keys_when_redis_cluster_error_then_return_none():
+    dto = _make_coordinates_dto(
+        start_x=127.02,
+        start_y=37.51,
+        end_x=127.04,
+        end_y=37.49,
+        level=BoundingLevelEnum.SELECT_QUERYSET_FLAG_LEVEL.value,
+    )
+    client = MagicMock()
+    client.mget.side_effect = RedisClusterException("cluster down")
+    map_tile_cache = MapTileCache(client=client)
+
+    assert map_tile_cache.get_tile_keys(dto=dto) is None
+    assert map_tile_cache.get_tile_values(keys=["tile_0"]) == {"tile_0": None}
+
+
+@pytest.mark.skip(reason="local redis 실행 안할경우 편의상 skip")
+def test_invalidate_when_house_changed_then_tile_key_changed(redis: RedisClient):
+    map_tile_cache = MapTileCache(client=redis)
+    dto = _make_coordinates_dto(
+        start_x=127.02, start_y=37.51, end_x=127.04, end_y=37.49, level=17
+    )
+    tile_keys = map_tile_cache.get_tile_keys(dto=dto)
+    map_tile_cache.set_tile_values(tile_values={key: [] for key in tile_keys.values()})
+
+    map_tile_cache.invalidate(coordinates=[(127.03, 37.50)])
+    changed_tile_keys = map_tile_cache.get_tile_keys(dto=dto)
+
+    changed_tile = MapTileCache.get_tile(longitude=127.03, latitude=37.50, level=17)
+    assert changed_tile_keys[changed_tile] != tile_keys[changed_tile]
+    changed_key = changed_tile_keys[changed_tile]
+    assert map_tile_cache.get_tile_values(keys=[changed_key])[changed_key] is None
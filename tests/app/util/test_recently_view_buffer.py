@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+from app.extensions.cache.recently_view_buffer import RecentlyViewBuffer
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from core.domains.user.dto.user_dto import RecentlyViewDto
+from core.domains.user.use_case.v1.user_worker_use_case import FlushRecentlyViewUseCase
+
+
+def get_keys(flush_list) -> list:
+    return sorted(
+        (data["user_id"], data["house_id"], data["type"]) for data in flush_list
+    )
+
+
+def test_recently_view_buffer_when_duplicated_views_then_coalesce_to_one(
+    fake_redis_client,
+):
+    buffer = RecentlyViewBuffer(client=fake_redis_client)
+    buffer.add(dto=RecentlyViewDto(user_id=1, house_id=1, type=1))
+    buffer.add(dto=RecentlyViewDto(user_id=1, house_id=1, type=1))
+    buffer.add(dto=RecentlyViewDto(user_id=1, house_id=2, type=1))
+
+    flush_list = buffer.get_flush_list()
+
+    assert get_keys(flush_list) == [(1, 1, 1), (1, 2, 1)]
+
+
+def test_recently_view_buffer_when_flush_not_completed_then_retry_flushing_first(
+    fake_redis_client,
+):
+    buffer = RecentlyViewBuffer(client=fake_redis_client)
+    buffer.add(dto=RecentlyViewDto(user_id=1, house_id=1, type=1))
+    assert get_keys(buffer.get_flush_list()) == [(1, 1, 1)]
+
+    # flush 중 조회는 새 buffer 에 기록, 이전 flush 실패 시 flushing 먼저 재처리
+    buffer.add(dto=RecentlyViewDto(user_id=2, house_id=1, type=1))
+    assert get_keys(buffer.get_flush_list()) == [(1, 1, 1)]
+
+    buffer.complete_flush()
+    assert get_keys(buffer.get_flush_list()) == [(2, 1, 1)]
+
+    buffer.complete_flush()
+    assert buffer.get_flush_list() == []
+
+
+def test_recently_view_buffer_when_flushing_created_by_other_worker_then_not_overwrite(
+    fake_redis_client,
+):
+    buffer = RecentlyViewBuffer(client=fake_redis_client)
+    buffer.add(dto=RecentlyViewDto(user_id=1, house_id=1, type=1))
+    assert get_keys(buffer.get_flush_list()) == [(1, 1, 1)]
+    buffer.add(dto=RecentlyViewDto(user_id=2, house_id=1, type=1))
+
+    # 다른 worker 가 flushing 을 만든 뒤 rename 시도 -> 기존 flushing 유지
+    assert not fake_redis_client.rename_if_not_exists(
+        key=RedisKeyPrefix.RECENTLY_VIEW_BUFFER.value,
+        new_key=RedisKeyPrefix.RECENTLY_VIEW_FLUSHING.value,
+    )
+    assert get_keys(buffer.get_flush_list()) == [(1, 1, 1)]
+
+
+def test_flush_recently_view_when_bad_row_then_upsert_others_and_complete(
+    fake_redis_client,
+):
+    buffer = RecentlyViewBuffer(client=fake_redis_client)
+    for house_id in range(1, 5):
+        buffer.add(dto=RecentlyViewDto(user_id=1, house_id=house_id, type=1))
+
+    upserted = list()
+
+    def bulk_upsert_recently_views(upsert_list):
+        if any(data["house_id"] == 3 for data in upsert_list):
+            raise ValueError("bad row")
+        upserted.extend(upsert_list)
+
+    user_repo = MagicMock()
+    user_repo.bulk_upsert_recently_views.side_effect = bulk_upsert_recently_views
+    use_case = FlushRecentlyViewUseCase(topic="test", user_repo=user_repo)
+
+    assert use_case.flush(buffer=buffer) == 3
+    assert get_keys(upserted) == [(1, 1, 1), (1, 2, 1), (1, 4, 1)]
+    assert buffer.get_flush_list() == []
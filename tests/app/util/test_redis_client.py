@@ -28,3 +28,51 @@ def test_set_value_to_redis_when_send_mobile_auth_number_then_success(
         # after delete key -> 0
         redis.delete(key)
         assert redis.is_exists(key) == 0
+
+
+def test_mget_when_mset_with_ttl_then_return_values_in_order(fake_redis_client):
+    fake_redis_client.mset(mapping={"key:1": "1", "key:2": "2"}, ex=60)
+
+    result = fake_redis_client.mget(keys=["key:2", "key:3", "key:1"])
+
+    assert result == [b"2", None, b"1"]
+    assert 0 < fake_redis_client._redis_client.ttl("key:1") <= 60
+
+
+def test_unlink_when_many_keys_then_delete_in_batches(fake_redis_client):
+    keys = [f"key:{idx}" for idx in range(RedisClient.BATCH_SIZE + 10)]
+    fake_redis_client.mset(mapping={key: "1" for key in keys})
+
+    deleted_count = fake_redis_client.unlink(keys=keys + ["key:not_exists"])
+
+    assert deleted_count == len(keys)
+    assert fake_redis_client.mget(keys=keys[:2]) == [None, None]
+    assert fake_redis_client.delete_many(keys=[]) == 0
+
+
+def test_pipeline_when_exit_context_then_execute_commands(fake_redis_client):
+    with fake_redis_client.pipeline() as pipeline:
+        pipeline.incr("counter")
+        pipeline.incr("counter")
+
+    assert fake_redis_client.get(key="counter") == b"2"
+
+
+def test_get_set_members_when_duplicated_values_then_get_once(fake_redis_client):
+    fake_redis_client.add_set_members(key="dirty", values=[1, 2])
+    fake_redis_client.add_set_members(key="dirty", values=[2, 3])
+
+    members = fake_redis_client.get_set_members(key="dirty")
+
+    assert sorted(int(member) for member in members) == [1, 2, 3]
+    assert fake_redis_client.get_set_members(key="empty") == []
+
+
+def test_set_hash_field_when_ex_then_set_field_and_expire(fake_redis_client):
+    fake_redis_client.set_hash_field(key="hash", field="202108", value="[]", ex=60)
+    fake_redis_client.set_hash_field(key="hash", field="202109", value="[1]")
+
+    assert fake_redis_client.get_hash_field(key="hash", field="202108") == b"[]"
+    assert fake_redis_client.get_hash_field(key="hash", field="202109") == b"[1]"
+    assert fake_redis_client.get_hash_field(key="hash", field="202110") is None
+    assert 0 < fake_redis_client._redis_client.ttl("hash") <= 60
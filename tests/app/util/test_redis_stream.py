@@ -0,0 +1,278 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.extensions.cache.cache import RedisClient
+from app.extensions.utils.worker_helper import SyncMetrics
+from core.domains.house.use_case.v1.sync_data_from_datamart import SyncDataUseCase
+from core.exceptions import InsertFailErrorException
+
+stream = "sync_stream"
+group = "sync_stream_group"
+
+
+def add_stream_message(client: RedisClient, table: str, value: dict) -> bytes:
+    return client._redis_client.xadd(
+        stream, {"table": table, "value": json.dumps(value, ensure_ascii=False)}
+    )
+
+
+def test_get_many_after_scan_when_sync_keys_then_get_values_and_unlink(
+    fake_redis_client,
+):
+    for idx in range(1, 4):
+        fake_redis_client.set(
+            key=f"sync:private_sales:{idx}", value=json.dumps(dict(id=idx))
+        )
+
+    fake_redis_client.scan(pattern="sync:*")
+    result = fake_redis_client.get_many_after_scan(count=10)
+    fake_redis_client.clear_cache()
+
+    assert sorted(json.loads(data["value"])["id"] for data in result) == [1, 2, 3]
+    assert fake_redis_client._redis_client.keys("sync:*") == []
+
+
+# fakeredis 1.x (redis-py 3.x 호환) 는 XGROUP 등 consumer group 명령 미지원 -> local redis 사용
+@pytest.mark.skip(reason="local redis 실행 안할경우 편의상 skip")
+def test_read_stream_group_when_ack_then_not_pending(redis: RedisClient):
+    redis.create_stream_group(stream=stream, group=group)
+    # 이미 생성된 group -> 무시
+    redis.create_stream_group(stream=stream, group=group)
+    entry_id = add_stream_message(redis, "private_sales", dict(id=1))
+
+    entries = redis.read_stream_group(
+        stream=stream, group=group, consumer="worker-1", count=10, block=10
+    )
+    ack_count = redis.ack_stream(stream=stream, group=group, ids=[entry_id])
+
+    assert [entry_id for entry_id, _ in entries] == [entry_id]
+    assert ack_count == 1
+    assert (
+        redis.claim_pending_stream(
+            stream=stream, group=group, consumer="worker-2", min_idle_time=0, count=10
+        )
+        == []
+    )
+
+
+@pytest.mark.skip(reason="local redis 실행 안할경우 편의상 skip")
+def test_claim_pending_stream_when_not_acked_then_claim_by_other_consumer(
+    redis: RedisClient,
+):
+    redis.create_stream_group(stream=stream, group=group)
+    entry_id = add_stream_message(redis, "private_sales", dict(id=1))
+    redis.read_stream_group(
+        stream=stream, group=group, consumer="worker-1", count=10, block=10
+    )
+
+    entries = redis.claim_pending_stream(
+        stream=stream, group=group, consumer="worker-2", min_idle_time=0, count=10
+    )
+
+    assert [entry_id for entry_id, _ in entries] == [entry_id]
+
+
+@pytest.mark.skip(reason="local redis 실행 안할경우 편의상 skip")
+def test_claim_pending_stream_when_entry_deleted_then_ack(redis: RedisClient):
+    redis.create_stream_group(stream=stream, group=group)
+    entry_id = add_stream_message(redis, "private_sales", dict(id=1))
+    deleted_entry_id = add_stream_message(redis, "private_sales", dict(id=2))
+    redis.read_stream_group(
+        stream=stream, group=group, consumer="worker-1", count=10, block=10
+    )
+    redis._redis_client.xdel(stream, deleted_entry_id)
+
+    entries = redis.claim_pending_stream(
+        stream=stream, group=group, consumer="worker-2", min_idle_time=0, count=10
+    )
+
+    assert [entry_id for entry_id, _ in entries] == [entry_id]
+    assert redis._redis_client.xpending(stream, group)["pending"] == 1
+
+
+def test_claim_pending_stream_when_deleted_entries_claimed_then_ack_deleted_only():
+    redis_client = RedisClient()
+    redis_client._redis_client = MagicMock()
+    redis_client._redis_client.xpending_range.return_value = [
+        dict(message_id=message_id, time_since_delivered=600000)
+        for message_id in (b"1-0", b"2-0", b"3-0", b"4-0")
+    ]
+    # 2-0 : 빈 fields, 3-0 : nil (redis 버전에 따라 다름), 4-0 : 다른 consumer 가 먼저 가져감
+    redis_client._redis_client.xclaim.return_value = [
+        (b"1-0", {b"table": b"private_sales", b"value": b'{"id": 1}'}),
+        (b"2-0", {}),
+        (None, None),
+    ]
+    redis_client._redis_client.xrange.side_effect = lambda name, min, max, count: (
+        [(min, {b"table": b"private_sales"})] if min == b"4-0" else []
+    )
+
+    entries = redis_client.claim_pending_stream(
+        stream=stream, group=group, consumer="worker-2", min_idle_time=0, count=10
+    )
+
+    assert [entry_id for entry_id, _ in entries] == [b"1-0"]
+    redis_client._redis_client.xack.assert_called_once_with(
+        stream, group, b"2-0", b"3-0"
+    )
+
+
+@pytest.mark.skip(reason="local redis 실행 안할경우 편의상 skip")
+def test_sync_data_use_case_when_stream_messages_then_upsert_and_ack(
+    redis: RedisClient,
+):
+    redis.create_stream_group(stream=stream, group=group)
+    add_stream_message(redis, "private_sales", dict(id=1, name="광영"))
+    add_stream_message(redis, "public_sales", dict(id=2, name="서희"))
+
+    use_case = SyncDataUseCase(topic="test", house_repo=MagicMock())
+    use_case._redis_client = redis
+
+    with patch.object(use_case, "_upsert_target_model") as mock_upsert:
+        use_case._process_stream()
+
+    mock_upsert.assert_called_once_with(
+        messages={
+            "private_sales": [dict(id=1, name="광영")],
+            "public_sales": [dict(id=2, name="서희")],
+        }
+    )
+    assert redis._redis_client.xpending(stream, group)["pending"] == 0
+
+
+def test_sync_data_use_case_when_invalid_stream_entry_then_separate_failure(app):
+    entries = [
+        (b"1-0", {b"table": b"private_sales", b"value": b'{"id": 1}'}),
+        (b"2-0", {b"table": b"public_sales", b"value": b"{invalid"}),
+        (b"3-0", {b"value": b'{"id": 3}'}),
+    ]
+    use_case = SyncDataUseCase(topic="test", house_repo=MagicMock())
+
+    messages, invalid_list = use_case._parse_stream_entries(entries=entries)
+
+    assert messages == {"private_sales": [dict(id=1)]}
+    assert invalid_list == [
+        dict(
+            target_table="public_sales",
+            sync_data=dict(entry_id="2-0", value="{invalid"),
+        ),
+        dict(target_table="", sync_data=dict(entry_id="3-0", value='{"id": 3}')),
+    ]
+
+
+def test_sync_data_use_case_when_scan_mode_then_backlog_is_remaining_key_count(
+    app, fake_redis_client
+):
+    for idx in range(1, 4):
+        fake_redis_client.set(
+            key=f"sync:private_sales:{idx}", value=json.dumps(dict(id=idx))
+        )
+    fake_redis_client.set(key="search_index_version", value=1)
+
+    use_case = SyncDataUseCase(topic="test", house_repo=MagicMock())
+    use_case._redis_client = fake_redis_client
+    use_case._metrics = SyncMetrics()
+
+    with patch.dict(app.config, {"SYNC_METRICS_PORT": 9108}):
+        use_case._set_scan_backlog_size()
+        fake_redis_client.delete(key="sync:private_sales:1")
+        # SCAN_BACKLOG_CHECK_SECONDS 이내에는 갱신하지 않음
+        use_case._set_scan_backlog_size()
+
+    assert use_case._metrics.backlog_size == 3
+
+    use_case._scan_backlog_checked_at = 0.0
+    with patch.dict(app.config, {"SYNC_METRICS_PORT": 9108}):
+        use_case._set_scan_backlog_size()
+
+    assert use_case._metrics.backlog_size == 2
+
+
+def raise_connection_error(model, upsert_list):
+    try:
+        raise OperationalError("INSERT", None, Exception("connection refused"))
+    except OperationalError as e:
+        raise InsertFailErrorException from e
+
+
+def test_sync_data_use_case_when_db_connection_error_in_scan_mode_then_keep_keys(
+    app, fake_redis_client
+):
+    for idx in range(1, 4):
+        fake_redis_client.set(
+            key=f"sync:private_sales:{idx}", value=json.dumps(dict(id=idx))
+        )
+    house_repo = MagicMock()
+    house_repo.get_exists_ids_by_ids.return_value = []
+    house_repo.upsert_target_model.side_effect = raise_connection_error
+
+    use_case = SyncDataUseCase(topic="test", house_repo=house_repo)
+    use_case._redis_client = fake_redis_client
+    use_case._metrics = SyncMetrics()
+
+    with pytest.raises(InsertFailErrorException):
+        use_case._process_scan()
+
+    # bisect 하지 않고, 실패 이력 저장 / key 삭제 없이 다음 polling 에서 재처리
+    assert house_repo.upsert_target_model.call_count == 1
+    house_repo.bulk_insert_sync_failure_histories.assert_not_called()
+    assert len(fake_redis_client._redis_client.keys("sync:*")) == 3
+    assert fake_redis_client.copied_keys == []
+
+    house_repo.upsert_target_model.side_effect = None
+    assert use_case._process_scan() == 3
+    assert fake_redis_client._redis_client.keys("sync:*") == []
+
+
+def test_sync_data_use_case_when_db_connection_error_in_stream_mode_then_not_ack(
+    app,
+):
+    entries = [
+        (b"1-0", {b"table": b"private_sales", b"value": b'{"id": 1}'}),
+        (b"2-0", {b"table": b"private_sales", b"value": b'{"id": 2}'}),
+    ]
+    redis_client = MagicMock()
+    redis_client.claim_pending_stream.return_value = entries
+    house_repo = MagicMock()
+    house_repo.get_exists_ids_by_ids.return_value = []
+    house_repo.upsert_target_model.side_effect = raise_connection_error
+
+    use_case = SyncDataUseCase(topic="test", house_repo=house_repo)
+    use_case._redis_client = redis_client
+    use_case._metrics = SyncMetrics()
+
+    with pytest.raises(InsertFailErrorException):
+        use_case._process_stream()
+
+    # ack 하지 않음 -> pending 으로 남아 재처리
+    assert house_repo.upsert_target_model.call_count == 1
+    house_repo.bulk_insert_sync_failure_histories.assert_not_called()
+    redis_client.ack_stream.assert_not_called()
+
+
+def test_sync_data_use_case_when_real_estate_moved_then_invalidate_previous_tile(
+    app, fake_redis_client
+):
+    house_repo = MagicMock()
+    house_repo.get_exists_ids_by_ids.return_value = {1}
+    # upsert 전 (이전 좌표) -> upsert 후 (새 좌표)
+    house_repo.get_coordinates_by_target_ids.side_effect = [
+        [(127.0, 37.5)],
+        [(129.1, 35.1)],
+    ]
+
+    use_case = SyncDataUseCase(topic="test", house_repo=house_repo)
+    use_case._redis_client = fake_redis_client
+    use_case._metrics = SyncMetrics()
+    use_case._map_tile_cache = MagicMock()
+
+    use_case._upsert_target_model(
+        messages={"real_estates": [dict(id=1, x_vl=129.1, y_vl=35.1)]}
+    )
+
+    use_case._map_tile_cache.invalidate.assert_called_once_with(
+        coordinates=[(127.0, 37.5), (129.1, 35.1)]
+    )
@@ -0,0 +1,174 @@
+from threading import Event
+
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from app.extensions.utils.search_index import (
+    HouseSearchIndex,
+    PrefixIndex,
+    SearchIndex,
+    SearchDocument,
+    get_choseong,
+    normalize_text,
+    split_search_keywords,
+)
+
+
+def make_document(
+    idx: int,
+    name: str,
+    dong: str,
+    address: str,
+    house_type: str = "분양",
+    region_rank: int = 2,
+) -> SearchDocument:
+    name_text = normalize_text(name)
+    return SearchDocument(
+        id=idx,
+        name=name,
+        latitude=37.5,
+        longitude=127.0,
+        house_type=house_type,
+        region_rank=region_rank,
+        name_text=name_text,
+        dong_text=normalize_text(dong),
+        text=name_text + normalize_text(dong) + normalize_text(address),
+        choseong=get_choseong(name_text),
+    )
+
+
+documents = [
+    make_document(1, "반포자이", "반포동", "서울특별시 서초구", region_rank=0),
+    make_document(2, "래미안 퍼스티지", "반포동", "서울특별시 서초구", region_rank=0),
+    make_document(3, "자이 2차", "영통동", "경기도 수원시", region_rank=1),
+    make_document(4, "반포 리버뷰", "우동", "부산광역시 해운대구", house_type="매매"),
+]
+
+
+def test_split_search_keywords_when_hangul_with_number_then_split_keywords():
+    assert split_search_keywords(keywords="반포 자이2차") == ["반포", "자이", "2", "차"]
+    assert split_search_keywords(keywords="  ") == []
+
+
+def test_get_choseong_when_hangul_syllables_then_return_choseong():
+    assert get_choseong("반포자이2") == "ㅂㅍㅈㅇ2"
+
+
+def test_search_when_not_adjacent_keywords_then_match_all_keywords():
+    search_index = SearchIndex()
+    search_index.build(documents=documents)
+
+    result = search_index.search(keywords=split_search_keywords("서초 퍼스티지"))
+
+    assert [document.id for document in result] == [2]
+
+
+def test_search_when_choseong_keywords_then_match_name_choseong():
+    search_index = SearchIndex()
+    search_index.build(documents=documents)
+
+    result = search_index.search(keywords=split_search_keywords("ㅂㅍ"))
+
+    assert [document.id for document in result] == [1, 4]
+
+
+def test_search_when_trailing_choseong_then_match_syllables_with_choseong():
+    search_index = SearchIndex()
+    search_index.build(documents=documents)
+
+    prefix_result = search_index.search(keywords=split_search_keywords("반포ㅈ"))
+    infix_result = search_index.search(keywords=split_search_keywords("포ㄹ"))
+
+    assert [document.id for document in prefix_result] == [1]
+    assert [document.id for document in infix_result] == [4]
+    assert [
+        document.id for document in search_index.autocomplete(prefix="래미ㅇ")
+    ] == [2]
+
+
+def test_search_when_name_matched_then_rank_before_address_matched():
+    search_index = SearchIndex()
+    search_index.build(documents=documents)
+
+    result = search_index.search(keywords=["반포"], house_type="분양")
+
+    # 매물명 prefix 일치(반포자이) -> 주소 일치(래미안 퍼스티지)
+    assert [document.id for document in result] == [1, 2]
+
+
+def test_search_when_not_built_then_return_empty_list():
+    search_index = SearchIndex()
+
+    assert search_index.is_built is False
+    assert search_index.search(keywords=["반포"]) == []
+
+
+def test_autocomplete_when_name_or_dong_prefix_then_return_by_region_rank():
+    search_index = SearchIndex()
+    search_index.build(documents=documents)
+
+    name_result = search_index.autocomplete(prefix="자이")
+    dong_result = search_index.autocomplete(prefix="반포")
+    choseong_result = search_index.autocomplete(prefix="ㄹㅁ", house_type="분양")
+
+    assert [document.id for document in name_result] == [3]
+    # 반포자이(서울), 래미안 퍼스티지(서울, 반포동), 반포 리버뷰(그 외)
+    assert [document.id for document in dong_result] == [1, 2, 4]
+    assert [document.id for document in choseong_result] == [2]
+
+
+def test_search_when_rebuilt_during_search_then_use_snapshot_at_start(monkeypatch):
+    search_index = SearchIndex()
+    search_index.build(documents=documents[3:])
+    get_prefix_offsets = SearchIndex._get_prefix_offsets
+
+    def get_prefix_offsets_with_rebuild(**kwargs):
+        # 검색 도중 background 재빌드로 인덱스가 교체된 경우
+        search_index.build(documents=documents)
+        return get_prefix_offsets(**kwargs)
+
+    monkeypatch.setattr(
+        search_index, "_get_prefix_offsets", get_prefix_offsets_with_rebuild
+    )
+    result = search_index.search(keywords=["반포"])
+
+    assert [document.id for document in result] == [4]
+    monkeypatch.undo()
+    result = search_index.search(keywords=["반포"])
+    assert [document.id for document in result] == [1, 2, 4]
+
+
+def test_prefix_index_when_short_prefix_then_use_precomputed_top_k():
+    prefix_index = PrefixIndex()
+    prefix_index.build(
+        entries=[("가나", 3), ("가다", 1), ("나가", 0), ("가나", 2), ("가", 1)]
+    )
+
+    assert prefix_index.search(prefix="가", limit=2) == [1, 2]
+    assert prefix_index.search(prefix="가나", limit=10) == [2, 3]
+    assert prefix_index.search(prefix="다", limit=10) == []
+
+
+def test_house_search_index_when_version_changed_then_rebuild_in_background(
+    fake_redis_client,
+):
+    search_index = HouseSearchIndex()
+    search_index.build(documents=documents[:1])
+    fake_redis_client.incr(key=RedisKeyPrefix.SEARCH_INDEX_VERSION.value)
+
+    loaded = Event()
+
+    def loader():
+        loaded.wait(timeout=5)
+        return documents
+
+    search_index.refresh(client=fake_redis_client, loader=loader)
+
+    # 재빌드 중에는 기존 인덱스로 조회
+    assert [document.id for document in search_index.search(keywords=["반포"])] == [1]
+
+    loaded.set()
+    search_index._build_thread.join(timeout=5)
+
+    assert search_index.version == b"1"
+    assert [
+        document.id for document in search_index.search(keywords=["반포"])
+    ] == [1, 2, 4]
@@ -0,0 +1,58 @@
+import random
+import struct
+
+from app.extensions.utils.spatial_index import SpatialIndex
+
+points = [
+    (idx, random.uniform(126.5, 127.9), random.uniform(37.0, 37.8))
+    for idx in range(1, 5001)
+]
+
+
+def test_query_bounding_when_build_spatial_index_then_same_as_brute_force():
+    spatial_index = SpatialIndex()
+    spatial_index.build(points=points)
+    start_x, start_y, end_x, end_y = 127.02, 37.51, 127.24, 37.39
+
+    result = spatial_index.query_bounding(
+        start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y
+    )
+
+    expected = [
+        idx for idx, x, y in points if start_x < x < end_x and end_y < y < start_y
+    ]
+    assert len(spatial_index) == len(points)
+    assert sorted(result) == sorted(expected)
+
+
+def test_query_radius_when_build_spatial_index_then_same_as_brute_force():
+    spatial_index = SpatialIndex()
+    spatial_index.build(points=points)
+    center_x, center_y, degree = 127.03, 37.50, 0.1
+
+    result = spatial_index.query_radius(x=center_x, y=center_y, degree=degree)
+
+    expected = [
+        idx
+        for idx, x, y in points
+        if (x - center_x) ** 2 + (y - center_y) ** 2 <= degree ** 2
+    ]
+    assert sorted(result) == sorted(expected)
+
+
+def test_query_bounding_when_not_built_then_return_empty_list():
+    spatial_index = SpatialIndex()
+
+    assert spatial_index.is_built is False
+    assert spatial_index.query_bounding(127.0, 37.5, 127.1, 37.4) == []
+
+
+def test_get_point_when_ewkb_or_wkt_then_return_coordinates():
+    ewkb = struct.pack("<BII", 1, 0x20000001, 4326) + struct.pack("<dd", 127.03, 37.5)
+
+    assert SpatialIndex.get_point(geometry=ewkb) == (127.03, 37.5)
+    assert SpatialIndex.get_point(geometry="SRID=4326;POINT(127.03 37.5)") == (
+        127.03,
+        37.5,
+    )
+    assert SpatialIndex.get_point(geometry=None) is None
@@ -0,0 +1,23 @@
+from app.extensions.utils.time_helper import (
+    get_server_today_range,
+    get_year_month_range,
+)
+
+
+def test_get_year_month_range_when_december_then_next_year_january():
+    assert get_year_month_range(year_month="202108") == ("202108", "202109")
+    assert get_year_month_range(year_month="202112") == ("202112", "202201")
+
+    start, end = get_year_month_range(year_month="202108")
+    assert start <= "20210801" < end
+    assert start <= "20210831" < end
+    assert not (start <= "20210901" < end)
+    assert not (start <= "20210731" < end)
+
+
+def test_get_server_today_range_then_one_day_without_timezone():
+    start, end = get_server_today_range()
+
+    assert start.tzinfo is None
+    assert (start.hour, start.minute, start.second) == (0, 0, 0)
+    assert (end - start).days == 1
@@ -0,0 +1,32 @@
+from app.extensions.utils.worker_helper import IdleBackoff, SyncMetrics
+
+
+def test_idle_backoff_when_idle_then_increase_delay_until_max_delay():
+    backoff = IdleBackoff(min_delay=0.1, max_delay=0.5, factor=2)
+
+    assert [backoff.next_delay() for _ in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+    backoff.reset()
+
+    assert backoff.next_delay() == 0.1
+
+
+def test_sync_metrics_render_when_observed_then_prometheus_text_format():
+    metrics = SyncMetrics()
+    metrics.observe_batch(size=10, seconds=2)
+    metrics.observe_upsert(table="private_sales", count=7, failure_count=1, seconds=0.5)
+    metrics.observe_upsert(
+        table="private_sales", count=2, failure_count=0, seconds=0.25
+    )
+    metrics.set_backlog_size(size=30)
+
+    lines = metrics.render().splitlines()
+
+    assert 'sync_messages_total{table="private_sales"} 9' in lines
+    assert 'sync_failures_total{table="private_sales"} 1' in lines
+    assert "sync_batch_size_sum 10" in lines
+    assert "sync_batch_size_count 1" in lines
+    assert 'sync_upsert_seconds_sum{table="private_sales"} 0.75' in lines
+    assert 'sync_upsert_seconds_count{table="private_sales"} 2' in lines
+    assert "sync_backlog_size 30" in lines
+    assert "sync_messages_per_second 5.0" in lines
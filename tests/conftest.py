@@ -1,5 +1,6 @@
 import os
 
+import fakeredis
 from flask import Flask
 from sqlalchemy.orm import scoped_session
 
@@ -99,3 +100,16 @@ def redis(app: Flask):
 
     _redis.flushall()
     _redis.disconnect()
+
+
+@pytest.fixture(scope="function")
+def fake_redis_client() -> RedisClient:
+    """
+    local redis 없이 실행 가능한 RedisClient (fakeredis, dev-dependencies)
+    """
+    _redis = RedisClient()
+    _redis._redis_client = fakeredis.FakeStrictRedis()
+
+    yield _redis
+
+    _redis.flushall()
@@ -0,0 +1,230 @@
+from time import perf_counter
+from typing import Any, Callable, List, Tuple
+
+import pytest
+from sqlalchemy import and_, event, func
+from sqlalchemy.orm import joinedload
+
+from app.extensions.database import session as db_session
+from app.persistence.model import (
+    GeneralSupplyResultModel,
+    PublicSaleDetailModel,
+    PublicSaleDetailPhotoModel,
+    PublicSaleModel,
+    PublicSalePhotoModel,
+    RealEstateModel,
+    SpecialSupplyResultModel,
+)
+from core.domains.house.repository.house_repository import HouseRepository
+from core.domains.report.enum.report_enum import RegionEnum
+
+REGIONS = [RegionEnum.THE_AREA.value, RegionEnum.OTHER_GYEONGGI.value, "기타지역"]
+
+
+def legacy_get_house_with_public_sales(house_id: int) -> Tuple[Any, Any]:
+    """
+        집계 + joinedload 를 1개 query 로 조회하던 기존 HouseRepository.get_house_with_public_sales
+    """
+    query = (
+        db_session.query(
+            PublicSaleModel,
+            func.min(PublicSaleDetailModel.supply_area).label("min_supply_area"),
+            func.max(PublicSaleDetailModel.supply_area).label("max_supply_area"),
+            func.avg(PublicSaleDetailModel.supply_price).label("avg_supply_price"),
+            func.avg(PublicSaleDetailModel.supply_area).label("avg_supply_area"),
+            func.min(PublicSaleDetailModel.acquisition_tax).label(
+                "min_acquisition_tax"
+            ),
+            func.max(PublicSaleDetailModel.acquisition_tax).label(
+                "max_acquisition_tax"
+            ),
+            func.min(PublicSaleDetailModel.supply_price).label("min_supply_price"),
+            func.max(PublicSaleDetailModel.supply_price).label("max_supply_price"),
+        )
+        .options(joinedload(PublicSaleModel.real_estates, innerjoin=True))
+        .options(joinedload(PublicSaleModel.public_sale_details, innerjoin=True))
+        .options(joinedload(PublicSaleModel.public_sale_photos))
+        .options(joinedload("public_sale_details.public_sale_detail_photos"))
+        .options(joinedload("public_sale_details.special_supply_results"))
+        .options(joinedload("public_sale_details.general_supply_results"))
+        .filter(
+            and_(
+                PublicSaleModel.id == house_id,
+                PublicSaleModel.real_estate_id == RealEstateModel.id,
+                PublicSaleDetailModel.public_sale_id == PublicSaleModel.id,
+            )
+        )
+        .group_by(PublicSaleModel.id)
+    )
+    query_set = query.first()
+
+    if not query_set:
+        return None, None
+
+    return query_set, query_set[0].housing_category
+
+
+def seed_public_sale_complex(
+    session, public_sale_id: int, detail_count: int, photo_count: int
+) -> None:
+    """
+        분양 매물 1건에 타입(detail) detail_count 개, 타입 별 평면도 1개 + 공급 결과 지역 별 3개씩,
+        단지 사진 photo_count 개 추가
+    """
+    details = [
+        PublicSaleDetailModel(
+            public_sale_id=public_sale_id,
+            area_type=f"{59 + index}A",
+            private_area=59 + index,
+            supply_area=84 + index,
+            supply_price=30000 + index * 100,
+            acquisition_tax=1000000 + index * 1000,
+        )
+        for index in range(detail_count)
+    ]
+    session.add_all(details)
+    session.flush()
+
+    for detail in details:
+        session.add(
+            PublicSaleDetailPhotoModel(
+                public_sale_detail_id=detail.id,
+                file_name="photo_file",
+                path="public_sale_detail_photos/2021/photo.jpeg",
+                extension="jpeg",
+                is_available=True,
+            )
+        )
+        for region in REGIONS:
+            session.add(
+                SpecialSupplyResultModel(public_sale_detail_id=detail.id, region=region)
+            )
+            session.add(
+                GeneralSupplyResultModel(public_sale_detail_id=detail.id, region=region)
+            )
+
+    session.add_all(
+        [
+            PublicSalePhotoModel(
+                public_sale_id=public_sale_id,
+                file_name="photo_file",
+                path="public_sale_photos/2021/photo.jpeg",
+                extension="jpeg",
+                seq=seq,
+                is_available=True,
+            )
+            for seq in range(photo_count)
+        ]
+    )
+    session.commit()
+
+
+def measure(session, load: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """
+        return : (load 결과, 실행 query 수, DB 에서 fetch 된 전체 row 수)
+        - 실행된 SQL 을 기록 후 다시 실행하여 결과 row 수 집계
+    """
+    connection = session.get_bind()
+    statements: List[Tuple[str, Any]] = list()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        session.expunge_all()
+        result = load()
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+    row_count = sum(
+        len(connection.exec_driver_sql(statement, parameters).fetchall())
+        for statement, parameters in statements
+    )
+    return result, len(statements), row_count
+
+
+def get_collection_sizes(public_sale: PublicSaleModel) -> dict:
+    return dict(
+        public_sale_photos=len(public_sale.public_sale_photos),
+        public_sale_details=len(public_sale.public_sale_details),
+        public_sale_detail_photos=sum(
+            1
+            for detail in public_sale.public_sale_details
+            if detail.public_sale_detail_photos
+        ),
+        special_supply_results=sum(
+            len(detail.special_supply_results)
+            for detail in public_sale.public_sale_details
+        ),
+        general_supply_results=sum(
+            len(detail.general_supply_results)
+            for detail in public_sale.public_sale_details
+        ),
+    )
+
+
+@pytest.mark.skip(reason="PostGIS 함수 사용으로 sqlite 환경에서는 skip")
+def test_get_house_with_public_sales_when_many_types_and_photos_then_same_result_with_less_rows(
+    session, create_real_estate_with_public_sale
+):
+    public_sale_id = create_real_estate_with_public_sale[0].public_sales[0].id
+    seed_public_sale_complex(
+        session=session, public_sale_id=public_sale_id, detail_count=5, photo_count=4
+    )
+
+    (legacy_result, legacy_category), _, legacy_rows = measure(
+        session=session,
+        load=lambda: legacy_get_house_with_public_sales(house_id=public_sale_id),
+    )
+    legacy_sizes = get_collection_sizes(public_sale=legacy_result[0])
+
+    (result, category), query_count, rows = measure(
+        session=session,
+        load=lambda: HouseRepository().get_house_with_public_sales(
+            house_id=public_sale_id
+        ),
+    )
+
+    assert category == legacy_category
+    assert tuple(result[1:]) == tuple(legacy_result[1:])
+    assert get_collection_sizes(public_sale=result[0]) == legacy_sizes
+    # 집계 1 + public_sales(real_estates) 1 + selectinload 5
+    assert query_count == 7
+    assert rows < legacy_rows
+
+
+@pytest.mark.skip(reason="benchmark, 필요시 skip 제거 후 수동 실행 (pytest -s -k benchmark)")
+def test_benchmark_get_house_with_public_sales(
+    session, create_real_estate_with_public_sale
+):
+    public_sale_id = create_real_estate_with_public_sale[0].public_sales[0].id
+    seed_public_sale_complex(
+        session=session, public_sale_id=public_sale_id, detail_count=30, photo_count=20
+    )
+    repeat = 20
+
+    for name, load in (
+        (
+            "legacy (joinedload + GROUP BY)",
+            lambda: legacy_get_house_with_public_sales(house_id=public_sale_id),
+        ),
+        (
+            "aggregate + selectinload",
+            lambda: HouseRepository().get_house_with_public_sales(
+                house_id=public_sale_id
+            ),
+        ),
+    ):
+        _, query_count, rows = measure(session=session, load=load)
+
+        start_time = perf_counter()
+        for _ in range(repeat):
+            session.expunge_all()
+            load()
+        seconds = (perf_counter() - start_time) / repeat
+
+        print(
+            f"\n{name} : {query_count} queries, {rows} rows fetched, "
+            f"{seconds * 1000:.2f} ms / call"
+        )
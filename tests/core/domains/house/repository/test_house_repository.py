@@ -1,6 +1,25 @@
+from collections import namedtuple
+from time import time
 from unittest.mock import patch
 
-from app.persistence.model import InterestHouseModel
+import pytest
+from sqlalchemy import func
+
+from app.extensions.utils.search_index import SearchDocument, HouseSearchIndex
+from app.extensions.utils.spatial_index import SpatialIndex, RealEstateSpatialIndex
+from app.persistence.model import (
+    AdministrativeDivisionModel,
+    DongInfoModel,
+    InterestHouseModel,
+    RealEstateModel,
+    PrivateSaleModel,
+    MapMarkerModel,
+    PublicSaleModel,
+    PublicSaleDetailModel,
+    PublicSaleAvgPriceModel,
+)
+from app.persistence.model.sync_failure_history_model import SyncFailureHistoryModel
+from app.persistence.model.temp_supply_area_api_model import TempSupplyAreaApiModel
 from core.domains.house.dto.house_dto import (
     UpsertInterestHouseDto,
     CoordinatesRangeDto,
@@ -8,8 +27,12 @@ from core.domains.house.dto.house_dto import (
     GetCalendarInfoDto,
     GetSearchHouseListDto,
 )
-from core.domains.house.entity.house_entity import GetSearchHouseListEntity
+from core.domains.house.entity.house_entity import (
+    GetSearchHouseListEntity,
+    MapSearchEntity,
+)
 from core.domains.house.enum.house_enum import (
+    BuildTypeEnum,
     HouseTypeEnum,
     PublicSaleStatusEnum,
     BoundingPrivateTypeEnum,
@@ -17,6 +40,7 @@ from core.domains.house.enum.house_enum import (
     BoundingLevelEnum,
     BoundingIncludePrivateEnum,
     HouseAreaRange,
+    DivisionLevelEnum,
 )
 from core.domains.house.repository.house_repository import HouseRepository
 from core.domains.user.dto.user_dto import GetUserDto
@@ -102,6 +126,92 @@ def test_get_bounding_by_coordinates_range_dto(
     assert mock_get_bounding.called is True
 
 
+def test_get_bounding_filter_with_two_points_when_spatial_index_enabled_then_filter_by_ids(
+    app, session, create_real_estate_with_bounding
+):
+    points = list()
+    for real_estate in session.query(RealEstateModel.id, RealEstateModel.coordinates):
+        x, y = SpatialIndex.get_point(geometry=real_estate.coordinates)
+        points.append((real_estate.id, x, y))
+    x, y = points[0][1], points[0][2]
+    dto = coordinates_dto.copy(
+        update=dict(start_x=x - 0.01, start_y=y + 0.01, end_x=x + 0.01, end_y=y - 0.01)
+    )
+
+    with patch.dict(app.config, {"SPATIAL_INDEX_ENABLED": True}), patch(
+        "core.domains.house.repository.house_repository.real_estate_spatial_index",
+        RealEstateSpatialIndex(),
+    ), patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_real_estate_points"
+    ) as mock_get_real_estate_points:
+        mock_get_real_estate_points.return_value = points
+        bounding_filter = HouseRepository().get_bounding_filter_with_two_points(
+            dto=dto
+        )
+
+    result = session.query(RealEstateModel.id).filter(bounding_filter).all()
+
+    assert mock_get_real_estate_points.called is True
+    assert sorted(query.id for query in result) == sorted(
+        idx for idx, point_x, point_y in points if point_x == x and point_y == y
+    )
+
+
+def test_get_map_marker_filters_when_bounding_and_private_filters_then_filter_map_markers(
+    session,
+):
+    for idx, building_type in enumerate(
+        [BuildTypeEnum.APARTMENT.value, BuildTypeEnum.STUDIO.value], start=1
+    ):
+        session.add(
+            MapMarkerModel(
+                id=idx,
+                real_estate_id=idx,
+                coordinates="SRID=4326;POINT(127.0 37.5)",
+                latitude=37.5,
+                longitude=127.0,
+                building_type=building_type,
+                name=f"마커{idx}",
+                is_available=True,
+            )
+        )
+    session.commit()
+
+    marker_filters = HouseRepository()._get_map_marker_filters(
+        filters=[
+            RealEstateModel.id.in_([1, 2]),
+            PrivateSaleModel.building_type == BuildTypeEnum.APARTMENT.value,
+        ]
+    )
+    result = session.query(MapMarkerModel).filter(*marker_filters).all()
+
+    assert [marker.id for marker in result] == [1]
+
+
+@pytest.mark.skip(reason="PostGIS 함수 사용으로 sqlite 환경에서는 skip")
+def test_spatial_index_when_compare_with_postgis_then_same_real_estate_ids(
+    app, session, create_real_estate_with_bounding
+):
+    dto = coordinates_dto
+    sql_filter = func.ST_Contains(
+        func.ST_MakeEnvelope(dto.start_x, dto.end_y, dto.end_x, dto.start_y, 4326),
+        RealEstateModel.coordinates,
+    )
+    sql_result = (
+        session.query(RealEstateModel.id)
+        .filter(sql_filter, RealEstateModel.is_available == "True")
+        .all()
+    )
+
+    spatial_index = SpatialIndex()
+    spatial_index.build(points=HouseRepository().get_real_estate_points())
+    index_result = spatial_index.query_bounding(
+        start_x=dto.start_x, start_y=dto.start_y, end_x=dto.end_x, end_y=dto.end_y
+    )
+
+    assert sorted(query.id for query in sql_result) == sorted(index_result)
+
+
 def test_get_administrative_by_coordinates_range_dto(
     session, create_real_estate_with_bounding
 ):
@@ -133,6 +243,22 @@ def test_is_user_liked_house(session, create_interest_house):
     assert result is True
 
 
+def test_get_liked_house_ids_when_user_liked_public_sales_then_return_house_id_set(
+    session, create_interest_house
+):
+    repo = HouseRepository()
+
+    assert repo.get_liked_house_ids(user_id=1, house_ids=[1, 2, 3]) == {1}
+    assert repo.get_liked_house_ids(user_id=2, house_ids=[1, 2, 3]) == set()
+    assert (
+        repo.get_liked_house_ids(
+            user_id=1, house_ids=[1], type_=HouseTypeEnum.PRIVATE_SALES.value
+        )
+        == set()
+    )
+    assert repo.get_liked_house_ids(user_id=None, house_ids=[1]) == set()
+
+
 def test_get_house_public_detail_when_get_house_public_detail_dto(
     session, create_real_estate_with_public_sale
 ):
@@ -235,3 +361,263 @@ def test_get_search_house_list_when_get_keywords(
         result = HouseRepository().get_search_house_list(dto=dto)
 
     assert isinstance(result[0], GetSearchHouseListEntity)
+
+
+def test_get_search_house_list_when_search_index_enabled_then_search_without_db(app):
+    documents = [
+        SearchDocument(
+            id=1,
+            name="반포자이",
+            latitude=37.5,
+            longitude=127.0,
+            house_type="분양",
+            region_rank=0,
+            name_text="반포자이",
+            dong_text="반포동",
+            text="반포자이서울특별시서초구반포동",
+            choseong="ㅂㅍㅈㅇ",
+        )
+    ]
+
+    search_index = HouseSearchIndex()
+    search_index.build(documents=documents)
+    search_index._checked_at = time()
+
+    with patch.dict(app.config, {"SEARCH_INDEX_ENABLED": True}), patch(
+        "core.domains.house.repository.house_repository.house_search_index",
+        search_index,
+    ), patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_search_documents"
+    ) as mock_get_search_documents:
+        result = HouseRepository().get_search_house_list(keywords="ㅂㅍ 서초")
+
+    # 입력 중 조회는 빌드된 인덱스만 사용 (DB 조회 없음)
+    assert mock_get_search_documents.called is False
+    assert isinstance(result[0], MapSearchEntity)
+    assert result[0].name == "반포자이"
+
+
+def test_get_search_house_id_query_when_keywords_in_different_columns_then_intersect(
+    session, create_real_estate_with_public_sale
+):
+    public_sales = (
+        session.query(PublicSaleModel.id, PublicSaleModel.real_estate_id)
+        .order_by(PublicSaleModel.id)
+        .all()
+    )
+    session.query(PublicSaleModel).filter_by(id=public_sales[0].id).update(
+        {"name": "반포자이"}
+    )
+    session.query(PublicSaleModel).filter_by(id=public_sales[1].id).update(
+        {"name": "래미안 퍼스티지"}
+    )
+    # factory 주소(faker)에 검색어가 포함되지 않도록 고정
+    session.query(RealEstateModel).update(
+        {"jibun_address": "지번 주소", "road_address": "도로명 주소"}
+    )
+    session.query(RealEstateModel).filter_by(id=public_sales[1].real_estate_id).update(
+        {"dong_myun": "반포동"}
+    )
+    session.commit()
+
+    def get_ids(keywords):
+        query = HouseRepository()._get_search_house_id_query(
+            id_column=PublicSaleModel.id,
+            name_column=PublicSaleModel.name,
+            real_estate_id_column=PublicSaleModel.real_estate_id,
+            keywords=keywords,
+        )
+        return sorted(row[0] for row in query.all())
+
+    assert get_ids(["반포"]) == [public_sales[0].id, public_sales[1].id]
+    assert get_ids(["반포", "퍼스티지"]) == [public_sales[1].id]
+
+
+def test_get_search_house_list_when_choseong_without_search_index_then_empty(app):
+    with patch.dict(app.config, {"SEARCH_INDEX_ENABLED": False}), patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_search_documents"
+    ) as mock_get_search_documents:
+        result = HouseRepository().get_search_house_list(keywords="ㅂㅍ")
+
+    # 초성 검색을 위해 요청 중 인덱스를 빌드하지 않음
+    assert result == []
+    assert mock_get_search_documents.called is False
+
+
+def test_upsert_target_model_when_exists_and_new_rows_then_insert_and_update(
+    session,
+):
+    session.add(DongInfoModel(id=1, private_sale_id=1, name="101동"))
+    session.commit()
+
+    upsert_list = [
+        dict(id=1, private_sale_id=1, name="101동(변경)", hhld_cnt=100),
+        dict(id=2, private_sale_id=1, name="102동", hhld_cnt=80, x_vl=127.0),
+    ]
+    exists_ids = HouseRepository().get_exists_ids_by_ids(
+        model=DongInfoModel, ids=[1, 2]
+    )
+    HouseRepository().upsert_target_model(model=DongInfoModel, upsert_list=upsert_list)
+    session.expire_all()
+
+    result = session.query(DongInfoModel).order_by(DongInfoModel.id).all()
+
+    assert exists_ids == {1}
+    assert [(dong.id, dong.name, dong.hhld_cnt) for dong in result] == [
+        (1, "101동(변경)", 100),
+        (2, "102동", 80),
+    ]
+
+
+def test_make_pre_calc_target_public_sale_avg_prices_list_when_batch_then_split_update_and_create(
+    session,
+):
+    detail_infos = [
+        (1, 1, 84, 50000, 10),
+        (2, 1, 109.09, 70000, 30),
+        (3, 2, 84, 40000, 5),
+        (4, 3, 0, 0, 5),
+    ]
+    session.add_all(
+        [
+            PublicSaleDetailModel(
+                id=idx,
+                public_sale_id=sale_id,
+                private_area=area,
+                supply_area=area,
+                supply_price=price,
+                acquisition_tax=0,
+                general_household=household,
+            )
+            for idx, sale_id, area, price, household in detail_infos
+        ]
+    )
+    session.add(
+        PublicSaleAvgPriceModel(id=7, public_sale_id=1, pyoung=33, default_pyoung=33)
+    )
+    session.commit()
+
+    default_infos = HouseRepository().get_default_infos_by_public_sale_ids(
+        public_sale_ids=[1, 2, 3]
+    )
+    (
+        update_list,
+        create_list,
+    ) = HouseRepository().make_pre_calc_target_public_sale_avg_prices_list(
+        default_infos=default_infos,
+        competition_and_score_infos={1: dict(avg_competition=5, min_score=60)},
+    )
+
+    # 공급면적 0 인 분양(3) 제외, 일반공급 세대수가 가장 많은 타입 선정
+    assert sorted(default_infos.keys()) == [1, 2]
+    assert [
+        (data["id"], data["pyoung"], data["supply_price"]) for data in update_list
+    ] == [(7, 33, 70000)]
+    assert update_list[0]["avg_competition"] == 5
+    assert [
+        (data["public_sale_id"], data["pyoung"], data["min_score"])
+        for data in create_list
+    ] == [(2, 25, None)]
+
+
+def test_copy_temp_supply_area_api_when_rows_over_chunk_size_then_insert_all(session):
+    columns = ("req_real_estate_id", "resp_rnum", "resp_area", "resp_etc_purps")
+    rows = ((1, rnum, 84.9, None) for rnum in range(1, 6))
+
+    row_count = HouseRepository().copy_temp_supply_area_api(
+        columns=columns, rows=rows, chunk_size=2
+    )
+
+    result = session.query(TempSupplyAreaApiModel).order_by(
+        TempSupplyAreaApiModel.resp_rnum
+    )
+    assert row_count == 5
+    assert [(data.resp_rnum, data.resp_etc_purps) for data in result] == [
+        (rnum, None) for rnum in range(1, 6)
+    ]
+
+
+def test_set_administrative_division_id_when_grouping_rows_then_bind_id_by_legal_code(
+    session,
+):
+    session.add_all(
+        [
+            AdministrativeDivisionModel(
+                id=idx,
+                name=name,
+                short_name=name,
+                apt_trade_price=0,
+                apt_deposit_price=0,
+                op_trade_price=0,
+                op_deposit_price=0,
+                public_sale_price=0,
+                front_legal_code=front_legal_code,
+                back_legal_code=back_legal_code,
+                level=level,
+            )
+            for idx, name, front_legal_code, back_legal_code, level in [
+                (1, "서울특별시", "11000", "00000", DivisionLevelEnum.LEVEL_1),
+                (2, "서울특별시 종로구", "11110", "00000", DivisionLevelEnum.LEVEL_2),
+                (3, "서울특별시 종로구 청운동", "11110", "10100", DivisionLevelEnum.LEVEL_3),
+            ]
+        ]
+    )
+    session.commit()
+
+    Row = namedtuple(
+        "Row",
+        "grouping_id, si_do, si_gun_gu, dong_myun, front_legal_code, back_legal_code, "
+        "max_front_legal_code, apt_avg_trade_price, apt_avg_deposit_price, "
+        "op_avg_trade_price, op_avg_deposit_price",
+    )
+    query_set = [
+        Row(3, "서울특별시", None, None, None, None, "11740", 100, 50, 0, 0),
+        Row(1, "서울특별시", "종로구", None, "11110", None, "11110", 200, 60, 0, 0),
+        Row(0, "서울특별시", "종로구", "청운동", "11110", "10100", "11110", 300, 70, 0, 0),
+        Row(0, "서울특별시", "종로구", "없는동", "11110", "99999", "11110", 400, 80, 0, 0),
+    ]
+
+    result_list = HouseRepository()._make_administrative_avg_price_list(
+        query_set=query_set
+    )
+    update_list, failure_list = HouseRepository().set_administrative_division_id(
+        result_list=result_list
+    )
+
+    assert [(data["id"], data["apt_trade_price"]) for data in update_list] == [
+        (1, 100),
+        (2, 200),
+        (3, 300),
+    ]
+    assert [
+        (data["front_legal_code"], data["back_legal_code"]) for data in failure_list
+    ] == [("11110", "99999")]
+
+
+def test_bulk_update_private_sales_when_bad_row_then_save_sync_failure_histories(
+    session,
+):
+    session.add_all(
+        [
+            PrivateSaleModel(id=1, real_estate_id=1, name="a", building_type="아파트"),
+            PrivateSaleModel(id=2, real_estate_id=1, name="b", building_type="아파트"),
+        ]
+    )
+    session.commit()
+
+    result = HouseRepository().bulk_update_private_sales(
+        update_list=[
+            dict(id=1, trade_status=1),
+            # NOT NULL 컬럼에 None -> 실패 row
+            dict(id=2, trade_status=None),
+        ]
+    )
+    session.expire_all()
+
+    failure_histories = session.query(SyncFailureHistoryModel).all()
+
+    assert result.row_count == 1
+    assert session.query(PrivateSaleModel).get(1).trade_status == 1
+    assert [
+        (history.target_table, history.sync_data) for history in failure_histories
+    ] == [("private_sales", dict(id=2, trade_status=None))]
@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
+from app.extensions.cache.calendar_snapshot_cache import CalendarSnapshotCache
+from app.extensions.cache.map_tile_cache import MapTileCache
 from app.extensions.utils.house_helper import HouseHelper
 from app.persistence.model import InterestHouseModel, RecentlyViewModel
 from core.domains.house.dto.house_dto import (
@@ -25,6 +27,8 @@ from core.domains.house.entity.house_entity import (
     MainRecentPublicInfoEntity,
     PublicSaleEntity,
     PublicSaleDetailEntity,
+    BoundingRealEstateEntity,
+    PublicSaleBoundingEntity,
 )
 from core.domains.house.enum.house_enum import (
     HouseTypeEnum,
@@ -42,6 +46,7 @@ from core.domains.house.enum.house_enum import (
 from core.domains.house.use_case.v1.house_use_case import (
     UpsertInterestHouseUseCase,
     BoundingUseCase,
+    BoundingClusterUseCase,
     GetHousePublicDetailUseCase,
     GetCalendarInfoUseCase,
     GetInterestHouseListUseCase,
@@ -188,6 +193,159 @@ def test_bounding_use_case_when_level_is_grater_than_queryset_flag_then_call_get
     assert result.value == mock_get_bounding.return_value
 
 
+def test_bounding_use_case_when_tile_cache_enabled_then_return_houses_in_viewport(
+    app, session
+):
+    """
+        tile 캐시 사용 시 cache miss tile 만 get_bounding 호출,
+        tile 경계 밖(viewport 밖) 매물과 중복 매물은 제외
+    """
+    dto = coordinates_dto.copy(
+        update=dict(start_x=127.02, start_y=37.51, end_x=127.04, end_y=37.49)
+    )
+    in_viewport = BoundingRealEstateEntity(
+        public_sales=PublicSaleBoundingEntity(
+            real_estate_id="1",
+            latitude=37.50,
+            longitude=127.03,
+            public_sale_id=1,
+            housing_category="민영",
+            name="반포자이",
+            status=PublicSaleStatusEnum.IS_RECEIVING.value,
+            supply_price=50000,
+        )
+    )
+    out_of_viewport = BoundingRealEstateEntity(
+        public_sales=in_viewport.public_sales.copy(
+            update=dict(public_sale_id=2, latitude=37.60)
+        )
+    )
+
+    with patch.dict(app.config, {"BOUNDING_TILE_CACHE_ENABLED": True}), patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.get_tile_keys"
+    ) as mock_get_tile_keys, patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.get_tile_values"
+    ) as mock_get_tile_values, patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.set_tile_values"
+    ) as mock_set_tile_values, patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_bounding"
+    ) as mock_get_bounding:
+        mock_get_tile_keys.return_value = {(0, 0): "tile_0", (0, 1): "tile_1"}
+        mock_get_tile_values.return_value = {
+            "tile_0": None,
+            "tile_1": [in_viewport.dict()],
+        }
+        mock_get_bounding.return_value = [in_viewport, out_of_viewport]
+        result = BoundingUseCase().execute(dto=dto)
+
+    assert isinstance(result, UseCaseSuccessOutput)
+    assert mock_get_bounding.call_count == 1
+    assert mock_set_tile_values.call_count == 1
+    assert list(mock_set_tile_values.call_args.kwargs["tile_values"]) == ["tile_0"]
+    assert result.value == [in_viewport]
+
+
+def test_bounding_use_case_when_tiles_missed_then_get_bounding_once_and_split_by_tile(
+    app, session
+):
+    """
+        cache miss tile 이 여러개여도 get_bounding 1번 조회 후 매물 좌표 기준 tile 별로 저장
+    """
+    dto = coordinates_dto.copy(
+        update=dict(start_x=127.02, start_y=37.51, end_x=127.04, end_y=37.49)
+    )
+    in_viewport = BoundingRealEstateEntity(
+        public_sales=PublicSaleBoundingEntity(
+            real_estate_id="1",
+            latitude=37.50,
+            longitude=127.03,
+            public_sale_id=1,
+            housing_category="민영",
+            name="반포자이",
+            status=PublicSaleStatusEnum.IS_RECEIVING.value,
+            supply_price=50000,
+        )
+    )
+    tiles = MapTileCache.get_tiles(dto=dto)
+    house_tile = MapTileCache.get_tile(
+        longitude=127.03, latitude=37.50, level=dto.level
+    )
+    cached_tile = next(tile for tile in tiles if tile != house_tile)
+    missed_tiles = [tile for tile in tiles if tile != cached_tile]
+    tile_keys = {tile: f"tile_{tile[0]}_{tile[1]}" for tile in tiles}
+
+    with patch.dict(app.config, {"BOUNDING_TILE_CACHE_ENABLED": True}), patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.get_tile_keys"
+    ) as mock_get_tile_keys, patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.get_tile_values"
+    ) as mock_get_tile_values, patch(
+        "app.extensions.cache.map_tile_cache.MapTileCache.set_tile_values"
+    ) as mock_set_tile_values, patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_bounding_filter_with_two_points"
+    ) as mock_get_bounding_filter, patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_bounding"
+    ) as mock_get_bounding:
+        mock_get_tile_keys.return_value = tile_keys
+        mock_get_tile_values.return_value = {
+            key: [] if tile == cached_tile else None for tile, key in tile_keys.items()
+        }
+        mock_get_bounding.return_value = [in_viewport]
+        result = BoundingUseCase().execute(dto=dto)
+
+    bounding_dto = mock_get_bounding_filter.call_args.kwargs["dto"]
+    assert mock_get_bounding.call_count == 1
+    assert (
+        bounding_dto.start_x,
+        bounding_dto.start_y,
+        bounding_dto.end_x,
+        bounding_dto.end_y,
+    ) == MapTileCache.get_tiles_bounds(tiles=missed_tiles, level=dto.level)
+    assert mock_set_tile_values.call_args.kwargs["tile_values"] == {
+        tile_keys[tile]: [in_viewport.dict()] if tile == house_tile else []
+        for tile in missed_tiles
+    }
+    assert result.value == [in_viewport]
+
+
+def test_bounding_cluster_use_case_when_houses_in_same_cell_then_make_cluster(
+    session,
+):
+    """
+        같은 grid cell 의 매물은 클러스터로 묶고, 떨어진 매물은 개별 마커로 반환
+    """
+    house = PublicSaleBoundingEntity(
+        real_estate_id="1",
+        latitude=37.50,
+        longitude=127.03,
+        public_sale_id=1,
+        housing_category="민영",
+        name="반포자이",
+        status=PublicSaleStatusEnum.IS_RECEIVING.value,
+        supply_price=50000,
+    )
+    near_house = house.copy(
+        update=dict(public_sale_id=2, latitude=37.5001, supply_price=70000)
+    )
+    far_house = house.copy(update=dict(public_sale_id=3, latitude=37.60))
+
+    with patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_bounding"
+    ) as mock_get_bounding:
+        mock_get_bounding.return_value = [
+            BoundingRealEstateEntity(public_sales=public_sale)
+            for public_sale in (house, near_house, far_house)
+        ]
+        result = BoundingClusterUseCase().execute(dto=coordinates_dto)
+
+    assert isinstance(result, UseCaseSuccessOutput)
+    assert len(result.value.clusters) == 1
+    assert result.value.clusters[0].count == 2
+    assert result.value.clusters[0].public_count == 2
+    assert result.value.clusters[0].avg_supply_price == 60000
+    assert len(result.value.houses) == 1
+    assert result.value.houses[0].public_sales.public_sale_id == 3
+
+
 def test_bounding_use_case_when_level_is_lower_than_queryset_flag_then_call_get_administrative(
     session, create_real_estate_with_bounding
 ):
@@ -452,13 +610,56 @@ def test_get_calendar_info_use_case_when_included_request_date(
     with patch(
         "core.domains.house.repository.house_repository.HouseRepository.get_simple_calendar_info"
     ) as mock_calendar_info:
-        mock_calendar_info.return_value = sample_calendar_info
+        mock_calendar_info.return_value = [sample_calendar_info]
         result = GetCalendarInfoUseCase().execute(dto=get_calendar_info_dto)
 
     assert isinstance(result, UseCaseSuccessOutput)
     assert mock_calendar_info.called is True
 
 
+def test_get_calendar_info_use_case_when_snapshot_cached_then_merge_is_like(
+    session, fake_redis_client
+):
+    """
+        캘린더 snapshot cache hit -> DB 조회 없이 사용자 is_like 만 merge
+    """
+    snapshot = [
+        dict(
+            is_like=False,
+            id=real_estate_id,
+            road_address="서울 서초구 어딘가",
+            jibun_address="서울 서초구 어딘가",
+            public_sale=PublicSaleSimpleCalendarEntity(
+                id=real_estate_id,
+                real_estate_id=real_estate_id,
+                name="힐스테이트",
+                trade_type=PreSaleTypeEnum.PRE_SALE.value,
+                offer_date="20210705",
+            ).dict(),
+        )
+        for real_estate_id in (1, 2)
+    ]
+    cache = CalendarSnapshotCache(client=fake_redis_client)
+    cache.set(version=cache.get_version(), year_month="20217", snapshot=snapshot)
+
+    with patch(
+        "core.domains.house.use_case.v1.house_use_case.redis", fake_redis_client
+    ), patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_simple_calendar_info"
+    ) as mock_calendar_info, patch(
+        "core.domains.house.repository.house_repository.HouseRepository.get_liked_house_ids"
+    ) as mock_liked_house_ids:
+        mock_liked_house_ids.return_value = {2}
+        result = GetCalendarInfoUseCase().execute(dto=get_calendar_info_dto)
+
+    assert mock_calendar_info.called is False
+    mock_liked_house_ids.assert_called_once_with(user_id=1, house_ids=[1, 2])
+    assert [(entity.id, entity.is_like) for entity in result.value] == [
+        (1, False),
+        (2, True),
+    ]
+
+
 def test_get_calendar_info_use_case_when_no_included_request_date(
     session, create_real_estate_with_public_sale
 ):
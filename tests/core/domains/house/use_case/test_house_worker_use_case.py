@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.extensions.utils.enum.cache_enum import RedisKeyPrefix
+from core.domains.house.enum.house_enum import PrivateSaleAvgCalcModeEnum
+from core.domains.house.use_case.v1.house_worker_use_case import (
+    PreCalculateAverageUseCase,
+)
+
+
+def get_set_ids(client, key: str) -> list:
+    return sorted(int(member) for member in client.get_set_members(key=key))
+
+
+def test_upsert_private_sale_avg_prices_when_failed_then_keep_processing_dirty_ids(
+    app, fake_redis_client
+):
+    fake_redis_client.add_set_members(
+        key=RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value, values=[1, 2]
+    )
+    house_repo = MagicMock()
+    house_repo.get_target_of_upsert_private_sale_avg_prices.side_effect = Exception(
+        "server closed the connection"
+    )
+    use_case = PreCalculateAverageUseCase(topic="test", house_repo=house_repo)
+
+    with patch(
+        "core.domains.house.use_case.v1.house_worker_use_case.redis",
+        fake_redis_client,
+    ), patch.dict(
+        app.config,
+        {"PRIVATE_SALE_AVG_CALC_MODE": PrivateSaleAvgCalcModeEnum.INCREMENTAL.value},
+    ):
+        with pytest.raises(Exception):
+            use_case.execute_upsert_private_sale_avg_prices()
+
+        # 재계산 중 변경은 새 dirty set 에 기록, 실패한 processing 은 다음 배치에서 먼저 재처리
+        fake_redis_client.add_set_members(
+            key=RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value, values=[3]
+        )
+        assert get_set_ids(
+            fake_redis_client, RedisKeyPrefix.PRIVATE_SALE_AVG_PROCESSING.value
+        ) == [1, 2]
+
+        house_repo.get_target_of_upsert_private_sale_avg_prices.side_effect = None
+        house_repo.get_target_of_upsert_private_sale_avg_prices.return_value = []
+        use_case.execute_upsert_private_sale_avg_prices()
+
+        house_repo.get_target_of_upsert_private_sale_avg_prices.assert_called_with(
+            private_sale_ids=[1, 2]
+        )
+        assert not fake_redis_client.is_exists(
+            RedisKeyPrefix.PRIVATE_SALE_AVG_PROCESSING.value
+        )
+        assert get_set_ids(
+            fake_redis_client, RedisKeyPrefix.PRIVATE_SALE_AVG_DIRTY.value
+        ) == [3]
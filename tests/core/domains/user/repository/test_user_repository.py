@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from typing import List
 
 import pytest
@@ -435,6 +436,37 @@ def test_create_recently_view(session):
     assert view_info.type == recently_view_dto.type
 
 
+def test_bulk_upsert_recently_views_when_viewed_and_new_house_then_update_and_insert(
+    session,
+):
+    UserRepository().create_recently_view(dto=recently_view_dto)
+    viewed_at = datetime(2021, 8, 1, 12, 0, 0)
+
+    UserRepository().bulk_upsert_recently_views(
+        upsert_list=[
+            dict(
+                user_id=recently_view_dto.user_id,
+                house_id=recently_view_dto.house_id,
+                type=recently_view_dto.type,
+                viewed_at=viewed_at,
+            ),
+            dict(
+                user_id=recently_view_dto.user_id,
+                house_id=recently_view_dto.house_id + 1,
+                type=recently_view_dto.type,
+                viewed_at=viewed_at,
+            ),
+        ]
+    )
+    view_infos = session.query(RecentlyViewModel).order_by(RecentlyViewModel.id).all()
+
+    assert [view_info.house_id for view_info in view_infos] == [
+        recently_view_dto.house_id,
+        recently_view_dto.house_id + 1,
+    ]
+    assert all(view_info.updated_at == viewed_at for view_info in view_infos)
+
+
 def test_get_user_profile_when_enter_setting_page_return_nickname(
     session, create_users
 ):